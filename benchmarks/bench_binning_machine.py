@@ -0,0 +1,121 @@
+from credit_scoring.binning_machine import BinningMachine
+from credit_scoring.bins_plan import BinsPlan, ColBinsPlan
+from credit_scoring.dataiku_compat import DataikuBinningMachine
+from credit_scoring.good_bad_counter import GoodBadCounter
+import numpy as np
+import pytest
+
+"""
+BENCHMARK BinningMachine class
+"""
+
+CHUNK_SIZE = 100000
+
+# bins settings of all columns, as in ib_settings
+bins_settings_list = [
+    {"column": "person_age", "type": "numerical", "bins": {"algo": "equal width", "method": "width", "value": 5}},
+    {"column": "person_income", "type": "numerical", "bins": {"algo": "equal frequency", "method": "num_bins", "value": 10}},
+    {"column": "person_home_ownership", "type": "categorical", "bins": "none"},
+    {"column": "person_emp_length", "type": "numerical", "bins": [{"name": "short", "ranges": [[0, 2], [20, 124]]}, {"name": "medium", "ranges": [[2, 5]]}, {"name": "long", "ranges": [[5, 20]]}]},
+    {"column": "loan_intent", "type": "categorical", "bins": [{"name": "education & medical", "elements": ["EDUCATION", "MEDICAL"]}, {"name": "others", "elements": ["VENTURE", "PERSONAL", "DEBTCONSOLIDATION", "HOMEIMPROVEMENT"]}]},
+    {"column": "loan_grade", "type": "categorical", "bins": [{"name": "good", "elements": ["A", "B"]}, {"name": "fair", "elements": ["C", "D"]}, {"name": "poor", "elements": ["E", "F", "G"]}]},
+    {"column": "loan_amnt", "type": "numerical", "bins": {"algo": "equal width", "method": "num_bins", "value": 20}},
+    {"column": "loan_int_rate", "type": "numerical", "bins": {"algo": "equal frequency", "method": "num_bins", "value": 20}},
+    {"column": "loan_percent_income", "type": "numerical", "bins": [{"name": "low", "ranges": [[0, 0.1]]}, {"name": "medium", "ranges": [[0.1, 0.3]]}, {"name": "high", "ranges": [[0.3, 1]]}]},
+    {"column": "cb_person_default_on_file", "type": "categorical", "bins": "none"},
+    {"column": "cb_person_cred_hist_length", "type": "numerical", "bins": {"algo": "equal width", "method": "width", "value": 2}},
+]
+
+
+def get_chunks(df):
+    return [df.iloc[start:start + CHUNK_SIZE] for start in range(0, len(df), CHUNK_SIZE)]
+
+
+def test_perform_eq_width_binning_by_width(run_benchmark, credit_risk_df):
+    col_df = credit_risk_df.loc[:, ["person_income"]]
+    run_benchmark(lambda: BinningMachine.perform_eq_width_binning_by_width(col_df, 10000))
+
+
+def test_perform_eq_width_binning_by_num_bins(run_benchmark, credit_risk_df):
+    col_df = credit_risk_df.loc[:, ["loan_int_rate"]]
+    run_benchmark(lambda: BinningMachine.perform_eq_width_binning_by_num_bins(col_df, 20))
+
+
+def test_perform_eq_freq_binning_by_freq(run_benchmark, credit_risk_df, num_rows):
+    col_df = credit_risk_df.loc[:, ["person_income"]]
+    run_benchmark(lambda: BinningMachine.perform_eq_freq_binning_by_freq(col_df, max(num_rows // 20, 1)))
+
+
+def test_perform_eq_freq_binning_by_num_bins(run_benchmark, credit_risk_df):
+    col_df = credit_risk_df.loc[:, ["loan_int_rate"]]
+    run_benchmark(lambda: BinningMachine.perform_eq_freq_binning_by_num_bins(col_df, 20))
+
+
+def test_perform_eq_freq_binning_by_edges(run_benchmark, credit_risk_df):
+    col_df = credit_risk_df.loc[:, ["loan_int_rate"]]
+    edges = sorted(set(np.nanquantile(col_df.iloc[:, 0].to_numpy(), np.linspace(0, 1, 21)).tolist()))
+    run_benchmark(lambda: BinningMachine.perform_eq_freq_binning_by_edges(col_df, edges))
+
+
+good_bad_def = {"bad": {"numerical": [], "categorical": [{"column": "loan_status", "elements": [1]}], "weight": 1}, "indeterminate": {"numerical": [], "categorical": []}, "good": {"weight": 1}}
+
+@pytest.mark.parametrize("column", ["person_income", "loan_int_rate"])
+def test_perform_optimal_binning(run_benchmark, credit_risk_df, column):
+    col_df = credit_risk_df.loc[:, [column]]
+    labels = GoodBadCounter.get_good_bad_labels(credit_risk_df, good_bad_def)
+    run_benchmark(lambda: BinningMachine.perform_optimal_binning(col_df, labels, {"algo": "optimal", "max_bins": 10, "min_bin_size": 0.05}))
+
+
+@pytest.mark.parametrize("column,col_type", [("person_income", "numerical"), ("loan_intent", "categorical")])
+def test_perform_chi_merge_binning(run_benchmark, credit_risk_df, column, col_type):
+    col_df = credit_risk_df.loc[:, [column]]
+    labels = GoodBadCounter.get_good_bad_labels(credit_risk_df, good_bad_def)
+    run_benchmark(lambda: BinningMachine.perform_chi_merge_binning(col_df, labels, {"algo": "chi merge", "max_bins": 10}, col_type=col_type))
+
+
+def test_get_eq_freq_edges_from_chunks(run_benchmark, credit_risk_df):
+    chunks = get_chunks(credit_risk_df.loc[:, ["person_income"]])
+    run_benchmark(lambda: BinningMachine.get_eq_freq_edges_from_chunks(chunks, num_bins=20))
+
+
+def test_get_fixed_bins_plan_from_chunks(run_benchmark, credit_risk_df):
+    chunks = get_chunks(credit_risk_df)
+    run_benchmark(lambda: BinningMachine.get_fixed_bins_plan_from_chunks(chunks, bins_settings_list))
+
+
+@pytest.mark.parametrize("use_plan", [False, True], ids=["bins", "plan"])
+def test_perform_categorical_custom_binning(run_benchmark, credit_risk_df, use_plan):
+    col_df = credit_risk_df.loc[:, ["loan_grade"]]
+    bins_settings = bins_settings_list[5]["bins"]
+    if use_plan:
+        bins_settings = ColBinsPlan(bins_settings_list[5])
+    run_benchmark(lambda: BinningMachine.perform_categorical_custom_binning(col_df, bins_settings))
+
+
+@pytest.mark.parametrize("use_plan", [False, True], ids=["bins", "plan"])
+def test_perform_numerical_custom_binning(run_benchmark, credit_risk_df, use_plan):
+    col_df = credit_risk_df.loc[:, ["person_emp_length"]]
+    bins_settings = bins_settings_list[3]["bins"]
+    if use_plan:
+        bins_settings = ColBinsPlan(bins_settings_list[3])
+    run_benchmark(lambda: BinningMachine.perform_numerical_custom_binning(col_df, bins_settings))
+
+
+@pytest.mark.parametrize("col_bins_settings", bins_settings_list, ids=[col_bins_settings["column"] for col_bins_settings in bins_settings_list])
+def test_perform_binning_on_col(run_benchmark, credit_risk_df, col_bins_settings):
+    col_df = credit_risk_df.loc[:, [col_bins_settings["column"]]]
+    run_benchmark(lambda: BinningMachine.perform_binning_on_col(col_df, col_bins_settings))
+
+
+@pytest.mark.parametrize("num_workers", [None, 4], ids=["serial", "4_workers"])
+def test_perform_binning_on_whole_df(run_benchmark, credit_risk_df, num_workers):
+    bins_plan = BinsPlan(bins_settings_list)
+    run_benchmark(lambda dframe: BinningMachine.perform_binning_on_whole_df(dframe, bins_plan, num_workers=num_workers),
+                  setup=lambda: (credit_risk_df.copy(),))
+
+
+# The binning of the flow_ib_bin_dataset recipe, i.e., (bins definitions, binned series) with "Missing" labels
+def test_dataiku_perform_binning_on_whole_df(run_benchmark, credit_risk_df):
+    bins_plan = BinsPlan(bins_settings_list)
+    run_benchmark(lambda dframe: DataikuBinningMachine.perform_binning_on_whole_df(dframe, bins_plan),
+                  setup=lambda: (credit_risk_df.copy(),))
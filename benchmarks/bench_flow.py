@@ -0,0 +1,33 @@
+from credit_scoring.dataset_io import DatasetIO
+from bench_binning_machine import bins_settings_list
+import run_flow
+import dataiku
+import json
+import pytest
+
+"""
+BENCHMARK the recipes of the interactive binning flow end to end, with the local dataiku stand-in
+"""
+
+# good bad definition in the format downloaded from the web app (i.e., elements & bounds as input by the user)
+good_bad_def = {"bad": {"numerical": [{"column": "paid_past_due", "ranges": [["90", "121"]]}], "categorical": [], "weight": "1"}, "indeterminate": {"numerical": [{"column": "paid_past_due", "ranges": [["60", "90"]]}], "categorical": []}, "good": {"weight": "1"}}
+
+
+# A fixture to get a data directory holding the input datasets of the flow, i.e., the synthetic dataset & ib_settings
+@pytest.fixture
+def flow_data_dir(credit_risk_df, tmp_path, file_format):
+    dataiku.set_data_dir(str(tmp_path))
+    dataiku.set_default_format(file_format)
+    DatasetIO.write_dataframe(credit_risk_df, str(tmp_path / "credit_risk_dataset_generated.parquet"))
+    ib_settings_path = tmp_path / "ib_settings.json"
+    ib_settings_path.write_text(json.dumps({"bins_settings": bins_settings_list, "good_bad_def": [good_bad_def]}))
+    run_flow.write_ib_settings(str(ib_settings_path))
+    yield str(tmp_path)
+    dataiku.set_default_format("parquet")
+
+
+@pytest.mark.parametrize("file_format", ["parquet", "csv"])
+def test_ib_flow(run_benchmark, benchmark, flow_data_dir):
+    timings = run_benchmark(lambda: run_flow.run_recipes(run_flow.IB_FLOW_RECIPE_LIST, flow_data_dir))
+    benchmark.extra_info["recipes"] = timings["recipes"]
+    benchmark.extra_info["io"] = timings["io"]
@@ -0,0 +1,22 @@
+from credit_scoring.good_bad_counter import GoodBadCounter
+import pytest
+
+"""
+BENCHMARK GoodBadCounter class
+"""
+
+# bad & indeterminate defined by a categorical column, or by ranges of a numerical column
+good_bad_def_list = [
+    {"bad": {"numerical": [], "categorical": [{"column": "loan_status", "elements": [1]}], "weight": 1}, "indeterminate": {"numerical": [], "categorical": []}, "good": {"weight": 1}},
+    {"bad": {"numerical": [{"column": "paid_past_due", "ranges": [[90, 121]]}], "categorical": [], "weight": 1}, "indeterminate": {"numerical": [{"column": "paid_past_due", "ranges": [[60, 90]]}], "categorical": []}, "good": {"weight": 1}},
+]
+
+
+@pytest.mark.parametrize("good_bad_def", good_bad_def_list, ids=["categorical_def", "numerical_def"])
+def test_get_statistics(run_benchmark, credit_risk_df, good_bad_def):
+    run_benchmark(lambda: GoodBadCounter.get_statistics(credit_risk_df, good_bad_def))
+
+
+@pytest.mark.parametrize("good_bad_def", good_bad_def_list, ids=["categorical_def", "numerical_def"])
+def test_get_good_bad_labels(run_benchmark, credit_risk_df, good_bad_def):
+    run_benchmark(lambda: GoodBadCounter.get_good_bad_labels(credit_risk_df, good_bad_def))
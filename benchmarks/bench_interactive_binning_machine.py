@@ -0,0 +1,132 @@
+from credit_scoring.interactive_binning_machine import InteractiveBinningMachine, ColValueIndex
+from credit_scoring.dataiku_compat import DataikuBinningMachine
+from credit_scoring.bins_plan import ColBinsPlan
+from credit_scoring.bin_aggregates import BinAggregates
+from credit_scoring.micro_bins import NumericMicroBins
+from credit_scoring.good_bad_counter import GoodBadCounter
+from credit_scoring.dataiku_compat import WebAppStatCalculator
+import copy
+import pytest
+
+"""
+BENCHMARK InteractiveBinningMachine class
+
+Each interactive action is timed together with binning the column with the changed bins settings (test_interactive_action),
+or together with updating the bin codes of the rows affected by the action only (test_interactive_action_rebin),
+as in the update_temp_bins_settings callback of the web app
+The summary statistics table after an action is timed from the rows, or from the label counts of each bin updated by the action
+(test_stat_table_after_action), as in the update_stat_tables_on_var_to_bin_change callback of the web app
+The bins & the summary statistics table of a numerical column are timed from the rows, or from the micro-bins of the column
+(test_numeric_stat_table), as the web app counts the numerical bins after automated binning or an interactive action
+"""
+
+# A function to get the bins settings of a column after automated binning, i.e., the starting point of interactive binning
+def get_temp_col_bins_settings(credit_risk_df, col_bins_settings):
+    def_li, _ = DataikuBinningMachine.perform_binning_on_col(credit_risk_df.loc[:, [col_bins_settings["column"]]], col_bins_settings)
+    return {"column": col_bins_settings["column"], "type": col_bins_settings["type"], "bins": def_li}
+
+
+numeric_col_bins_settings = {"column": "person_income", "type": "numerical", "bins": {"algo": "equal width", "method": "num_bins", "value": 20}}
+categoric_col_bins_settings = {"column": "loan_intent", "type": "categorical", "bins": "none"}
+
+# (action name, col_bins_settings, function to run the action given the temp_col_bins_settings)
+action_list = [
+    ("categoric_create_new_bin", categoric_col_bins_settings,
+     lambda settings: InteractiveBinningMachine.categoric_create_new_bin("new", ["EDUCATION", "MEDICAL"], settings)),
+    ("categoric_add_elements", categoric_col_bins_settings,
+     lambda settings: InteractiveBinningMachine.categoric_add_elements("VENTURE", "VENTURE", ["PERSONAL"], settings)),
+    ("categoric_split_bin", categoric_col_bins_settings,
+     lambda settings: InteractiveBinningMachine.categoric_split_bin("VENTURE", "new", ["VENTURE"], InteractiveBinningMachine.categoric_merge_bins(["VENTURE", "PERSONAL"], "VENTURE", settings)[0])),
+    ("categoric_rename_bin", categoric_col_bins_settings,
+     lambda settings: InteractiveBinningMachine.categoric_rename_bin("VENTURE", "new", settings)),
+    ("categoric_merge_bins", categoric_col_bins_settings,
+     lambda settings: InteractiveBinningMachine.categoric_merge_bins(["VENTURE", "PERSONAL"], "new", settings)),
+    ("numeric_create_new_bin", numeric_col_bins_settings,
+     lambda settings: InteractiveBinningMachine.numeric_create_new_bin("new", [[30000, 50000]], settings)),
+    ("get_numeric_adjust_cutpoints", numeric_col_bins_settings,
+     lambda settings: InteractiveBinningMachine.get_numeric_adjust_cutpoints(settings["bins"][0]["name"], "new", [[settings["bins"][0]["ranges"][0][0], 50000]], settings)),
+    ("numeric_rename_bin", numeric_col_bins_settings,
+     lambda settings: InteractiveBinningMachine.numeric_rename_bin(settings["bins"][0]["name"], "new", settings)),
+    ("numeric_merge_bins", numeric_col_bins_settings,
+     lambda settings: InteractiveBinningMachine.numeric_merge_bins([settings["bins"][0]["name"], settings["bins"][1]["name"]], "new", settings)),
+]
+
+
+@pytest.mark.parametrize("col_bins_settings,action", [(col_bins_settings, action) for _, col_bins_settings, action in action_list], ids=[name for name, _, __ in action_list])
+def test_interactive_action(run_benchmark, credit_risk_df, col_bins_settings, action):
+    col_df = credit_risk_df.loc[:, [col_bins_settings["column"]]]
+    temp_col_bins_settings = get_temp_col_bins_settings(credit_risk_df, col_bins_settings)
+
+    # the action changes the bins settings given, so each call is given a copy
+    def run_action(settings):
+        new_settings, _, __ = action(settings)
+        return DataikuBinningMachine.perform_binning_on_col(col_df, new_settings)
+
+    run_benchmark(run_action, setup=lambda: (copy.deepcopy(temp_col_bins_settings),))
+
+
+@pytest.mark.parametrize("col_bins_settings,action", [(col_bins_settings, action) for _, col_bins_settings, action in action_list], ids=[name for name, _, __ in action_list])
+def test_interactive_action_rebin(run_benchmark, credit_risk_df, col_bins_settings, action):
+    temp_col_bins_settings = get_temp_col_bins_settings(credit_risk_df, col_bins_settings)
+    bin_codes = ColBinsPlan(temp_col_bins_settings).get_bin_codes(credit_risk_df[col_bins_settings["column"]])
+    col_value_index = ColValueIndex(credit_risk_df[col_bins_settings["column"]], col_bins_settings["type"])  # built once per column in the web app
+
+    def run_action(settings):
+        old_settings = copy.deepcopy(settings)
+        new_settings, _, __ = action(settings)
+        bins_diff = InteractiveBinningMachine.get_bins_diff(old_settings, new_settings)
+        return InteractiveBinningMachine.rebin_codes(bin_codes, bins_diff, new_settings, col_value_index)
+
+    run_benchmark(run_action, setup=lambda: (copy.deepcopy(temp_col_bins_settings),))
+
+
+good_bad_def = {"bad": {"numerical": [], "categorical": [{"column": "loan_status", "elements": [1]}], "weight": 1}, "indeterminate": {"numerical": [], "categorical": []}, "good": {"weight": 1}}
+
+@pytest.mark.parametrize("use_aggregates", [False, True], ids=["from_rows", "from_aggregates"])
+@pytest.mark.parametrize("col_bins_settings,action", [(col_bins_settings, action) for _, col_bins_settings, action in action_list], ids=[name for name, _, __ in action_list])
+def test_stat_table_after_action(run_benchmark, credit_risk_df, col_bins_settings, action, use_aggregates):
+    temp_col_bins_settings = get_temp_col_bins_settings(credit_risk_df, col_bins_settings)
+    col_plan = ColBinsPlan(temp_col_bins_settings)
+    bin_codes = col_plan.get_bin_codes(credit_risk_df[col_bins_settings["column"]])
+    col_value_index = ColValueIndex(credit_risk_df[col_bins_settings["column"]], col_bins_settings["type"])
+    labels = GoodBadCounter.get_good_bad_labels(credit_risk_df, good_bad_def)  # cached once per good bad definition in the web app
+    aggregates = BinAggregates.from_bin_codes(bin_codes, col_plan.bin_names, labels)
+
+    def run_action(settings):
+        old_settings = copy.deepcopy(settings)
+        new_settings, _, __ = action(settings)
+        if not use_aggregates:
+            return WebAppStatCalculator.compute_summary_stat_table(credit_risk_df, new_settings, good_bad_def, labels)
+        bins_diff = InteractiveBinningMachine.get_bins_diff(old_settings, new_settings)
+        new_bin_codes = InteractiveBinningMachine.rebin_codes(bin_codes, bins_diff, new_settings, col_value_index)
+        new_aggregates = aggregates.apply_bins_diff(bins_diff, bin_codes, new_bin_codes, labels, col_value_index)
+        bin_name_list, label_counts = new_aggregates.get_label_counts(DataikuBinningMachine.MISSING_LABEL)
+        return WebAppStatCalculator.compute_summary_stat_table_from_counts(bin_name_list, label_counts, good_bad_def)
+
+    run_benchmark(run_action, setup=lambda: (copy.deepcopy(temp_col_bins_settings),))
+
+
+numeric_bins_list = [
+    ("equal_width", {"algo": "equal width", "method": "num_bins", "value": 20}),
+    ("equal_freq", {"algo": "equal frequency", "method": "num_bins", "value": 10}),
+    ("custom", [{"name": "low", "ranges": [[0, 30000]]}, {"name": "mid", "ranges": [[30000, 80000]]}, {"name": "high", "ranges": [[80000, 10000000]]}]),
+]
+
+@pytest.mark.parametrize("use_micro_bins", [False, True], ids=["from_rows", "from_micro_bins"])
+@pytest.mark.parametrize("bins", [bins for _, bins in numeric_bins_list], ids=[name for name, _ in numeric_bins_list])
+def test_numeric_stat_table(run_benchmark, credit_risk_df, bins, use_micro_bins):
+    col_bins_settings = {"column": "person_income", "type": "numerical", "bins": bins}
+    labels = GoodBadCounter.get_good_bad_labels(credit_risk_df, good_bad_def)
+    # built once per column & good bad definition in the web app
+    micro_bins = NumericMicroBins.from_col_value_index(ColValueIndex(credit_risk_df["person_income"], "numerical"), labels, is_integer=True)
+
+    def run_binning():
+        if not use_micro_bins:
+            if isinstance(bins, list):
+                return WebAppStatCalculator.compute_summary_stat_table(credit_risk_df, col_bins_settings, good_bad_def, labels)
+            def_li, _ = DataikuBinningMachine.perform_binning_on_col(credit_risk_df.loc[:, ["person_income"]], col_bins_settings)
+            return WebAppStatCalculator.compute_summary_stat_table(credit_risk_df, {"column": "person_income", "type": "numerical", "bins": def_li}, good_bad_def, labels)
+        bin_name_list, label_counts = micro_bins.get_aggregates(col_bins_settings).get_label_counts(DataikuBinningMachine.MISSING_LABEL)
+        return WebAppStatCalculator.compute_summary_stat_table_from_counts(bin_name_list, label_counts, good_bad_def)
+
+    run_benchmark(run_binning)
@@ -0,0 +1,30 @@
+from credit_scoring.stat_calculator import StatCalculator
+from credit_scoring.good_bad_counter import GoodBadCounter
+from credit_scoring.dataiku_compat import DataikuStatCalculator, WebAppStatCalculator
+from credit_scoring.bins_plan import BinsPlan
+from bench_binning_machine import bins_settings_list
+import pytest
+
+"""
+BENCHMARK StatCalculator class
+"""
+
+good_bad_def = {"bad": {"numerical": [{"column": "paid_past_due", "ranges": [[90, 121]]}], "categorical": [], "weight": 1}, "indeterminate": {"numerical": [{"column": "paid_past_due", "ranges": [[60, 90]]}], "categorical": []}, "good": {"weight": 1}}
+
+
+@pytest.mark.parametrize("col_bins_settings", bins_settings_list, ids=[col_bins_settings["column"] for col_bins_settings in bins_settings_list])
+def test_compute_summary_stat_table(run_benchmark, credit_risk_df, col_bins_settings):
+    run_benchmark(lambda: StatCalculator(credit_risk_df, col_bins_settings, good_bad_def).compute_summary_stat_table())
+
+
+# The tables of all columns at once, as in the flow_ib_stat_compute_stat recipe
+def test_compute_summary_stat_tables(run_benchmark, credit_risk_df):
+    bins_plan = BinsPlan(bins_settings_list)
+    run_benchmark(lambda: DataikuStatCalculator.compute_summary_stat_tables(credit_risk_df, bins_plan, good_bad_def))
+
+
+# The table of a column in the web app, with the good/bad labels cached (i.e., GoodBadLabelCache)
+@pytest.mark.parametrize("col_bins_settings", bins_settings_list[:2], ids=[col_bins_settings["column"] for col_bins_settings in bins_settings_list[:2]])
+def test_web_app_compute_summary_stat_table(run_benchmark, credit_risk_df, col_bins_settings):
+    labels = GoodBadCounter.get_good_bad_labels(credit_risk_df, good_bad_def)
+    run_benchmark(lambda: WebAppStatCalculator.compute_summary_stat_table(credit_risk_df, col_bins_settings, good_bad_def, labels))
@@ -0,0 +1,66 @@
+import os
+import sys
+import tracemalloc
+import pytest
+from credit_risk_data_generator import generate_credit_risk_dataset
+
+# The classes to benchmark live in the Dataiku project library (code/code_in_dataiku/lib/python)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "code", "code_in_dataiku", "lib", "python"))
+# The local stand-in of the dataiku package & the flow runner (code/local_dataiku), to benchmark the recipes end to end
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "code", "local_dataiku"))
+
+try:
+    import pytest_benchmark
+except ImportError:  # the benchmarks need pytest-benchmark (pip install pytest-benchmark)
+    collect_ignore_glob = ["bench_*.py"]
+
+# Number of timed rounds for each dataset size, fewer rounds for larger datasets
+ROUNDS_BY_NUM_ROWS = [(10000, 20), (1000000, 3)]
+DEFAULT_ROUNDS = 1
+
+
+def pytest_addoption(parser):
+    parser.addoption("--num-rows", default="10000,1000000",
+                     help="comma-separated sizes of the synthetic datasets to benchmark on, e.g., 10000,1000000,10000000")
+
+
+# Every benchmark taking num_rows is run once for each dataset size
+def pytest_generate_tests(metafunc):
+    if "num_rows" in metafunc.fixturenames:
+        num_rows_list = [int(num_rows) for num_rows in metafunc.config.getoption("--num-rows").split(",")]
+        metafunc.parametrize("num_rows", num_rows_list, ids=[f"{num_rows}_rows" for num_rows in num_rows_list], scope="session")
+
+
+# The synthetic dataset of a size is generated once, and released before generating the dataset of the next size
+@pytest.fixture(scope="session")
+def credit_risk_df(num_rows):
+    return generate_credit_risk_dataset(num_rows)
+
+
+# A fixture to time a function with pytest-benchmark, and record the peak memory allocated by a single call of it
+# setup (optional) returns the arguments of each call (e.g., a copy of the dataset for a function changing its input),
+# it is run outside the timing & the memory tracing
+@pytest.fixture
+def run_benchmark(benchmark, num_rows):
+    def run(func, setup=None):
+        rounds = DEFAULT_ROUNDS
+        for max_num_rows, num_rounds in ROUNDS_BY_NUM_ROWS:
+            if num_rows <= max_num_rows:
+                rounds = num_rounds
+                break
+
+        # Memory is traced in a separate call, as tracing slows down the timed calls
+        args = setup() if setup is not None else tuple()
+        tracemalloc.start()
+        try:
+            func(*args)
+            _, peak_memory = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        benchmark.extra_info["num_rows"] = num_rows
+        benchmark.extra_info["peak_memory_mb"] = round(peak_memory / 2**20, 3)
+
+        if setup is None:
+            return benchmark.pedantic(func, rounds=rounds, iterations=1)
+        return benchmark.pedantic(func, setup=lambda: (setup(), {}), rounds=rounds)
+    return run
@@ -0,0 +1,44 @@
+import numpy as np
+import pandas as pd
+
+# A function to generate a synthetic credit risk dataset with the same columns, dtypes & value ranges as
+# credit_risk_dataset_generated (i.e., the input dataset of the flow), of any number of rows
+# The columns are generated independently (except the loan status, paid past due & loan percent income), so the
+# dataset is only for measuring the runtime & memory of binning, counting & computing statistics at scale
+def generate_credit_risk_dataset(num_rows, seed=0):
+    rng = np.random.default_rng(seed)
+
+    person_income = np.clip(np.round(rng.lognormal(mean=10.9, sigma=0.55, size=num_rows)), 4000, 6000000).astype(np.int64)
+    loan_amnt = np.clip(np.round(rng.gamma(shape=2.2, scale=4400, size=num_rows) / 25) * 25, 500, 35000).astype(np.int64)
+    loan_grade = __choice__(rng, ["A", "B", "C", "D", "E", "F", "G"], [0.33, 0.32, 0.2, 0.11, 0.03, 0.008, 0.002], num_rows)
+
+    # bad rate increases with the loan grade, and a bad loan has been paid 90-120 days past due
+    grade_bad_rate = np.array([0.1, 0.16, 0.21, 0.59, 0.64, 0.7, 0.98])
+    loan_status = (rng.random(num_rows) < grade_bad_rate[np.searchsorted(np.array(["A", "B", "C", "D", "E", "F", "G"]), loan_grade)]).astype(np.int64)
+    paid_past_due = np.where(loan_status == 1, rng.integers(90, 121, num_rows), rng.integers(0, 90, num_rows)).astype(np.int64)
+
+    return pd.DataFrame({
+        "person_age": np.clip(np.round(20 + rng.gamma(shape=2.0, scale=4.0, size=num_rows)), 20, 144).astype(np.int64),
+        "person_income": person_income,
+        "person_home_ownership": __choice__(rng, ["RENT", "MORTGAGE", "OWN", "OTHER"], [0.505, 0.412, 0.08, 0.003], num_rows),
+        "person_emp_length": __with_missing__(rng, np.clip(rng.poisson(4.8, num_rows), 0, 123).astype(float), 0.0275),
+        "loan_intent": __choice__(rng, ["EDUCATION", "MEDICAL", "VENTURE", "PERSONAL", "DEBTCONSOLIDATION", "HOMEIMPROVEMENT"], [0.2, 0.19, 0.17, 0.17, 0.16, 0.11], num_rows),
+        "loan_grade": loan_grade,
+        "loan_amnt": loan_amnt,
+        "loan_int_rate": __with_missing__(rng, np.round(rng.uniform(5.42, 23.22, num_rows), 2), 0.0956),
+        "loan_status": loan_status,
+        "loan_percent_income": np.clip(np.round(loan_amnt / person_income, 2), 0, 0.83),
+        "cb_person_default_on_file": __choice__(rng, ["N", "Y"], [0.82, 0.18], num_rows),
+        "cb_person_cred_hist_length": rng.integers(2, 31, num_rows).astype(np.int64),
+        "paid_past_due": paid_past_due,
+    })
+
+# A function to pick a string value for each row, the values are object dtype (as returned by dataiku.Dataset.get_dataframe)
+def __choice__(rng, value_list, prob_list, num_rows):
+    prob_arr = np.array(prob_list) / np.sum(prob_list)
+    return np.array(value_list, dtype=object)[rng.choice(len(value_list), size=num_rows, p=prob_arr)]
+
+# A function to replace a fraction of the values by NaN
+def __with_missing__(rng, values, missing_fraction):
+    values[rng.random(len(values)) < missing_fraction] = np.nan
+    return values
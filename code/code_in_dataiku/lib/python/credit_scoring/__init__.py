@@ -0,0 +1,17 @@
+# Project library shared by the Dataiku recipes, the web app & the tests
+# BinningMachine & StatCalculator are the binning & statistics engine, and the Dataiku* classes wrap them in the
+# (bins definitions, binned series) format of the recipes & the web app
+from .bins_plan import BinsPlan, ColBinsPlan
+from .quantile_sketch import QuantileSketch
+from .optimal_binning import OptimalBinning
+from .chi_merge import ChiMerge
+from .good_bad_def_decoder import GoodBadDefDecoder
+from .good_bad_def_validator import GoodBadDefValidator
+from .good_bad_counter import GoodBadCounter
+from .binning_machine import BinningMachine
+from .stat_calculator import StatCalculator
+from .dataiku_compat import get_str_from_ranges, DataikuBinningMachine, DataikuStatCalculator, WebAppStatCalculator
+from .interactive_binning_machine import InteractiveBinningMachine, ColValueIndex, decode_ib_ranges
+from .bin_aggregates import BinAggregates
+from .micro_bins import NumericMicroBins
+from .dataset_io import DatasetIO, DatasetFileWriter
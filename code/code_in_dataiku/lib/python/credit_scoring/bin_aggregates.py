@@ -0,0 +1,92 @@
+import numpy as np
+from .good_bad_counter import GoodBadCounter
+
+
+# A class holding the good/bad/indeterminate counts of each bin of a binned column (binned into bin codes, see ColBinsPlan.get_bin_codes),
+# so that the mixed chart & the summary statistics table are computed from the counts instead of the rows, e.g.,
+#   aggregates = BinAggregates.from_bin_codes(bin_codes, bin_names, labels)
+#   bin_name_list, label_counts = aggregates.get_label_counts("Missing")
+#   stat_df = WebAppStatCalculator.compute_summary_stat_table_from_counts(bin_name_list, label_counts, good_bad_def)
+# The counts are updated by the changes of the bins of an interactive binning action (see apply_bins_diff)
+# The rows not in any bin (code -1) are counted in an extra last row, and the first row of each bin is kept
+# to list the bins in the order of appearance, as StatCalculator does
+class BinAggregates:
+    def __init__(self, bin_names, label_counts, first_rows, num_rows) -> None:
+        self.bin_names = list(bin_names)
+        self.label_counts = label_counts  # (number of bins + 1) x 3 sample counts, a column for each label (see GoodBadCounter.GOOD_LABEL)
+        self.first_rows = first_rows  # the first row of each bin (+ the extra last row), num_rows if no row is in the bin
+        self.num_rows = num_rows
+
+    # A method to count the labels of each bin, given the bin code & the good/bad/indeterminate label of each row
+    # (see GoodBadCounter.get_good_bad_labels)
+    @staticmethod
+    def from_bin_codes(bin_codes, bin_names, labels):
+        num_bins = len(bin_names)
+        count_idx = np.where(bin_codes < 0, num_bins, bin_codes)
+        label_counts = np.bincount(count_idx * 3 + labels, minlength=(num_bins + 1) * 3).reshape(num_bins + 1, 3)
+        first_rows = np.full(num_bins + 1, len(bin_codes), dtype=np.int64)
+        np.minimum.at(first_rows, count_idx, np.arange(len(bin_codes)))
+        return BinAggregates(bin_names, label_counts, first_rows, len(bin_codes))
+
+    # A method to get the counts after an interactive binning action, given the changes of the bins (see InteractiveBinningMachine.get_bins_diff),
+    # the bin codes before & after the action (see InteractiveBinningMachine.rebin_codes), the labels & the ColValueIndex of the column
+    # The counts of renamed & merged bins are moved/summed by the code map, and only the rows holding moved values are counted again
+    # Return a new BinAggregates (this one is not changed)
+    def apply_bins_diff(self, bins_diff, old_bin_codes, new_bin_codes, labels, col_value_index):
+        num_bins = len(bins_diff["new_bin_names"])
+        code_map = np.array(bins_diff["code_map"], dtype=np.int64)
+        count_map = np.append(np.where(code_map < 0, num_bins, code_map), num_bins)  # the extra last row stays the last row
+
+        label_counts = np.zeros((num_bins + 1, 3), dtype=np.int64)
+        np.add.at(label_counts, count_map, self.label_counts)
+        first_rows = np.full(num_bins + 1, self.num_rows, dtype=np.int64)
+        np.minimum.at(first_rows, count_map, self.first_rows)
+
+        moved_rows = col_value_index.get_moved_rows(bins_diff)
+        if len(moved_rows) > 0:
+            # the moved rows are counted in the bin given by the code map, so they are taken from there & put into their new bin
+            old_count_idx = count_map[old_bin_codes[moved_rows]]  # code -1 picks the extra last row
+            new_count_idx = np.where(new_bin_codes[moved_rows] < 0, num_bins, new_bin_codes[moved_rows])
+            moved_labels = labels[moved_rows]
+            label_counts -= np.bincount(old_count_idx * 3 + moved_labels, minlength=(num_bins + 1) * 3).reshape(num_bins + 1, 3)
+            label_counts += np.bincount(new_count_idx * 3 + moved_labels, minlength=(num_bins + 1) * 3).reshape(num_bins + 1, 3)
+            np.minimum.at(first_rows, new_count_idx, moved_rows)
+
+            # a bin whose first row has moved out is searched for its new first row
+            for count_idx in np.unique(old_count_idx).tolist():
+                first_row = first_rows[count_idx]
+                if first_row == self.num_rows:
+                    continue
+                bin_code = count_idx if count_idx < num_bins else -1
+                if label_counts[count_idx].sum() == 0:
+                    first_rows[count_idx] = self.num_rows
+                elif new_bin_codes[first_row] != bin_code:
+                    first_rows[count_idx] = int(np.argmax(new_bin_codes == bin_code))
+
+        return BinAggregates(bins_diff["new_bin_names"], label_counts, first_rows, self.num_rows)
+
+    # A method to get the bins in the order of appearance and the label counts of each bin, as StatCalculator counts a binned column
+    # labelled with the bin names (and missing_label for the rows not in any bin), i.e., bins without rows are not listed,
+    # bins of the same label are counted as a single bin, and label_counts has an extra last row of zeros
+    # Return a tuple (bin_name_list, label_counts)
+    def get_label_counts(self, missing_label=None):
+        bin_name_list = list()
+        count_list = list()
+        position_dict = dict()
+        for count_idx in np.argsort(self.first_rows, kind="stable").tolist():
+            if self.first_rows[count_idx] == self.num_rows:
+                break
+            bin_name = self.bin_names[count_idx] if count_idx < len(self.bin_names) else missing_label
+            if bin_name in position_dict:
+                count_list[position_dict[bin_name]] = count_list[position_dict[bin_name]] + self.label_counts[count_idx]
+                continue
+            position_dict[bin_name] = len(bin_name_list)
+            bin_name_list.append(bin_name)
+            count_list.append(self.label_counts[count_idx])
+        count_list.append(np.zeros(3, dtype=np.int64))
+        return (bin_name_list, np.vstack(count_list))
+
+    # A method to get the total sample good, bad & indeterminate counts of all rows
+    def get_total_counts(self):
+        total_counts = self.label_counts.sum(axis=0)
+        return (int(total_counts[GoodBadCounter.GOOD_LABEL]), int(total_counts[GoodBadCounter.BAD_LABEL]), int(total_counts[GoodBadCounter.INDETERMINATE_LABEL]))
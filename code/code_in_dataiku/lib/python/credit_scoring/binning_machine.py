@@ -0,0 +1,659 @@
+import pandas as pd
+import numpy as np
+from decimal import Decimal
+from .quantile_sketch import QuantileSketch
+from .bins_plan import BinsPlan, ColBinsPlan
+from .optimal_binning import OptimalBinning
+from .chi_merge import ChiMerge
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+# A class for performing binning based on bins settings
+class BinningMachine:
+    # Automated binning algorithms using the good/bad/indeterminate label of each row, which are not binned chunk by chunk
+    SUPERVISED_ALGO_LIST = ["optimal", "chi merge"]
+
+    # Perform equal width binning based on a specified width (for numerical column only)
+    # min_val & max_val of the whole column can be given when col_df is only a chunk of the column
+    @staticmethod
+    def perform_eq_width_binning_by_width(col_df, width, as_category=False, min_val=None, max_val=None):
+        if len(col_df) == 0:
+            return -1
+        if col_df.isna().all().all():
+            return pd.Series([None for _ in range(len(col_df))])
+        if not pd.api.types.is_numeric_dtype(col_df.iloc[:, 0]): # Cannot be categorical type
+            return -1
+        if not (isinstance(width, int) or isinstance(width, float)) or width <= 0: # width cannot be non-numeric
+            return -1
+        
+        min = float(col_df.iloc[:, 0].min()) if min_val is None else float(min_val)
+        max = float(col_df.iloc[:, 0].max()) if max_val is None else float(max_val)
+        bin_ranges = BinningMachine.get_eq_width_bin_ranges_by_width(min, max, width)
+        
+        bin_codes = BinningMachine.get_eq_width_bin_codes(col_df, bin_ranges, min, width)
+        bin_name_list = [f"[{bin_range[0]}, {bin_range[1]})" for bin_range in bin_ranges]
+        return BinningMachine.get_binned_series_from_codes(bin_codes, bin_name_list, as_category=as_category)
+    
+    # A method to perform equal width binning based on a specified number of bins
+    # min_val & max_val of the whole column can be given when col_df is only a chunk of the column
+    @staticmethod
+    def perform_eq_width_binning_by_num_bins(col_df, num_bins, as_category=False, min_val=None, max_val=None):
+        if len(col_df) == 0:
+            return -1
+        if col_df.isna().all().all():
+            return pd.Series([None for _ in range(len(col_df))])
+        if not pd.api.types.is_numeric_dtype(col_df.iloc[:, 0]): # Cannot be categorical type
+            return -1
+        if not isinstance(num_bins, int) or num_bins <= 0:
+            return -1
+        
+        min = float(col_df.iloc[:, 0].min()) if min_val is None else float(min_val)
+        max = float(col_df.iloc[:, 0].max()) if max_val is None else float(max_val)
+        width = (max - min) / num_bins
+        bin_ranges = BinningMachine.get_eq_width_bin_ranges_by_num_bins(min, max, num_bins)
+        
+        bin_codes = BinningMachine.get_eq_width_bin_codes(col_df, bin_ranges, min, width)
+        bin_name_list = [f"[{bin_range[0]}, {bin_range[1]})" for bin_range in bin_ranges]
+        return BinningMachine.get_binned_series_from_codes(bin_codes, bin_name_list, as_category=as_category)
+    
+    # A method to get the ranges of equal-width bins of a specified width, from min to max (inclusive)
+    @staticmethod
+    def get_eq_width_bin_ranges_by_width(min_val, max_val, width):
+        num_bins = int(np.ceil((max_val - min_val) / width)) + 1
+        
+        bin_edges = list()
+        for i in range(num_bins):
+            bin_edges.append(float(Decimal(str(min_val)) + Decimal(str(width)) * i))
+        
+        return [[edge, float(Decimal(str(edge))+Decimal(str(width)))] for edge in bin_edges]
+    
+    # A method to get the ranges of a specified number of equal-width bins, from min to max (inclusive)
+    @staticmethod
+    def get_eq_width_bin_ranges_by_num_bins(min_val, max_val, num_bins):
+        width = (max_val - min_val) / num_bins
+        add_to_last_width = Decimal(str(width * 0.01)) # to include max value
+        
+        bin_edges = list()
+        for i in range(num_bins):
+            bin_edges.append(float(Decimal(str(min_val)) + Decimal(str(width)) * i))
+        
+        bin_ranges = [[edge, float(Decimal(str(edge))+Decimal(str(width)))] for edge in bin_edges]
+        bin_ranges[len(bin_ranges)-1][1] = float(Decimal(str(add_to_last_width)) + Decimal(str(bin_ranges[len(bin_ranges)-1][1])))
+        return bin_ranges
+    
+    # A method to get the bin code of each row of a numerical column for equal-width bins (-1 if not in any bin)
+    # The bin is computed arithmetically as floor((x - min) / width), then checked against the bin edges so that
+    # a value lying right on an edge still goes to the same bin as the linear scan over bin_ranges
+    @staticmethod
+    def get_eq_width_bin_codes(col_df, bin_ranges, min_val, width):
+        values = col_df.iloc[:, 0].to_numpy(dtype=float)
+        lower_edges = np.array([bin_range[0] for bin_range in bin_ranges], dtype=float)
+        upper_edges = np.array([bin_range[1] for bin_range in bin_ranges], dtype=float)
+        num_bins = len(bin_ranges)
+        
+        with np.errstate(invalid="ignore"):
+            bin_codes = np.floor((values - min_val) / width)
+        bin_codes = np.clip(np.nan_to_num(bin_codes), 0, num_bins - 1).astype(np.int64)
+        arithmetic_bin_codes = bin_codes.copy()
+        
+        prev_bin_codes = np.maximum(bin_codes - 1, 0)
+        is_exact = (lower_edges[bin_codes] <= values) & (values < upper_edges[bin_codes])
+        is_exact &= ~((bin_codes > 0) & (lower_edges[prev_bin_codes] <= values) & (values < upper_edges[prev_bin_codes]))
+        
+        # rounding error (or NaN), fall back to a binary search for the first bin whose upper edge is above the value
+        bin_codes[~is_exact] = np.searchsorted(upper_edges, values[~is_exact], side="right")
+        is_in_bin = bin_codes < num_bins
+        is_in_bin[is_in_bin] = lower_edges[bin_codes[is_in_bin]] <= values[is_in_bin]
+        bin_codes[~is_in_bin] = -1
+        
+        # the Decimal edges can leave a gap of a few ulps between 2 adjacent bins, keep such values in the arithmetic bin
+        is_in_gap = ~is_in_bin & (values >= lower_edges[0]) & (values < upper_edges[-1])
+        bin_codes[is_in_gap] = arithmetic_bin_codes[is_in_gap]
+        
+        return bin_codes
+    
+    # A method to perform equal frequency binning based on a specified frequency
+    @staticmethod
+    def perform_eq_freq_binning_by_freq(col_df, freq):
+        if len(col_df) == 0:
+            return -1
+        if col_df.isna().all().all():
+            return pd.Series([None for _ in range(len(col_df))])
+        if not pd.api.types.is_numeric_dtype(col_df.iloc[:, 0]): # Cannot be categorical type
+            return -1
+        if not isinstance(freq, int) or freq <= 0 or freq > len(col_df):
+            return -1
+        
+        
+        num_bins = int(np.ceil(len(col_df)/freq))
+        # print(num_bins)
+        # if num_bins == 1: 
+        #     print(type(col_df.iloc[:, 0]))
+        #     return col_df.iloc[:, 0]
+        
+        # bin the col_df
+        interval_list, bin_codes = BinningMachine.get_eq_freq_bin_codes(col_df, num_bins)
+        bin_name_list = [f"[{interval.left}, {interval.right})" for interval in interval_list]
+        return BinningMachine.get_binned_series_from_codes(bin_codes, bin_name_list)
+    
+    # A method to perform equal-frequency binning based on a specified number of bins
+    @staticmethod
+    def perform_eq_freq_binning_by_num_bins(col_df, num_bins):
+        if len(col_df) == 0:
+            return -1
+        if col_df.isna().all().all():
+            return pd.Series([None for _ in range(len(col_df))])
+        if not pd.api.types.is_numeric_dtype(col_df.iloc[:, 0]): # Cannot be categorical type
+            return -1
+        if not isinstance(num_bins, int) or num_bins <= 0:
+            return -1
+        
+        interval_list, bin_codes = BinningMachine.get_eq_freq_bin_codes(col_df, num_bins)
+        bin_name_list = [f"[{interval.left}, {interval.right})" for interval in interval_list]
+        return BinningMachine.get_binned_series_from_codes(bin_codes, bin_name_list)
+    
+    # A method to perform optimal binning (see OptimalBinning), i.e., the bins maximizing the IV of the column,
+    # given the good/bad/indeterminate label of each row (see GoodBadCounter.get_good_bad_labels)
+    @staticmethod
+    def perform_optimal_binning(col_df, labels, auto_bins, as_category=False):
+        if len(col_df) == 0:
+            return -1
+        if col_df.isna().all().all():
+            return pd.Series([None for _ in range(len(col_df))])
+        if not pd.api.types.is_numeric_dtype(col_df.iloc[:, 0]): # Cannot be categorical type
+            return -1
+        if labels is None or len(labels) != len(col_df): # the labels of the rows are needed
+            return -1
+        
+        values, cum_label_counts, missing_label_counts = OptimalBinning.get_value_label_counts(col_df.iloc[:, 0], labels)
+        bin_ranges = OptimalBinning.get_bin_ranges(values, cum_label_counts, auto_bins, missing_label_counts)
+        if bin_ranges == -1:
+            return -1
+        
+        bin_codes = BinningMachine.get_bin_codes_from_ranges(col_df, bin_ranges)
+        bin_name_list = [f"[{bin_range[0]}, {bin_range[1]})" for bin_range in bin_ranges]
+        return BinningMachine.get_binned_series_from_codes(bin_codes, bin_name_list, as_category=as_category)
+    
+    # A method to perform ChiMerge binning (see ChiMerge) on a numerical or categorical column, i.e., adjacent bins of similar
+    # good/bad distributions are merged, given the good/bad/indeterminate label of each row (see GoodBadCounter.get_good_bad_labels)
+    @staticmethod
+    def perform_chi_merge_binning(col_df, labels, auto_bins, col_type="numerical", as_category=False):
+        if len(col_df) == 0:
+            return -1
+        if col_df.isna().all().all():
+            return pd.Series([None for _ in range(len(col_df))])
+        if col_type == "numerical" and not pd.api.types.is_numeric_dtype(col_df.iloc[:, 0]): # Cannot be categorical type
+            return -1
+        if labels is None or len(labels) != len(col_df): # the labels of the rows are needed
+            return -1
+        
+        if col_type != "numerical":
+            bins_settings, bin_codes = BinningMachine.get_chi_merge_categorical_bins(col_df, labels, auto_bins)
+            if bins_settings == -1:
+                return -1
+            return BinningMachine.get_binned_series_from_codes(bin_codes, [a_bin["name"] for a_bin in bins_settings], as_category=as_category)
+        
+        values, cum_label_counts, _ = OptimalBinning.get_value_label_counts(col_df.iloc[:, 0], labels)
+        bin_ranges = ChiMerge.get_bin_ranges(values, cum_label_counts, auto_bins)
+        if bin_ranges == -1:
+            return -1
+        
+        bin_codes = BinningMachine.get_bin_codes_from_ranges(col_df, bin_ranges)
+        bin_name_list = [f"[{bin_range[0]}, {bin_range[1]})" for bin_range in bin_ranges]
+        return BinningMachine.get_binned_series_from_codes(bin_codes, bin_name_list, as_category=as_category)
+    
+    # A method to get the categorical bins of ChiMerge binning (in ascending bad rate), each named by its elements,
+    # and the bin code of each row (-1 if missing) from the element codes of the rows, so that the column is not looked up again
+    # Return a tuple (bins settings, bin codes), or (-1, -1) if error occurs
+    @staticmethod
+    def get_chi_merge_categorical_bins(col_df, labels, auto_bins):
+        elements, label_counts, _, element_codes = ChiMerge.get_element_label_counts(col_df.iloc[:, 0], labels)
+        element_bin_codes = ChiMerge.get_element_bin_codes(label_counts, auto_bins)
+        if isinstance(element_bin_codes, int):
+            return (-1, -1)
+        
+        bins_settings = list()
+        for bin_code in range(int(element_bin_codes.max()) + 1):
+            element_li = [elements[idx] for idx in np.flatnonzero(element_bin_codes == bin_code).tolist()]
+            bins_settings.append({"name": ", ".join([str(element) for element in element_li]), "elements": element_li})
+        bin_codes = np.where(element_codes >= 0, element_bin_codes[element_codes], -1)
+        return (bins_settings, bin_codes)
+    
+    # A method to get the bin code of each row of a numerical column for a list of [lower, upper] bin ranges (-1 if not in any bin)
+    @staticmethod
+    def get_bin_codes_from_ranges(col_df, bin_ranges):
+        bins_index = BinningMachine.compile_numerical_bins_index([{"name": idx, "ranges": [bin_range]} for idx, bin_range in enumerate(bin_ranges)])
+        return BinningMachine.get_numerical_bin_codes(col_df, bins_index)
+    
+    # A method to get the equal-frequency intervals (by pd.qcut) of a numerical column, and the interval code of each row (-1 if missing)
+    @staticmethod
+    def get_eq_freq_bin_codes(col_df, num_bins):
+        interval_series = pd.qcut(col_df.iloc[:, 0], num_bins, duplicates="drop")
+        interval_list = interval_series.cat.categories.to_list()
+        bin_codes = interval_series.cat.codes.to_numpy().astype(np.int64)
+        
+        # no interval if the column has a single unique value, then every row is put in [value, value + 1)
+        if not (bin_codes >= 0).any():
+            value = float(col_df.iloc[:, 0].dropna().iloc[0])
+            interval_list = [pd.Interval(value, value+1)]
+            bin_codes = np.zeros(len(col_df), dtype=np.int64)
+        
+        return (interval_list, bin_codes)
+    
+    # A method to compute equal-frequency bin edges for a numerical column which is read chunk by chunk
+    # (e.g., from dataiku.Dataset.iter_dataframes), either based on a specified frequency or a specified number of bins
+    @staticmethod
+    def get_eq_freq_edges_from_chunks(chunks, freq=None, num_bins=None, k=200, max_exact_values=QuantileSketch.DEFAULT_MAX_EXACT_VALUES):
+        """
+        chunks is an iterable of single column pd.DataFrame, the edges are exact (the same as pd.qcut) if the column has at most
+        max_exact_values non-missing values (see QuantileSketch), the output is in the form of:
+        {
+            "edges": [0.0, 6.333, 9.667, 101.0],
+            "rank_error_bound": 0,  # max number of rows by which the rank of each edge may differ from the exact pd.qcut edge (with probability 99%)
+            "relative_rank_error_bound": 0.0,  # rank_error_bound as a fraction of the number of non-missing rows
+        }
+        """
+        sketch = QuantileSketch(k, max_exact_values=max_exact_values)
+        num_rows = 0
+        for chunk_df in chunks:
+            if len(chunk_df) == 0:
+                continue
+            if not pd.api.types.is_numeric_dtype(chunk_df.iloc[:, 0]) and not chunk_df.isna().all().all(): # Cannot be categorical type
+                return -1
+            num_rows += len(chunk_df)
+            sketch.update(chunk_df.iloc[:, 0].to_numpy(dtype=float))
+        
+        if num_rows == 0:
+            return -1
+        if freq is not None:
+            if not isinstance(freq, int) or freq <= 0 or freq > num_rows:
+                return -1
+            num_bins = int(np.ceil(num_rows/freq))
+        if not isinstance(num_bins, int) or num_bins <= 0:
+            return -1
+        
+        if sketch.count == 0: # all missing
+            edges = list()
+        else:
+            edges = sorted(set(sketch.get_quantiles(np.linspace(0, 1, num_bins + 1)))) # same as duplicates="drop" of pd.qcut
+        
+        return {
+            "edges": edges,
+            "rank_error_bound": sketch.rank_error_bound,
+            "relative_rank_error_bound": sketch.get_relative_rank_error_bound(),
+        }
+    
+    # A method to perform equal-frequency binning on a column (or a chunk of it) based on pre-computed bin edges
+    @staticmethod
+    def perform_eq_freq_binning_by_edges(col_df, edges, as_category=False):
+        if len(col_df) == 0:
+            return -1
+        if col_df.isna().all().all() or len(edges) == 0:
+            return pd.Series([None for _ in range(len(col_df))])
+        if not pd.api.types.is_numeric_dtype(col_df.iloc[:, 0]): # Cannot be categorical type
+            return -1
+        
+        interval_list, bin_codes = BinningMachine.get_eq_freq_bin_codes_by_edges(col_df, edges)
+        bin_name_list = [f"[{interval.left}, {interval.right})" for interval in interval_list]
+        return BinningMachine.get_binned_series_from_codes(bin_codes, bin_name_list, as_category=as_category)
+    
+    # A method to get the equal-frequency intervals of a numerical column (or a chunk of it) from pre-computed bin edges, 
+    # and the interval code of each row (-1 if missing)
+    @staticmethod
+    def get_eq_freq_bin_codes_by_edges(col_df, edges):
+        if len(edges) == 1: # single unique value, same as the pd.qcut path
+            interval_list = [pd.Interval(float(edges[0]), float(edges[0])+1)]
+            bin_codes = np.where(col_df.iloc[:, 0].isna().to_numpy(), -1, 0)
+            return (interval_list, bin_codes)
+        
+        # pd.qcut is pd.cut on the quantile edges with include_lowest=True, so the bins are labelled the same way
+        interval_series = pd.cut(col_df.iloc[:, 0], bins=edges, include_lowest=True, duplicates="drop")
+        return (interval_series.cat.categories.to_list(), interval_series.cat.codes.to_numpy().astype(np.int64))
+    
+    # A method to fix the bins of the auto-binned numerical columns by a first pass over all chunks of a dataset (e.g., from 
+    # dataiku.Dataset.iter_dataframes), so that each chunk can then be binned on its own with the same bins as binning the whole dataset at once
+    # The bins settings of such columns are given the "min" & "max" of the whole column, and also the "edges" if equal frequency
+    @staticmethod
+    def get_fixed_bins_plan_from_chunks(chunks, bins_settings_list, k=200, max_exact_values=QuantileSketch.DEFAULT_MAX_EXACT_VALUES):
+        """
+        bins_settings_list is a list of bins settings or a BinsPlan, the equal-frequency edges are exact if the column has at most
+        max_exact_values non-missing values (see QuantileSketch), the output is a BinsPlan, e.g., 
+        {"column": "person_age", "type": "numerical", "bins": {"algo": "equal width", "method": "num_bins", "value": 5}}
+        is fixed to:
+        {"column": "person_age", "type": "numerical", "bins": {"algo": "equal width", "method": "num_bins", "value": 5, "min": 20.0, "max": 144.0}}
+        """
+        bins_plan = bins_settings_list if isinstance(bins_settings_list, BinsPlan) else BinsPlan(bins_settings_list)
+        # supervised algorithms are left as they are, as their bins depend on the labels of the rows (see DataikuBinningMachine.get_supervised_fixed_bins_plan)
+        auto_col_list = [col_plan.column for col_plan in bins_plan if col_plan.type == "numerical" and isinstance(col_plan.bins, dict)
+                         and col_plan.bins.get("algo") not in BinningMachine.SUPERVISED_ALGO_LIST]
+        
+        # Collect the min, max, number of rows & the quantile sketch of each auto-binned column
+        col_info_dict = {col: {"min": None, "max": None, "num_rows": 0, "sketch": QuantileSketch(k, max_exact_values=max_exact_values), "is_numeric": True} for col in auto_col_list}
+        for chunk_df in chunks:
+            for col in auto_col_list:
+                if col not in chunk_df.columns or len(chunk_df) == 0:
+                    continue
+                col_info = col_info_dict[col]
+                col_info["num_rows"] += len(chunk_df)
+                if chunk_df[col].isna().all():
+                    continue
+                if not pd.api.types.is_numeric_dtype(chunk_df[col]): # Cannot be categorical type
+                    col_info["is_numeric"] = False
+                    continue
+                values = chunk_df[col].to_numpy(dtype=float)
+                chunk_min = float(np.nanmin(values))
+                chunk_max = float(np.nanmax(values))
+                col_info["min"] = chunk_min if col_info["min"] is None else min(col_info["min"], chunk_min)
+                col_info["max"] = chunk_max if col_info["max"] is None else max(col_info["max"], chunk_max)
+                if bins_plan.get(col).bins["algo"] != "equal width":
+                    col_info["sketch"].update(values)
+        
+        fixed_bins_settings_list = list()
+        for col_plan in bins_plan:
+            col_bins_settings = col_plan.get_col_bins_settings()
+            col_info = col_info_dict.get(col_plan.column)
+            # the column is left as it is if it is all missing or not numerical, then it is binned with the same result (or error) chunk by chunk
+            if col_info is not None and col_info["is_numeric"] and col_info["min"] is not None:
+                bins = dict(col_bins_settings["bins"])
+                bins["min"] = col_info["min"]
+                bins["max"] = col_info["max"]
+                if bins["algo"] != "equal width":
+                    num_bins = bins["value"]
+                    if bins["method"] == "freq":
+                        num_bins = int(np.ceil(col_info["num_rows"]/bins["value"])) if isinstance(bins["value"], int) and 0 < bins["value"] <= col_info["num_rows"] else None
+                    if isinstance(num_bins, int) and num_bins > 0:
+                        bins["edges"] = sorted(set(col_info["sketch"].get_quantiles(np.linspace(0, 1, num_bins + 1)))) # same as duplicates="drop" of pd.qcut
+                col_bins_settings["bins"] = bins
+            fixed_bins_settings_list.append(col_bins_settings)
+        
+        return BinsPlan(fixed_bins_settings_list)
+    
+    # A method to compile the bins settings of a categorical column into a lookup table from element to bin code
+    @staticmethod
+    def compile_categorical_bins_index(bins_settings):
+        """
+        bins_settings = [{"name": "good", "elements": ["A", "B"]}, {"name": "poor", "elements": ["E"]}]
+        is compiled to:
+        {
+            "element_codes": {"A": 0, "B": 0, "E": 1},
+            "bin_names": ["good", "poor"],
+        }
+        """
+        element_codes, bin_name_list = ColBinsPlan.compile_categorical_bins(bins_settings)
+        return {"element_codes": element_codes, "bin_names": bin_name_list}
+
+    # A method to get the bin code of each row of a categorical column using a compiled lookup table (-1 if not in any bin)
+    @staticmethod
+    def get_categorical_bin_codes(col_df, bins_index):
+        return ColBinsPlan.lookup_categorical_bin_codes(col_df.iloc[:, 0], bins_index["element_codes"])
+
+    # A method to perform custom binning for a categorical column, bins_settings can also be a compiled ColBinsPlan
+    @staticmethod
+    def perform_categorical_custom_binning(col_df, bins_settings, as_category=False):
+        if len(col_df) == 0:
+            return -1
+        if isinstance(bins_settings, ColBinsPlan):
+            return BinningMachine.get_binned_series_from_plan(col_df, bins_settings, as_category=as_category)
+
+        bins_index = BinningMachine.compile_categorical_bins_index(bins_settings)
+        bin_codes = BinningMachine.get_categorical_bin_codes(col_df, bins_index)
+
+        return BinningMachine.get_binned_series_from_codes(bin_codes, bins_index["bin_names"], as_category=as_category)
+    
+    # A method to compile the bins settings of a numerical column into an interval index, i.e. the sorted edges of all ranges
+    # and the code of the bin which each gap between 2 adjacent edges belongs to (-1 if the gap is not in any bin)
+    @staticmethod
+    def compile_numerical_bins_index(bins_settings):
+        """
+        bins_settings = [{"name": "good", "ranges": [[10, 20], [25, 50]]}, {"name": "poor", "ranges": [[80, 100]]}]
+        is compiled to:
+        {
+            "edges": array([10., 20., 25., 50., 80., 100.]),
+            "codes": array([0, -1, 0, -1, 1]),
+            "bin_names": ["good", "poor"],
+        }
+        """
+        edges, codes, bin_name_list = ColBinsPlan.compile_numerical_bins(bins_settings)
+        return {"edges": edges, "codes": codes, "bin_names": bin_name_list}
+
+    # A method to get the bin code of each row of a numerical column using a compiled interval index (-1 if not in any bin)
+    @staticmethod
+    def get_numerical_bin_codes(col_df, bins_index):
+        return ColBinsPlan.lookup_numerical_bin_codes(col_df.iloc[:, 0].to_numpy(dtype=float), bins_index["edges"], bins_index["codes"])
+
+    # A method to translate bin codes to a pd.Series of bin names, rows with code -1 are labelled as missing_label
+    @staticmethod
+    def get_binned_series_from_codes(bin_codes, bin_name_list, missing_label=None, as_category=False):
+        if as_category:
+            if missing_label is None:
+                return pd.Series(pd.Categorical.from_codes(bin_codes, categories=bin_name_list))
+            categories = list(bin_name_list)
+            if missing_label not in categories:
+                categories.append(missing_label)
+            bin_codes = np.where(bin_codes == -1, categories.index(missing_label), bin_codes)
+            return pd.Series(pd.Categorical.from_codes(bin_codes, categories=categories))
+
+        # the extra last label is picked by code -1
+        label_arr = np.empty(len(bin_name_list) + 1, dtype=object)
+        for idx in range(len(bin_name_list)):
+            label_arr[idx] = bin_name_list[idx]
+        label_arr[-1] = missing_label
+        return pd.Series(label_arr[bin_codes])
+
+    # A method to perform custom binning on a column using the lookup tables compiled in a ColBinsPlan
+    @staticmethod
+    def get_binned_series_from_plan(col_df, col_plan, missing_label=None, as_category=False):
+        bin_codes = col_plan.get_bin_codes(col_df.iloc[:, 0])
+        if as_category:
+            return BinningMachine.get_binned_series_from_codes(bin_codes, col_plan.bin_names, missing_label=missing_label, as_category=True)
+        return pd.Series(col_plan.get_label_table(missing_label)[bin_codes])
+
+    # A method to perform custom binning for a numerical column, bins_settings can also be a compiled ColBinsPlan
+    @staticmethod
+    def perform_numerical_custom_binning(col_df, bins_settings, as_category=False):
+        if len(col_df) == 0:
+            return -1
+        if isinstance(bins_settings, ColBinsPlan):
+            return BinningMachine.get_binned_series_from_plan(col_df, bins_settings, as_category=as_category)
+
+        bins_index = BinningMachine.compile_numerical_bins_index(bins_settings)
+        bin_codes = BinningMachine.get_numerical_bin_codes(col_df, bins_index)
+
+        return BinningMachine.get_binned_series_from_codes(bin_codes, bins_index["bin_names"], as_category=as_category)
+    
+    # A method to perform binning (equal-width/equal-frequency/optimal/chi merge/custom) for a single column (either categorical or numerical)
+    # col_bins_settings can also be a ColBinsPlan, or a BinsPlan (the plan of the column of col_df is used)
+    # labels (optional) is the good/bad/indeterminate label of each row of col_df, needed by supervised algorithms (e.g., optimal)
+    @staticmethod
+    def perform_binning_on_col(col_df, col_bins_settings, labels=None):
+        """
+        col_bins_settings is in the form of: 
+        {
+            "column": "person_income",
+            "type": "numerical",
+            "info_val": 0.11,
+            "bins": [
+                {
+                    "name": "0-9999, 30000-39999",
+                    "ranges": [[0, 9999], [30000, 39999]],
+                },
+                {
+                    "name": "20000-29999",
+                    "ranges": [[20000, 29999]],
+                },
+            ],
+        }
+        """
+        if isinstance(col_bins_settings, BinsPlan):
+            col_bins_settings = col_bins_settings.get(col_df.columns[0])
+            if col_bins_settings is None:
+                return -1
+        
+        if col_bins_settings["bins"] == "none":
+            if len(col_df) == 0:
+                return -1
+            return col_df.iloc[:, 0] # no binning
+        elif isinstance(col_bins_settings["bins"], dict):  # auto binning
+            if col_bins_settings["bins"]["algo"] == "optimal":
+                if col_bins_settings["type"] == "numerical":
+                    return BinningMachine.perform_optimal_binning(col_df, labels, col_bins_settings["bins"])
+                else:
+                    return -1
+            elif col_bins_settings["bins"]["algo"] == "chi merge": # both numerical & categorical
+                return BinningMachine.perform_chi_merge_binning(col_df, labels, col_bins_settings["bins"], col_type=col_bins_settings["type"])
+            elif col_bins_settings["bins"]["algo"] == "equal width":
+                # min & max of the whole column are fixed in the bins settings if binning chunk by chunk
+                min_val = col_bins_settings["bins"].get("min")
+                max_val = col_bins_settings["bins"].get("max")
+                if col_bins_settings["bins"]["method"] == "width":
+                    if col_bins_settings["type"] == "numerical":
+                        return BinningMachine.perform_eq_width_binning_by_width(col_df, col_bins_settings["bins"]["value"], min_val=min_val, max_val=max_val)
+                    else:
+                        return -1
+                else: # by num of bins
+                    if col_bins_settings["type"] == "numerical":
+                        return BinningMachine.perform_eq_width_binning_by_num_bins(col_df, col_bins_settings["bins"]["value"], min_val=min_val, max_val=max_val)
+                    else:
+                        return -1
+            elif "edges" in col_bins_settings["bins"]: # equal frequency with edges fixed by the whole column, if binning chunk by chunk
+                if col_bins_settings["type"] == "numerical":
+                    return BinningMachine.perform_eq_freq_binning_by_edges(col_df, col_bins_settings["bins"]["edges"])
+                else:
+                    return -1
+            else: # equal frequency
+                if col_bins_settings["bins"]["method"] == "freq":
+                    if col_bins_settings["type"] == "numerical":
+                        return BinningMachine.perform_eq_freq_binning_by_freq(col_df, col_bins_settings["bins"]["value"])
+                    else:
+                        return -1
+                else: # by num of bins
+                    if col_bins_settings["type"] == "numerical":
+                        return BinningMachine.perform_eq_freq_binning_by_num_bins(col_df, col_bins_settings["bins"]["value"])
+                    else:
+                        return -1
+        else: # custom binning, use the compiled lookup tables if given a plan
+            bins_settings = col_bins_settings if isinstance(col_bins_settings, ColBinsPlan) else col_bins_settings["bins"]
+            if col_bins_settings["type"] == "numerical":
+                return BinningMachine.perform_numerical_custom_binning(col_df, bins_settings)
+            else:
+                return BinningMachine.perform_categorical_custom_binning(col_df, bins_settings)
+    
+    # A method that perform binning (equal-width/equal-frequency/custom) for the whole dataframe (can contain numerical/categorical columns)
+    # bins_settings_list can also be a BinsPlan, then the compiled lookup tables are used
+    # If num_workers > 1 (or a ProcessPoolExecutor is given, e.g., kept to bin many chunks), the columns are binned in parallel by a process pool
+    @staticmethod
+    def perform_binning_on_whole_df(dframe, bins_settings_list, num_workers=None, executor=None):
+        if len(dframe) == 0:
+            return dframe
+        
+        # Find col_bins_settings of each column once (the first bins settings of the column is used)
+        col_bins_settings_dict = dict()
+        for bins_settings in bins_settings_list:
+            if bins_settings["column"] not in col_bins_settings_dict:
+                col_bins_settings_dict[bins_settings["column"]] = bins_settings
+        
+        # if no bins settings for the column, skip it
+        col_list = [col for col in dframe.columns if col in col_bins_settings_dict]
+        
+        if (executor is not None or (num_workers is not None and num_workers > 1)) and len(col_list) > 1:
+            binned_series_dict = BinningMachine.perform_binning_on_cols_in_parallel(dframe, col_list, col_bins_settings_dict, num_workers, executor=executor)
+        else:
+            binned_series_dict = dict()
+            for col in col_list:
+                binned_series_dict[col] = BinningMachine.perform_binning_on_col(dframe.loc[:, [col]], col_bins_settings_dict[col])
+        
+        for col in col_list:
+            binned_series = binned_series_dict[col]
+            if not isinstance(binned_series, pd.Series): # error occurs
+                return -1
+            
+            # assigned by position, as the binned series has a 0..n-1 index but dframe may not (e.g., a chunk of iter_dataframes)
+            binned_col_name = col + "_binned"
+            dframe[binned_col_name] = binned_series.to_numpy()
+        
+        return dframe
+    
+    # A method to bin columns in a process pool, all columns are copied into a single shared memory block once so that workers read them without copying
+    # Categorical columns are shared as integer codes (the unique values are small enough to be sent to the workers directly)
+    # bin_col_func(col_df, col_bins_settings) bins a column in the workers, returning the binned series or -1 (BinningMachine.perform_binning_on_col
+    # by default), it must be picklable, e.g., a static method of a class
+    # executor (optional) is a ProcessPoolExecutor kept by the caller, e.g., to bin many chunks without starting the processes for every chunk,
+    # otherwise a pool of num_workers processes is started & shut down here
+    # Return a dictionary of the binned series (with the index of dframe) of each column, or -1 if error occurs in binning the column
+    @staticmethod
+    def perform_binning_on_cols_in_parallel(dframe, col_list, col_bins_settings_dict, num_workers=None, bin_col_func=None, executor=None):
+        # Lay out the columns one after another (at 8-byte aligned offsets) in the shared memory block
+        arr_list = list()
+        uniques_list = list()
+        offset_list = list()
+        size = 0
+        for col in col_list:
+            arr = dframe[col].to_numpy()
+            uniques = None
+            if arr.dtype.hasobject: # e.g. strings, only plain numpy buffers can be shared
+                arr, uniques = pd.factorize(dframe[col])
+            arr_list.append(arr)
+            uniques_list.append(uniques)
+            offset_list.append(size)
+            size += (arr.nbytes + 7) // 8 * 8
+        
+        shm = shared_memory.SharedMemory(create=True, size=max(size, 1))
+        own_executor = executor is None
+        try:
+            for arr, offset in zip(arr_list, offset_list):
+                np.ndarray(arr.shape, dtype=arr.dtype, buffer=shm.buf, offset=offset)[:] = arr
+            
+            if own_executor:
+                executor = ProcessPoolExecutor(max_workers=num_workers)
+            future_dict = dict()
+            for col, arr, uniques, offset in zip(col_list, arr_list, uniques_list, offset_list):
+                future_dict[col] = executor.submit(BinningMachine.__perform_binning_on_shared_col__, shm.name, offset, arr.dtype.str, len(arr), uniques, col, col_bins_settings_dict[col], bin_col_func)
+            
+            # the workers return positional arrays, the index of dframe is attached here
+            binned_series_dict = dict()
+            for col in col_list:
+                result_codes, result_uniques = future_dict[col].result()
+                if result_uniques is None: # error occurs or numerical result
+                    binned_series_dict[col] = pd.Series(result_codes, index=dframe.index) if isinstance(result_codes, np.ndarray) else -1
+                else:
+                    binned_series_dict[col] = BinningMachine.get_binned_series_from_codes(result_codes, list(result_uniques)).set_axis(dframe.index)
+            return binned_series_dict
+        finally:
+            if own_executor and executor is not None:
+                executor.shutdown()
+            shm.close()
+            shm.unlink()
+    
+    # A method (run in a worker process) to bin a column stored in shared memory from the given offset
+    @staticmethod
+    def __perform_binning_on_shared_col__(shm_name, offset, dtype_str, length, uniques, col, col_bins_settings, bin_col_func=None):
+        shm = shared_memory.SharedMemory(name=shm_name)
+        try:
+            # all views on the shared memory are released when this returns, so that it can be closed
+            return BinningMachine.__perform_binning_on_buffer__(shm.buf[offset:offset + length * np.dtype(dtype_str).itemsize], dtype_str, length, uniques, col, col_bins_settings, bin_col_func)
+        finally:
+            shm.close()
+    
+    # A method to bin a column backed by a buffer, object results are returned as codes & unique labels, 
+    # which are much smaller to pickle than the label of every row, and numerical results as a plain array (i.e., by position)
+    @staticmethod
+    def __perform_binning_on_buffer__(buf, dtype_str, length, uniques, col, col_bins_settings, bin_col_func=None):
+        arr = np.ndarray((length,), dtype=np.dtype(dtype_str), buffer=buf)
+        if uniques is None:
+            col_df = pd.DataFrame({col: arr}, copy=False)
+        else: # rebuild the categorical column from the codes, missing values are coded -1
+            values = np.empty(len(uniques) + 1, dtype=object)
+            values[:-1] = list(uniques)
+            values[-1] = None
+            col_df = pd.DataFrame({col: values[arr]})
+        
+        if bin_col_func is None:
+            bin_col_func = BinningMachine.perform_binning_on_col
+        binned_series = bin_col_func(col_df, col_bins_settings)
+        if not isinstance(binned_series, pd.Series):
+            return (-1, None)
+        if pd.api.types.is_numeric_dtype(binned_series):
+            return (binned_series.to_numpy().copy(), None) # copy, as it may still be a view on the shared memory
+        
+        result_codes, result_uniques = pd.factorize(binned_series)
+        return (result_codes, result_uniques)
@@ -0,0 +1,251 @@
+import json
+import numpy as np
+import pandas as pd
+
+# A class holding the compiled bins settings of a single column, i.e. the bins settings with every bound casted once,
+# plus the lookup tables used to assign a bin to each row (edges & bin codes for numerical columns, element codes for categorical columns)
+# It can be used where a col_bins_settings dict is expected, e.g., col_plan["column"], col_plan["type"], col_plan["bins"]
+class ColBinsPlan:
+    __slots__ = ("column", "type", "bins", "bin_names", "edges", "codes", "element_codes")
+
+    def __init__(self, col_bins_settings) -> None:
+        self.column = col_bins_settings["column"]
+        self.type = col_bins_settings["type"]
+        self.bins = ColBinsPlan.cast_bins(col_bins_settings["type"], col_bins_settings["bins"])
+        self.bin_names = None
+        self.edges = None  # numerical custom bins only
+        self.codes = None  # numerical custom bins only
+        self.element_codes = None  # categorical custom bins only
+
+        if self.is_custom():
+            if self.type == "numerical":
+                self.edges, self.codes, self.bin_names = ColBinsPlan.compile_numerical_bins(self.bins)
+            else:
+                self.element_codes, self.bin_names = ColBinsPlan.compile_categorical_bins(self.bins)
+
+    def __getitem__(self, key):
+        if key not in ("column", "type", "bins"):
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __repr__(self) -> str:
+        return f"ColBinsPlan(column={self.column!r}, type={self.type!r}, bins={self.bins!r})"
+
+    # A method to check if the column is binned by custom bins (i.e., bins settings is a list of bins)
+    def is_custom(self):
+        return isinstance(self.bins, list)
+
+    # A method to get the col_bins_settings dict of the column
+    def get_col_bins_settings(self):
+        return {"column": self.column, "type": self.type, "bins": self.bins}
+
+    # A method to get the bin code of each row of a column using the compiled lookup tables (-1 if not in any bin)
+    def get_bin_codes(self, col_series):
+        if self.type == "numerical":
+            return ColBinsPlan.lookup_numerical_bin_codes(col_series.to_numpy(dtype=float), self.edges, self.codes)
+        return ColBinsPlan.lookup_categorical_bin_codes(col_series, self.element_codes)
+
+    # A method to get the label of each bin code, the extra last label is picked by code -1
+    def get_label_table(self, missing_label=None):
+        label_arr = np.empty(len(self.bin_names) + 1, dtype=object)
+        for idx in range(len(self.bin_names)):
+            label_arr[idx] = self.bin_names[idx]
+        label_arr[-1] = missing_label
+        return label_arr
+
+    # A method to cast the bounds of numerical custom bins to float, and the value of auto bins to int/float
+    # Values which cannot be casted are kept as they are, so that binning reports the error as usual
+    @staticmethod
+    def cast_bins(col_type, bins):
+        if col_type != "numerical" and not isinstance(bins, dict):  # categorical auto bins (chi merge) are casted too
+            return bins
+        if isinstance(bins, list):
+            casted_bins = list()
+            for a_bin in bins:
+                casted_bin = dict(a_bin)
+                casted_bin["ranges"] = [[ColBinsPlan.__cast__(r[0], float), ColBinsPlan.__cast__(r[1], float)] for r in a_bin["ranges"]]
+                casted_bins.append(casted_bin)
+            return casted_bins
+        if isinstance(bins, dict):
+            casted_bins = dict(bins)
+            if bins.get("method") == "num_bins":
+                casted_bins["value"] = ColBinsPlan.__cast__(bins["value"], int)
+            elif bins.get("algo") == "equal width":
+                casted_bins["value"] = ColBinsPlan.__cast__(bins["value"], float)
+            elif bins.get("method") == "freq":
+                casted_bins["value"] = ColBinsPlan.__cast__(bins["value"], int)
+            elif bins.get("algo") == "optimal":
+                if "max_bins" in bins:
+                    casted_bins["max_bins"] = ColBinsPlan.__cast__(bins["max_bins"], int)
+                if "min_bin_size" in bins:
+                    casted_bins["min_bin_size"] = ColBinsPlan.__cast__(bins["min_bin_size"], float)
+            elif bins.get("algo") == "chi merge":
+                for key, to_type in [("max_bins", int), ("threshold", float), ("init_bins", int)]:
+                    if key in bins:
+                        casted_bins[key] = ColBinsPlan.__cast__(bins[key], to_type)
+            return casted_bins
+        return bins
+
+    @staticmethod
+    def __cast__(value, to_type):
+        try:
+            return to_type(value)
+        except (TypeError, ValueError):
+            return value
+
+    # A method to compile numerical custom bins into an interval index, i.e. the sorted edges of all ranges
+    # and the code of the bin which each gap between 2 adjacent edges belongs to (-1 if the gap is not in any bin)
+    @staticmethod
+    def compile_numerical_bins(bins):
+        bin_name_list = list()
+        edge_set = set()
+        for a_bin in bins:
+            if a_bin["name"] not in bin_name_list:
+                bin_name_list.append(a_bin["name"])
+            for r in a_bin["ranges"]:
+                if not ColBinsPlan.__is_nan_range__(r): # a range with missing bound contains no value
+                    edge_set.add(float(r[0]))
+                    edge_set.add(float(r[1]))
+
+        edges = np.array(sorted(edge_set), dtype=float)
+        codes = np.full(max(len(edges) - 1, 0), -1, dtype=np.int64)
+
+        # Fill in reverse order so that a value covered by more than 1 bin goes to the first one, same as the linear scan
+        for a_bin in reversed(bins):
+            bin_code = bin_name_list.index(a_bin["name"])
+            for r in a_bin["ranges"]:
+                if ColBinsPlan.__is_nan_range__(r):
+                    continue
+                start_idx = np.searchsorted(edges, float(r[0]))
+                end_idx = np.searchsorted(edges, float(r[1]))
+                codes[start_idx:end_idx] = bin_code
+
+        return (edges, codes, bin_name_list)
+
+    @staticmethod
+    def __is_nan_range__(r):
+        return np.isnan(float(r[0])) or np.isnan(float(r[1]))
+
+    # A method to compile categorical custom bins into a lookup table from element to bin code
+    @staticmethod
+    def compile_categorical_bins(bins):
+        bin_name_list = list()
+        element_codes = dict()
+        for a_bin in bins:
+            if a_bin["name"] not in bin_name_list:
+                bin_name_list.append(a_bin["name"])
+            bin_code = bin_name_list.index(a_bin["name"])
+            for element in a_bin["elements"]:
+                # an element listed in more than 1 bin goes to the first one, same as the linear scan
+                if element not in element_codes:
+                    element_codes[element] = bin_code
+
+        return (element_codes, bin_name_list)
+
+    # A method to get the bin code of each value of a numerical column from an interval index (-1 if not in any bin)
+    @staticmethod
+    def lookup_numerical_bin_codes(values, edges, codes):
+        bin_codes = np.full(len(values), -1, dtype=np.int64)
+        if len(codes) == 0:
+            return bin_codes
+
+        # index of the gap each value falls into, NaN is sorted after all edges so it never falls into any gap
+        gap_idx = np.searchsorted(edges, values, side="right") - 1
+        is_in_gap = (gap_idx >= 0) & (gap_idx < len(codes))
+        bin_codes[is_in_gap] = codes[gap_idx[is_in_gap]]
+        return bin_codes
+
+    # A method to get the bin code of each value of a categorical column from an element lookup table (-1 if not in any bin)
+    @staticmethod
+    def lookup_categorical_bin_codes(col_series, element_codes):
+        # look up each unique value once only, missing values are factorized to -1 which picks the extra last code
+        unique_codes, unique_values = pd.factorize(col_series)
+        unique_bin_codes = np.full(len(unique_values) + 1, -1, dtype=np.int64)
+        for idx in range(len(unique_values)):
+            unique_bin_codes[idx] = element_codes.get(unique_values[idx], -1)
+
+        return unique_bin_codes[unique_codes]
+
+
+# A class holding the compiled bins settings of all columns, built once per bins settings blob (e.g., ib_settings)
+# The first bins settings of a column is used if the column has more than 1 bins settings
+class BinsPlan:
+    __slots__ = ("col_plans",)
+
+    def __init__(self, bins_settings_list) -> None:
+        self.col_plans = dict()
+        for col_bins_settings in bins_settings_list:
+            if isinstance(col_bins_settings, ColBinsPlan):
+                col_plan = col_bins_settings
+            else:
+                col_plan = ColBinsPlan(col_bins_settings)
+            if col_plan.column not in self.col_plans:
+                self.col_plans[col_plan.column] = col_plan
+
+    # A method to build the plan from the JSON string of a list of bins settings
+    @staticmethod
+    def from_json(bins_settings_data):
+        return BinsPlan(json.loads(bins_settings_data))
+
+    def __contains__(self, column):
+        return column in self.col_plans
+
+    def __iter__(self):
+        return iter(self.col_plans.values())
+
+    def __len__(self):
+        return len(self.col_plans)
+
+    # A method to get the compiled bins settings of a column, None if the column has no bins settings
+    def get(self, column):
+        return self.col_plans.get(column)
+
+    # A method to remove a column from the plan, e.g., the column used in good bad definition
+    def remove(self, column):
+        self.col_plans.pop(column, None)
+
+    # A method to get the list of bins settings (with bounds casted) of all columns
+    def get_bins_settings_list(self):
+        return [col_plan.get_col_bins_settings() for col_plan in self.col_plans.values()]
+
+    # A method to save the plan as a .npz file (file is a path or a file-like object),
+    # the lookup tables are saved as arrays, so that they are not compiled again when loaded
+    def save(self, file):
+        meta_list = list()
+        arr_dict = dict()
+        for idx, col_plan in enumerate(self.col_plans.values()):
+            meta = col_plan.get_col_bins_settings()
+            meta["bin_names"] = col_plan.bin_names
+            if col_plan.is_custom() and col_plan.type == "numerical":
+                arr_dict[f"edges_{idx}"] = col_plan.edges
+                arr_dict[f"codes_{idx}"] = col_plan.codes
+            elif col_plan.is_custom():
+                meta["elements"] = list(col_plan.element_codes.keys())
+                arr_dict[f"element_codes_{idx}"] = np.array(list(col_plan.element_codes.values()), dtype=np.int64)
+            meta_list.append(meta)
+
+        np.savez(file, meta=np.array(json.dumps(meta_list)), **arr_dict)
+
+    # A method to load a plan saved by BinsPlan.save
+    @staticmethod
+    def load(file):
+        with np.load(file, allow_pickle=False) as npz:
+            meta_list = json.loads(str(npz["meta"]))
+            col_plan_list = list()
+            for idx, meta in enumerate(meta_list):
+                col_plan = ColBinsPlan.__new__(ColBinsPlan)
+                col_plan.column = meta["column"]
+                col_plan.type = meta["type"]
+                col_plan.bins = meta["bins"]
+                col_plan.bin_names = meta["bin_names"]
+                col_plan.edges = None
+                col_plan.codes = None
+                col_plan.element_codes = None
+                if col_plan.is_custom() and col_plan.type == "numerical":
+                    col_plan.edges = npz[f"edges_{idx}"]
+                    col_plan.codes = npz[f"codes_{idx}"]
+                elif col_plan.is_custom():
+                    col_plan.element_codes = dict(zip(meta["elements"], npz[f"element_codes_{idx}"].tolist()))
+                col_plan_list.append(col_plan)
+
+        return BinsPlan(col_plan_list)
@@ -0,0 +1,111 @@
+import numpy as np
+import pandas as pd
+from .good_bad_counter import GoodBadCounter
+from .optimal_binning import OptimalBinning
+
+
+# A class for ChiMerge automated binning of a numerical or categorical column, i.e., adjacent bins with similar good/bad distributions
+# are merged until the number of bins is at most max_bins and every pair of adjacent bins differs significantly, given in the bins settings as:
+#   {"algo": "chi merge", "max_bins": 10, "threshold": 3.841, "init_bins": 100}
+# (threshold is the chi-square value of a pair of adjacent bins below which they are merged, 3.841 is the 95% significance level with
+# 1 degree of freedom, init_bins is the max number of fine pre-bins to start from, the keys not given take the DEFAULT_SETTINGS)
+# The good/bad/indeterminate counts of each distinct value (or element) are counted once by np.bincount, then grouped into at most
+# init_bins pre-bins of about the same number of rows, so merging only works on the contingency table of the pre-bins
+# The elements of a categorical column are ordered by bad rate, so that merging adjacent bins groups the elements of similar bad rates
+class ChiMerge:
+    DEFAULT_SETTINGS = {"max_bins": 10, "threshold": 3.841, "init_bins": 100}
+
+    # A method to get the settings of ChiMerge with the defaults filled in
+    # Return -1 if any setting is invalid
+    @staticmethod
+    def get_settings(auto_bins):
+        settings = dict(ChiMerge.DEFAULT_SETTINGS)
+        settings.update({key: auto_bins[key] for key in ChiMerge.DEFAULT_SETTINGS if key in auto_bins})
+        if not isinstance(settings["max_bins"], int) or settings["max_bins"] <= 0:
+            return -1
+        if not isinstance(settings["threshold"], (int, float)) or settings["threshold"] < 0:
+            return -1
+        if not isinstance(settings["init_bins"], int) or settings["init_bins"] <= 0:
+            return -1
+        return settings
+
+    # A method to pre-aggregate a categorical column given the good/bad/indeterminate label of each row (see GoodBadCounter.get_good_bad_labels)
+    # Return a tuple (distinct elements in the order of appearance, number of elements x 3 label counts of each element,
+    # label counts of missing values, element code of each row (-1 if missing)), the element codes are kept to bin the rows without a lookup
+    @staticmethod
+    def get_element_label_counts(col_series, labels):
+        element_codes, elements = pd.factorize(col_series)
+        is_missing = element_codes < 0
+        label_counts = np.bincount(element_codes[~is_missing] * 3 + labels[~is_missing], minlength=len(elements) * 3).reshape(len(elements), 3)
+        return (elements.tolist(), label_counts, np.bincount(labels[is_missing], minlength=3), element_codes)
+
+    # A method to get the ranges of the bins of a numerical column, given the pre-aggregated column (see OptimalBinning.get_value_label_counts,
+    # or NumericMicroBins), the last bin is extended to include the max value, as equal frequency binning does
+    # Return a list of [lower, upper] of each bin (in ascending order), or -1 if the settings are invalid or there are no values
+    @staticmethod
+    def get_bin_ranges(values, cum_label_counts, auto_bins):
+        settings = ChiMerge.get_settings(auto_bins)
+        if settings == -1 or len(values) == 0:
+            return -1
+
+        pre_bounds = OptimalBinning.get_candidate_bounds(cum_label_counts.sum(axis=1), settings["init_bins"])
+        bounds = pre_bounds[ChiMerge.merge(np.diff(cum_label_counts[pre_bounds], axis=0), settings["max_bins"], settings["threshold"])]
+
+        edge_list = [float(values[bound]) for bound in bounds[:-1]]
+        edge_list.append(float(values[-1]) + 0.0001)
+        return [[edge_list[idx], edge_list[idx + 1]] for idx in range(len(edge_list) - 1)]
+
+    # A method to group the elements of a categorical column, given the label counts of each element (see get_element_label_counts)
+    # Return the bin code of each element (the bins in ascending bad rate), or -1 if the settings are invalid or there are no elements
+    @staticmethod
+    def get_element_bin_codes(label_counts, auto_bins):
+        settings = ChiMerge.get_settings(auto_bins)
+        if settings == -1 or len(label_counts) == 0:
+            return -1
+
+        # elements without good or bad rows (i.e., no bad rate) are put last
+        with np.errstate(divide="ignore", invalid="ignore"):
+            bad_rates = label_counts[:, GoodBadCounter.BAD_LABEL] / (label_counts[:, GoodBadCounter.GOOD_LABEL] + label_counts[:, GoodBadCounter.BAD_LABEL])
+        order = np.argsort(bad_rates, kind="stable")
+        cum_label_counts = np.zeros((len(label_counts) + 1, 3), dtype=np.int64)
+        np.cumsum(label_counts[order], axis=0, out=cum_label_counts[1:])
+
+        pre_bounds = OptimalBinning.get_candidate_bounds(cum_label_counts.sum(axis=1), settings["init_bins"])
+        bounds = pre_bounds[ChiMerge.merge(np.diff(cum_label_counts[pre_bounds], axis=0), settings["max_bins"], settings["threshold"])]
+        element_bin_codes = np.empty(len(label_counts), dtype=np.int64)
+        element_bin_codes[order] = np.repeat(np.arange(len(bounds) - 1), np.diff(bounds))
+        return element_bin_codes
+
+    # A method to merge adjacent bins given the label counts of each bin (number of bins x 3), the pair of adjacent bins with the lowest
+    # chi-square is merged one at a time, until there are at most max_bins bins and the chi-square of every pair is at least threshold
+    # Return the bounds of the merged bins, i.e., the index of the first given bin of each merged bin, followed by the number of given bins
+    @staticmethod
+    def merge(label_counts, max_bins, threshold):
+        counts = label_counts[:, [GoodBadCounter.GOOD_LABEL, GoodBadCounter.BAD_LABEL]].astype(float)
+        bounds = np.arange(len(counts) + 1)
+        chi2 = ChiMerge.get_adjacent_chi2(counts)
+        while len(counts) > 1:
+            idx = int(np.argmin(chi2))
+            if len(counts) <= max_bins and chi2[idx] >= threshold:
+                break
+            counts[idx] += counts[idx + 1]
+            counts = np.delete(counts, idx + 1, axis=0)
+            bounds = np.delete(bounds, idx + 1)
+            # only the chi-square of the pairs next to the merged bin are changed
+            chi2 = np.delete(chi2, idx)
+            start, end = max(idx - 1, 0), min(idx + 1, len(counts) - 1)
+            chi2[start:end] = ChiMerge.get_adjacent_chi2(counts[start:end + 1])
+        return bounds
+
+    # A method to get the chi-square of each pair of adjacent bins, given the good & bad counts of each bin (number of bins x 2)
+    # A class without rows in both bins adds nothing, e.g., 2 bins without bad rows have a chi-square of 0
+    @staticmethod
+    def get_adjacent_chi2(counts):
+        pair_counts = np.stack((counts[:-1], counts[1:]), axis=1)  # [pair, bin, class]
+        bin_totals = pair_counts.sum(axis=2, keepdims=True)
+        class_totals = pair_counts.sum(axis=1, keepdims=True)
+        totals = bin_totals.sum(axis=1, keepdims=True)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            expected = bin_totals * class_totals / totals
+            chi2_terms = np.where(expected > 0, (pair_counts - expected) ** 2 / expected, 0.0)
+        return chi2_terms.sum(axis=(1, 2))
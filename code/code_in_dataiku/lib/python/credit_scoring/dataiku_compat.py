@@ -0,0 +1,415 @@
+import pandas as pd
+import numpy as np
+from .bins_plan import BinsPlan, ColBinsPlan
+from .binning_machine import BinningMachine
+from .quantile_sketch import QuantileSketch
+from .optimal_binning import OptimalBinning
+from .chi_merge import ChiMerge
+from .good_bad_def_decoder import GoodBadDefDecoder
+from .stat_calculator import StatCalculator
+
+# Wrappers keeping the output format of the Dataiku recipes & the web app on top of BinningMachine & StatCalculator:
+# binning returns (list of bins definitions, binned series), numerical bins are named by their ranges (e.g., "[[20.0, 30.0)]"),
+# and rows which do not belong to any bin are labelled as "Missing"
+
+
+def get_str_from_ranges(ranges):
+    if not isinstance(ranges, list):
+        return -1
+    if len(ranges) == 0:
+        return '[]'
+
+    ranges = GoodBadDefDecoder.sort_numerical_def_ranges(ranges)
+
+    ranges_str = "["
+    ranges_str = f"{ranges_str}[{ranges[0][0]}, {ranges[0][1]})"
+    for idx in range(1, len(ranges)):
+        ranges_str = f"{ranges_str}, [{ranges[idx][0]}, {ranges[idx][1]})"
+    ranges_str += "]"
+    return ranges_str
+
+
+# A class for performing binning based on bins settings, in the (bins definitions, binned series) format of the recipes & the web app
+class DataikuBinningMachine:
+    MISSING_LABEL = "Missing"
+
+    # Perform equal width binning based on a specified width (for numerical column only)
+    # min_val & max_val of the whole column can be given when col_df is only a chunk of the column
+    @staticmethod
+    def perform_eq_width_binning_by_width(col_df, width, min_val=None, max_val=None):
+        col_df = DataikuBinningMachine.__check_eq_width_col_df__(col_df, min_val, max_val)
+        if not isinstance(col_df, pd.DataFrame):
+            return col_df
+        # width cannot be non-numeric
+        if not (isinstance(width, int) or isinstance(width, float)) or width <= 0:
+            return (-1, -1)
+
+        min = float(col_df.iloc[:, 0].min()) if min_val is None else float(min_val)
+        max = float(col_df.iloc[:, 0].max()) if max_val is None else float(max_val)
+        bin_ranges = BinningMachine.get_eq_width_bin_ranges_by_width(min, max, width)
+
+        bin_codes = BinningMachine.get_eq_width_bin_codes(col_df, bin_ranges, min, width)
+        return DataikuBinningMachine.get_result_from_codes(bin_codes, bin_ranges)
+
+    # A method to perform equal width binning based on a specified number of bins
+    # min_val & max_val of the whole column can be given when col_df is only a chunk of the column
+    @staticmethod
+    def perform_eq_width_binning_by_num_bins(col_df, num_bins, min_val=None, max_val=None):
+        col_df = DataikuBinningMachine.__check_eq_width_col_df__(col_df, min_val, max_val)
+        if not isinstance(col_df, pd.DataFrame):
+            return col_df
+        if not isinstance(num_bins, int) or num_bins <= 0:
+            return (-1, -1)
+
+        min = float(col_df.iloc[:, 0].min()) if min_val is None else float(min_val)
+        max = float(col_df.iloc[:, 0].max()) if max_val is None else float(max_val)
+        width = (max - min) / num_bins
+        bin_ranges = BinningMachine.get_eq_width_bin_ranges_by_num_bins(min, max, num_bins)
+
+        bin_codes = BinningMachine.get_eq_width_bin_codes(col_df, bin_ranges, min, width)
+        return DataikuBinningMachine.get_result_from_codes(bin_codes, bin_ranges)
+
+    # A method to check the column of equal width binning, returns the column to bin or the error result
+    @staticmethod
+    def __check_eq_width_col_df__(col_df, min_val, max_val):
+        if len(col_df) == 0:
+            return (-1, -1)
+        if col_df.isna().all().all():
+            if min_val is None or max_val is None:
+                return (-1, pd.Series([None for _ in range(len(col_df))]))
+            col_df = col_df.astype(float)  # a chunk without any value of a column binned chunk by chunk, every row is "Missing"
+        # Cannot be categorical type
+        if not pd.api.types.is_numeric_dtype(col_df.iloc[:, 0]):
+            return (-1, -1)
+        return col_df
+
+    # A method to perform equal frequency binning based on a specified frequency
+    @staticmethod
+    def perform_eq_freq_binning_by_freq(col_df, freq):
+        if len(col_df) == 0:
+            return (-1, -1)
+        if col_df.isna().all().all():
+            return (-1, pd.Series([None for _ in range(len(col_df))]))
+        # Cannot be categorical type
+        if not pd.api.types.is_numeric_dtype(col_df.iloc[:, 0]):
+            return (-1, -1)
+        if not isinstance(freq, int) or freq <= 0 or freq > len(col_df):
+            return (-1, -1)
+
+        num_bins = int(np.ceil(len(col_df)/freq))
+        interval_list, bin_codes = BinningMachine.get_eq_freq_bin_codes(col_df, num_bins)
+        return DataikuBinningMachine.__get_eq_freq_result__(interval_list, bin_codes, float(col_df.iloc[:, 0].max()), only_used_bins=True)
+
+    # A method to perform equal-frequency binning based on a specified number of bins
+    @staticmethod
+    def perform_eq_freq_binning_by_num_bins(col_df, num_bins):
+        if len(col_df) == 0:
+            return (-1, -1)
+        if col_df.isna().all().all():
+            return (-1, pd.Series([None for _ in range(len(col_df))]))
+        # Cannot be categorical type
+        if not pd.api.types.is_numeric_dtype(col_df.iloc[:, 0]):
+            return (-1, -1)
+        if not isinstance(num_bins, int) or num_bins <= 0:
+            return (-1, -1)
+
+        interval_list, bin_codes = BinningMachine.get_eq_freq_bin_codes(col_df, num_bins)
+        return DataikuBinningMachine.__get_eq_freq_result__(interval_list, bin_codes, float(col_df.iloc[:, 0].max()), only_used_bins=True)
+
+    # A method to perform equal-frequency binning on a column (or a chunk of it) based on pre-computed bin edges,
+    # max_val is the max value of the whole column, the bin ending at max_val is extended to include it
+    @staticmethod
+    def perform_eq_freq_binning_by_edges(col_df, edges, max_val):
+        if len(col_df) == 0:
+            return (-1, -1)
+        if len(edges) == 0:
+            return (-1, pd.Series([None for _ in range(len(col_df))]))
+        if col_df.isna().all().all():
+            col_df = col_df.astype(float)  # a chunk without any value, every row is "Missing"
+        # Cannot be categorical type
+        if not pd.api.types.is_numeric_dtype(col_df.iloc[:, 0]):
+            return (-1, -1)
+
+        # every chunk gets the same bins definitions, even if some bins have no row in the chunk
+        interval_list, bin_codes = BinningMachine.get_eq_freq_bin_codes_by_edges(col_df, edges)
+        return DataikuBinningMachine.__get_eq_freq_result__(interval_list, bin_codes, max_val, only_used_bins=False)
+
+    # A method to perform optimal binning (see OptimalBinning) given the good/bad/indeterminate label of each row
+    @staticmethod
+    def perform_optimal_binning(col_df, labels, auto_bins):
+        if len(col_df) == 0:
+            return (-1, -1)
+        if col_df.isna().all().all():
+            return (-1, pd.Series([None for _ in range(len(col_df))]))
+        # Cannot be categorical type
+        if not pd.api.types.is_numeric_dtype(col_df.iloc[:, 0]):
+            return (-1, -1)
+        # the labels of the rows are needed
+        if labels is None or len(labels) != len(col_df):
+            return (-1, -1)
+
+        values, cum_label_counts, missing_label_counts = OptimalBinning.get_value_label_counts(col_df.iloc[:, 0], labels)
+        bin_ranges = OptimalBinning.get_bin_ranges(values, cum_label_counts, auto_bins, missing_label_counts)
+        if bin_ranges == -1:
+            return (-1, -1)
+
+        bin_codes = BinningMachine.get_bin_codes_from_ranges(col_df, bin_ranges)
+        return DataikuBinningMachine.get_result_from_codes(bin_codes, bin_ranges)
+
+    # A method to perform ChiMerge binning (see ChiMerge) on a numerical or categorical column given the good/bad/indeterminate label of each row
+    @staticmethod
+    def perform_chi_merge_binning(col_df, labels, auto_bins, col_type="numerical"):
+        if len(col_df) == 0:
+            return (-1, -1)
+        if col_df.isna().all().all():
+            return (-1, pd.Series([None for _ in range(len(col_df))]))
+        # a numerical column cannot be categorical type
+        if col_type == "numerical" and not pd.api.types.is_numeric_dtype(col_df.iloc[:, 0]):
+            return (-1, -1)
+        # the labels of the rows are needed
+        if labels is None or len(labels) != len(col_df):
+            return (-1, -1)
+
+        if col_type != "numerical":
+            bins_settings, bin_codes = BinningMachine.get_chi_merge_categorical_bins(col_df, labels, auto_bins)
+            if bins_settings == -1:
+                return (-1, -1)
+            # rows which does not belongs to any bin are labelled as "Missing"
+            bin_name_list = [a_bin["name"] for a_bin in bins_settings]
+            return (bins_settings, BinningMachine.get_binned_series_from_codes(bin_codes, bin_name_list, missing_label=DataikuBinningMachine.MISSING_LABEL))
+
+        values, cum_label_counts, _ = OptimalBinning.get_value_label_counts(col_df.iloc[:, 0], labels)
+        bin_ranges = ChiMerge.get_bin_ranges(values, cum_label_counts, auto_bins)
+        if bin_ranges == -1:
+            return (-1, -1)
+
+        bin_codes = BinningMachine.get_bin_codes_from_ranges(col_df, bin_ranges)
+        return DataikuBinningMachine.get_result_from_codes(bin_codes, bin_ranges)
+
+    # A method to convert equal-frequency intervals & the interval code of each row into the (bins definitions, binned series) format,
+    # the interval ending at max_val is extended to include it
+    @staticmethod
+    def __get_eq_freq_result__(interval_list, bin_codes, max_val, only_used_bins):
+        bin_ranges = list()
+        for interval in interval_list:
+            if interval.right == max_val:
+                bin_ranges.append([interval.left, interval.right+0.0001])
+            else:
+                bin_ranges.append([interval.left, interval.right])
+
+        def_li, binned_series = DataikuBinningMachine.get_result_from_codes(bin_codes, bin_ranges)
+        if only_used_bins:
+            used_code_set = set(np.unique(bin_codes[bin_codes >= 0]).tolist())
+            def_li = [def_li[code] for code in range(len(def_li)) if code in used_code_set]
+        return (def_li, binned_series)
+
+    # A method to get the (bins definitions, binned series) result from numerical bin ranges & the bin code of each row (-1 if not in any bin)
+    @staticmethod
+    def get_result_from_codes(bin_codes, bin_ranges):
+        def_li = list()
+        for r in bin_ranges:
+            def_li.append({"name": get_str_from_ranges([r]), "ranges": [r]})
+
+        bin_name_list = [a_def["name"] for a_def in def_li]
+        return (def_li, BinningMachine.get_binned_series_from_codes(bin_codes, bin_name_list, missing_label=DataikuBinningMachine.MISSING_LABEL))
+
+    # A method to fix the bins of the auto-binned numerical columns by a first pass over all chunks of a dataset (see BinningMachine)
+    @staticmethod
+    def get_fixed_bins_plan_from_chunks(chunks, bins_settings_list, k=200, max_exact_values=QuantileSketch.DEFAULT_MAX_EXACT_VALUES):
+        return BinningMachine.get_fixed_bins_plan_from_chunks(chunks, bins_settings_list, k=k, max_exact_values=max_exact_values)
+
+    # A method to fix the bins of the columns binned by supervised algorithms (optimal/chi merge) into custom bins, given the rows of
+    # the columns (e.g., the whole dataset) & the good/bad/indeterminate label of each row (see GoodBadCounter.get_good_bad_labels),
+    # so that the dataset can be binned (e.g., chunk by chunk) without the labels, the same as the web app saves the result of these algorithms
+    # Output - a BinsPlan, or -1 if any of these columns cannot be binned (e.g., no labels)
+    @staticmethod
+    def get_supervised_fixed_bins_plan(dframe, bins_settings_list, labels):
+        bins_plan = bins_settings_list if isinstance(bins_settings_list, BinsPlan) else BinsPlan(bins_settings_list)
+        fixed_bins_settings_list = list()
+        for col_plan in bins_plan:
+            col_bins_settings = col_plan.get_col_bins_settings()
+            if isinstance(col_plan.bins, dict) and col_plan.bins.get("algo") in BinningMachine.SUPERVISED_ALGO_LIST:
+                if col_plan.column not in dframe.columns:
+                    return -1
+                def_li, _ = DataikuBinningMachine.perform_binning_on_col(dframe.loc[:, [col_plan.column]], col_plan, labels=labels)
+                if def_li == -1:
+                    return -1
+                col_bins_settings = {"column": col_plan.column, "type": col_plan.type, "bins": def_li}
+            fixed_bins_settings_list.append(col_bins_settings)
+        return BinsPlan(fixed_bins_settings_list)
+
+    # A method to get the compiled plan of custom bins, bins_settings is either a list of bins or a ColBinsPlan
+    @staticmethod
+    def get_col_plan(col_df, col_type, bins_settings):
+        if isinstance(bins_settings, ColBinsPlan):
+            return bins_settings
+        return ColBinsPlan({"column": col_df.columns[0], "type": col_type, "bins": bins_settings})
+
+    # A method to perform custom binning for a categorical column, bins_settings can also be a compiled ColBinsPlan
+    @staticmethod
+    def perform_categorical_custom_binning(col_df, bins_settings):
+        if len(col_df) == 0:
+            return (-1, -1)
+
+        col_plan = DataikuBinningMachine.get_col_plan(col_df, "categorical", bins_settings)
+        bin_codes = col_plan.get_bin_codes(col_df.iloc[:, 0])
+        # rows which does not belongs to any bin are labelled as "Missing"
+        return (col_plan.bins, pd.Series(col_plan.get_label_table(DataikuBinningMachine.MISSING_LABEL)[bin_codes]))
+
+    # A method to perform custom binning for a numerical column, bins_settings can also be a compiled ColBinsPlan
+    @staticmethod
+    def perform_numerical_custom_binning(col_df, bins_settings):
+        if len(col_df) == 0:
+            return (-1, -1)
+
+        col_plan = DataikuBinningMachine.get_col_plan(col_df, "numerical", bins_settings)
+        bin_codes = col_plan.get_bin_codes(col_df.iloc[:, 0])
+        # rows which does not belongs to any bin are labelled as "Missing"
+        return (col_plan.bins, pd.Series(col_plan.get_label_table(DataikuBinningMachine.MISSING_LABEL)[bin_codes]))
+
+    # A method to perform binning (equal-width/equal-frequency/optimal/chi merge/custom) for a single column (either categorical or numerical)
+    # col_bins_settings can also be a ColBinsPlan, or a BinsPlan (the plan of the column of col_df is used)
+    # labels (optional) is the good/bad/indeterminate label of each row of col_df, needed by supervised algorithms (e.g., optimal)
+    @staticmethod
+    def perform_binning_on_col(col_df, col_bins_settings, labels=None):
+        """
+        col_bins_settings is in the form of:
+        {
+            "column": "person_income",
+            "type": "numerical",
+            "info_val": 0.11,
+            "bins": [
+                {
+                    "name": "0-9999, 30000-39999",
+                    "ranges": [[0, 9999], [30000, 39999]],
+                },
+                {
+                    "name": "20000-29999",
+                    "ranges": [[20000, 29999]],
+                },
+            ],
+        }
+        """
+        if isinstance(col_bins_settings, BinsPlan):
+            col_bins_settings = col_bins_settings.get(col_df.columns[0])
+            if col_bins_settings is None:
+                return (-1, -1)
+
+        if col_bins_settings["bins"] == "none":
+            if len(col_df) == 0:
+                return (-1, -1)
+            unique_bin = col_df.iloc[:, 0].unique().tolist()
+            if col_bins_settings["type"] == "numerical":
+                def_li = list()
+                for bin in unique_bin:
+                    def_li.append({"name": str(bin), "ranges": [[bin, bin+0.0000001]]})
+                return DataikuBinningMachine.perform_numerical_custom_binning(col_df, def_li)
+            else:
+                def_li = list()
+                for bin in unique_bin:
+                    def_li.append({"name": str(bin), "elements": [bin]})
+                return DataikuBinningMachine.perform_categorical_custom_binning(col_df, def_li)
+        elif isinstance(col_bins_settings["bins"], dict):  # auto binning
+            if col_bins_settings["bins"]["algo"] == "chi merge":  # both numerical & categorical
+                return DataikuBinningMachine.perform_chi_merge_binning(col_df, labels, col_bins_settings["bins"], col_type=col_bins_settings["type"])
+            if col_bins_settings["type"] != "numerical":
+                return (-1, -1)
+            if col_bins_settings["bins"]["algo"] == "optimal":
+                return DataikuBinningMachine.perform_optimal_binning(col_df, labels, col_bins_settings["bins"])
+            elif col_bins_settings["bins"]["algo"] == "equal width":
+                # min & max of the whole column are fixed in the bins settings if binning chunk by chunk
+                min_val = col_bins_settings["bins"].get("min")
+                max_val = col_bins_settings["bins"].get("max")
+                if col_bins_settings["bins"]["method"] == "width":
+                    return DataikuBinningMachine.perform_eq_width_binning_by_width(col_df, col_bins_settings["bins"]["value"], min_val=min_val, max_val=max_val)
+                else:  # by num of bins
+                    return DataikuBinningMachine.perform_eq_width_binning_by_num_bins(col_df, col_bins_settings["bins"]["value"], min_val=min_val, max_val=max_val)
+            elif "edges" in col_bins_settings["bins"]:  # equal frequency with edges fixed by the whole column, if binning chunk by chunk
+                return DataikuBinningMachine.perform_eq_freq_binning_by_edges(col_df, col_bins_settings["bins"]["edges"], col_bins_settings["bins"]["max"])
+            else:  # equal frequency
+                if col_bins_settings["bins"]["method"] == "freq":
+                    return DataikuBinningMachine.perform_eq_freq_binning_by_freq(col_df, col_bins_settings["bins"]["value"])
+                else:  # by num of bins
+                    return DataikuBinningMachine.perform_eq_freq_binning_by_num_bins(col_df, col_bins_settings["bins"]["value"])
+        else:  # custom binning, use the compiled lookup tables if given a plan
+            bins_settings = col_bins_settings if isinstance(col_bins_settings, ColBinsPlan) else col_bins_settings["bins"]
+            if col_bins_settings["type"] == "numerical":
+                return DataikuBinningMachine.perform_numerical_custom_binning(col_df, bins_settings)
+            else:
+                return DataikuBinningMachine.perform_categorical_custom_binning(col_df, bins_settings)
+
+    # A method to bin a single column, returns the binned series only (or -1 if error occurs), e.g., to bin the columns in a process pool
+    @staticmethod
+    def get_binned_series_of_col(col_df, col_bins_settings):
+        _, binned_series = DataikuBinningMachine.perform_binning_on_col(col_df, col_bins_settings)
+        return binned_series
+
+    # A method that perform binning (equal-width/equal-frequency/custom) for the whole dataframe (can contain numerical/categorical columns)
+    # bins_settings_list can also be a BinsPlan
+    # If num_workers > 1 (or a ProcessPoolExecutor is given, e.g., kept to bin many chunks), the columns are binned in parallel by a process pool
+    # (see BinningMachine.perform_binning_on_cols_in_parallel)
+    @staticmethod
+    def perform_binning_on_whole_df(dframe, bins_settings_list, num_workers=None, executor=None):
+        if len(dframe) == 0:
+            return dframe
+
+        col_bins_settings_dict = dict()
+        for col in dframe.columns:
+            # Find col_bins_settings
+            col_bins_settings = None
+            if isinstance(bins_settings_list, BinsPlan):
+                col_bins_settings = bins_settings_list.get(col)
+            else:
+                for bins_settings in bins_settings_list:
+                    if bins_settings["column"] == col:
+                        col_bins_settings = bins_settings
+                        break
+
+            # if no bins settings for the column, skip it
+            if col_bins_settings == None:
+                continue
+            col_bins_settings_dict[col] = col_bins_settings
+
+        col_list = list(col_bins_settings_dict.keys())
+        if (executor is not None or (num_workers is not None and num_workers > 1)) and len(col_list) > 1:
+            binned_series_dict = BinningMachine.perform_binning_on_cols_in_parallel(
+                dframe, col_list, col_bins_settings_dict, num_workers, bin_col_func=DataikuBinningMachine.get_binned_series_of_col, executor=executor)
+        else:
+            binned_series_dict = dict()
+            for col in col_list:
+                binned_series_dict[col] = DataikuBinningMachine.get_binned_series_of_col(dframe.loc[:, [col]], col_bins_settings_dict[col])
+
+        for col in col_list:
+            binned_series = binned_series_dict[col]
+            if not isinstance(binned_series, pd.Series):  # error occurs
+                return -1
+
+            # assigned by position, as the binned series has a 0..n-1 index but dframe may not (e.g., a chunk of iter_dataframes)
+            binned_col_name = col + "_binned"
+            dframe[binned_col_name] = binned_series.to_numpy()
+
+        return dframe
+
+
+# A class for calculating the statistics of the binned columns, with the percentage columns named as in the recipe outputs
+class DataikuStatCalculator(StatCalculator):
+    PCT_COL_NAME_LIST = ["Good_Pct", "Bad_Pct", "Total_Pct"]
+
+    # A method to bin a single column, in the format of the recipes
+    @staticmethod
+    def perform_binning_on_col(col_df, col_bins_settings, labels=None):
+        _, binned_series = DataikuBinningMachine.perform_binning_on_col(col_df, col_bins_settings, labels=labels)
+        return binned_series
+
+
+# A class for calculating the statistics of a binned column shown in the web app, the percentages are rounded to 2 decimal places
+class WebAppStatCalculator(DataikuStatCalculator):
+    PCT_COL_NAME_LIST = ["Good%", "Bad%", "Total%"]
+    PCT_DECIMALS = 2
+
+    # A method to compute the summary statistics table of a single column, labels (good/bad/indeterminate of each row) can be reused
+    @staticmethod
+    def compute_summary_stat_table(df, col_bins_settings, good_bad_def, labels=None):
+        if len(df) == 0 or col_bins_settings == None or good_bad_def == None:
+            return None
+        return WebAppStatCalculator.compute_summary_stat_tables(df, [col_bins_settings], good_bad_def, labels=labels)[col_bins_settings["column"]]
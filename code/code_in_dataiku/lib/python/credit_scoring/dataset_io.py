@@ -0,0 +1,162 @@
+import os
+import numpy as np
+import pandas as pd
+
+# File formats a dataset can be stored as, by file extension
+PARQUET_EXTENSIONS = (".parquet", ".pq")
+FEATHER_EXTENSIONS = (".feather", ".arrow")
+
+# A class to store datasets as Parquet/Feather files with explicit column types, and read them back memory-mapped
+# with the same dtypes as dataiku.Dataset.get_dataframe(), i.e., int64 for integer columns without missing values,
+# float64 for numbers (incl. integers with missing values), bool, and object (str, missing values as NaN) for the others
+# pyarrow is only imported when a file is read or written, so the rest of the library does not depend on it
+class DatasetIO:
+    # A method to cast the columns of a dataframe to the dtypes of dataiku.Dataset.get_dataframe()
+    # Columns holding values of different types (e.g., int & str) cannot be stored with a single column type --> error raises ValueError
+    @staticmethod
+    def cast_to_dataiku_dtypes(df):
+        dtype_dict = dict()
+        for col in df.columns:
+            col_series = df[col]
+            if pd.api.types.is_bool_dtype(col_series.dtype):
+                dtype_dict[col] = "bool"
+            elif pd.api.types.is_integer_dtype(col_series.dtype):
+                dtype_dict[col] = "float64" if col_series.isna().any() else "int64"
+            elif pd.api.types.is_numeric_dtype(col_series.dtype):
+                dtype_dict[col] = "float64"
+            else:
+                # the type of the values of an object column, e.g., "string", or "mixed-integer" for int & str values
+                inferred_type = pd.api.types.infer_dtype(col_series, skipna=True)
+                if inferred_type in ("string", "empty"):
+                    dtype_dict[col] = "object"
+                elif inferred_type == "integer":
+                    dtype_dict[col] = "float64" if col_series.isna().any() else "int64"
+                elif inferred_type in ("floating", "mixed-integer-float"):
+                    dtype_dict[col] = "float64"
+                elif inferred_type == "boolean" and not col_series.isna().any():
+                    dtype_dict[col] = "bool"
+                else:
+                    raise ValueError(f"Column {col!r} holds values of different types ({inferred_type})")
+        return df.astype(dtype_dict)
+
+    # A method to get the Arrow schema of a dataframe already casted by cast_to_dataiku_dtypes()
+    @staticmethod
+    def get_arrow_schema(df):
+        import pyarrow as pa
+
+        type_dict = {"int64": pa.int64(), "float64": pa.float64(), "bool": pa.bool_(), "object": pa.string()}
+        field_list = list()
+        for col in df.columns:
+            field_list.append(pa.field(str(col), type_dict[str(df[col].dtype)]))
+        return pa.schema(field_list)
+
+    # A method to write a dataframe to a Parquet or Feather file (by the file extension) with explicit column types
+    # Feather files are written uncompressed, so that reading them memory-mapped does not copy the numeric columns
+    @staticmethod
+    def write_dataframe(df, path):
+        import pyarrow as pa
+
+        df = DatasetIO.cast_to_dataiku_dtypes(df)
+        table = pa.Table.from_pandas(df, schema=DatasetIO.get_arrow_schema(df), preserve_index=False)
+        extension = os.path.splitext(path)[1].lower()
+        if extension in PARQUET_EXTENSIONS:
+            import pyarrow.parquet as pq
+            pq.write_table(table, path)
+        elif extension in FEATHER_EXTENSIONS:
+            import pyarrow.feather as feather
+            feather.write_feather(table, path, compression="uncompressed")
+        else:
+            raise ValueError(f"Unsupported dataset file extension: {extension!r}")
+
+    # A method to read a Parquet or Feather file (by the file extension) memory-mapped, optionally only some columns
+    # String columns are read as object columns with NaN for missing values, as dataiku.Dataset.get_dataframe() does
+    @staticmethod
+    def read_dataframe(path, columns=None):
+        extension = os.path.splitext(path)[1].lower()
+        if extension in PARQUET_EXTENSIONS:
+            import pyarrow.parquet as pq
+            table = pq.read_table(path, columns=columns, memory_map=True)
+        elif extension in FEATHER_EXTENSIONS:
+            import pyarrow.feather as feather
+            table = feather.read_table(path, columns=columns, memory_map=True)
+        else:
+            raise ValueError(f"Unsupported dataset file extension: {extension!r}")
+        return DatasetIO.table_to_dataframe(table)
+
+    # A method to read a Parquet or Feather file (by the file extension) memory-mapped, chunk by chunk
+    # Only a chunk (plus the memory-mapped file) is in memory at a time, e.g., for binning a dataset larger than the memory
+    @staticmethod
+    def iter_dataframes(path, chunksize=10000, columns=None):
+        extension = os.path.splitext(path)[1].lower()
+        if extension in PARQUET_EXTENSIONS:
+            import pyarrow.parquet as pq
+            batch_iter = pq.ParquetFile(path, memory_map=True).iter_batches(batch_size=chunksize, columns=columns)
+        elif extension in FEATHER_EXTENSIONS:
+            import pyarrow.feather as feather
+            batch_iter = feather.read_table(path, columns=columns, memory_map=True).to_batches(max_chunksize=chunksize)
+        else:
+            raise ValueError(f"Unsupported dataset file extension: {extension!r}")
+
+        for batch in batch_iter:
+            yield DatasetIO.table_to_dataframe(batch)
+
+    # A method to convert an Arrow table (or record batch) into a dataframe, with NaN for the missing values of string columns
+    @staticmethod
+    def table_to_dataframe(table):
+        df = table.to_pandas()
+        for col in df.columns:
+            if df[col].dtype == object:
+                df[col] = df[col].fillna(np.nan)
+        return df
+
+    # A method to convert an Excel file (e.g., a test dataset) into a Parquet/Feather file next to it, or at the path given
+    # Returns the path of the converted file
+    @staticmethod
+    def convert_excel_file(excel_path, path=None, extension=".parquet"):
+        if path is None:
+            path = os.path.splitext(excel_path)[0] + extension
+        DatasetIO.write_dataframe(pd.read_excel(excel_path), path)
+        return path
+
+
+# A class to write a dataframe chunk by chunk to a Parquet or Feather file (by the file extension), e.g.,
+#   with DatasetFileWriter(path) as writer:
+#       for chunk_df in chunks:
+#           writer.write_dataframe(chunk_df)
+# The column types are fixed by the schema given, or by the first chunk written, and the later chunks are casted to them
+class DatasetFileWriter:
+    def __init__(self, path, schema=None) -> None:
+        self.path = path
+        self.schema = schema
+        self.__writer = None
+        self.extension = os.path.splitext(path)[1].lower()
+        if self.extension not in PARQUET_EXTENSIONS + FEATHER_EXTENSIONS:
+            raise ValueError(f"Unsupported dataset file extension: {self.extension!r}")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    # A method to append a chunk to the file
+    def write_dataframe(self, df):
+        import pyarrow as pa
+
+        df = DatasetIO.cast_to_dataiku_dtypes(df)
+        if self.schema is None:
+            self.schema = DatasetIO.get_arrow_schema(df)
+        table = pa.Table.from_pandas(df, schema=self.schema, preserve_index=False)
+        if self.__writer is None:
+            if self.extension in PARQUET_EXTENSIONS:
+                import pyarrow.parquet as pq
+                self.__writer = pq.ParquetWriter(self.path, self.schema)
+            else:
+                self.__writer = pa.ipc.new_file(self.path, self.schema, options=pa.ipc.IpcWriteOptions(compression=None))
+        self.__writer.write_table(table)
+
+    # A method to finish the file, a file without any chunk written gets the schema only (i.e., an empty dataset)
+    def close(self):
+        if self.__writer is None:
+            self.write_dataframe(pd.DataFrame({field.name: pd.Series(dtype=object) for field in self.schema}) if self.schema is not None else pd.DataFrame())
+        self.__writer.close()
@@ -0,0 +1,87 @@
+import numpy as np
+
+# A class for counting the number of good and bad samples/population in the column
+class GoodBadCounter:
+    GOOD_LABEL = 0
+    BAD_LABEL = 1
+    INDETERMINATE_LABEL = 2
+
+    # A method to get the number of sample bad, sample indeterminate, sample good, population good, and population bad
+    @staticmethod
+    def get_statistics(dframe, good_bad_def):
+        labels = GoodBadCounter.get_good_bad_labels(dframe, good_bad_def)
+        sample_good_count, sample_bad_count, sample_indeterminate_count = GoodBadCounter.count_labels(labels)
+        good_weight = good_bad_def["good"]["weight"]
+        bad_weight = good_bad_def["bad"]["weight"]
+        population_good_count = GoodBadCounter.get_population_good(
+            sample_good_count, good_weight)
+        population_bad_count = GoodBadCounter.get_population_bad(
+            sample_bad_count, bad_weight)
+        return (sample_bad_count, sample_indeterminate_count, sample_good_count, good_weight, bad_weight, population_good_count, population_bad_count)
+
+    # A method to label each row as good (0), bad (1) or indeterminate (2) in a single pass over the definitions
+    # A row matching both the bad & indeterminate definitions is labelled as bad
+    @staticmethod
+    def get_good_bad_labels(dframe, good_bad_def):
+        is_bad = GoodBadCounter.get_def_mask(dframe, good_bad_def["bad"])
+        if "indeterminate" in good_bad_def:
+            is_indeterminate = GoodBadCounter.get_def_mask(dframe, good_bad_def["indeterminate"]) & ~is_bad
+        else:
+            is_indeterminate = np.zeros(len(dframe), dtype=bool)
+
+        labels = np.full(len(dframe), GoodBadCounter.GOOD_LABEL, dtype=np.int8)
+        labels[is_bad] = GoodBadCounter.BAD_LABEL
+        labels[is_indeterminate] = GoodBadCounter.INDETERMINATE_LABEL
+        return labels
+
+    # A method to count the number of good, bad & indeterminate labels
+    @staticmethod
+    def count_labels(labels):
+        counts = np.bincount(labels, minlength=3)
+        return (int(counts[GoodBadCounter.GOOD_LABEL]), int(counts[GoodBadCounter.BAD_LABEL]), int(counts[GoodBadCounter.INDETERMINATE_LABEL]))
+
+    # A method to get a boolean mask telling which rows satisfy any one of the numerical or categorical definitions
+    @staticmethod
+    def get_def_mask(dframe, defs):
+        mask = np.zeros(len(dframe), dtype=bool)
+        if "numerical" in defs:
+            for numeric_def in defs["numerical"]:
+                col = dframe[numeric_def["column"]].to_numpy()
+                # row is in any one of the ranges [lower, upper), missing values are never in a range
+                for a_range in numeric_def["ranges"]:
+                    mask |= (col >= a_range[0]) & (col < a_range[1])
+
+        if "categorical" in defs:
+            for categoric_def in defs["categorical"]:
+                # missing elements never match a row when compared by equality, so they are not looked up either
+                elements = [element for element in categoric_def["elements"] if element is not None and element == element]
+                mask |= dframe[categoric_def["column"]].isin(elements).to_numpy()
+
+        return mask
+
+    # A method to count the number of sample bad
+    @staticmethod
+    def count_sample_bad(dframe, bad_defs):
+        is_bad = GoodBadCounter.get_def_mask(dframe, bad_defs)
+        # keep only the rows which are not bad, for counting the indeterminate afterwards
+        return (dframe[~is_bad], int(is_bad.sum()))
+
+    # A method to count the number of sample indeterminate
+    @staticmethod
+    def count_sample_indeterminate(dframe, indeterminate_defs):
+        return int(GoodBadCounter.get_def_mask(dframe, indeterminate_defs).sum())
+
+    # A method to count the number of sample good
+    @staticmethod
+    def count_sample_good(dframe, sample_bad_count, sample_indeterminate_count):
+        return (len(dframe) - sample_bad_count - sample_indeterminate_count)
+
+    # A method to count the number of population good
+    @staticmethod
+    def get_population_good(sample_good_count, good_weight):
+        return sample_good_count * good_weight
+
+    # A method to count the number of population bad
+    @staticmethod
+    def get_population_bad(sample_bad_count, bad_weight):
+        return sample_bad_count * bad_weight
@@ -0,0 +1,84 @@
+import copy
+
+# A class for merging overlapping good bad definition ranges/elements for the same type (bad or indeterminate)
+class GoodBadDefDecoder:    
+    # A method to cast a good bad definition parsed from the ib_settings JSON (i.e., every value is a string) to the types used for labelling,
+    # i.e., the numerical bounds & the weights to float, & the numeric categorical elements (e.g., "1") to float, the other elements are kept.
+    # The given definition is not changed, a cast copy is returned
+    @staticmethod
+    def cast_good_bad_def(good_bad_def):
+        good_bad_def = copy.deepcopy(good_bad_def)
+        for def_type in ["bad", "indeterminate"]:
+            if def_type not in good_bad_def:
+                continue
+            for numeric_def in good_bad_def[def_type].get("numerical", list()):
+                numeric_def["ranges"] = [[float(r[0]), float(r[1])] for r in numeric_def["ranges"]]
+            for categoric_def in good_bad_def[def_type].get("categorical", list()):
+                categoric_def["elements"] = [float(element) if isinstance(element, str) and element.isnumeric() else element for element in categoric_def["elements"]]
+        for def_type in ["bad", "good"]:
+            if def_type in good_bad_def and "weight" in good_bad_def[def_type]:
+                good_bad_def[def_type]["weight"] = float(good_bad_def[def_type]["weight"])
+        return good_bad_def
+
+    # A method to translate numerical definition ranges defined by user (with/without overlapping) info to a list of numerical definition (no overlapping)
+    @staticmethod
+    def get_numeric_def_list_from_section(numeric_info_list):
+        # Group the ranges by column, columns are kept in the order of their first appearance
+        column_ranges_dict = dict()
+        for numeric_info in numeric_info_list:
+            column = numeric_info[0]
+            a_range = [numeric_info[1], numeric_info[2]]
+            if column not in column_ranges_dict:
+                column_ranges_dict[column] = list()
+            column_ranges_dict[column].append(a_range)
+
+        numeric_list = list()
+        for column, ranges in column_ranges_dict.items():
+            numeric_list.append({
+                "column": column,
+                "ranges": GoodBadDefDecoder.merge_numerical_def_ranges(ranges),
+            })
+        return numeric_list
+
+    # A method to merge overlapping (or touching) ranges into sorted non-overlapping ranges, e.g., from [[15, 20], [1, 10], [8, 14]] to [[1, 14], [15, 20]].
+    # Sort the ranges by lower bound, then sweep once to extend the last merged range or start a new one, i.e., O(n log n)
+    @staticmethod
+    def merge_numerical_def_ranges(numeric_def_r):
+        merged_def_ranges = list()
+        for r in GoodBadDefDecoder.sort_numerical_def_ranges(numeric_def_r):
+            if len(merged_def_ranges) != 0 and r[0] <= merged_def_ranges[-1][1]:
+                if r[1] > merged_def_ranges[-1][1]:
+                    merged_def_ranges[-1][1] = r[1]
+            else:
+                merged_def_ranges.append([r[0], r[1]])
+        return merged_def_ranges
+
+    # A method to sort a list of numerical def e.g., from [[15, 20], [1, 10], [13, 14]] to [[1, 10], [13, 14], [15, 20]].
+    # Ranges with the same lower bound are kept in their original order
+    @staticmethod
+    def sort_numerical_def_ranges(numeric_def_r):
+        return sorted(numeric_def_r, key=lambda r: r[0])
+
+    # A method to translate categorical definition elements defined by user (with/without overlapping) info to a list of categorical definition (no overlapping)
+    @staticmethod
+    def get_categorical_def_list_from_section(categoric_info_list):
+        categoric_list = list()  # initialization
+        for categoric_info in categoric_info_list:
+            single_def_dict = dict()
+            column = categoric_info[0]
+            elements = categoric_info[1]
+            # Check if any overlapping with previously saved data
+            has_overlap = False
+            for saved_def in categoric_list:
+                if saved_def["column"] == column:
+                    has_overlap = True
+                    # Append element to elements list if it is not existed yet
+                    for element in elements:
+                        if element not in saved_def["elements"]:
+                            saved_def["elements"].append(element)
+                    break
+            if has_overlap == False:
+                single_def_dict["column"] = column
+                single_def_dict["elements"] = elements
+                categoric_list.append(single_def_dict)
+        return categoric_list
\ No newline at end of file
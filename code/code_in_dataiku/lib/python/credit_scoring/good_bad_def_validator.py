@@ -0,0 +1,78 @@
+import bisect
+from .good_bad_def_decoder import GoodBadDefDecoder
+
+# A class for validating user inputs for good bad definitions
+class GoodBadDefValidator:
+    # A method to validate if numerical definitions for bad/indeterminate has overlapped
+    def validate_if_numerical_def_overlapped(self, bad_numeric_list, indeterminate_numeric_list):
+        return len(self.get_numerical_def_conflicts(bad_numeric_list, indeterminate_numeric_list)) == 0
+
+    # A method to get all pairs of bad & indeterminate numerical ranges [lower, upper) which have overlapped
+    # The indeterminate ranges of each column are merged first (see GoodBadDefDecoder.merge_numerical_def_ranges, as the web app does),
+    # so they are sorted & disjoint, and the ranges overlapping a bad range are found by binary search, i.e., O((n + m) log m + number of conflicts)
+    # Return a list in the form of [[column, bad_range, merged indeterminate_range], ...]
+    def get_numerical_def_conflicts(self, bad_numeric_list, indeterminate_numeric_list):
+        # Index the merged indeterminate ranges of each column by their bounds
+        indeterminate_index = GoodBadDefValidator.__get_numerical_range_index__(indeterminate_numeric_list)
+
+        conflict_list = list()
+        for bad_numeric_def in bad_numeric_list:
+            column = bad_numeric_def["column"]
+            if column not in indeterminate_index:
+                continue
+            merged_ranges, lower_list, upper_list = indeterminate_index[column]
+            for bad_range in bad_numeric_def["ranges"]:
+                # The overlapped ranges are the ones with upper > bad lower & lower < bad upper, i.e., a slice of the disjoint ranges
+                start = bisect.bisect_right(upper_list, bad_range[0])
+                end = bisect.bisect_left(lower_list, bad_range[1])
+                for indeterminate_range in merged_ranges[start:end]:
+                    conflict_list.append([column, bad_range, indeterminate_range])
+        return conflict_list
+
+    # A method to validate if categorical definitions for bad/indeterminate has overlapped
+    def validate_if_categorical_def_overlapped(self, bad_categoric_list, indeterminate_categoric_list):
+        return len(self.get_categorical_def_conflicts(bad_categoric_list, indeterminate_categoric_list)) == 0
+
+    # A method to get all elements which are in both the bad & indeterminate categorical definitions of the same column
+    # Return a list in the form of [[column, element], ...]
+    def get_categorical_def_conflicts(self, bad_categoric_list, indeterminate_categoric_list):
+        indeterminate_element_dict = dict()
+        for indeterminate_categoric_def in indeterminate_categoric_list:
+            indeterminate_element_dict.setdefault(indeterminate_categoric_def["column"], set()).update(indeterminate_categoric_def["elements"])
+
+        conflict_list = list()
+        for bad_categoric_def in bad_categoric_list:
+            column = bad_categoric_def["column"]
+            if column not in indeterminate_element_dict:
+                continue
+            common_element_set = indeterminate_element_dict[column].intersection(bad_categoric_def["elements"])
+            # Keep the order of the elements in the bad definition
+            for element in dict.fromkeys(bad_categoric_def["elements"]):
+                if element in common_element_set:
+                    conflict_list.append([column, element])
+        return conflict_list
+
+    # A method to validate if all numerical definition range have upper bound > lower bound, if not, returns false
+    def validate_numerical_bounds(self, numeric_info_list):
+        for numeric_info in numeric_info_list:
+            a_range = [numeric_info[1], numeric_info[2]]
+            try:
+                if a_range[1] <= a_range[0]:
+                    return False
+            except:
+                return False
+        return True
+
+    # A method to index the numerical ranges of each column, merged into sorted non-overlapping ranges
+    # Return a dict of column -> (merged_ranges, lower_list, upper_list), both bound lists are ascending as the ranges are disjoint
+    @staticmethod
+    def __get_numerical_range_index__(numeric_list):
+        column_range_dict = dict()
+        for numeric_def in numeric_list:
+            column_range_dict.setdefault(numeric_def["column"], list()).extend(numeric_def["ranges"])
+
+        range_index = dict()
+        for column, ranges in column_range_dict.items():
+            merged_ranges = GoodBadDefDecoder.merge_numerical_def_ranges(ranges)
+            range_index[column] = (merged_ranges, [r[0] for r in merged_ranges], [r[1] for r in merged_ranges])
+        return range_index
@@ -0,0 +1,722 @@
+import copy
+import numpy as np
+import pandas as pd
+from .bins_plan import ColBinsPlan
+from .dataiku_compat import get_str_from_ranges
+
+
+# A class for handling interactive binning logics
+class InteractiveBinningMachine:
+    # Interactive actions which can be performed by perform_action()
+    ACTION_LIST = ["categoric_create_new_bin", "categoric_add_elements", "categoric_split_bin", "categoric_rename_bin", "categoric_merge_bins",
+                   "numeric_create_new_bin", "get_numeric_adjust_cutpoints", "numeric_rename_bin", "numeric_merge_bins"]
+
+    # A method to perform an interactive action (e.g., "categoric_rename_bin") with its arguments, and get the changes of the bins
+    # Return a tuple (temp_col_bins_settings, old_bin_list, new_bin_list, bins_diff), where the first 3 are returned by the action
+    # and bins_diff is returned by get_bins_diff(), so that the binned column can be updated by rebin_codes() instead of binning it again
+    @staticmethod
+    def perform_action(action, temp_col_bins_settings, **kwargs):
+        if action not in InteractiveBinningMachine.ACTION_LIST:
+            raise ValueError(f"Unknown interactive binning action: {action!r}")
+        old_col_bins_settings = copy.deepcopy(temp_col_bins_settings)
+        new_settings, old_bin_list, new_bin_list = getattr(InteractiveBinningMachine, action)(temp_col_bins_settings=temp_col_bins_settings, **kwargs)
+        return (new_settings, old_bin_list, new_bin_list, InteractiveBinningMachine.get_bins_diff(old_col_bins_settings, new_settings))
+
+    # A method to get the changes of the bins of a column from its bins settings before & after an interactive action
+    # Bins are compared by the values they hold (i.e., ranges or elements), not by how the action changed the bins settings, e.g.,
+    # {
+    #     "old_bin_names": ["A", "B", "C"],  # bin codes before the action (i.e., the index in the list), -1 is missing
+    #     "new_bin_names": ["C", "AB"],      # bin codes after the action
+    #     "code_map": [1, 1, 0],             # the new bin code of the rows of each old bin, except the rows with moved values
+    #     "renamed": [],                     # [[old bin name, new bin name], ...] of the bins holding the same values
+    #     "merged": [[["A", "B"], "AB"]],    # [[[old bin names], new bin name], ...] of the new bins made of whole old bins
+    #     "moved_ranges": [],                # numerical: [[lower, upper], ...] of the values which have moved to another bin
+    #     "moved_elements": [],              # categorical: elements which have moved to another bin
+    # }
+    # Return None if any of the bins settings is not a list of bins (e.g., auto binning), i.e., the column must be binned again
+    @staticmethod
+    def get_bins_diff(old_col_bins_settings, new_col_bins_settings):
+        if not isinstance(old_col_bins_settings["bins"], list) or not isinstance(new_col_bins_settings["bins"], list):
+            return None
+        old_plan = ColBinsPlan(old_col_bins_settings)
+        new_plan = ColBinsPlan(new_col_bins_settings)
+
+        # Split the values into pieces where both the old & new bin are the same, each weighted by its size
+        if old_plan.type == "numerical":
+            edges = np.union1d(old_plan.edges, new_plan.edges)
+            piece_list = edges[:-1].tolist()
+            old_code_arr = ColBinsPlan.lookup_numerical_bin_codes(edges[:-1], old_plan.edges, old_plan.codes)
+            new_code_arr = ColBinsPlan.lookup_numerical_bin_codes(edges[:-1], new_plan.edges, new_plan.codes)
+            weight_arr = np.diff(edges)
+        else:
+            piece_list = list(old_plan.element_codes)
+            for element in new_plan.element_codes:
+                if element not in old_plan.element_codes:
+                    piece_list.append(element)
+            old_code_arr = np.array([old_plan.element_codes.get(element, -1) for element in piece_list], dtype=np.int64)
+            new_code_arr = np.array([new_plan.element_codes.get(element, -1) for element in piece_list], dtype=np.int64)
+            weight_arr = np.ones(len(piece_list))
+
+        # The rows of an old bin go to the new bin holding most of its values, the rest of its values are moved
+        code_map = np.full(len(old_plan.bin_names), -1, dtype=np.int64)
+        for old_code in range(len(old_plan.bin_names)):
+            is_in_old_bin = old_code_arr == old_code
+            if is_in_old_bin.any():
+                new_weight_arr = np.bincount(new_code_arr[is_in_old_bin] + 1, weights=weight_arr[is_in_old_bin])
+                code_map[old_code] = int(np.argmax(new_weight_arr)) - 1
+        is_moved_arr = new_code_arr != np.append(code_map, -1)[old_code_arr]
+
+        bins_diff = {
+            "old_bin_names": list(old_plan.bin_names),
+            "new_bin_names": list(new_plan.bin_names),
+            "code_map": code_map.tolist(),
+            "renamed": list(),
+            "merged": list(),
+            "moved_ranges": list(),
+            "moved_elements": list(),
+        }
+
+        # A new bin is renamed from or merged from old bins only if no value has moved into or out of these bins
+        moved_code_set = set(old_code_arr[is_moved_arr].tolist()) | set(new_code_arr[is_moved_arr].tolist())
+        for new_code, new_bin_name in enumerate(new_plan.bin_names):
+            old_code_list = [old_code for old_code in range(len(code_map)) if code_map[old_code] == new_code]
+            if new_code in moved_code_set or any(old_code in moved_code_set for old_code in old_code_list):
+                continue
+            if len(old_code_list) == 1 and old_plan.bin_names[old_code_list[0]] != new_bin_name:
+                bins_diff["renamed"].append([old_plan.bin_names[old_code_list[0]], new_bin_name])
+            elif len(old_code_list) > 1:
+                bins_diff["merged"].append([[old_plan.bin_names[old_code] for old_code in old_code_list], new_bin_name])
+
+        if old_plan.type == "numerical":
+            for piece_idx in np.flatnonzero(is_moved_arr).tolist():
+                if len(bins_diff["moved_ranges"]) > 0 and bins_diff["moved_ranges"][-1][1] == piece_list[piece_idx]:
+                    bins_diff["moved_ranges"][-1][1] = float(edges[piece_idx + 1])  # join adjacent ranges
+                else:
+                    bins_diff["moved_ranges"].append([piece_list[piece_idx], float(edges[piece_idx + 1])])
+        else:
+            bins_diff["moved_elements"] = [piece_list[piece_idx] for piece_idx in np.flatnonzero(is_moved_arr).tolist()]
+
+        return bins_diff
+
+    # A method to update the bin code of each row of a column (as ColBinsPlan.get_bin_codes, -1 is missing) after an interactive action,
+    # given the changes of the bins (get_bins_diff), the bins settings after the action & the ColValueIndex of the column
+    # A rename keeps the bin codes as they are, a merge maps the bin codes, and only the rows holding moved values are looked up again
+    # Return the new bin codes (the given bin codes are not changed)
+    @staticmethod
+    def rebin_codes(bin_codes, bins_diff, new_col_bins_settings, col_value_index):
+        code_map = np.array(bins_diff["code_map"], dtype=np.int64)
+        if len(code_map) == len(bins_diff["new_bin_names"]) and np.array_equal(code_map, np.arange(len(code_map))):
+            new_bin_codes = bin_codes
+        else:
+            new_bin_codes = np.append(code_map, -1)[bin_codes]  # code -1 picks the extra last code
+
+        if len(bins_diff["moved_ranges"]) == 0 and len(bins_diff["moved_elements"]) == 0:
+            return new_bin_codes
+        if new_bin_codes is bin_codes:
+            new_bin_codes = bin_codes.copy()
+
+        new_plan = ColBinsPlan(new_col_bins_settings)
+        if new_plan.type == "numerical":
+            for lower, upper in bins_diff["moved_ranges"]:
+                rows, values = col_value_index.get_rows_in_range(lower, upper)
+                new_bin_codes[rows] = ColBinsPlan.lookup_numerical_bin_codes(values, new_plan.edges, new_plan.codes)
+        else:
+            for element in bins_diff["moved_elements"]:
+                new_bin_codes[col_value_index.get_rows_of_element(element)] = new_plan.element_codes.get(element, -1)
+        return new_bin_codes
+
+    @staticmethod
+    def categoric_create_new_bin(new_bin_name, new_bin_element_li, temp_col_bins_settings):
+        if len(new_bin_element_li) == 0:
+            return (temp_col_bins_settings, -3, -3)
+
+        if InteractiveBinningMachine.validate_new_name(new_bin_name, temp_col_bins_settings) == False:
+            return (temp_col_bins_settings, -1, -1)
+
+        old_bin_list = list()
+        new_bin_list = list()
+
+        bin_to_remove_idx_li = list()
+        # for all bins, remove overlapped elements with new_bin_element_li
+        for idx in range(len(temp_col_bins_settings["bins"])):
+            intersaction = set(temp_col_bins_settings["bins"][idx]["elements"]) & set(
+                new_bin_element_li)
+            if bool(intersaction) == True:
+                old_bin_list.append([temp_col_bins_settings["bins"][idx]["name"], str(
+                    temp_col_bins_settings["bins"][idx]["elements"])])
+                intersaction_li = list(intersaction)
+                temp_col_bins_settings["bins"][idx]["elements"] = [
+                    x for x in temp_col_bins_settings["bins"][idx]["elements"] if x not in intersaction_li]
+
+                if len(temp_col_bins_settings["bins"][idx]["elements"]) == 0:
+                    bin_to_remove_idx_li.append(idx)
+                else:
+                    new_bin_list.append([temp_col_bins_settings["bins"][idx]["name"], str(
+                        temp_col_bins_settings["bins"][idx]["elements"])])
+
+        for idx in sorted(bin_to_remove_idx_li, reverse=True):
+            del temp_col_bins_settings["bins"][idx]
+
+        # add the new bin to bins settings
+        if new_bin_name == "" or new_bin_name == None:
+            new_bin_name = str(new_bin_element_li)
+
+        if InteractiveBinningMachine.validate_new_name(new_bin_name, temp_col_bins_settings) == False:
+            return (temp_col_bins_settings, -1, -1)
+
+        new_bin = {
+            "name": new_bin_name,
+            "elements": new_bin_element_li
+        }
+
+        new_bin_list.append([new_bin_name, str(new_bin_element_li)])
+
+        temp_col_bins_settings["bins"].append(new_bin)
+
+        return (temp_col_bins_settings, old_bin_list, new_bin_list)
+
+    @staticmethod
+    def categoric_add_elements(selected_bin_name, new_bin_name, elements_to_add_li, temp_col_bins_settings):
+        if len(elements_to_add_li) == 0:
+            return (temp_col_bins_settings, -3, -3)
+
+        if InteractiveBinningMachine.validate_new_name(new_bin_name, temp_col_bins_settings, selected_bin_name=selected_bin_name) == False:
+            return (temp_col_bins_settings, -1, -1)
+
+        old_bin_list = list()
+        new_bin_list = list()
+
+        bin_to_remove_idx_li = list()
+        # for all bins, remove overlapped elements with new_bin_element_li
+        for idx in range(len(temp_col_bins_settings["bins"])):
+            intersaction = set(temp_col_bins_settings["bins"][idx]["elements"]) & set(
+                elements_to_add_li)
+            if bool(intersaction) == True:
+                old_bin_list.append([temp_col_bins_settings["bins"][idx]["name"], str(
+                    temp_col_bins_settings["bins"][idx]["elements"])])
+                intersaction_li = list(intersaction)
+                temp_col_bins_settings["bins"][idx]["elements"] = [
+                    x for x in temp_col_bins_settings["bins"][idx]["elements"] if x not in intersaction_li]
+
+                if len(temp_col_bins_settings["bins"][idx]["elements"]) == 0:
+                    bin_to_remove_idx_li.append(idx)
+                else:
+                    new_bin_list.append([temp_col_bins_settings["bins"][idx]["name"], str(
+                        temp_col_bins_settings["bins"][idx]["elements"])])
+
+            elif temp_col_bins_settings["bins"][idx]["name"] == selected_bin_name:
+                old_bin_list.append([temp_col_bins_settings["bins"][idx]["name"], str(
+                    temp_col_bins_settings["bins"][idx]["elements"])])
+                # Add elements to the selected bin
+                for element in elements_to_add_li:
+                    temp_col_bins_settings["bins"][idx]["elements"].append(
+                        element)
+                if new_bin_name != "" and new_bin_name != None:
+                    temp_col_bins_settings["bins"][idx]["name"] = new_bin_name
+                new_bin_list.append([temp_col_bins_settings["bins"][idx]["name"], str(
+                    temp_col_bins_settings["bins"][idx]["elements"])])
+
+        for idx in sorted(bin_to_remove_idx_li, reverse=True):
+            del temp_col_bins_settings["bins"][idx]
+
+        return (temp_col_bins_settings, old_bin_list, new_bin_list)
+
+    @staticmethod
+    def categoric_split_bin(selected_bin_name, new_bin_name, elements_to_split_out_li, temp_col_bins_settings):
+        if len(elements_to_split_out_li) == 0:
+            return (temp_col_bins_settings, -3, -3)
+
+        if InteractiveBinningMachine.validate_new_name(new_bin_name, temp_col_bins_settings, selected_bin_name=selected_bin_name) == False:
+            return (temp_col_bins_settings, -1, -1)
+
+        old_bin_list = list()
+        new_bin_list = list()
+
+        for idx in range(len(temp_col_bins_settings["bins"])):
+            if temp_col_bins_settings["bins"][idx]["name"] == selected_bin_name:
+                if set(temp_col_bins_settings["bins"][idx]["elements"]) == set(elements_to_split_out_li):
+                    return (temp_col_bins_settings, -4, -4)
+                old_bin_list.append([temp_col_bins_settings["bins"][idx]["name"], str(
+                    temp_col_bins_settings["bins"][idx]["elements"])])
+                # Remove user indicated elements from selected bin
+                temp_col_bins_settings["bins"][idx]["elements"] = [
+                    x for x in temp_col_bins_settings["bins"][idx]["elements"] if x not in elements_to_split_out_li]
+                new_bin_list.append([temp_col_bins_settings["bins"][idx]["name"], str(
+                    temp_col_bins_settings["bins"][idx]["elements"])])
+                break
+
+        if new_bin_name == "" or new_bin_name == None:
+            new_bin_name = str(elements_to_split_out_li)
+
+        new_bin = {
+            "name": new_bin_name,
+            "elements": elements_to_split_out_li,
+        }
+
+        temp_col_bins_settings["bins"].append(new_bin)
+
+        new_bin_list.append([new_bin_name, str(elements_to_split_out_li)])
+
+        return (temp_col_bins_settings, old_bin_list, new_bin_list)
+
+    @staticmethod
+    def categoric_rename_bin(selected_bin_name, new_bin_name, temp_col_bins_settings):
+        if selected_bin_name == new_bin_name:
+            return (temp_col_bins_settings, -2, -2)
+
+        if InteractiveBinningMachine.validate_new_name(new_bin_name, temp_col_bins_settings) == False:
+            return (temp_col_bins_settings, -1, -1)
+
+        old_bin_list = list()
+        new_bin_list = list()
+
+        for idx in range(len(temp_col_bins_settings["bins"])):
+            if temp_col_bins_settings["bins"][idx]["name"] == selected_bin_name:
+                old_bin_list.append([temp_col_bins_settings["bins"][idx]["name"], str(
+                    temp_col_bins_settings["bins"][idx]["elements"])])
+
+                if new_bin_name == "" or new_bin_name == None:
+                    new_bin_name = str(
+                        temp_col_bins_settings["bins"][idx]["elements"])
+
+                if InteractiveBinningMachine.validate_new_name(new_bin_name, temp_col_bins_settings) == False:
+                    return (temp_col_bins_settings, -1, -1)
+
+                temp_col_bins_settings["bins"][idx]["name"] = new_bin_name
+                new_bin_list.append([temp_col_bins_settings["bins"][idx]["name"], str(
+                    temp_col_bins_settings["bins"][idx]["elements"])])
+                break
+
+        return (temp_col_bins_settings, old_bin_list, new_bin_list)
+
+    @staticmethod
+    def categoric_merge_bins(selected_bin_name_li, new_bin_name, temp_col_bins_settings):
+        new_bin_element_list = list()
+        bin_to_remove_idx_li = list()
+        # Add elements to bin if it is one of the selected bins
+        for idx in range(len(temp_col_bins_settings["bins"])):
+            if temp_col_bins_settings["bins"][idx]["name"] in selected_bin_name_li:
+                for element in temp_col_bins_settings["bins"][idx]["elements"]:
+                    new_bin_element_list.append(element)
+                bin_to_remove_idx_li.append(idx)
+
+        for idx in sorted(bin_to_remove_idx_li, reverse=True):
+            del temp_col_bins_settings["bins"][idx]
+
+        if new_bin_name == "" or new_bin_name == None:
+            new_bin_name = str(new_bin_element_list)
+
+        if InteractiveBinningMachine.validate_new_name(new_bin_name, temp_col_bins_settings) == False:
+            return (temp_col_bins_settings, -1, -1)
+
+        new_bin = {
+            "name": new_bin_name,
+            "elements": new_bin_element_list,
+        }
+
+        temp_col_bins_settings["bins"].append(new_bin)
+
+        new_bin_list = [[new_bin_name, str(new_bin_element_list)]]
+
+        return (temp_col_bins_settings, [], new_bin_list)
+
+    @staticmethod
+    def numeric_create_new_bin(new_bin_name, new_bin_ranges, temp_col_bins_settings):
+        if len(new_bin_ranges) == 0:
+            return (temp_col_bins_settings, -6, -6)
+
+        if InteractiveBinningMachine.validate_new_name(new_bin_name, temp_col_bins_settings) == False:
+            return (temp_col_bins_settings, -1, -1)
+
+        old_bin_list = list()
+        new_bin_list = list()
+
+        bin_to_remove_idx_li = list()
+        # for all bins, remove overlapped ranges with new_bin_ranges
+        for bin_def_idx in range(len(temp_col_bins_settings["bins"])):
+            with_changes = False
+            for new_r in new_bin_ranges:
+                r_to_remove_idx_li = list()
+                r_to_append_li = list()
+                for r_idx in range(len(temp_col_bins_settings["bins"][bin_def_idx]["ranges"])):
+                    r = temp_col_bins_settings["bins"][bin_def_idx]["ranges"][r_idx]
+                    if new_r[1] <= r[0]:
+                        continue
+                    elif new_r[0] <= r[0] and new_r[1] > r[0] and new_r[1] < r[1]:
+                        if with_changes == False:
+                            old_bin_list.append([temp_col_bins_settings["bins"][bin_def_idx]["name"], get_str_from_ranges(
+                                temp_col_bins_settings["bins"][bin_def_idx]["ranges"])])
+                            with_changes = True
+                        # then new def = [new_r[1], r[1]]
+                        temp_col_bins_settings["bins"][bin_def_idx]["ranges"][r_idx] = [
+                            new_r[1], r[1]]
+                    elif new_r[0] <= r[0] and new_r[1] > r[0] and new_r[1] >= r[1]:
+                        if with_changes == False:
+                            old_bin_list.append([temp_col_bins_settings["bins"][bin_def_idx]["name"], get_str_from_ranges(
+                                temp_col_bins_settings["bins"][bin_def_idx]["ranges"])])
+                            with_changes = True
+                        # remove the def r
+                        r_to_remove_idx_li.append(r_idx)
+                    elif new_r[0] > r[0] and new_r[1] < r[1]:
+                        if with_changes == False:
+                            old_bin_list.append([temp_col_bins_settings["bins"][bin_def_idx]["name"], get_str_from_ranges(
+                                temp_col_bins_settings["bins"][bin_def_idx]["ranges"])])
+                            with_changes = True
+                        # split to two = [r[0], new_r[0]] & [new_r[1], r[1]]
+                        temp_col_bins_settings["bins"][bin_def_idx]["ranges"][r_idx] = [
+                            r[0], new_r[0]]
+                        r_to_append_li.append([new_r[1], r[1]])
+                    elif new_r[0] > r[0] and new_r[0] < r[1] and new_r[1] >= r[1]:
+                        if with_changes == False:
+                            old_bin_list.append([temp_col_bins_settings["bins"][bin_def_idx]["name"], get_str_from_ranges(
+                                temp_col_bins_settings["bins"][bin_def_idx]["ranges"])])
+                            with_changes = True
+                        # new def = [r[0], new_r[0]]
+                        temp_col_bins_settings["bins"][bin_def_idx]["ranges"][r_idx] = [
+                            r[0], new_r[0]]
+                    elif new_r[0] >= r[1]:
+                        continue
+
+                for idx in sorted(r_to_remove_idx_li, reverse=True):
+                    del temp_col_bins_settings["bins"][bin_def_idx]["ranges"][idx]
+
+                for r_to_append in r_to_append_li:
+                    temp_col_bins_settings["bins"][bin_def_idx]["ranges"].append(
+                        r_to_append)
+
+            if len(temp_col_bins_settings["bins"][bin_def_idx]["ranges"]) == 0:
+                bin_to_remove_idx_li.append(bin_def_idx)
+            elif with_changes == True:
+                new_bin_list.append([temp_col_bins_settings["bins"][bin_def_idx]["name"], get_str_from_ranges(
+                    temp_col_bins_settings["bins"][bin_def_idx]["ranges"])])
+
+        # Remove bin_def if it has empty def range list
+        for idx in sorted(bin_to_remove_idx_li, reverse=True):
+            del temp_col_bins_settings["bins"][idx]
+
+        if new_bin_name == "" or new_bin_name == None:
+            new_bin_name = get_str_from_ranges(new_bin_ranges)
+
+        if InteractiveBinningMachine.validate_new_name(new_bin_name, temp_col_bins_settings) == False:
+            return (temp_col_bins_settings, -1, -1)
+
+        # Add new bin to def
+        new_bin = {
+            "name": new_bin_name,
+            "ranges": new_bin_ranges,
+        }
+
+        temp_col_bins_settings["bins"].append(new_bin)
+
+        new_bin_list.append(
+            [new_bin_name, get_str_from_ranges(new_bin_ranges)])
+
+        if len(old_bin_list) == 0:
+            return (temp_col_bins_settings, old_bin_list, ("", new_bin_list))
+
+        return (temp_col_bins_settings, old_bin_list, new_bin_list)
+
+    @staticmethod
+    def get_numeric_adjust_cutpoints(selected_bin_name, new_bin_name, new_bin_ranges, temp_col_bins_settings):
+
+        if len(new_bin_ranges) == 0:
+            return (temp_col_bins_settings, -6, -6)
+
+        if InteractiveBinningMachine.validate_new_name(new_bin_name, temp_col_bins_settings) == False:
+            return (temp_col_bins_settings, -1, -1)
+
+        old_bin_list = list()
+        new_bin_list = list()
+
+        # For all bins except the selected one, remove ranges in updated_bin_ranges that overlaps with it
+        bin_to_remove_idx_li = list()
+        for bin_def_idx in range(len(temp_col_bins_settings["bins"])):
+            if temp_col_bins_settings["bins"][bin_def_idx]["name"] == selected_bin_name:
+                if temp_col_bins_settings["bins"][bin_def_idx]["ranges"] == new_bin_ranges:
+                    return (temp_col_bins_settings, [], [])
+                old_bin_list.append([temp_col_bins_settings["bins"][bin_def_idx]["name"], get_str_from_ranges(
+                    temp_col_bins_settings["bins"][bin_def_idx]["ranges"])])
+                # Remove ranges from old def that overlapped with updated_bin_ranges
+                for new_r in new_bin_ranges:
+                    r_to_remove_idx_li = list()
+                    r_to_append_li = list()
+                    for r_idx in range(len(temp_col_bins_settings["bins"][bin_def_idx]["ranges"])):
+                        r = temp_col_bins_settings["bins"][bin_def_idx]["ranges"][r_idx]
+                        if new_r[1] <= r[0]:
+                            continue
+                        elif new_r[0] <= r[0] and new_r[1] > r[0] and new_r[1] < r[1]:
+                            # then new def = [new_r[1], r[1]]
+                            temp_col_bins_settings["bins"][bin_def_idx]["ranges"][r_idx] = [
+                                new_r[1], r[1]]
+                        elif new_r[0] <= r[0] and new_r[1] > r[0] and new_r[1] >= r[1]:
+                            # remove the def r
+                            r_to_remove_idx_li.append(r_idx)
+                        elif new_r[0] > r[0] and new_r[1] < r[1]:
+                            # split to two = [r[0], new_r[0]] & [new_r[1], r[1]]
+                            temp_col_bins_settings["bins"][bin_def_idx]["ranges"][r_idx] = [
+                                r[0], new_r[0]]
+                            r_to_append_li.append([new_r[1], r[1]])
+                        elif new_r[0] > r[0] and new_r[0] < r[1] and new_r[1] >= r[1]:
+                            # new def = [r[0], new_r[0]]
+                            temp_col_bins_settings["bins"][bin_def_idx]["ranges"][r_idx] = [
+                                r[0], new_r[0]]
+                        elif new_r[0] >= r[1]:
+                            continue
+
+                    for idx in sorted(r_to_remove_idx_li, reverse=True):
+                        del temp_col_bins_settings["bins"][bin_def_idx]["ranges"][idx]
+
+                    for r_to_append in r_to_append_li:
+                        temp_col_bins_settings["bins"][bin_def_idx]["ranges"].append(
+                            r_to_append)
+
+                # no need split
+                if len(temp_col_bins_settings["bins"][bin_def_idx]["ranges"]) == 0:
+                    temp_col_bins_settings["bins"][bin_def_idx]["ranges"] = new_bin_ranges
+                else:
+                    new_bin_list.append([get_str_from_ranges(temp_col_bins_settings["bins"][bin_def_idx]["ranges"]), get_str_from_ranges(
+                        temp_col_bins_settings["bins"][bin_def_idx]["ranges"])])
+                    temp_col_bins_settings["bins"].append({"name": get_str_from_ranges(
+                        temp_col_bins_settings["bins"][bin_def_idx]["ranges"]), "ranges": temp_col_bins_settings["bins"][bin_def_idx]["ranges"]})
+
+                    if new_bin_name != "" and new_bin_name != None:
+                        temp_col_bins_settings["bins"][bin_def_idx]["name"] = new_bin_name
+                    temp_col_bins_settings["bins"][bin_def_idx]["ranges"] = new_bin_ranges
+                    new_bin_list.append([temp_col_bins_settings["bins"][bin_def_idx]["name"], get_str_from_ranges(
+                        temp_col_bins_settings["bins"][bin_def_idx]["ranges"])])
+
+            else:
+                with_changes = False
+                for new_r in new_bin_ranges:
+                    r_to_remove_idx_li = list()
+                    r_to_append_li = list()
+                    for r_idx in range(len(temp_col_bins_settings["bins"][bin_def_idx]["ranges"])):
+                        r = temp_col_bins_settings["bins"][bin_def_idx]["ranges"][r_idx]
+                        if new_r[1] <= r[0]:
+                            continue
+                        elif new_r[0] <= r[0] and new_r[1] > r[0] and new_r[1] < r[1]:
+                            if with_changes == False:
+                                old_bin_list.append([temp_col_bins_settings["bins"][bin_def_idx]["name"], get_str_from_ranges(
+                                    temp_col_bins_settings["bins"][bin_def_idx]["ranges"])])
+                                with_changes = True
+                            # then new def = [new_r[1], r[1]]
+                            temp_col_bins_settings["bins"][bin_def_idx]["ranges"][r_idx] = [
+                                new_r[1], r[1]]
+                        elif new_r[0] <= r[0] and new_r[1] > r[0] and new_r[1] >= r[1]:
+                            if with_changes == False:
+                                old_bin_list.append([temp_col_bins_settings["bins"][bin_def_idx]["name"], get_str_from_ranges(
+                                    temp_col_bins_settings["bins"][bin_def_idx]["ranges"])])
+                                with_changes = True
+                            # remove the def r
+                            r_to_remove_idx_li.append(r_idx)
+                        elif new_r[0] > r[0] and new_r[1] < r[1]:
+                            if with_changes == False:
+                                old_bin_list.append([temp_col_bins_settings["bins"][bin_def_idx]["name"], get_str_from_ranges(
+                                    temp_col_bins_settings["bins"][bin_def_idx]["ranges"])])
+                                with_changes = True
+                            # split to two = [r[0], new_r[0]] & [new_r[1], r[1]]
+                            temp_col_bins_settings["bins"][bin_def_idx]["ranges"][r_idx] = [
+                                r[0], new_r[0]]
+                            r_to_append_li.append([new_r[1], r[1]])
+                        elif new_r[0] > r[0] and new_r[0] < r[1] and new_r[1] >= r[1]:
+                            if with_changes == False:
+                                old_bin_list.append([temp_col_bins_settings["bins"][bin_def_idx]["name"], get_str_from_ranges(
+                                    temp_col_bins_settings["bins"][bin_def_idx]["ranges"])])
+                                with_changes = True
+                            # new def = [r[0], new_r[0]]
+                            temp_col_bins_settings["bins"][bin_def_idx]["ranges"][r_idx] = [
+                                r[0], new_r[0]]
+                        elif new_r[0] >= r[1]:
+                            continue
+
+                    for idx in sorted(r_to_remove_idx_li, reverse=True):
+                        del temp_col_bins_settings["bins"][bin_def_idx]["ranges"][idx]
+
+                    for r_to_append in r_to_append_li:
+                        temp_col_bins_settings["bins"][bin_def_idx]["ranges"].append(
+                            r_to_append)
+
+                if len(temp_col_bins_settings["bins"][bin_def_idx]["ranges"]) == 0:
+                    bin_to_remove_idx_li.append(bin_def_idx)
+                elif with_changes == True:
+                    new_bin_list.append([temp_col_bins_settings["bins"][bin_def_idx]["name"], get_str_from_ranges(
+                        temp_col_bins_settings["bins"][bin_def_idx]["ranges"])])
+
+        # Remove bin_def if it has empty def range list
+        for idx in sorted(bin_to_remove_idx_li, reverse=True):
+            del temp_col_bins_settings["bins"][idx]
+
+        return (temp_col_bins_settings, old_bin_list, new_bin_list)
+
+    @staticmethod
+    def numeric_rename_bin(selected_bin_name, new_bin_name, temp_col_bins_settings):
+        if selected_bin_name == new_bin_name:
+            return (temp_col_bins_settings, -2, -2)
+
+        if InteractiveBinningMachine.validate_new_name(new_bin_name, temp_col_bins_settings) == False:
+            return (temp_col_bins_settings, -1, -1)
+
+        old_bin_list = list()
+        new_bin_list = list()
+
+        for idx in range(len(temp_col_bins_settings["bins"])):
+            if temp_col_bins_settings["bins"][idx]["name"] == selected_bin_name:
+                old_bin_list.append([temp_col_bins_settings["bins"][idx]["name"], get_str_from_ranges(
+                    temp_col_bins_settings["bins"][idx]["ranges"])])
+
+                if new_bin_name == "" or new_bin_name == None:
+                    new_bin_name = get_str_from_ranges(
+                        temp_col_bins_settings["bins"][idx]["ranges"])
+
+                if InteractiveBinningMachine.validate_new_name(new_bin_name, temp_col_bins_settings) == False:
+                    return (temp_col_bins_settings, -1, -1)
+
+                temp_col_bins_settings["bins"][idx]["name"] = new_bin_name
+                new_bin_list.append([temp_col_bins_settings["bins"][idx]["name"], get_str_from_ranges(
+                    temp_col_bins_settings["bins"][idx]["ranges"])])
+                break
+
+        return (temp_col_bins_settings, old_bin_list, new_bin_list)
+
+    @staticmethod
+    def numeric_merge_bins(selected_bin_name_li, new_bin_name, temp_col_bins_settings):
+        new_bin_ranges_li = list()
+        bin_to_remove_idx_li = list()
+        # Add elements to bin if it is one of the selected bins
+        for idx in range(len(temp_col_bins_settings["bins"])):
+            if temp_col_bins_settings["bins"][idx]["name"] in selected_bin_name_li:
+                for r in temp_col_bins_settings["bins"][idx]["ranges"]:
+                    new_bin_ranges_li.append(r)
+                bin_to_remove_idx_li.append(idx)
+
+        for idx in sorted(bin_to_remove_idx_li, reverse=True):
+            del temp_col_bins_settings["bins"][idx]
+
+        decoded_new_bin_ranges_li = decode_ib_ranges(new_bin_ranges_li)
+
+        if new_bin_name == "" or new_bin_name == None:
+            new_bin_name = get_str_from_ranges(decoded_new_bin_ranges_li)
+
+        if InteractiveBinningMachine.validate_new_name(new_bin_name, temp_col_bins_settings) == False:
+            return (temp_col_bins_settings, -1, -1)
+
+        new_bin = {
+            "name": new_bin_name,
+            "ranges": decoded_new_bin_ranges_li,
+        }
+
+        temp_col_bins_settings["bins"].append(new_bin)
+
+        new_bin_list = [
+            [new_bin_name, get_str_from_ranges(decoded_new_bin_ranges_li)]]
+
+        return (temp_col_bins_settings, [], new_bin_list)
+
+    @staticmethod
+    def validate_new_name(new_name, temp_col_bins_settings, selected_bin_name=None):
+        # Return false if name has already been use. otherwise, return True
+        if selected_bin_name == None:
+            for bin_def in temp_col_bins_settings["bins"]:
+                if bin_def["name"] == new_name:
+                    return False
+            return True
+        else:
+            if selected_bin_name == new_name:
+                return True
+            for bin_def in temp_col_bins_settings["bins"]:
+                if bin_def["name"] == new_name:
+                    return False
+            return True
+
+
+# A function to merge the overlapping ranges of a new bin input by the user into a list of non-overlapping ranges
+def decode_ib_ranges(ranges):
+    if len(ranges) == 0:
+        return []
+    numeric_list = list()  # initialization
+    # print(len(ranges))
+    for numeric_info in ranges:
+        single_def_list = list()
+        # print(f"numeric_info: {numeric_info}")
+        a_range = [numeric_info[0], numeric_info[1]]
+        # The 2 bounds are valid, now check if any overlapping with previously saved data
+        has_column_overlap = False
+        for def_idx, saved_def in enumerate(numeric_list):
+            # print(f"def_idx: {def_idx}, saved_def: {saved_def}")
+            has_column_overlap = True
+            has_range_overlap = False
+            overlapped_def_range_idxes = list()
+            # Merge range to element list
+            for def_range_idx, def_range in enumerate(saved_def):
+                if len(overlapped_def_range_idxes) != 0:
+                    a_range = numeric_list[def_idx][overlapped_def_range_idxes[0]]
+
+                if a_range[0] <= def_range[0] and a_range[1] >= def_range[1]:
+                    has_range_overlap = True
+                    numeric_list[def_idx][def_range_idx] = [
+                        a_range[0], a_range[1]]
+                    overlapped_def_range_idxes.insert(0, def_range_idx)
+                elif def_range[0] <= a_range[0] and def_range[1] >= a_range[1]:
+                    has_range_overlap = True
+                elif a_range[0] <= def_range[0] and a_range[1] >= def_range[0] and a_range[1] <= def_range[1]:
+                    has_range_overlap = True
+                    numeric_list[def_idx][def_range_idx] = [
+                        a_range[0], def_range[1]]
+                    overlapped_def_range_idxes.insert(0, def_range_idx)
+                elif a_range[0] >= def_range[0] and a_range[0] <= def_range[1] and a_range[1] >= def_range[1]:
+                    has_range_overlap = True
+                    numeric_list[def_idx][def_range_idx] = [
+                        def_range[0], a_range[1]]
+                    overlapped_def_range_idxes.insert(0, def_range_idx)
+            if len(overlapped_def_range_idxes) != 0:
+                del overlapped_def_range_idxes[0]
+                for i in sorted(overlapped_def_range_idxes, reverse=True):
+                    del numeric_list[def_idx][i]
+            if has_range_overlap == False:
+                numeric_list[def_idx].append(a_range)
+            break
+        if has_column_overlap == False:
+            single_def_list = [a_range]
+            numeric_list.append(single_def_list)
+
+    return numeric_list[0]
+
+
+# A class indexing the rows of a column by value, so that the rows holding some values are found without scanning the column
+# Numerical: the non-missing values sorted, so the rows in a range [lower, upper) are a slice found by binary search
+# Categorical: the rows grouped by unique value, so the rows of an element are a slice
+class ColValueIndex:
+    def __init__(self, col_series, col_type) -> None:
+        self.col_type = col_type
+        if col_type == "numerical":
+            values = col_series.to_numpy(dtype=float)
+            self.rows = np.argsort(values, kind="stable")[:np.count_nonzero(~np.isnan(values))]  # NaN is sorted last
+            self.sorted_values = values[self.rows]
+        else:
+            value_codes, unique_values = pd.factorize(col_series)
+            self.rows = np.argsort(value_codes, kind="stable")
+            self.offsets = np.searchsorted(value_codes[self.rows], np.arange(len(unique_values) + 1))
+            self.value_code_dict = {value: value_code for value_code, value in enumerate(unique_values.tolist())}
+
+    # A method to get the rows with values in the range [lower, upper), and their values
+    def get_rows_in_range(self, lower, upper):
+        start_idx = np.searchsorted(self.sorted_values, lower, side="left")
+        end_idx = np.searchsorted(self.sorted_values, upper, side="left")
+        return (self.rows[start_idx:end_idx], self.sorted_values[start_idx:end_idx])
+
+    # A method to get the rows holding an element
+    def get_rows_of_element(self, element):
+        value_code = self.value_code_dict.get(element)
+        if value_code is None:
+            return self.rows[:0]
+        return self.rows[self.offsets[value_code]:self.offsets[value_code + 1]]
+
+    # A method to get the rows holding the values moved to another bin by an interactive binning action (see InteractiveBinningMachine.get_bins_diff)
+    def get_moved_rows(self, bins_diff):
+        if self.col_type == "numerical":
+            rows_list = [self.get_rows_in_range(lower, upper)[0] for lower, upper in bins_diff["moved_ranges"]]
+        else:
+            rows_list = [self.get_rows_of_element(element) for element in bins_diff["moved_elements"]]
+        if len(rows_list) == 0:
+            return self.rows[:0]
+        return np.concatenate(rows_list)
@@ -0,0 +1,194 @@
+import numpy as np
+import pandas as pd
+from .bins_plan import ColBinsPlan
+from .binning_machine import BinningMachine
+from .bin_aggregates import BinAggregates
+from .optimal_binning import OptimalBinning
+from .chi_merge import ChiMerge
+from .dataiku_compat import get_str_from_ranges
+
+
+# A class holding a numerical column pre-aggregated into "micro-bins", i.e., its distinct values (sorted) with the cumulative
+# good/bad/indeterminate counts up to each value, so that the label counts of any numerical bins (custom ranges, equal width,
+# equal frequency or optimal) are computed by binary searches over the distinct values instead of binning the rows, e.g.,
+#   micro_bins = NumericMicroBins.from_col_value_index(ColValueIndex(df["person_income"], "numerical"), labels)
+#   aggregates = micro_bins.get_aggregates(col_bins_settings)  # BinAggregates of the bins, as if the column is binned
+# The first row of each distinct value is kept to list the bins in the order of appearance (see BinAggregates)
+class NumericMicroBins:
+    def __init__(self, values, cum_label_counts, first_rows, missing_label_counts, missing_first_row, num_rows, is_integer=False) -> None:
+        self.values = values  # distinct non-missing values, sorted
+        self.cum_label_counts = cum_label_counts  # (number of values + 1) x 3, the label counts of the values before each value
+        self.first_rows = first_rows  # the first row of each value
+        self.missing_label_counts = missing_label_counts  # the label counts of the missing values
+        self.missing_first_row = missing_first_row  # the first row of the missing values, num_rows if none
+        self.num_rows = num_rows
+        self.is_integer = is_integer  # if the column holds integers, for naming the bins of no binning as Dataiku does
+
+    # A method to pre-aggregate a numerical column given its ColValueIndex (i.e., the rows sorted by value) & the label of each row
+    # (see GoodBadCounter.get_good_bad_labels), the column is not sorted again
+    @staticmethod
+    def from_col_value_index(col_value_index, labels, is_integer=False):
+        num_rows = len(labels)
+        sorted_values = col_value_index.sorted_values
+        is_new_value = np.empty(len(sorted_values), dtype=bool)
+        is_new_value[:1] = True
+        is_new_value[1:] = sorted_values[1:] != sorted_values[:-1]
+        value_starts = np.flatnonzero(is_new_value)
+        value_idx = np.cumsum(is_new_value) - 1
+
+        values = sorted_values[value_starts]
+        label_counts = np.bincount(value_idx * 3 + labels[col_value_index.rows], minlength=len(values) * 3).reshape(len(values), 3)
+        cum_label_counts = np.zeros((len(values) + 1, 3), dtype=np.int64)
+        np.cumsum(label_counts, axis=0, out=cum_label_counts[1:])
+        first_rows = np.minimum.reduceat(col_value_index.rows, value_starts) if len(values) > 0 else np.zeros(0, dtype=np.int64)
+
+        is_missing = np.ones(num_rows, dtype=bool)
+        is_missing[col_value_index.rows] = False
+        missing_rows = np.flatnonzero(is_missing)
+        missing_label_counts = np.bincount(labels[missing_rows], minlength=3)
+        missing_first_row = int(missing_rows[0]) if len(missing_rows) > 0 else num_rows
+
+        return NumericMicroBins(values, cum_label_counts, first_rows, missing_label_counts, missing_first_row, num_rows, is_integer)
+
+    # A method to get the number of unique values of the column, missing values (if any) counted as a value, same as len(col.unique())
+    def get_num_unique_values(self):
+        return len(self.values) + (1 if self.missing_first_row < self.num_rows else 0)
+
+    # A method to get the label counts of the values in the range [lower, upper)
+    def get_range_label_counts(self, lower, upper):
+        start_idx, end_idx = np.searchsorted(self.values, [lower, upper], side="left")
+        return self.cum_label_counts[max(end_idx, start_idx)] - self.cum_label_counts[start_idx]
+
+    # A method to get the label counts of each bin (BinAggregates) of a numerical column bins settings, the same as counting the bin codes
+    # of the column binned by ColBinsPlan, auto binning (equal width/equal frequency/no binning) is first turned into its list of bins
+    # Return None if the bins cannot be computed (e.g., invalid auto binning settings)
+    def get_aggregates(self, col_bins_settings):
+        if not isinstance(col_bins_settings["bins"], list):
+            def_li = self.get_auto_bins(col_bins_settings["bins"])
+            if def_li == -1:
+                return None
+            col_bins_settings = {"column": col_bins_settings["column"], "type": col_bins_settings["type"], "bins": def_li}
+        col_plan = ColBinsPlan(col_bins_settings)
+        num_bins = len(col_plan.bin_names)
+
+        # the distinct values of each gap between 2 adjacent edges, with a gap before the first & after the last edge not in any bin
+        value_bounds = np.concatenate(([0], np.searchsorted(self.values, col_plan.edges, side="left"), [len(self.values)]))
+        gap_codes = np.concatenate(([-1], col_plan.codes, [-1])) if len(col_plan.edges) > 0 else np.array([-1], dtype=np.int64)
+        gap_count_idx = np.where(gap_codes < 0, num_bins, gap_codes)
+
+        label_counts = np.zeros((num_bins + 1, 3), dtype=np.int64)
+        np.add.at(label_counts, gap_count_idx, self.cum_label_counts[value_bounds[1:]] - self.cum_label_counts[value_bounds[:-1]])
+        label_counts[num_bins] += self.missing_label_counts
+
+        first_rows = np.full(num_bins + 1, self.num_rows, dtype=np.int64)
+        is_gap_used = value_bounds[1:] > value_bounds[:-1]
+        if is_gap_used.any():
+            # the gaps cover all distinct values in order, so the used gaps start at increasing positions & end where the next one starts
+            np.minimum.at(first_rows, gap_count_idx[is_gap_used], np.minimum.reduceat(self.first_rows, value_bounds[:-1][is_gap_used]))
+        first_rows[num_bins] = min(first_rows[num_bins], self.missing_first_row)
+
+        return BinAggregates(col_plan.bin_names, label_counts, first_rows, self.num_rows)
+
+    # A method to get the list of bins of auto binning (equal width/equal frequency/optimal/chi merge/no binning) of the column, the same as the bins
+    # definitions returned by DataikuBinningMachine.perform_binning_on_col, computed from the distinct values only
+    # Return -1 if the bins cannot be computed (e.g., invalid settings, or no values)
+    def get_auto_bins(self, auto_bins):
+        if auto_bins == "none":
+            return self.__get_no_binning_bins__()
+        if not isinstance(auto_bins, dict) or len(self.values) == 0:
+            return -1
+
+        if auto_bins["algo"] == "optimal":
+            bin_ranges = OptimalBinning.get_bin_ranges(self.values, self.cum_label_counts, auto_bins, self.missing_label_counts)
+            if bin_ranges == -1:
+                return -1
+            return [{"name": get_str_from_ranges([r]), "ranges": [r]} for r in bin_ranges]
+
+        if auto_bins["algo"] == "chi merge":
+            bin_ranges = ChiMerge.get_bin_ranges(self.values, self.cum_label_counts, auto_bins)
+            if bin_ranges == -1:
+                return -1
+            return [{"name": get_str_from_ranges([r]), "ranges": [r]} for r in bin_ranges]
+
+        if auto_bins["algo"] == "equal width":
+            min_val = float(self.values[0]) if auto_bins.get("min") is None else float(auto_bins["min"])
+            max_val = float(self.values[-1]) if auto_bins.get("max") is None else float(auto_bins["max"])
+            if auto_bins["method"] == "width":
+                if not isinstance(auto_bins["value"], (int, float)) or auto_bins["value"] <= 0:
+                    return -1
+                bin_ranges = BinningMachine.get_eq_width_bin_ranges_by_width(min_val, max_val, auto_bins["value"])
+            else:
+                if not isinstance(auto_bins["value"], int) or auto_bins["value"] <= 0:
+                    return -1
+                bin_ranges = BinningMachine.get_eq_width_bin_ranges_by_num_bins(min_val, max_val, auto_bins["value"])
+            return [{"name": get_str_from_ranges([r]), "ranges": [r]} for r in bin_ranges]
+
+        if "edges" in auto_bins:  # equal frequency with edges fixed by the whole column, every bin is kept
+            return self.__get_eq_freq_bins__(np.array(auto_bins["edges"], dtype=float), float(auto_bins["max"]), only_used_bins=False)
+
+        if auto_bins["method"] == "freq":
+            if not isinstance(auto_bins["value"], int) or auto_bins["value"] <= 0 or auto_bins["value"] > self.num_rows:
+                return -1
+            num_bins = int(np.ceil(self.num_rows / auto_bins["value"]))
+        else:
+            if not isinstance(auto_bins["value"], int) or auto_bins["value"] <= 0:
+                return -1
+            num_bins = auto_bins["value"]
+        edges = self.get_quantiles(np.linspace(0, 1, num_bins + 1))
+        if num_bins > 1:  # same as duplicates="drop" of pd.qcut, which keeps the 2 edges of a single bin
+            edges = np.unique(edges)
+        return self.__get_eq_freq_bins__(edges, float(self.values[-1]), only_used_bins=True)
+
+    # A method to get the quantiles of the non-missing values, the same as np.quantile (linear interpolation) over the rows as pd.qcut does
+    def get_quantiles(self, quantiles):
+        cum_counts = self.cum_label_counts[1:].sum(axis=1)
+        num_values = int(cum_counts[-1])
+        virtual_indexes = (num_values - 1) * np.asarray(quantiles, dtype=float)
+        previous_indexes = np.floor(virtual_indexes).astype(np.int64)
+        gamma = virtual_indexes - previous_indexes
+        previous_indexes = np.clip(previous_indexes, 0, num_values - 1)
+        next_indexes = np.clip(previous_indexes + 1, 0, num_values - 1)
+
+        # the value of the row of each rank, i.e., the first distinct value with more rows up to it than the rank
+        previous_values = self.values[np.searchsorted(cum_counts, previous_indexes, side="right")]
+        next_values = self.values[np.searchsorted(cum_counts, next_indexes, side="right")]
+        diff = next_values - previous_values
+        return np.where(gamma >= 0.5, next_values - diff * (1 - gamma), previous_values + diff * gamma) + 0.0  # no negative zero
+
+    # A method to get the equal-frequency bins from the quantile edges, named by the intervals of pd.qcut (i.e., pd.cut on the edges)
+    # The bin ending at max_val is extended to include it, and only the bins holding values are kept if only_used_bins
+    def __get_eq_freq_bins__(self, edges, max_val, only_used_bins):
+        if len(edges) == 0:
+            return -1
+        if len(edges) == 1:  # single unique value, every value is put in [value, value + 1)
+            interval_list = [pd.Interval(float(edges[0]), float(edges[0]) + 1)]
+            is_used_list = [True]
+        else:
+            interval_list = pd.cut(edges, bins=edges, include_lowest=True, duplicates="drop").categories.to_list()
+            # pd.cut puts a value in (left, right], and the min edge in the first interval
+            value_bounds = np.searchsorted(self.values, edges, side="right")
+            value_bounds[0] = np.searchsorted(self.values, edges[0], side="left")
+            is_used_list = (value_bounds[1:] > value_bounds[:-1]).tolist()
+
+        def_li = list()
+        for interval, is_used in zip(interval_list, is_used_list):
+            if only_used_bins and not is_used:
+                continue
+            r = [interval.left, interval.right + 0.0001] if interval.right == max_val else [interval.left, interval.right]
+            def_li.append({"name": get_str_from_ranges([r]), "ranges": [r]})
+        return def_li
+
+    # A method to get the bins of no binning, i.e., a bin for each distinct value (incl. missing) in the order of appearance
+    def __get_no_binning_bins__(self):
+        if self.num_rows == 0:
+            return -1
+        value_list = [int(value) if self.is_integer else float(value) for value in self.values.tolist()]
+        first_row_list = self.first_rows.tolist()
+        if self.missing_first_row < self.num_rows:
+            value_list.append(float("nan"))
+            first_row_list.append(self.missing_first_row)
+
+        def_li = list()
+        for idx in np.argsort(first_row_list, kind="stable").tolist():
+            def_li.append({"name": str(value_list[idx]), "ranges": [[float(value_list[idx]), value_list[idx] + 0.0000001]]})
+        return def_li
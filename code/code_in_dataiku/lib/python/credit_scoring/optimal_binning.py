@@ -0,0 +1,167 @@
+import numpy as np
+from .good_bad_counter import GoodBadCounter
+
+
+# A class for "optimal" automated binning of a numerical column, i.e., the bins maximizing the information value (IV) of the column
+# subject to a minimum bin size, a maximum number of bins & monotonic WOE, given in the bins settings as:
+#   {"algo": "optimal", "max_bins": 10, "min_bin_size": 0.05, "monotonic": "auto"}
+# (min_bin_size is a fraction of the non-missing rows, monotonic is "auto" (the better of ascending & descending WOE),
+# "ascending", "descending" or "none", the keys not given take the DEFAULT_SETTINGS)
+# The column is pre-aggregated into the good/bad/indeterminate counts of its distinct values (see get_value_label_counts, or
+# NumericMicroBins), which are grouped into at most max_candidates candidate bins of about the same number of rows, then the best bins
+# made of adjacent candidates are found by dynamic programming over the candidate cut points, so the search does not depend on the number of rows
+class OptimalBinning:
+    DEFAULT_SETTINGS = {"max_bins": 10, "min_bin_size": 0.05, "monotonic": "auto", "max_candidates": 100}
+    MONOTONIC_LIST = ["auto", "ascending", "descending", "none"]
+
+    # A method to get the settings of optimal binning with the defaults filled in
+    # Return -1 if any setting is invalid
+    @staticmethod
+    def get_settings(auto_bins):
+        settings = dict(OptimalBinning.DEFAULT_SETTINGS)
+        settings.update({key: auto_bins[key] for key in OptimalBinning.DEFAULT_SETTINGS if key in auto_bins})
+        if not isinstance(settings["max_bins"], int) or settings["max_bins"] <= 0:
+            return -1
+        if not isinstance(settings["min_bin_size"], (int, float)) or not 0 <= settings["min_bin_size"] <= 1:
+            return -1
+        if settings["monotonic"] not in OptimalBinning.MONOTONIC_LIST:
+            return -1
+        if not isinstance(settings["max_candidates"], int) or settings["max_candidates"] <= 0:
+            return -1
+        return settings
+
+    # A method to pre-aggregate a numerical column given the good/bad/indeterminate label of each row (see GoodBadCounter.get_good_bad_labels)
+    # Return a tuple (sorted distinct values, (number of values + 1) x 3 cumulative label counts before each value, label counts of missing values)
+    @staticmethod
+    def get_value_label_counts(col_series, labels):
+        col_values = col_series.to_numpy(dtype=float)
+        is_missing = np.isnan(col_values)
+        values, value_idx = np.unique(col_values[~is_missing], return_inverse=True)
+        label_counts = np.bincount(value_idx * 3 + labels[~is_missing], minlength=len(values) * 3).reshape(len(values), 3)
+        cum_label_counts = np.zeros((len(values) + 1, 3), dtype=np.int64)
+        np.cumsum(label_counts, axis=0, out=cum_label_counts[1:])
+        return (values, cum_label_counts, np.bincount(labels[is_missing], minlength=3))
+
+    # A method to get the ranges of the optimal bins, given the pre-aggregated column (see get_value_label_counts)
+    # The rows of missing values are not binned, but counted in the total good & bad as in the summary statistics table
+    # The last bin is extended to include the max value, as equal frequency binning does
+    # Return a list of [lower, upper] of each bin (in ascending order), or -1 if the settings are invalid or there are no values
+    @staticmethod
+    def get_bin_ranges(values, cum_label_counts, auto_bins, missing_label_counts=None):
+        settings = OptimalBinning.get_settings(auto_bins)
+        if settings == -1 or len(values) == 0:
+            return -1
+
+        bounds = OptimalBinning.get_candidate_bounds(cum_label_counts.sum(axis=1), settings["max_candidates"])
+        total_label_counts = cum_label_counts[-1] + (0 if missing_label_counts is None else np.asarray(missing_label_counts))
+        min_bin_rows = int(np.ceil(settings["min_bin_size"] * int(cum_label_counts[-1].sum())))
+        cuts = OptimalBinning.solve(cum_label_counts[bounds], total_label_counts, settings["max_bins"], min_bin_rows, settings["monotonic"])
+
+        edge_list = [float(values[bounds[cut]]) for cut in cuts[:-1]]
+        edge_list.append(float(values[-1]) + 0.0001)
+        return [[edge_list[idx], edge_list[idx + 1]] for idx in range(len(edge_list) - 1)]
+
+    # A method to group the distinct values into at most max_candidates candidate bins of about the same number of rows,
+    # given the cumulative number of rows before each value
+    # Return the index of the first value of each candidate bin, followed by the number of values
+    @staticmethod
+    def get_candidate_bounds(cum_counts, max_candidates):
+        num_values = len(cum_counts) - 1
+        if num_values <= max_candidates:
+            return np.arange(num_values + 1)
+        # a candidate bin ends after the first value reaching its share of the rows
+        targets = np.linspace(0, cum_counts[-1], max_candidates + 1)[1:-1]
+        inner_bounds = np.searchsorted(cum_counts[1:], targets, side="left") + 1
+        return np.unique(np.concatenate(([0], inner_bounds, [num_values])))
+
+    # A method to find the cut points maximizing the IV by dynamic programming, given the cumulative label counts at each candidate cut point
+    # (cum_counts[p] is the label counts before cut point p, the first is 0 & the last is all rows) & the total label counts incl. missing values
+    # A bin has at least min_bin_rows rows and both good & bad rows (i.e., a finite WOE), and the WOE of the bins is monotonic if required
+    # Return the cut points (positions in cum_counts) of the best bins, from 0 to the last position
+    # (a single bin if no bins satisfy the constraints, e.g., all rows are good)
+    @staticmethod
+    def solve(cum_counts, total_label_counts, max_bins, min_bin_rows, monotonic="auto"):
+        num_cuts = len(cum_counts)
+        good = cum_counts[None, :, GoodBadCounter.GOOD_LABEL] - cum_counts[:, None, GoodBadCounter.GOOD_LABEL]  # [i, j]: rows between cut points i & j
+        bad = cum_counts[None, :, GoodBadCounter.BAD_LABEL] - cum_counts[:, None, GoodBadCounter.BAD_LABEL]
+        size = cum_counts.sum(axis=1)[None, :] - cum_counts.sum(axis=1)[:, None]
+        is_valid = (size > 0) & (size >= min_bin_rows) & (good > 0) & (bad > 0)
+
+        # the population weights cancel out in the good & bad percentages, so the sample counts are used
+        with np.errstate(divide="ignore", invalid="ignore"):
+            good_pct = good / total_label_counts[GoodBadCounter.GOOD_LABEL]
+            bad_pct = bad / total_label_counts[GoodBadCounter.BAD_LABEL]
+            woe = np.log(good_pct / bad_pct)
+            iv = np.where(is_valid, (good_pct - bad_pct) * woe, -np.inf)
+
+        best_result = (-np.inf, [0, num_cuts - 1])
+        direction_list = {"auto": [1, -1], "ascending": [1], "descending": [-1], "none": [0]}[monotonic]
+        for direction in direction_list:
+            total_iv, cuts = OptimalBinning.__solve_in_direction__(iv, -woe if direction < 0 else woe, max_bins, is_monotonic=direction != 0)
+            if total_iv > best_result[0]:
+                best_result = (total_iv, cuts)
+        return best_result[1]
+
+    # A method to find the best bins (max total IV) ending at the last cut point, with the WOE of the bins strictly ascending if is_monotonic
+    # score[i, j] is the best total IV of the bins from cut point 0 to j with the last bin between i & j, and parent[i, j] is
+    # the first cut point of the bin before it, so that adding a bin only needs the best bins ending at its first cut point
+    # Return a tuple (total IV, cut points), (-inf, None) if no bins satisfy the constraints
+    @staticmethod
+    def __solve_in_direction__(iv, woe, max_bins, is_monotonic):
+        num_cuts = len(iv)
+        last = num_cuts - 1
+        score = np.full((num_cuts, num_cuts), -np.inf)
+        score[0] = iv[0]
+        parent_list = [np.full((num_cuts, num_cuts), -1, dtype=np.int64)]
+        best_iv, best_end = score[0, last], (0, 0)  # (number of bins - 1, first cut point of the last bin)
+
+        for num_bins_idx in range(1, max_bins):
+            new_score = np.full((num_cuts, num_cuts), -np.inf)
+            parent = np.full((num_cuts, num_cuts), -1, dtype=np.int64)
+            for i in range(1, last):
+                prev_score = score[:i, i]
+                prev_idx = np.flatnonzero(np.isfinite(prev_score))
+                next_idx = np.flatnonzero(np.isfinite(iv[i, i + 1:])) + i + 1
+                if len(prev_idx) == 0 or len(next_idx) == 0:
+                    continue
+                if not is_monotonic:
+                    k = prev_idx[np.argmax(prev_score[prev_idx])]
+                    new_score[i, next_idx] = prev_score[k] + iv[i, next_idx]
+                    parent[i, next_idx] = k
+                    continue
+                # the best previous bin with a lower WOE, by the running max of the scores of the previous bins sorted by WOE
+                prev_idx = prev_idx[np.argsort(woe[prev_idx, i], kind="stable")]
+                running_argmax = prev_idx[OptimalBinning.__get_running_argmax__(prev_score[prev_idx])]
+                num_lower = np.searchsorted(woe[prev_idx, i], woe[i, next_idx], side="left")
+                has_lower = num_lower > 0
+                k = running_argmax[num_lower[has_lower] - 1]
+                new_score[i, next_idx[has_lower]] = prev_score[k] + iv[i, next_idx[has_lower]]
+                parent[i, next_idx[has_lower]] = k
+
+            score = new_score
+            parent_list.append(parent)
+            end_idx = int(np.argmax(score[:, last]))
+            if score[end_idx, last] > best_iv:  # more bins are only taken for a higher IV
+                best_iv, best_end = score[end_idx, last], (num_bins_idx, end_idx)
+
+        if not np.isfinite(best_iv):
+            return (-np.inf, None)
+        # trace the bins back from the last one
+        cuts = [last]
+        num_bins_idx, start = best_end
+        end = last
+        while num_bins_idx > 0:
+            cuts.append(start)
+            start, end = int(parent_list[num_bins_idx][start, end]), start
+            num_bins_idx -= 1
+        cuts.append(0)
+        return (float(best_iv), cuts[::-1])
+
+    # A method to get the position of the max value of each prefix of an array
+    @staticmethod
+    def __get_running_argmax__(arr):
+        running_max = np.maximum.accumulate(arr)
+        is_new_max = np.empty(len(arr), dtype=bool)
+        is_new_max[0] = True
+        is_new_max[1:] = running_max[1:] > running_max[:-1]
+        return np.maximum.accumulate(np.where(is_new_max, np.arange(len(arr)), 0))
@@ -0,0 +1,146 @@
+import numpy as np
+
+# A class for estimating quantiles of a numerical column which is read chunk by chunk (i.e., never fully in memory)
+# The values are kept as they are (i.e., the quantiles are exact, the same as pd.qcut) until there are more than max_exact_values of them,
+# then it becomes a mergeable KLL sketch: values are buffered in levels, level h holds values with weight 2^h, the capacity of level h is
+# k * (2/3)^(H-1-h) for H levels (i.e., the top level holds k values, lower levels less), and a full level is compacted by sorting it and
+# promoting every other value (from a random offset) to the next level
+class QuantileSketch:
+    # Default number of values kept exactly, i.e., about 80 MB of float values per sketch
+    DEFAULT_MAX_EXACT_VALUES = 10000000
+    # Ratio between the capacities of 2 adjacent levels, & the min capacity of a level
+    CAPACITY_RATIO = 2/3
+    MIN_CAPACITY = 2
+    # The rank error of each quantile is within rank_error_bound with probability at least 1 - ERROR_PROBABILITY
+    ERROR_PROBABILITY = 0.01
+
+    def __init__(self, k=200, max_exact_values=DEFAULT_MAX_EXACT_VALUES, seed=0) -> None:
+        self.k = k  # capacity of the top level, larger k -> smaller error, more memory
+        self.max_exact_values = max_exact_values  # memory budget of the exact values, in number of values
+        self.levels = [np.empty(0, dtype=float)]
+        self.count = 0  # number of non-missing values seen
+        self.min = None
+        self.max = None
+        self.error_variance = 0  # sum of the variances of the rank errors added by the compactions (4^h for a compaction of level h)
+        self.num_compactions = 0
+        self.rng = np.random.default_rng(seed)  # to pick the offset of the values promoted to the next level
+
+    # Max difference between the estimated & exact rank of any value (in number of rows), with probability at least 1 - ERROR_PROBABILITY
+    # Each compaction of level h moves the rank of a value by -2^h, 0 or +2^h with mean 0, so the bound follows from Hoeffding's inequality
+    @property
+    def rank_error_bound(self):
+        if self.error_variance == 0:
+            return 0
+        return int(np.ceil(np.sqrt(2 * self.error_variance * np.log(2 / QuantileSketch.ERROR_PROBABILITY))))
+
+    # A method to add a chunk of values to the sketch, missing values are ignored
+    def update(self, values):
+        values = np.asarray(values, dtype=float)
+        values = values[~np.isnan(values)]
+        if len(values) == 0:
+            return self
+
+        self.count += len(values)
+        self.min = float(values.min()) if self.min is None else min(self.min, float(values.min()))
+        self.max = float(values.max()) if self.max is None else max(self.max, float(values.max()))
+
+        self.levels[0] = np.concatenate([self.levels[0], values])
+        self.__compress__()
+        return self
+
+    # A method to merge another sketch (e.g., built on another chunk or by another process) into this sketch
+    def merge(self, other):
+        if other.count == 0:
+            return self
+
+        self.count += other.count
+        self.min = other.min if self.min is None else min(self.min, other.min)
+        self.max = other.max if self.max is None else max(self.max, other.max)
+        self.error_variance += other.error_variance
+        self.num_compactions += other.num_compactions
+
+        for h in range(len(other.levels)):
+            if h >= len(self.levels):
+                self.levels.append(np.empty(0, dtype=float))
+            self.levels[h] = np.concatenate([self.levels[h], other.levels[h]])
+        self.__compress__()
+        return self
+
+    # A method to check if all values are still kept, i.e., the quantiles are exact
+    def is_exact(self):
+        return self.num_compactions == 0
+
+    # A method to get the estimated values at the given quantiles (between 0 and 1)
+    def get_quantiles(self, quantiles):
+        if self.count == 0:
+            return [None for _ in quantiles]
+
+        # Nothing has been compacted yet, so all values are still kept and the quantiles are exact (same interpolation as pd.qcut)
+        if self.is_exact():
+            return np.quantile(self.levels[0], quantiles).tolist()
+
+        values, weights = self.__get_weighted_values__()
+        cum_weights = np.cumsum(weights)
+
+        result = list()
+        for q in quantiles:
+            if q <= 0:
+                result.append(self.min)
+            elif q >= 1:
+                result.append(self.max)
+            else:
+                idx = min(np.searchsorted(cum_weights, q * self.count, side="left"), len(values) - 1)
+                result.append(float(values[idx]))
+        return result
+
+    # A method to get the estimated number of values <= value
+    def get_rank(self, value):
+        values, weights = self.__get_weighted_values__()
+        return int(weights[values <= value].sum())
+
+    # A method to get the rank error bound as a fraction of the number of values
+    def get_relative_rank_error_bound(self):
+        if self.count == 0:
+            return 0
+        return self.rank_error_bound / self.count
+
+    def __get_weighted_values__(self):
+        values = np.concatenate(self.levels)
+        weights = np.concatenate([np.full(len(self.levels[h]), 2 ** h, dtype=np.int64) for h in range(len(self.levels))])
+        sorted_idx = np.argsort(values, kind="stable")
+        return (values[sorted_idx], weights[sorted_idx])
+
+    # A method to get the capacity of level h, given the current number of levels
+    def __get_capacity__(self, h):
+        return max(int(np.ceil(self.k * QuantileSketch.CAPACITY_RATIO ** (len(self.levels) - 1 - h))), QuantileSketch.MIN_CAPACITY)
+
+    def __compress__(self):
+        if self.is_exact() and self.count <= self.max_exact_values:
+            return
+        # Compact the lowest full level until no level is full, the capacities shrink as levels are added
+        h = 0
+        while h < len(self.levels):
+            if len(self.levels[h]) > self.__get_capacity__(h):
+                self.__compact_level__(h)
+                h = 0
+            else:
+                h += 1
+
+    def __compact_level__(self, h):
+        buffer = np.sort(self.levels[h])
+        # Keep 1 value at this level if the number of values is odd, so that every compacted pair is promoted as 1 value
+        if len(buffer) % 2 == 1:
+            kept, buffer = buffer[-1:], buffer[:-1]
+        else:
+            kept = np.empty(0, dtype=float)
+
+        offset = int(self.rng.integers(2))
+        self.num_compactions += 1
+
+        if h + 1 == len(self.levels):
+            self.levels.append(np.empty(0, dtype=float))
+        self.levels[h + 1] = np.concatenate([self.levels[h + 1], buffer[offset::2]])
+        self.levels[h] = kept
+
+        # The rank of any value is changed by 0 or +/- the weight of a value at level h, with mean 0
+        self.error_variance += 4 ** h
@@ -0,0 +1,281 @@
+import pandas as pd
+import numpy as np
+from .binning_machine import BinningMachine
+from .good_bad_counter import GoodBadCounter
+
+# A class to calculate statistical values for displaying the mixed chart & statistical tables
+class StatCalculator:
+    # Names of the percentage columns of the summary statistics table, and the number of decimal places they are rounded to
+    PCT_COL_NAME_LIST = ["Good%", "Bad%", "Total%"]
+    PCT_DECIMALS = 4
+
+    def __init__(self, df, col_bins_settings, good_bad_def) -> None:
+        # for binning & good bad calculation, need whole df (OR only columns to be binned & columns involved in good bad def)
+        self.df = df
+        self.col_bins_settings = col_bins_settings  # for binning
+        self.good_bad_def = good_bad_def  # for good bad calculation
+
+    # Output - a dataframe representing the summary statistics table of the column
+    def compute_summary_stat_table(self):
+        if len(self.df) == 0 or self.col_bins_settings == None or self.good_bad_def == None:
+            return None
+
+        # the column is binned without adding the binned column to self.df
+        return type(self).compute_summary_stat_tables(self.df, [self.col_bins_settings], self.good_bad_def)[self.col_bins_settings["column"]]
+
+    # A method to compute the summary statistics tables of many columns at once (e.g., all columns in the bins settings), df is not changed
+    # Each row is labelled as good, bad or indeterminate once, and the label counts of all (column, bin) pairs are aggregated into a single
+    # long-format count table, from which the table of each column is computed
+    # bins_settings_list can also be a BinsPlan, col_list defaults to all columns in the bins settings
+    # labels (optional) is the good/bad/indeterminate label of each row of df (e.g., cached by the web app), computed if not given
+    # Output - a dict of column name -> summary statistics table of the column (None if the column has no bins settings)
+    @classmethod
+    def compute_summary_stat_tables(cls, df, bins_settings_list, good_bad_def, col_list=None, labels=None):
+        # Find the bins settings of each column (the first one if a column has more than 1 bins settings)
+        col_bins_settings_dict = dict()
+        for col_bins_settings in bins_settings_list:
+            if col_bins_settings["column"] not in col_bins_settings_dict:
+                col_bins_settings_dict[col_bins_settings["column"]] = col_bins_settings
+        if col_list is None:
+            col_list = list(col_bins_settings_dict.keys())
+
+        stat_table_dict = {col: None for col in col_list}
+        if len(df) == 0 or good_bad_def == None:
+            return stat_table_dict
+
+        """
+        1. Label each row once, shared by all columns
+        """
+        if labels is None:
+            labels = GoodBadCounter.get_good_bad_labels(df, good_bad_def)
+
+        """
+        2. Bin each column, and count the labels of each (column, bin) pair
+        """
+        # The bins of all columns are numbered in a single range, the bins of a column start from its offset,
+        # with an extra last bin for the rows not in any bin
+        bin_name_list_dict = dict()
+        offset_dict = dict()
+        label_count_list = list()
+        num_rows_in_table = 0
+        for col in col_list:
+            col_bins_settings = col_bins_settings_dict.get(col)
+            if col_bins_settings == None:
+                continue
+
+            binned_series = cls.__get_binned_series__(df, col_bins_settings, labels)
+            bin_name_list, bin_idx = StatCalculator.get_bin_indices(binned_series)
+            label_count_list.append(np.bincount(bin_idx * 3 + labels, minlength=(len(bin_name_list) + 1) * 3))
+
+            bin_name_list_dict[col] = bin_name_list
+            offset_dict[col] = num_rows_in_table
+            num_rows_in_table += len(bin_name_list) + 1
+
+        if len(label_count_list) == 0:
+            return stat_table_dict
+        # long-format count table, i.e. a row for each (column, bin) pair, a column for each label
+        label_counts = np.concatenate(label_count_list).reshape(num_rows_in_table, 3)
+
+        """
+        3. Compute Summary Statistic Table of each column
+        """
+        for col, bin_name_list in bin_name_list_dict.items():
+            offset = offset_dict[col]
+            stat_table_dict[col] = cls.__get_summary_stat_table__(
+                bin_name_list, label_counts[offset:offset + len(bin_name_list) + 1], good_bad_def)
+
+        return stat_table_dict
+
+    # A method to compute the summary statistics table of a column from the label counts of each bin instead of the rows,
+    # e.g., kept by BinAggregates (see BinAggregates.get_label_counts), the extra last row of label_counts holds the rows not in any bin
+    @classmethod
+    def compute_summary_stat_table_from_counts(cls, bin_name_list, label_counts, good_bad_def):
+        if good_bad_def == None:
+            return None
+        return cls.__get_summary_stat_table__(bin_name_list, label_counts, good_bad_def)
+
+    # A method to bin a single column of df, aligned on the index of df as if it is added as a column of df
+    # (rows without a bin are NaN), and an error (i.e., -1) is put in every row as a single bin
+    # labels (the good/bad/indeterminate label of each row of df) are used by supervised automated binning (e.g., optimal)
+    @classmethod
+    def __get_binned_series__(cls, df, col_bins_settings, labels=None):
+        binned_series = cls.perform_binning_on_col(df.loc[:, [col_bins_settings["column"]]], col_bins_settings, labels=labels)
+        if not isinstance(binned_series, pd.Series):
+            return pd.Series([binned_series for _ in range(len(df))], index=df.index)
+        return binned_series.reindex(df.index)
+
+    # A method to bin a single column, returns the binned series (or -1 if error occurs)
+    @staticmethod
+    def perform_binning_on_col(col_df, col_bins_settings, labels=None):
+        return BinningMachine.perform_binning_on_col(col_df, col_bins_settings, labels=labels)
+
+    # A method to get the summary statistics table of a column, from the label counts of each bin
+    # (the extra last row of label_counts holds the rows not in any bin)
+    @classmethod
+    def __get_summary_stat_table__(cls, bin_name_list, label_counts, good_bad_def):
+        # Create a list which stores summary table' column names
+        summary_table_col_name_list = ["Bin", "Good", "Bad", "Odds", "Total"] + cls.PCT_COL_NAME_LIST + ["Info_Odds", "WOE", "MC"]
+
+        good_weight = good_bad_def["good"]["weight"]
+        bad_weight = good_bad_def["bad"]["weight"]
+
+        # Get total good & bad, including rows not in any bin
+        total_good_count = GoodBadCounter.get_population_good(int(label_counts[:, GoodBadCounter.GOOD_LABEL].sum()), good_weight)
+        total_bad_count = GoodBadCounter.get_population_bad(int(label_counts[:, GoodBadCounter.BAD_LABEL].sum()), bad_weight)
+
+        # Compute the statistics of all bins as columns
+        good_arr = GoodBadCounter.get_population_good(label_counts[:-1, GoodBadCounter.GOOD_LABEL], good_weight)
+        bad_arr = GoodBadCounter.get_population_bad(label_counts[:-1, GoodBadCounter.BAD_LABEL], bad_weight)
+        bin_stats_rows = StatCalculator.__compute_bin_stats__(
+            bin_name_list, good_arr, bad_arr, total_good_count, total_bad_count)
+
+        # Create a pd.DataFrame object using the rows of bins
+        var_summary_df = pd.DataFrame(
+            bin_stats_rows, index=bin_name_list, columns=summary_table_col_name_list)
+
+        # Call compute_var_stats(var_df: pd.DataFrame, var_summary_df : pd.DataFrame, total_num_records : Integer) and save the list
+        var_stats_list = StatCalculator.__compute_var_stats__(
+            var_summary_df, total_good_count, total_bad_count)
+
+        # Create a dictionary using "all" as the key, and the list created as the value
+        all_summary_series = pd.Series(
+            var_stats_list, index=summary_table_col_name_list)
+
+        # Append the series as a row to the pd.DataFrame created
+        var_summary_df = pd.concat(
+            [var_summary_df, all_summary_series.to_frame().T.infer_objects()], ignore_index=True)
+
+        # format df
+        for col in ['Odds', 'Info_Odds', 'WOE', 'MC']:
+            var_summary_df[col] = var_summary_df[col].apply(
+                lambda x: 0 if (x != None and abs(x) < 0.001) else x)
+            var_summary_df[col] = var_summary_df[col].apply(
+                lambda x: round(x, 4) if (x != None) else x)
+
+        for col in cls.PCT_COL_NAME_LIST:
+            var_summary_df[col] = var_summary_df[col].apply(
+                lambda x: round(x, cls.PCT_DECIMALS) if (x != None) else x)
+
+        return var_summary_df
+
+    # A method to get the list of unique bin names (in the order of appearance), and the index of the bin of each row
+    # Rows with missing values are put in the None bin, or in an extra index (i.e., len(bin_name_list)) if there is no None bin
+    @staticmethod
+    def get_bin_indices(binned_series):
+        bin_codes, uniques = pd.factorize(binned_series)
+        # factorize numbers the bins in the order of appearance too, so the codes are the indices if no row is missing
+        if not (bin_codes == -1).any():
+            return (uniques.tolist(), bin_codes.astype(np.int64))
+
+        bin_name_list = binned_series.unique().tolist()
+
+        # map the codes of factorize (which skips missing values, coded as -1) to the index in bin_name_list
+        bin_position_dict = dict()
+        for idx, bin_name in enumerate(bin_name_list):
+            if bin_name is not None and bin_name == bin_name:
+                bin_position_dict[bin_name] = idx
+        missing_position = bin_name_list.index(None) if None in bin_name_list else len(bin_name_list)
+        position_lookup = np.array([bin_position_dict[bin_name] for bin_name in uniques.tolist()] + [missing_position], dtype=np.int64)
+
+        return (bin_name_list, position_lookup[bin_codes])
+
+    # A method to compute the statistics of all bins at once given the population good & bad of each bin
+    # Return a list of rows, one row for each bin in the same order as bin_name_list
+    @staticmethod
+    def __compute_bin_stats__(bin_name_list, good_arr, bad_arr, total_good, total_bad):
+        total_arr = good_arr + bad_arr
+        # Undefined values (e.g., odds when bad is 0) are NaN here, and None in the table
+        good_pct_arr = StatCalculator.__compute_pct_arr__(good_arr, total_good)
+        bad_pct_arr = StatCalculator.__compute_pct_arr__(bad_arr, total_bad)
+        total_pct_arr = StatCalculator.__compute_pct_arr__(total_arr, total_good + total_bad)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            odds_arr = np.where(bad_arr != 0, good_arr / bad_arr, np.nan)
+            info_odds_arr = np.where(bad_pct_arr != 0, good_pct_arr / bad_pct_arr, np.nan)
+            woe_arr = np.where(info_odds_arr > 0, np.log(info_odds_arr), np.nan)
+            mc_arr = (good_pct_arr - bad_pct_arr) * woe_arr
+
+        # MC is 0 if WOE is undefined
+        mc_list = [0 if mc is None else mc for mc in StatCalculator.__to_list__(mc_arr)]
+
+        return [list(bin_stats_row) for bin_stats_row in zip(bin_name_list, good_arr.tolist(), bad_arr.tolist(), StatCalculator.__to_list__(odds_arr), total_arr.tolist(),
+                                                             StatCalculator.__to_list__(good_pct_arr * 100), StatCalculator.__to_list__(bad_pct_arr * 100), StatCalculator.__to_list__(total_pct_arr * 100),
+                                                             StatCalculator.__to_list__(info_odds_arr), StatCalculator.__to_list__(woe_arr), mc_list)]
+
+    # A method to compute the percentages of an array of values, NaN if the total is 0
+    @staticmethod
+    def __compute_pct_arr__(value_arr, total_value):
+        if total_value == 0:
+            return np.full(len(value_arr), np.nan)
+        return value_arr / total_value
+
+    # A method to convert an array into a list, with NaN replaced by None
+    @staticmethod
+    def __to_list__(arr):
+        return [None if x != x else x for x in arr.tolist()]
+
+    @staticmethod
+    def __compute_var_stats__(var_summary_df, total_good, total_bad):
+        # Create an empty list for storing the statistics for the whole dataset
+        var_stats_list = list()
+
+        # Call compute_good(df : pd.DataFrame) using df and save the returned value
+        good = total_good
+        # Call compute_bad(df : pd.DataFrame) using df and save the returned value
+        bad = total_bad
+        # Call compute_total(df : pd.DataFrame) using df and save the returned value
+        total = good + bad
+        # Call compute_pct(value : Integer, total_value : Integer) and save the returned value (i.e., good%)
+        good_pct = StatCalculator.compute_pct(good, total_good)
+        # Call compute_pct(value : Integer, total_value : Integer) and save the returned value (i.e., bad%)
+        bad_pct = StatCalculator.compute_pct(bad, total_bad)
+        # Call compute_pct(value : Integer, total_value : Integer) and save the returned value (i.e., total%)
+        total_pct = 1
+        # Call compute_odds(good_pct : Float, bad_pct : Float) and save the returned value
+        odds = StatCalculator.compute_odds(good, bad)
+        info_odds = None
+        # Empty woe
+        woe = None
+        # Sum up the MC column and save the value = InfoVal
+        mc = var_summary_df.MC.sum()
+
+        # Append all statistics to the empty list in order
+        var_stats_list = ["Total", good, bad, odds, total, good_pct * 100 if good_pct != None else None,
+                          bad_pct * 100 if bad_pct != None else None, total_pct*100, info_odds, woe, mc]
+        # Return list
+        return var_stats_list
+
+    @staticmethod
+    def compute_pct(value, total_value):
+        if total_value == 0:
+            return None
+        else:
+            return (value/total_value)
+
+    @staticmethod
+    def compute_odds(good, bad):
+        if bad == 0:
+            return None
+        else:
+            return (good/bad)
+
+    @staticmethod
+    def compute_info_odds(good_pct, bad_pct):
+        if bad_pct == 0 or good_pct == None or bad_pct == None:
+            return None
+        else:
+            return (good_pct/bad_pct)
+
+    @staticmethod
+    def compute_woe(info_odds):
+        if info_odds == None or info_odds <= 0:
+            return None
+        else:
+            return np.log(info_odds)
+
+    @staticmethod
+    def compute_mc(good_pct, bad_pct, woe):
+        if woe == None:
+            return 0
+        else:
+            return (good_pct - bad_pct)*woe
\ No newline at end of file
@@ -9,7 +9,19 @@ from dash.dependencies import Input, Output, State, ALL, MATCH
 from dash.exceptions import PreventUpdate
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
-from decimal import Decimal
+import json
+import hashlib
+import threading
+import uuid
+import os
+from collections import OrderedDict
+from credit_scoring import GoodBadDefValidator, GoodBadDefDecoder, GoodBadCounter, get_str_from_ranges, DataikuBinningMachine, WebAppStatCalculator, InteractiveBinningMachine, ColValueIndex, ColBinsPlan, BinAggregates, NumericMicroBins, decode_ib_ranges
+try:
+    import pyarrow as pa
+    import pyarrow.feather as feather
+except ImportError:  # spilling binned columns to disk is disabled without pyarrow
+    pa = None
+    feather = None
 
 # Get data from dataiku
 dataset = dataiku.Dataset("credit_risk_dataset_generated")
@@ -31,6 +43,7 @@ def SharedDataStorage():
             dcc.Store(id="temp_chart_info"),
             dcc.Store(id="saved_settings"),
             dcc.Store(id="temp_bins_settings"),
+            dcc.Store(id="session_id"),
         ]
     )
 
@@ -310,473 +323,362 @@ def generate_predictor_type_list(var_name_list):
 
 
 """
-Good/Bad Definition Page
-"""
-# A class for validating user inputs for good bad definitions
-
-
-class GoodBadDefValidator:
-    # A method to validate if numerical definitions for bad/indeterminate has overlapped
-    def validate_if_numerical_def_overlapped(self, bad_numeric_list, indeterminate_numeric_list):
-        for bad_numeric_def in bad_numeric_list:
-            column = bad_numeric_def["column"]
-            for indeterminate_numeric_def in indeterminate_numeric_list:
-                # found matching column definition
-                if indeterminate_numeric_def["column"] == column:
-                    # Check if any overlapping definition
-                    for bad_range in bad_numeric_def["ranges"]:
-                        for indeterminate_range in indeterminate_numeric_def["ranges"]:
-                            if bad_range[0] < indeterminate_range[0] and bad_range[1] > indeterminate_range[0]:
-                                return False
-                            if bad_range[0] < indeterminate_range[1] and bad_range[1] > indeterminate_range[1]:
-                                return False
-                            if bad_range[0] == indeterminate_range[0] and bad_range[1] <= indeterminate_range[1]:
-                                return False
-                            if bad_range[1] == indeterminate_range[1] and bad_range[0] >= indeterminate_range[0]:
-                                return False
-                    break
-        return True
-
-    # A method to validate if categorical definitions for bad/indeterminate has overlapped
-    def validate_if_categorical_def_overlapped(self, bad_categoric_list, indeterminate_categoric_list):
-        for bad_categoric_def in bad_categoric_list:
-            column = bad_categoric_def["column"]
-            for indeterminate_categoric_def in indeterminate_categoric_list:
-                # found matching column definition
-                if indeterminate_categoric_def["column"] == column:
-                    # Check if any overlapping definition
-                    for element in bad_categoric_def["elements"]:
-                        if element in indeterminate_categoric_def["elements"]:
-                            return False
-                    break
-        return True
-
-    # A method to validate if all numerical definition range have upper bound > lower bound, if not, returns false
-    def validate_numerical_bounds(self, numeric_info_list):
-        for numeric_info in numeric_info_list:
-            a_range = [numeric_info[1], numeric_info[2]]
-            try:
-                if a_range[1] <= a_range[0]:
-                    return False
-            except:
-                return False
-        return True
+Interactive Binning Page
+"""
+# A class for caching the good/bad/indeterminate label of each row of df, so that the labels
+# are computed once for each good bad definition instead of once in every callback
+# Labels are keyed by the hash of the good bad definition JSON, and cleared when the definition is confirmed again
+class GoodBadLabelCache:
+    __label_dict = dict()
+    __lock = threading.Lock()
 
+    # A method to get the key of the good bad definition in the cache
+    @staticmethod
+    def get_key(good_bad_def):
+        return hashlib.sha256(json.dumps(good_bad_def, sort_keys=True).encode("utf-8")).hexdigest()
 
-# A class for merging overlapping good bad definition ranges/elements for the same type (bad or indeterminate)
-class GoodBadDefDecoder:
-    # A method to translate numerical definition ranges defined by user (with/without overlapping) info to a list of numerical definition (no overlapping)
+    # A method to get the labels (0=good, 1=bad, 2=indeterminate) of all rows in df, and the population weights
+    # Return a dictionary {"labels": np.array, "good_weight": good_weight, "bad_weight": bad_weight}
     @staticmethod
-    def get_numeric_def_list_from_section(numeric_info_list):
-        numeric_list = list()  # initialization
-
-        for numeric_info in numeric_info_list:
-            single_def_dict = dict()
-            column = numeric_info[0]
-            a_range = [numeric_info[1], numeric_info[2]]
-            # The 2 bounds are valid, now check if any overlapping with previously saved data
-            has_column_overlap = False
-            for def_idx, saved_def in enumerate(numeric_list):
-                if saved_def["column"] == column:
-                    has_column_overlap = True
-                    has_range_overlap = False
-                    overlapped_def_range_idxes = list()
-                    # Merge range to element list
-                    for def_range_idx, def_range in enumerate(saved_def["ranges"]):
-                        if len(overlapped_def_range_idxes) != 0:
-                            a_range = numeric_list[def_idx]["ranges"][overlapped_def_range_idxes[0]]
-
-                        if a_range[0] <= def_range[0] and a_range[1] >= def_range[1]:
-                            has_range_overlap = True
-                            numeric_list[def_idx]["ranges"][def_range_idx] = [
-                                a_range[0], a_range[1]]
-                            overlapped_def_range_idxes.insert(0, def_range_idx)
-                        elif def_range[0] <= a_range[0] and def_range[1] >= a_range[1]:
-                            has_range_overlap = True
-                        elif a_range[0] <= def_range[0] and a_range[1] >= def_range[0] and a_range[1] <= def_range[1]:
-                            has_range_overlap = True
-                            numeric_list[def_idx]["ranges"][def_range_idx] = [
-                                a_range[0], def_range[1]]
-                            overlapped_def_range_idxes.insert(0, def_range_idx)
-                        elif a_range[0] >= def_range[0] and a_range[0] <= def_range[1] and a_range[1] >= def_range[1]:
-                            has_range_overlap = True
-                            numeric_list[def_idx]["ranges"][def_range_idx] = [
-                                def_range[0], a_range[1]]
-                            overlapped_def_range_idxes.insert(0, def_range_idx)
-                    if len(overlapped_def_range_idxes) != 0:
-                        del overlapped_def_range_idxes[0]
-                        for i in sorted(overlapped_def_range_idxes, reverse=True):
-                            del numeric_list[def_idx]["ranges"][i]
-                    if has_range_overlap == False:
-                        numeric_list[def_idx]["ranges"].append(a_range)
-                    break
-            if has_column_overlap == False:
-                single_def_dict["column"] = column
-                single_def_dict["ranges"] = [a_range]
-                numeric_list.append(single_def_dict)
-
-        for idx in range(len(numeric_list)):
-            numeric_list[idx]["ranges"] = GoodBadDefDecoder.sort_numerical_def_ranges(
-                numeric_list[idx]["ranges"])
-
-        return numeric_list
-
-    # A method to sort a list of numerical def e.g., from [[15, 20], [1, 10], [13, 14]] to [[1, 10], [13, 14], [15, 20]].
+    def get_labels(good_bad_def):
+        key = GoodBadLabelCache.get_key(good_bad_def)
+        with GoodBadLabelCache.__lock:
+            if key not in GoodBadLabelCache.__label_dict:
+                labels = GoodBadCounter.get_good_bad_labels(df, good_bad_def)
+                labels.setflags(write=False)  # shared by all callbacks
+                GoodBadLabelCache.__label_dict[key] = {
+                    "labels": labels,
+                    "good_weight": good_bad_def["good"]["weight"],
+                    "bad_weight": good_bad_def["bad"]["weight"],
+                }
+            return GoodBadLabelCache.__label_dict[key]
+
+    # A method to get the cached labels given the key of the good bad definition, None if they are no longer cached
     @staticmethod
-    def sort_numerical_def_ranges(numeric_def_r):
-        sorted_def_ranges = list()
-        for r in numeric_def_r:
-            has_appended = False
-            for idx in range(len(sorted_def_ranges)):
-                if r[0] < sorted_def_ranges[idx][0]:
-                    sorted_def_ranges.insert(idx, r)
-                    has_appended = True
-                    break
-            if has_appended == False:
-                sorted_def_ranges.append(r)
-        return sorted_def_ranges
-
-    # A method to translate categorical definition elements defined by user (with/without overlapping) info to a list of categorical definition (no overlapping)
+    def get_labels_by_key(key):
+        with GoodBadLabelCache.__lock:
+            return GoodBadLabelCache.__label_dict.get(key)
+
+    # A method to get the same statistics as GoodBadCounter.get_statistics from the cached labels
+    # row_mask (optional) is a boolean array selecting the rows of df to be counted, e.g., rows of a bin
     @staticmethod
-    def get_categorical_def_list_from_section(categoric_info_list):
-        categoric_list = list()  # initialization
-        for categoric_info in categoric_info_list:
-            single_def_dict = dict()
-            column = categoric_info[0]
-            elements = categoric_info[1]
-            # Check if any overlapping with previously saved data
-            has_overlap = False
-            for saved_def in categoric_list:
-                if saved_def["column"] == column:
-                    has_overlap = True
-                    # Append element to elements list if it is not existed yet
-                    for element in elements:
-                        if element not in saved_def["elements"]:
-                            saved_def["elements"].append(element)
-                    break
-            if has_overlap == False:
-                single_def_dict["column"] = column
-                single_def_dict["elements"] = elements
-                categoric_list.append(single_def_dict)
-        return categoric_list
-
-
-# A class for counting the number of good and bad samples/population in the column
-class GoodBadCounter:
-    # A method to get the number of sample bad, sample indeterminate, sample good, population good, and population bad
+    def get_statistics(good_bad_def, row_mask=None):
+        cached = GoodBadLabelCache.get_labels(good_bad_def)
+        labels = cached["labels"] if row_mask is None else cached["labels"][row_mask]
+        sample_good_count, sample_bad_count, sample_indeterminate_count = GoodBadCounter.count_labels(labels)
+        population_good_count = GoodBadCounter.get_population_good(sample_good_count, cached["good_weight"])
+        population_bad_count = GoodBadCounter.get_population_bad(sample_bad_count, cached["bad_weight"])
+        return (sample_bad_count, sample_indeterminate_count, sample_good_count, cached["good_weight"], cached["bad_weight"], population_good_count, population_bad_count)
+
+    # A method to remove all cached labels
     @staticmethod
-    def get_statistics(dframe, good_bad_def):
-        new_dframe, sample_bad_count = GoodBadCounter.count_sample_bad(
-            dframe, good_bad_def["bad"])
-        if "indeterminate" in good_bad_def:
-            sample_indeterminate_count = GoodBadCounter.count_sample_indeterminate(
-                new_dframe, good_bad_def["indeterminate"])
-        else:
-            sample_indeterminate_count = 0
-        sample_good_count = GoodBadCounter.count_sample_good(
-            dframe, sample_bad_count, sample_indeterminate_count)
-        good_weight = good_bad_def["good"]["weight"]
-        bad_weight = good_bad_def["bad"]["weight"]
-        population_good_count = GoodBadCounter.get_population_good(
-            sample_good_count, good_weight)
-        population_bad_count = GoodBadCounter.get_population_bad(
-            sample_bad_count, bad_weight)
-        return (sample_bad_count, sample_indeterminate_count, sample_good_count, good_weight, bad_weight, population_good_count, population_bad_count)
-
-    # A method to count the number of sample bad
+    def clear():
+        with GoodBadLabelCache.__lock:
+            GoodBadLabelCache.__label_dict.clear()
+
+
+# A class for caching the information value (IV) of each variable for sorting the variables by IV
+# IV is keyed by (column, hash of the column bins settings, hash of the good bad definition), so that
+# only the variables with changed bins settings are computed again
+class IVCache:
+    __iv_dict = dict()
+    __lock = threading.Lock()
+
+    # A method to get the key of the IV of a variable
     @staticmethod
-    def count_sample_bad(dframe, bad_defs):
-        bad_count = 0
-        if "numerical" in bad_defs:
-            for bad_numeric_def in bad_defs["numerical"]:
-                # count number of rows if dframe row is in bad_numeric_def range, and add to bad_count
-                for a_range in bad_numeric_def["ranges"]:
-                    bad_count += len(dframe[(dframe[bad_numeric_def["column"]] >= a_range[0]) & (
-                        dframe[bad_numeric_def["column"]] < a_range[1])])
-                    # delete rows if dframe row is in bad_numeric_def range
-                    dframe = dframe.drop(dframe[(dframe[bad_numeric_def["column"]] >= a_range[0]) & (
-                        dframe[bad_numeric_def["column"]] < a_range[1])].index)
-
-        if "categorical" in bad_defs:
-            for bad_categoric_def in bad_defs["categorical"]:
-                # count number of rows if dframe row is having any one of the bad_categoric_def elements value
-                for element in bad_categoric_def["elements"]:
-                    bad_count += len(
-                        dframe[(dframe[bad_categoric_def["column"]] == element)])
-                    # delete rows if dframe row has value 'element'
-                    dframe = dframe.drop(
-                        dframe[(dframe[bad_categoric_def["column"]] == element)].index)
-
-        return (dframe, bad_count)
-
-    # A method to count the number of sample indeterminate
+    def get_key(col_bins_settings, good_bad_def):
+        settings_hash = hashlib.sha256(json.dumps(col_bins_settings, sort_keys=True).encode("utf-8")).hexdigest()
+        return (col_bins_settings["column"], settings_hash, GoodBadLabelCache.get_key(good_bad_def))
+
+    # A method to get a list of (column, IV) for all variables in the bins settings
+    # Variables not in the cache (e.g., all variables on first load) are computed in one batch sharing the good/bad labels
     @staticmethod
-    def count_sample_indeterminate(dframe, indeterminate_defs):
-        indeterminate_count = 0
-        if "numerical" in indeterminate_defs:
-            for indeterminate_numeric_def in indeterminate_defs["numerical"]:
-                # count number of rows if dframe row is in indeterminate_numeric_def range, and add to indeterminate_count
-                for a_range in indeterminate_numeric_def["ranges"]:
-                    indeterminate_count += len(dframe[(dframe[indeterminate_numeric_def["column"]] >= a_range[0]) & (
-                        dframe[indeterminate_numeric_def["column"]] < a_range[1])])
-                    # delete rows if dframe row is in indeterminate_numeric_def range
-                    dframe = dframe.drop(dframe[(dframe[indeterminate_numeric_def["column"]] >= a_range[0]) & (
-                        dframe[indeterminate_numeric_def["column"]] < a_range[1])].index)
-
-        if "categorical" in indeterminate_defs:
-            for indeterminate_categoric_def in indeterminate_defs["categorical"]:
-                # count number of rows if dframe row is having any one of the indeterminate_categoric_def elements value
-                for element in indeterminate_categoric_def["elements"]:
-                    indeterminate_count += len(
-                        dframe[(dframe[indeterminate_categoric_def["column"]] == element)])
-                    # delete rows if dframe row has value 'element'
-                    dframe = dframe.drop(
-                        dframe[(dframe[indeterminate_categoric_def["column"]] == element)].index)
-
-        return indeterminate_count
-
-    # A method to count the number of sample good
+    def get_iv_list(bins_settings_list, good_bad_def):
+        key_list = [IVCache.get_key(col_bins_settings, good_bad_def) for col_bins_settings in bins_settings_list]
+        with IVCache.__lock:
+            missing_idx_list = [idx for idx, key in enumerate(key_list) if key not in IVCache.__iv_dict]
+
+        if len(missing_idx_list) > 0:
+            labels = GoodBadLabelCache.get_labels(good_bad_def)["labels"]
+            for idx in missing_idx_list:
+                iv = IVCache.compute_iv(bins_settings_list[idx], good_bad_def, labels)
+                with IVCache.__lock:
+                    IVCache.__iv_dict[key_list[idx]] = iv
+
+        with IVCache.__lock:
+            return [(col_bins_settings["column"], IVCache.__iv_dict[key]) for col_bins_settings, key in zip(bins_settings_list, key_list)]
+
+    # A method to compute the IV of a variable, i.e., the total MC in its summary statistics table
+    # Only the column to be binned is copied, as the good/bad labels of all rows are given
     @staticmethod
-    def count_sample_good(dframe, sample_bad_count, sample_indeterminate_count):
-        return (len(dframe) - sample_bad_count - sample_indeterminate_count)
+    def compute_iv(col_bins_settings, good_bad_def, labels):
+        stat_df = WebAppStatCalculator.compute_summary_stat_table(
+            df.loc[:, [col_bins_settings["column"]]], col_bins_settings, good_bad_def, labels)
+        return stat_df.iloc[-1]['MC']
 
-    # A method to count the number of population good
+    # A method to remove all cached IV
     @staticmethod
-    def get_population_good(sample_good_count, good_weight):
-        return sample_good_count * good_weight
+    def clear():
+        with IVCache.__lock:
+            IVCache.__iv_dict.clear()
+
 
-    # A method to count the number of population bad
+# A class for caching the ColValueIndex of each column of df, so that the rows holding the values moved to another bin
+# by an interactive binning action are found without scanning the column (see InteractiveBinningMachine.rebin_codes)
+class ColValueIndexCache:
+    __index_dict = dict()
+    __lock = threading.Lock()
+
+    # A method to get the ColValueIndex of a column, built on first use
     @staticmethod
-    def get_population_bad(sample_bad_count, bad_weight):
-        return sample_bad_count * bad_weight
+    def get_index(column, col_type):
+        with ColValueIndexCache.__lock:
+            if (column, col_type) not in ColValueIndexCache.__index_dict:
+                ColValueIndexCache.__index_dict[(column, col_type)] = ColValueIndex(df[column], col_type)
+            return ColValueIndexCache.__index_dict[(column, col_type)]
 
+    # A method to remove all cached indexes
+    @staticmethod
+    def clear():
+        with ColValueIndexCache.__lock:
+            ColValueIndexCache.__index_dict.clear()
 
-"""
-Interactive Binning Page
-"""
-# A class to calculate statistical values for displaying the mixed chart & statistical tables
 
+# A class for caching the NumericMicroBins of each numerical column of df for each good bad definition, so that the label counts
+# of any numerical bins (custom, equal width, equal frequency or optimal) are computed from the distinct values instead of binning the rows
+class MicroBinsCache:
+    __micro_bins_dict = dict()
+    __lock = threading.Lock()
 
-class StatCalculator:
-    # Output - a dataframe representing the summary statistics table of the column
+    # A method to get the NumericMicroBins of a numerical column, built on first use from its ColValueIndex & the cached labels
     @staticmethod
-    def compute_summary_stat_table(df, col_bins_settings, good_bad_def):
-        if len(df) == 0 or col_bins_settings == None or good_bad_def == None:
-            return None
-        """
-        1. Binning
-        """
-        col_to_bin = col_bins_settings["column"]  # get the name of column to be binned
-
-        col_df = df.loc[:, [col_to_bin]]  # get a single column
-
-        # perform binning
-        _, binned_series = BinningMachine.perform_binning_on_col(
-            col_df, col_bins_settings)
-        df.insert(loc=0, column=col_to_bin+"_binned", value=binned_series)
-
-        """
-        2. Compute Summary Statistic Table
-        """
-        # Initialize an empty dictionary for storing information of each rows of the summary table (i.e., each bin)
-        summary_dict = dict()
-        # Create a list which stores summary table' column names
-        summary_table_col_name_list = ["Bin", "Good", "Bad", "Odds",
-                                       "Total", "Good%", "Bad%", "Total%", "Info_Odds", "WOE", "MC"]
-
-        # Get and save a list of unique bin_name
-        bin_name_list = df.iloc[:, 0].unique().tolist()
-
-        # Get total good & bad
-        _, _, _, _, _, total_good_count, total_bad_count = GoodBadCounter.get_statistics(
-            df, good_bad_def)
-
-        # For each bin_name in the list (i.e. loop nbin times)
-        for bin_name in bin_name_list:
-            # Get a DataFrame which filtered out rows that does not belong to the bin
-            if bin_name == None:
-                bin_df = df.loc[df.iloc[:, 0].isna()]
-            else:
-                bin_df = df.loc[df.iloc[:, 0] == bin_name]
-            # Call compute_bin_stats(var_df : pd.DataFrame, total_num_records : Integer, bin_name : String) and save as bin_stats_list
-            bin_stats_list = StatCalculator.__compute_bin_stats__(good_bad_def,
-                                                                  bin_df, bin_name, total_good_count, total_bad_count)
-            # Add an element in the dictionary, with bin_name as the key, and bin_stats_list as the value
-            summary_dict[bin_name] = bin_stats_list
-
-        # Create a pd.DataFrame object using the created dictionary
-        var_summary_df = pd.DataFrame.from_dict(
-            summary_dict, orient='index', columns=summary_table_col_name_list)
-
-        # Call compute_var_stats(var_df: pd.DataFrame, var_summary_df : pd.DataFrame, total_num_records : Integer) and save the list
-        var_stats_list = StatCalculator.__compute_var_stats__(
-            var_summary_df, total_good_count, total_bad_count)
-
-        # Create a dictionary using "all" as the key, and the list created as the value
-        all_summary_series = pd.Series(
-            var_stats_list, index=summary_table_col_name_list)
-
-        # Append the dictionary as a row to the pd.DataFrame created
-        var_summary_df = var_summary_df.append(
-            all_summary_series, ignore_index=True)
-
-        # format df
-        for col in ['Odds', 'Info_Odds', 'WOE', 'MC']:
-            var_summary_df[col] = var_summary_df[col].apply(
-                lambda x: 0 if (x != None and abs(x) < 0.001) else x)
-            var_summary_df[col] = var_summary_df[col].apply(
-                lambda x: round(x, 4) if (x != None) else x)
-
-        for col in ['Good%', 'Bad%', 'Total%']:
-            var_summary_df[col] = var_summary_df[col].apply(
-                lambda x: round(x, 2) if (x != None) else x)
-
-        return var_summary_df
-
+    def get_micro_bins(column, good_bad_def):
+        key = (column, GoodBadLabelCache.get_key(good_bad_def))
+        with MicroBinsCache.__lock:
+            if key in MicroBinsCache.__micro_bins_dict:
+                return MicroBinsCache.__micro_bins_dict[key]
+
+        micro_bins = NumericMicroBins.from_col_value_index(ColValueIndexCache.get_index(column, "numerical"),
+            GoodBadLabelCache.get_labels(good_bad_def)["labels"], is_integer=pd.api.types.is_integer_dtype(df[column]))
+        with MicroBinsCache.__lock:
+            return MicroBinsCache.__micro_bins_dict.setdefault(key, micro_bins)
+
+    # A method to remove all cached micro-bins
+    @staticmethod
+    def clear():
+        with MicroBinsCache.__lock:
+            MicroBinsCache.__micro_bins_dict.clear()
+
+
+# A class for keeping the binned column of the variable being binned on the server, instead of sending
+# a copy of the whole dataset to the browser (dcc.Store) on every interaction
+# Only a small key (session id & hash of the column bins settings) and the bins settings are stored in dcc.Store
+# The binned column is kept as bin codes (see ColBinsPlan.get_bin_codes, -1 is missing) & bin names, so that an interactive
+# binning action can update the bin codes of the affected rows only (see rebin_temp_col)
+# The label counts of each bin (BinAggregates) are kept with the binned column for each good bad definition,
+# so that the mixed chart & the summary statistics table are computed from the counts
+# A numerical column is counted from its micro-bins (see MicroBinsCache), so its bin codes are only computed when needed
+# Binned columns are kept in a LRU cache, evicted columns are spilled to disk as Arrow files if spill_dir is set
+class BinnedColStore:
+    max_entries = 16  # max number of binned columns kept in memory (for all sessions)
+    spill_dir = None  # e.g., tempfile.gettempdir(), None to discard evicted columns (they are re-binned when needed)
+    __col_dict = OrderedDict()
+    __lock = threading.Lock()
+
+    # A method to get the key of the binned column of a session
     @staticmethod
-    def __compute_bin_stats__(good_bad_def, bin_df, bin_name, total_good, total_bad):
-        # Initialize an empty list (e.g., bin_stats_list) for storing the statistics for a bin
-        bin_stats_list = list()
-
-        # Compute bin good & bad count
-        _, _, _, _, _, good, bad = GoodBadCounter.get_statistics(
-            bin_df, good_bad_def)
-        # Compute bin total count
-        total = good + bad
-        # Call compute_pct(value : Integer, total_value : Integer) and save the returned value (i.e., good%)
-        good_pct = StatCalculator.compute_pct(good, total_good)
-        # Call compute_pct(value : Integer, total_value : Integer) and save the returned value (i.e., bad%)
-        bad_pct = StatCalculator.compute_pct(bad, total_bad)
-        # Call compute_pct(value : Integer, total_value : Integer) and save the returned value (i.e., total%)
-        total_pct = StatCalculator.compute_pct(total, total_good + total_bad)
-        # Call compute_odds(good_pct : Float, bad_pct : Float) and save the returned value
-        odds = StatCalculator.compute_odds(good, bad)
-        info_odds = StatCalculator.compute_info_odds(good_pct, bad_pct)
-        # Call compute_woe(df : pd.DataFrame) using df and save the returned value
-        woe = StatCalculator.compute_woe(info_odds)
-        # Call compute_info_val(good_pct : Float, bad_pct : Float, woe : Float) and save the returned value
-        mc = StatCalculator.compute_mc(good_pct, bad_pct, woe)
-
-        # Append all statistics to the bin_stats_list in order
-        bin_stats_row = [bin_name, good, bad, odds, total, good_pct * 100 if good_pct != None else None, bad_pct *
-                         100 if bad_pct != None else None, total_pct*100 if total_pct != None else None, info_odds, woe, mc]
-        bin_stats_list.extend(bin_stats_row)
-
-        # Return list
-        return bin_stats_list
+    def get_key(session_id, col_bins_settings):
+        settings_hash = hashlib.sha256(json.dumps(col_bins_settings, sort_keys=True).encode("utf-8")).hexdigest()
+        return f"{session_id}:{settings_hash}"
 
+    # A method to save the bin codes & bin names of the binned column (binned by a list of bins), and return the data to be saved in dcc.Store
+    # bin_codes is None to bin the column on first use, aggregates_dict (optional) is the BinAggregates of the binned column
+    # by the key of the good bad definition
+    @staticmethod
+    def put(session_id, col_bins_settings, bin_codes, bin_names, aggregates_dict=None):
+        key = BinnedColStore.get_key(session_id, col_bins_settings)
+        if bin_codes is not None:
+            bin_codes.setflags(write=False)  # may be shared by the binned columns before & after an interactive binning action
+        BinnedColStore.__save__(key, {"bin_codes": bin_codes, "bin_names": list(bin_names), "aggregates": dict(aggregates_dict or {})})
+        return json.dumps({"key": key, "col_bins_settings": col_bins_settings})
+
+    # A method to get the bin codes & bin names of the binned column given the data saved in dcc.Store
+    @staticmethod
+    def get_codes(temp_binned_col_data):
+        binned_col = BinnedColStore.__get_binned_col__(temp_binned_col_data)
+        if binned_col["bin_codes"] is None:
+            col_plan = ColBinsPlan(json.loads(temp_binned_col_data)["col_bins_settings"])
+            bin_codes = col_plan.get_bin_codes(df[col_plan.column])
+            bin_codes.setflags(write=False)
+            with BinnedColStore.__lock:
+                binned_col["bin_codes"] = bin_codes
+        return (binned_col["bin_codes"], binned_col["bin_names"])
+
+    # A method to get the label counts of each bin (BinAggregates) of the binned column for a good bad definition,
+    # the rows (or the micro-bins of a numerical column) are counted once, then the counts are kept with the binned column
     @staticmethod
-    def __compute_var_stats__(var_summary_df, total_good, total_bad):
-        # Create an empty list for storing the statistics for the whole dataset
-        var_stats_list = list()
-
-        # Call compute_good(df : pd.DataFrame) using df and save the returned value
-        good = total_good
-        # Call compute_bad(df : pd.DataFrame) using df and save the returned value
-        bad = total_bad
-        # Call compute_total(df : pd.DataFrame) using df and save the returned value
-        total = good + bad
-        # Call compute_pct(value : Integer, total_value : Integer) and save the returned value (i.e., good%)
-        good_pct = StatCalculator.compute_pct(good, total_good)
-        # Call compute_pct(value : Integer, total_value : Integer) and save the returned value (i.e., bad%)
-        bad_pct = StatCalculator.compute_pct(bad, total_bad)
-        # Call compute_pct(value : Integer, total_value : Integer) and save the returned value (i.e., total%)
-        total_pct = 1
-        # Call compute_odds(good_pct : Float, bad_pct : Float) and save the returned value
-        odds = StatCalculator.compute_odds(good, bad)
-        info_odds = None
-        # Empty woe
-        woe = None
-        # Sum up the MC column and save the value = InfoVal
-        mc = var_summary_df.MC.sum()
-
-        # Append all statistics to the empty list in order
-        var_stats_list = ["Total", good, bad, odds, total, good_pct *
-                          100 if good_pct != None else None, bad_pct*100 if bad_pct != None else None, total_pct*100 if total_pct != None else None, info_odds, woe, mc]
-        # Return list
-        return var_stats_list
+    def get_aggregates(temp_binned_col_data, good_bad_def):
+        binned_col = BinnedColStore.__get_binned_col__(temp_binned_col_data)
+        good_bad_def_key = GoodBadLabelCache.get_key(good_bad_def)
+        aggregates = binned_col["aggregates"].get(good_bad_def_key)
+        if aggregates is None:
+            col_bins_settings = json.loads(temp_binned_col_data)["col_bins_settings"]
+            if col_bins_settings["type"] == "numerical":
+                aggregates = MicroBinsCache.get_micro_bins(col_bins_settings["column"], good_bad_def).get_aggregates(col_bins_settings)
+            else:
+                bin_codes, bin_names = BinnedColStore.get_codes(temp_binned_col_data)
+                aggregates = BinAggregates.from_bin_codes(bin_codes, bin_names, GoodBadLabelCache.get_labels(good_bad_def)["labels"])
+            with BinnedColStore.__lock:
+                binned_col["aggregates"][good_bad_def_key] = aggregates
+        return aggregates
 
+    # A method to get all label counts kept with the binned column, a dict of the key of the good bad definition -> BinAggregates
     @staticmethod
-    def compute_pct(value, total_value):
-        if total_value == 0:
-            return None
-        else:
-            return (value/total_value)
+    def get_aggregates_dict(temp_binned_col_data):
+        binned_col = BinnedColStore.__get_binned_col__(temp_binned_col_data)
+        with BinnedColStore.__lock:
+            return dict(binned_col["aggregates"])
 
+    # A method to get the binned column given the data saved in dcc.Store
+    # The column is binned again on first use if it is no longer kept (e.g., evicted without spilling, or the server restarted)
     @staticmethod
-    def compute_odds(good, bad):
-        if bad == 0:
-            return None
-        else:
-            return (good/bad)
+    def __get_binned_col__(temp_binned_col_data):
+        temp_binned_col_info = json.loads(temp_binned_col_data)
+        key = temp_binned_col_info["key"]
+        binned_col = BinnedColStore.__load__(key)
+        if binned_col is None:
+            col_plan = ColBinsPlan(temp_binned_col_info["col_bins_settings"])
+            binned_col = {"bin_codes": None, "bin_names": list(col_plan.bin_names), "aggregates": dict()}
+            BinnedColStore.__save__(key, binned_col)
+        return binned_col
+
+    # A method to get the binned column (the bin name of each row, rows not in any bin are labelled as "Missing") given the data saved in dcc.Store
+    @staticmethod
+    def get(temp_binned_col_data):
+        bin_codes, bin_names = BinnedColStore.get_codes(temp_binned_col_data)
+        label_arr = np.empty(len(bin_names) + 1, dtype=object)
+        for idx in range(len(bin_names)):
+            label_arr[idx] = bin_names[idx]
+        label_arr[-1] = DataikuBinningMachine.MISSING_LABEL  # picked by code -1
+        return label_arr[bin_codes]
 
     @staticmethod
-    def compute_info_odds(good_pct, bad_pct):
-        if bad_pct == 0 or good_pct == None or bad_pct == None:
-            return None
-        else:
-            return (good_pct/bad_pct)
+    def __save__(key, binned_col):
+        with BinnedColStore.__lock:
+            BinnedColStore.__col_dict[key] = binned_col
+            BinnedColStore.__col_dict.move_to_end(key)
+            while len(BinnedColStore.__col_dict) > BinnedColStore.max_entries:
+                evicted_key, evicted_col = BinnedColStore.__col_dict.popitem(last=False)
+                BinnedColStore.__spill__(evicted_key, evicted_col)
 
     @staticmethod
-    def compute_woe(info_odds):
-        if info_odds == None or info_odds <= 0:
+    def __load__(key):
+        with BinnedColStore.__lock:
+            if key in BinnedColStore.__col_dict:
+                BinnedColStore.__col_dict.move_to_end(key)
+                return BinnedColStore.__col_dict[key]
+
+        spill_path = BinnedColStore.__get_spill_path__(key)
+        if spill_path is None or not os.path.exists(spill_path):
             return None
-        else:
-            return np.log(info_odds)
+        try:
+            table = feather.read_table(spill_path)
+            binned_col = {
+                "bin_codes": table.column("bin_code").to_numpy(),
+                "bin_names": json.loads(table.schema.metadata[b"bin_names"]),
+                "aggregates": dict(),  # counted again when needed
+            }
+            os.remove(spill_path)
+        except (OSError, KeyError, ValueError, pa.ArrowException):
+            return None
+        BinnedColStore.__save__(key, binned_col)
+        return binned_col
 
     @staticmethod
-    def compute_mc(good_pct, bad_pct, woe):
-        if woe == None:
-            return 0
-        else:
-            return (good_pct - bad_pct)*woe
+    def __spill__(key, binned_col):
+        spill_path = BinnedColStore.__get_spill_path__(key)
+        if spill_path is None or binned_col["bin_codes"] is None:  # not binned yet, nothing to keep
+            return
+        try:
+            table = pa.table({"bin_code": binned_col["bin_codes"]})
+            feather.write_feather(table.replace_schema_metadata({"bin_names": json.dumps(binned_col["bin_names"])}), spill_path)
+        except (OSError, TypeError, pa.ArrowException):  # e.g., bin names not JSON serializable, the column will be binned again when needed
+            pass
 
+    @staticmethod
+    def __get_spill_path__(key):
+        if BinnedColStore.spill_dir == None or feather == None:
+            return None
+        return os.path.join(BinnedColStore.spill_dir, "binned_col_" + hashlib.sha256(key.encode("utf-8")).hexdigest() + ".arrow")
+
+
+# A function to bin the column of the variable being binned by a list of bins, and save it in BinnedColStore
+# A numerical column is not binned here, as its label counts are computed from its micro-bins (see BinnedColStore.get_aggregates)
+# Return the data to be saved in dcc.Store
+def bin_temp_col(session_id, col_bins_settings):
+    col_plan = ColBinsPlan(col_bins_settings)
+    if col_plan.type == "numerical":
+        return BinnedColStore.put(session_id, col_bins_settings, None, col_plan.bin_names)
+    return BinnedColStore.put(session_id, col_bins_settings, col_plan.get_bin_codes(df[col_plan.column]), col_plan.bin_names)
+
+
+# A function to update the binned column after an interactive binning action, given the data of the binned column before the
+# action saved in dcc.Store & the changes of the bins (see InteractiveBinningMachine.perform_action)
+# A rename keeps the bin codes, a merge maps the bin codes, and only the rows holding moved values are binned again,
+# the whole column is binned again if the binned column before the action does not match the changes
+# The label counts of each bin are updated in the same way (see BinAggregates.apply_bins_diff)
+# A numerical column is counted again from its micro-bins instead, without binning any row (see bin_temp_col)
+# Return the data to be saved in dcc.Store
+def rebin_temp_col(session_id, temp_binned_col_data, new_col_bins_settings, bins_diff):
+    if temp_binned_col_data == None or bins_diff == None or new_col_bins_settings["type"] == "numerical":
+        return bin_temp_col(session_id, new_col_bins_settings)
+    bin_codes, bin_names = BinnedColStore.get_codes(temp_binned_col_data)
+    if bin_names != bins_diff["old_bin_names"]:
+        return bin_temp_col(session_id, new_col_bins_settings)
+
+    col_value_index = ColValueIndexCache.get_index(new_col_bins_settings["column"], new_col_bins_settings["type"])
+    new_bin_codes = InteractiveBinningMachine.rebin_codes(bin_codes, bins_diff, new_col_bins_settings, col_value_index)
+
+    new_aggregates_dict = dict()
+    for good_bad_def_key, aggregates in BinnedColStore.get_aggregates_dict(temp_binned_col_data).items():
+        cached = GoodBadLabelCache.get_labels_by_key(good_bad_def_key)
+        if cached is not None:  # counts of a good bad definition no longer used are dropped
+            new_aggregates_dict[good_bad_def_key] = aggregates.apply_bins_diff(bins_diff, bin_codes, new_bin_codes, cached["labels"], col_value_index)
+    return BinnedColStore.put(session_id, new_col_bins_settings, new_bin_codes, bins_diff["new_bin_names"], new_aggregates_dict)
+
+
+# A function to get the unique bins (sorted), and the total count, bad count & WOE of each bin for the mixed chart
+# The bins are counted from the label counts kept with the binned column (see BinnedColStore.get_aggregates), not from the rows
+def get_chart_aggregates(temp_binned_col_data, good_bad_def):
+    if good_bad_def == None:  # good bad def not defined, so no count
+        unique_bins = pd.factorize(BinnedColStore.get(temp_binned_col_data), sort=True)[1].tolist()
+        return (unique_bins, [0] * len(unique_bins), [0] * len(unique_bins), [0] * len(unique_bins))
+
+    aggregates = BinnedColStore.get_aggregates(temp_binned_col_data, good_bad_def)
+    bin_name_list, bin_label_counts = aggregates.get_label_counts(DataikuBinningMachine.MISSING_LABEL)
+    bin_idx, unique_bins = pd.factorize(pd.Series(bin_name_list, dtype=object), sort=True)
+    unique_bins = unique_bins.tolist()
+    label_counts = np.zeros((len(unique_bins), 3), dtype=np.int64)
+    label_counts[bin_idx] = bin_label_counts[:-1]  # without the extra last row
+
+    good_list = GoodBadCounter.get_population_good(label_counts[:, GoodBadCounter.GOOD_LABEL], good_bad_def["good"]["weight"]).tolist()
+    bad_list = GoodBadCounter.get_population_bad(label_counts[:, GoodBadCounter.BAD_LABEL], good_bad_def["bad"]["weight"]).tolist()
+
+    # Get total good & bad
+    sample_good_count, sample_bad_count, _ = aggregates.get_total_counts()
+    total_good = GoodBadCounter.get_population_good(sample_good_count, good_bad_def["good"]["weight"])
+    total_bad = GoodBadCounter.get_population_bad(sample_bad_count, good_bad_def["bad"]["weight"])
 
-def get_list_of_total_count(temp_df, binned_col, unique_bin_name_list, good_bad_def):
     total_count_list = list()
-
-    for unique_bin_name in unique_bin_name_list:
-        if good_bad_def == None:  # If-else statement put outside for loop would be better
-            total_count_list.append(0)  # good bad def not defined, so no count
-        else:
-            bin_df = temp_df[temp_df[binned_col] == unique_bin_name]
-            # Get total good & bad
-            _, _, _, _, _, total_good_count, total_bad_count = GoodBadCounter.get_statistics(
-                bin_df, good_bad_def)
-            total_count_list.append(total_good_count+total_bad_count)
-    return total_count_list
-
-
-def get_list_of_bad_count(temp_df, binned_col, unique_bin_name_list, good_bad_def):
-    bad_count_list = list()
-    for unique_bin_name in unique_bin_name_list:
-        if good_bad_def == None:  # good bad def not defined, so no count
-            bad_count_list.append(0)
-        else:
-            bin_df = temp_df[temp_df[binned_col] == unique_bin_name]
-            _, _, _, _, _, _, total_bad_count = GoodBadCounter.get_statistics(
-                bin_df, good_bad_def)
-            bad_count_list.append(total_bad_count)
-    return bad_count_list
-
-
-def get_list_of_woe(temp_df, binned_col, unique_bin_name_list, good_bad_def):
     woe_list = list()
-    for unique_bin_name in unique_bin_name_list:
-        if good_bad_def == None:
-            woe_list.append(0)
-        else:
-            bin_df = temp_df[temp_df[binned_col] == unique_bin_name]
-            _, _, _, _, _, total_good, total_bad = GoodBadCounter.get_statistics(
-                df, good_bad_def)
-            _, _, _, _, _, good, bad = GoodBadCounter.get_statistics(
-                bin_df, good_bad_def)
-            good_pct = StatCalculator.compute_pct(good, total_good)
-            bad_pct = StatCalculator.compute_pct(bad, total_bad)
-            info_odds = StatCalculator.compute_info_odds(good_pct, bad_pct)
-            woe = StatCalculator.compute_woe(info_odds)
-            woe_list.append(woe)
-    return woe_list
+    for good, bad in zip(good_list, bad_list):
+        total_count_list.append(good + bad)
+        good_pct = WebAppStatCalculator.compute_pct(good, total_good)
+        bad_pct = WebAppStatCalculator.compute_pct(bad, total_bad)
+        info_odds = WebAppStatCalculator.compute_info_odds(good_pct, bad_pct)
+        woe_list.append(WebAppStatCalculator.compute_woe(info_odds))
+
+    return (unique_bins, total_count_list, bad_list, woe_list)
 
 
 def generate_mixed_chart_fig(
@@ -855,374 +757,6 @@ def generate_mixed_chart_fig(
     return fig
 
 
-def get_str_from_ranges(ranges):
-    if not isinstance(ranges, list):
-        return -1
-    if len(ranges) == 0:
-        return '[]'
-
-    ranges = GoodBadDefDecoder.sort_numerical_def_ranges(ranges)
-
-    ranges_str = "["
-    ranges_str = f"{ranges_str}[{ranges[0][0]}, {ranges[0][1]})"
-    for idx in range(1, len(ranges)):
-        ranges_str = f"{ranges_str}, [{ranges[idx][0]}, {ranges[idx][1]})"
-    ranges_str += "]"
-    return ranges_str
-
-
-# A class for performing binning based on bins settings
-class BinningMachine:
-    # Perform equal width binning based on a specified width (for numerical column only)
-    @staticmethod
-    def perform_eq_width_binning_by_width(col_df, width):
-        if len(col_df) == 0:
-            return (-1, -1)
-        if col_df.isna().all().all():
-            return (-1, pd.Series([None for _ in range(len(col_df))]))
-        # Cannot be categorical type
-        if not pd.api.types.is_numeric_dtype(col_df.iloc[:, 0]):
-            return (-1, -1)
-        # width cannot be non-numeric
-        if not (isinstance(width, int) or isinstance(width, float)) or width <= 0:
-            return (-1, -1)
-
-        min = col_df.min()
-        max = col_df.max()
-        num_bins = int(np.ceil((max - min) / width)) + 1
-
-        bin_edges = list()
-        for i in range(num_bins):
-            bin_edges.append(
-                float(Decimal(str(float(min))) + Decimal(str(width)) * i))
-
-        bin_ranges = [
-            [edge, float(Decimal(str(edge))+Decimal(str(width)))] for edge in bin_edges]
-
-        binned_result = list()
-        for _, row in col_df.iterrows():
-            val = row.iloc[0]
-            if np.isnan(val):
-                binned_result.append("Missing")
-
-            for bin_range in bin_ranges:
-                if val >= bin_range[0] and val < bin_range[1]:
-                    binned_result.append(f"[[{bin_range[0]}, {bin_range[1]})]")
-                    break
-
-        def_li = list()
-        for r in bin_ranges:
-            def_li.append({"name": get_str_from_ranges([r]), "ranges": [r]})
-
-        return (def_li, pd.Series(binned_result))
-
-    # A method to perform equal width binning based on a specified number of bins
-    @staticmethod
-    def perform_eq_width_binning_by_num_bins(col_df, num_bins):
-        if len(col_df) == 0:
-            return (-1, -1)
-        if col_df.isna().all().all():
-            return (-1, pd.Series([None for _ in range(len(col_df))]))
-        # Cannot be categorical type
-        if not pd.api.types.is_numeric_dtype(col_df.iloc[:, 0]):
-            return (-1, -1)
-        if not isinstance(num_bins, int) or num_bins <= 0:
-            return (-1, -1)
-
-        min = col_df.min()
-        max = col_df.max()
-        width = (float(max) - float(min)) / num_bins
-        add_to_last_width = Decimal(str(width * 0.01))  # to include max value
-
-        bin_edges = list()
-        for i in range(num_bins):
-            bin_edges.append(
-                float(Decimal(str(float(min))) + Decimal(str(width)) * i))
-
-        bin_ranges = [
-            [edge, float(Decimal(str(edge))+Decimal(str(width)))] for edge in bin_edges]
-        bin_ranges[len(bin_ranges)-1][1] = float(Decimal(str(add_to_last_width)
-                                                         ) + Decimal(str(bin_ranges[len(bin_ranges)-1][1])))
-
-        binned_result = list()
-        for _, row in col_df.iterrows():
-            val = row.iloc[0]
-            if np.isnan(val):
-                binned_result.append("Missing")
-            for bin_range in bin_ranges:
-                if val >= bin_range[0] and val < bin_range[1]:
-                    binned_result.append(f"[[{bin_range[0]}, {bin_range[1]})]")
-                    break
-
-        def_li = list()
-        for r in bin_ranges:
-            def_li.append({"name": get_str_from_ranges([r]), "ranges": [r]})
-
-        return (def_li, pd.Series(binned_result))
-
-    # A method to perform equal frequency binning based on a specified frequency
-    @staticmethod
-    def perform_eq_freq_binning_by_freq(col_df, freq):
-        if len(col_df) == 0:
-            return (-1, -1)
-        if col_df.isna().all().all():
-            return (-1, pd.Series([None for _ in range(len(col_df))]))
-        # Cannot be categorical type
-        if not pd.api.types.is_numeric_dtype(col_df.iloc[:, 0]):
-            return (-1, -1)
-        if not isinstance(freq, int) or freq <= 0 or freq > len(col_df):
-            return (-1, -1)
-
-        num_bins = int(np.ceil(len(col_df)/freq))
-        # print(num_bins)
-        # if num_bins == 1:
-        #     print(type(col_df.iloc[:, 0]))
-        #     return col_df.iloc[:, 0]
-
-        # bin the col_df
-        interval_li = pd.qcut(
-            col_df.iloc[:, 0], num_bins, duplicates="drop").to_list()
-
-        if all(not isinstance(x, pd._libs.interval.Interval) for x in interval_li):
-            interval_li = [pd.Interval(float(col_df.iloc[0:1, 0]), float(
-                col_df.iloc[0:1, 0])+1) for _ in interval_li]
-
-        # convert to the format we want
-        max_val = float(col_df.max())
-        binned_result = list()
-        for idx in range(len(interval_li)):
-            if not isinstance(interval_li[idx], pd._libs.interval.Interval):
-                binned_result.append("Missing")
-            else:
-                if interval_li[idx].right == max_val:
-                    binned_result.append(
-                        f"[[{interval_li[idx].left}, {interval_li[idx].right+0.0001})]")
-                else:
-                    binned_result.append(
-                        f"[[{interval_li[idx].left}, {interval_li[idx].right})]")
-
-        def_set = set()
-        for idx in range(len(interval_li)):
-            if isinstance(interval_li[idx], pd._libs.interval.Interval):
-                if interval_li[idx].right == max_val:
-                    def_set.add(
-                        (interval_li[idx].left, interval_li[idx].right+0.0001))
-                else:
-                    def_set.add(
-                        (interval_li[idx].left, interval_li[idx].right))
-        bin_ranges = list(def_set)
-
-        def_li = list()
-        for r in bin_ranges:
-            def_li.append({"name": get_str_from_ranges(
-                [[r[0], r[1]]]), "ranges": [[r[0], r[1]]]})
-
-        return (def_li, pd.Series(binned_result))
-
-    # A method to perform equal-frequency binning based on a specified number of bins
-    @staticmethod
-    def perform_eq_freq_binning_by_num_bins(col_df, num_bins):
-        if len(col_df) == 0:
-            return (-1, -1)
-        if col_df.isna().all().all():
-            return (-1, pd.Series([None for _ in range(len(col_df))]))
-        # Cannot be categorical type
-        if not pd.api.types.is_numeric_dtype(col_df.iloc[:, 0]):
-            return (-1, -1)
-        if not isinstance(num_bins, int) or num_bins <= 0:
-            return (-1, -1)
-
-        interval_li = pd.qcut(
-            col_df.iloc[:, 0], num_bins, duplicates="drop").to_list()
-
-        if all(not isinstance(x, pd._libs.interval.Interval) for x in interval_li):
-            interval_li = [pd.Interval(float(col_df.iloc[0:1, 0]), float(
-                col_df.iloc[0:1, 0])+1) for _ in interval_li]
-
-        print(f"column_df: {col_df}")
-        print(f"interval_li: {interval_li}, len: {len(interval_li)}")
-
-        # convert to the format we want
-        max_val = float(col_df.max())
-        binned_result = list()
-        for idx in range(len(interval_li)):
-            if not isinstance(interval_li[idx], pd._libs.interval.Interval):
-                binned_result.append("Missing")
-            else:
-                print(
-                    f"interval_li[idx].right: {interval_li[idx].right}, max_val: {max_val}")
-                print(
-                    f"interval_li[idx].right: {type(interval_li[idx].right)}, max_val: {type(max_val)}")
-                if interval_li[idx].right == max_val:
-                    binned_result.append(
-                        f"[[{interval_li[idx].left}, {interval_li[idx].right+0.0001})]")
-                else:
-                    binned_result.append(
-                        f"[[{interval_li[idx].left}, {interval_li[idx].right})]")
-
-        def_set = set()
-        for idx in range(len(interval_li)):
-            if isinstance(interval_li[idx], pd._libs.interval.Interval):
-                if interval_li[idx].right == max_val:
-                    def_set.add(
-                        (interval_li[idx].left, interval_li[idx].right+0.0001))
-                else:
-                    def_set.add(
-                        (interval_li[idx].left, interval_li[idx].right))
-        bin_ranges = list(def_set)
-
-        print(f"bin_ranges: {bin_ranges}, len: {len(bin_ranges)}")
-
-        def_li = list()
-        for r in bin_ranges:
-            def_li.append({"name": get_str_from_ranges(
-                [[r[0], r[1]]]), "ranges": [[r[0], r[1]]]})
-
-        _, binned_result_series = BinningMachine.perform_numerical_custom_binning(
-            col_df, def_li)
-
-        return (def_li, binned_result_series)
-
-    # A method to perform custom binning for a categorical column
-    @staticmethod
-    def perform_categorical_custom_binning(col_df, bins_settings):
-        if len(col_df) == 0:
-            return (-1, -1)
-
-        binned_result = list()
-
-        for _, row in col_df.iterrows():
-            val = row.iloc[0]
-            has_assigned_bin = False
-            for a_bin in bins_settings:
-                if val in a_bin["elements"]:
-                    binned_result.append(a_bin["name"])
-                    has_assigned_bin = True
-                    break
-            if has_assigned_bin == False:  # does not belongs to any bin
-                binned_result.append("Missing")
-
-        return (bins_settings, pd.Series(binned_result))
-
-    # A method to perform custom binning for a numerical column
-    @staticmethod
-    def perform_numerical_custom_binning(col_df, bins_settings):
-        if len(col_df) == 0:
-            return (-1, -1)
-
-        binned_result = list()
-
-        for _, row in col_df.iterrows():
-            val = row.iloc[0]
-            has_assigned_bin = False
-            for a_bin in bins_settings:
-                for r in a_bin["ranges"]:
-                    if val >= r[0] and val < r[1]:
-                        binned_result.append(a_bin["name"])
-                        has_assigned_bin = True
-                        break
-
-            if has_assigned_bin == False:  # does not belongs to any bin
-                binned_result.append("Missing")
-
-        return (bins_settings, pd.Series(binned_result))
-
-    # A method to perform binning (equal-width/equal-frequency/custom) for a single column (either categorical or numerical)
-    @staticmethod
-    def perform_binning_on_col(col_df, col_bins_settings):
-        """
-        col_bins_settings is in the form of: 
-        {
-            "column": "person_income",
-            "type": "numerical",
-            "info_val": 0.11,
-            "bins": [
-                {
-                    "name": "0-9999, 30000-39999",
-                    "ranges": [[0, 9999], [30000, 39999]],
-                },
-                {
-                    "name": "20000-29999",
-                    "ranges": [[20000, 29999]],
-                },
-            ],
-        }
-        """
-        if col_bins_settings["bins"] == "none":
-            if len(col_df) == 0:
-                return (-1, -1)
-            unique_bin = col_df.iloc[:, 0].unique().tolist()
-            if col_bins_settings["type"] == "numerical":
-                def_li = list()
-                for bin in unique_bin:
-                    def_li.append(
-                        {"name": str(bin), "ranges": [[bin, bin+0.0000001]]})
-                return BinningMachine.perform_numerical_custom_binning(col_df, def_li)
-            else:
-                def_li = list()
-                for bin in unique_bin:
-                    def_li.append({"name": str(bin), "elements": [bin]})
-                return BinningMachine.perform_categorical_custom_binning(col_df, def_li)
-        elif isinstance(col_bins_settings["bins"], dict):  # auto binning
-            if col_bins_settings["bins"]["algo"] == "equal width":
-                if col_bins_settings["bins"]["method"] == "width":
-                    if col_bins_settings["type"] == "numerical":
-                        return BinningMachine.perform_eq_width_binning_by_width(col_df, col_bins_settings["bins"]["value"])
-                    else:
-                        return (-1, -1)
-                else:  # by num of bins
-                    if col_bins_settings["type"] == "numerical":
-                        return BinningMachine.perform_eq_width_binning_by_num_bins(col_df, col_bins_settings["bins"]["value"])
-                    else:
-                        return (-1, -1)
-            else:  # equal frequency
-                if col_bins_settings["bins"]["method"] == "freq":
-                    if col_bins_settings["type"] == "numerical":
-                        return BinningMachine.perform_eq_freq_binning_by_freq(col_df, col_bins_settings["bins"]["value"])
-                    else:
-                        return (-1, -1)
-                else:  # by num of bins
-                    if col_bins_settings["type"] == "numerical":
-                        return BinningMachine.perform_eq_freq_binning_by_num_bins(col_df, col_bins_settings["bins"]["value"])
-                    else:
-                        return (-1, -1)
-        else:  # custom binning
-            if col_bins_settings["type"] == "numerical":
-                return BinningMachine.perform_numerical_custom_binning(col_df, col_bins_settings["bins"])
-            else:
-                return BinningMachine.perform_categorical_custom_binning(col_df, col_bins_settings["bins"])
-
-    # A method that perform binning (equal-width/equal-frequency/custom) for the whole dataframe (can contain numerical/categorical columns)
-    @staticmethod
-    def perform_binning_on_whole_df(dframe, bins_settings_list):
-        if len(dframe) == 0:
-            return dframe
-
-        for col in dframe.columns:
-            col_df = dframe.loc[:, [col]]
-
-            # Find col_bins_settings
-            col_bins_settings = None
-            for bins_settings in bins_settings_list:
-                if bins_settings["column"] == col:
-                    col_bins_settings = bins_settings
-                    break
-
-            # if no bins settings for the column, skip it
-            if col_bins_settings == None:
-                continue
-
-            _, binned_series = BinningMachine.perform_binning_on_col(
-                col_df, col_bins_settings)
-            if not isinstance(binned_series, pd.Series):  # error occurs
-                return -1
-
-            binned_col_name = col + "_binned"
-            dframe[binned_col_name] = binned_series
-
-        return dframe
-
-
 def generate_categoric_old_div_children(old_bin_list=[], dtype=None):
     if dtype == None:
         return []
@@ -1385,564 +919,6 @@ def generate_selected_bin_info_div_children(temp_chart_info, temp_col_bins_setti
         ]
 
 
-# A class for handling interactive binning logics
-class InteractiveBinningMachine:
-    @staticmethod
-    def categoric_create_new_bin(new_bin_name, new_bin_element_li, temp_col_bins_settings):
-        if len(new_bin_element_li) == 0:
-            return (temp_col_bins_settings, -3, -3)
-
-        if InteractiveBinningMachine.validate_new_name(new_bin_name, temp_col_bins_settings) == False:
-            return (temp_col_bins_settings, -1, -1)
-
-        old_bin_list = list()
-        new_bin_list = list()
-
-        bin_to_remove_idx_li = list()
-        # for all bins, remove overlapped elements with new_bin_element_li
-        for idx in range(len(temp_col_bins_settings["bins"])):
-            intersaction = set(temp_col_bins_settings["bins"][idx]["elements"]) & set(
-                new_bin_element_li)
-            if bool(intersaction) == True:
-                old_bin_list.append([temp_col_bins_settings["bins"][idx]["name"], str(
-                    temp_col_bins_settings["bins"][idx]["elements"])])
-                intersaction_li = list(intersaction)
-                temp_col_bins_settings["bins"][idx]["elements"] = [
-                    x for x in temp_col_bins_settings["bins"][idx]["elements"] if x not in intersaction_li]
-
-                if len(temp_col_bins_settings["bins"][idx]["elements"]) == 0:
-                    bin_to_remove_idx_li.append(idx)
-                else:
-                    new_bin_list.append([temp_col_bins_settings["bins"][idx]["name"], str(
-                        temp_col_bins_settings["bins"][idx]["elements"])])
-
-        for idx in sorted(bin_to_remove_idx_li, reverse=True):
-            del temp_col_bins_settings["bins"][idx]
-
-        # add the new bin to bins settings
-        if new_bin_name == "" or new_bin_name == None:
-            new_bin_name = str(new_bin_element_li)
-
-        if InteractiveBinningMachine.validate_new_name(new_bin_name, temp_col_bins_settings) == False:
-            return (temp_col_bins_settings, -1, -1)
-
-        new_bin = {
-            "name": new_bin_name,
-            "elements": new_bin_element_li
-        }
-
-        new_bin_list.append([new_bin_name, str(new_bin_element_li)])
-
-        temp_col_bins_settings["bins"].append(new_bin)
-
-        return (temp_col_bins_settings, old_bin_list, new_bin_list)
-
-    @staticmethod
-    def categoric_add_elements(selected_bin_name, new_bin_name, elements_to_add_li, temp_col_bins_settings):
-        if len(elements_to_add_li) == 0:
-            return (temp_col_bins_settings, -3, -3)
-
-        if InteractiveBinningMachine.validate_new_name(new_bin_name, temp_col_bins_settings, selected_bin_name=selected_bin_name) == False:
-            return (temp_col_bins_settings, -1, -1)
-
-        old_bin_list = list()
-        new_bin_list = list()
-
-        bin_to_remove_idx_li = list()
-        # for all bins, remove overlapped elements with new_bin_element_li
-        for idx in range(len(temp_col_bins_settings["bins"])):
-            intersaction = set(temp_col_bins_settings["bins"][idx]["elements"]) & set(
-                elements_to_add_li)
-            if bool(intersaction) == True:
-                old_bin_list.append([temp_col_bins_settings["bins"][idx]["name"], str(
-                    temp_col_bins_settings["bins"][idx]["elements"])])
-                intersaction_li = list(intersaction)
-                temp_col_bins_settings["bins"][idx]["elements"] = [
-                    x for x in temp_col_bins_settings["bins"][idx]["elements"] if x not in intersaction_li]
-
-                if len(temp_col_bins_settings["bins"][idx]["elements"]) == 0:
-                    bin_to_remove_idx_li.append(idx)
-                else:
-                    new_bin_list.append([temp_col_bins_settings["bins"][idx]["name"], str(
-                        temp_col_bins_settings["bins"][idx]["elements"])])
-
-            elif temp_col_bins_settings["bins"][idx]["name"] == selected_bin_name:
-                old_bin_list.append([temp_col_bins_settings["bins"][idx]["name"], str(
-                    temp_col_bins_settings["bins"][idx]["elements"])])
-                # Add elements to the selected bin
-                for element in elements_to_add_li:
-                    temp_col_bins_settings["bins"][idx]["elements"].append(
-                        element)
-                if new_bin_name != "" and new_bin_name != None:
-                    temp_col_bins_settings["bins"][idx]["name"] = new_bin_name
-                new_bin_list.append([temp_col_bins_settings["bins"][idx]["name"], str(
-                    temp_col_bins_settings["bins"][idx]["elements"])])
-
-        for idx in sorted(bin_to_remove_idx_li, reverse=True):
-            del temp_col_bins_settings["bins"][idx]
-
-        return (temp_col_bins_settings, old_bin_list, new_bin_list)
-
-    @staticmethod
-    def categoric_split_bin(selected_bin_name, new_bin_name, elements_to_split_out_li, temp_col_bins_settings):
-        if len(elements_to_split_out_li) == 0:
-            return (temp_col_bins_settings, -3, -3)
-
-        if InteractiveBinningMachine.validate_new_name(new_bin_name, temp_col_bins_settings, selected_bin_name=selected_bin_name) == False:
-            return (temp_col_bins_settings, -1, -1)
-
-        old_bin_list = list()
-        new_bin_list = list()
-
-        for idx in range(len(temp_col_bins_settings["bins"])):
-            if temp_col_bins_settings["bins"][idx]["name"] == selected_bin_name:
-                if set(temp_col_bins_settings["bins"][idx]["elements"]) == set(elements_to_split_out_li):
-                    return (temp_col_bins_settings, -4, -4)
-                old_bin_list.append([temp_col_bins_settings["bins"][idx]["name"], str(
-                    temp_col_bins_settings["bins"][idx]["elements"])])
-                # Remove user indicated elements from selected bin
-                temp_col_bins_settings["bins"][idx]["elements"] = [
-                    x for x in temp_col_bins_settings["bins"][idx]["elements"] if x not in elements_to_split_out_li]
-                new_bin_list.append([temp_col_bins_settings["bins"][idx]["name"], str(
-                    temp_col_bins_settings["bins"][idx]["elements"])])
-                break
-
-        if new_bin_name == "" or new_bin_name == None:
-            new_bin_name = str(elements_to_split_out_li)
-
-        new_bin = {
-            "name": new_bin_name,
-            "elements": elements_to_split_out_li,
-        }
-
-        temp_col_bins_settings["bins"].append(new_bin)
-
-        new_bin_list.append([new_bin_name, str(elements_to_split_out_li)])
-
-        return (temp_col_bins_settings, old_bin_list, new_bin_list)
-
-    @staticmethod
-    def categoric_rename_bin(selected_bin_name, new_bin_name, temp_col_bins_settings):
-        if selected_bin_name == new_bin_name:
-            return (temp_col_bins_settings, -2, -2)
-
-        if InteractiveBinningMachine.validate_new_name(new_bin_name, temp_col_bins_settings) == False:
-            return (temp_col_bins_settings, -1, -1)
-
-        old_bin_list = list()
-        new_bin_list = list()
-
-        for idx in range(len(temp_col_bins_settings["bins"])):
-            if temp_col_bins_settings["bins"][idx]["name"] == selected_bin_name:
-                old_bin_list.append([temp_col_bins_settings["bins"][idx]["name"], str(
-                    temp_col_bins_settings["bins"][idx]["elements"])])
-
-                if new_bin_name == "" or new_bin_name == None:
-                    new_bin_name = str(
-                        temp_col_bins_settings["bins"][idx]["elements"])
-
-                if InteractiveBinningMachine.validate_new_name(new_bin_name, temp_col_bins_settings) == False:
-                    return (temp_col_bins_settings, -1, -1)
-
-                temp_col_bins_settings["bins"][idx]["name"] = new_bin_name
-                new_bin_list.append([temp_col_bins_settings["bins"][idx]["name"], str(
-                    temp_col_bins_settings["bins"][idx]["elements"])])
-                break
-
-        return (temp_col_bins_settings, old_bin_list, new_bin_list)
-
-    @staticmethod
-    def categoric_merge_bins(selected_bin_name_li, new_bin_name, temp_col_bins_settings):
-        new_bin_element_list = list()
-        bin_to_remove_idx_li = list()
-        # Add elements to bin if it is one of the selected bins
-        for idx in range(len(temp_col_bins_settings["bins"])):
-            if temp_col_bins_settings["bins"][idx]["name"] in selected_bin_name_li:
-                for element in temp_col_bins_settings["bins"][idx]["elements"]:
-                    new_bin_element_list.append(element)
-                bin_to_remove_idx_li.append(idx)
-
-        for idx in sorted(bin_to_remove_idx_li, reverse=True):
-            del temp_col_bins_settings["bins"][idx]
-
-        if new_bin_name == "" or new_bin_name == None:
-            new_bin_name = str(new_bin_element_list)
-
-        if InteractiveBinningMachine.validate_new_name(new_bin_name, temp_col_bins_settings) == False:
-            return (temp_col_bins_settings, -1, -1)
-
-        new_bin = {
-            "name": new_bin_name,
-            "elements": new_bin_element_list,
-        }
-
-        temp_col_bins_settings["bins"].append(new_bin)
-
-        new_bin_list = [[new_bin_name, str(new_bin_element_list)]]
-
-        return (temp_col_bins_settings, [], new_bin_list)
-
-    @staticmethod
-    def numeric_create_new_bin(new_bin_name, new_bin_ranges, temp_col_bins_settings):
-        if len(new_bin_ranges) == 0:
-            return (temp_col_bins_settings, -6, -6)
-
-        if InteractiveBinningMachine.validate_new_name(new_bin_name, temp_col_bins_settings) == False:
-            return (temp_col_bins_settings, -1, -1)
-
-        old_bin_list = list()
-        new_bin_list = list()
-
-        bin_to_remove_idx_li = list()
-        # for all bins, remove overlapped ranges with new_bin_ranges
-        for bin_def_idx in range(len(temp_col_bins_settings["bins"])):
-            with_changes = False
-            for new_r in new_bin_ranges:
-                r_to_remove_idx_li = list()
-                r_to_append_li = list()
-                for r_idx in range(len(temp_col_bins_settings["bins"][bin_def_idx]["ranges"])):
-                    r = temp_col_bins_settings["bins"][bin_def_idx]["ranges"][r_idx]
-                    if new_r[1] <= r[0]:
-                        continue
-                    elif new_r[0] <= r[0] and new_r[1] > r[0] and new_r[1] < r[1]:
-                        if with_changes == False:
-                            old_bin_list.append([temp_col_bins_settings["bins"][bin_def_idx]["name"], get_str_from_ranges(
-                                temp_col_bins_settings["bins"][bin_def_idx]["ranges"])])
-                            with_changes = True
-                        # then new def = [new_r[1], r[1]]
-                        temp_col_bins_settings["bins"][bin_def_idx]["ranges"][r_idx] = [
-                            new_r[1], r[1]]
-                    elif new_r[0] <= r[0] and new_r[1] > r[0] and new_r[1] >= r[1]:
-                        if with_changes == False:
-                            old_bin_list.append([temp_col_bins_settings["bins"][bin_def_idx]["name"], get_str_from_ranges(
-                                temp_col_bins_settings["bins"][bin_def_idx]["ranges"])])
-                            with_changes = True
-                        # remove the def r
-                        r_to_remove_idx_li.append(r_idx)
-                    elif new_r[0] > r[0] and new_r[1] < r[1]:
-                        if with_changes == False:
-                            old_bin_list.append([temp_col_bins_settings["bins"][bin_def_idx]["name"], get_str_from_ranges(
-                                temp_col_bins_settings["bins"][bin_def_idx]["ranges"])])
-                            with_changes = True
-                        # split to two = [r[0], new_r[0]] & [new_r[1], r[1]]
-                        temp_col_bins_settings["bins"][bin_def_idx]["ranges"][r_idx] = [
-                            r[0], new_r[0]]
-                        r_to_append_li.append([new_r[1], r[1]])
-                    elif new_r[0] > r[0] and new_r[0] < r[1] and new_r[1] >= r[1]:
-                        if with_changes == False:
-                            old_bin_list.append([temp_col_bins_settings["bins"][bin_def_idx]["name"], get_str_from_ranges(
-                                temp_col_bins_settings["bins"][bin_def_idx]["ranges"])])
-                            with_changes = True
-                        # new def = [r[0], new_r[0]]
-                        temp_col_bins_settings["bins"][bin_def_idx]["ranges"][r_idx] = [
-                            r[0], new_r[0]]
-                    elif new_r[0] >= r[1]:
-                        continue
-
-                for idx in sorted(r_to_remove_idx_li, reverse=True):
-                    del temp_col_bins_settings["bins"][bin_def_idx]["ranges"][idx]
-
-                for r_to_append in r_to_append_li:
-                    temp_col_bins_settings["bins"][bin_def_idx]["ranges"].append(
-                        r_to_append)
-
-            if len(temp_col_bins_settings["bins"][bin_def_idx]["ranges"]) == 0:
-                bin_to_remove_idx_li.append(bin_def_idx)
-            elif with_changes == True:
-                new_bin_list.append([temp_col_bins_settings["bins"][bin_def_idx]["name"], get_str_from_ranges(
-                    temp_col_bins_settings["bins"][bin_def_idx]["ranges"])])
-
-        # Remove bin_def if it has empty def range list
-        for idx in sorted(bin_to_remove_idx_li, reverse=True):
-            del temp_col_bins_settings["bins"][idx]
-
-        if new_bin_name == "" or new_bin_name == None:
-            new_bin_name = get_str_from_ranges(new_bin_ranges)
-
-        if InteractiveBinningMachine.validate_new_name(new_bin_name, temp_col_bins_settings) == False:
-            return (temp_col_bins_settings, -1, -1)
-
-        # Add new bin to def
-        new_bin = {
-            "name": new_bin_name,
-            "ranges": new_bin_ranges,
-        }
-
-        temp_col_bins_settings["bins"].append(new_bin)
-
-        new_bin_list.append(
-            [new_bin_name, get_str_from_ranges(new_bin_ranges)])
-
-        if len(old_bin_list) == 0:
-            return (temp_col_bins_settings, old_bin_list, ("", new_bin_list))
-
-        return (temp_col_bins_settings, old_bin_list, new_bin_list)
-
-    @staticmethod
-    def get_numeric_adjust_cutpoints(selected_bin_name, new_bin_name, new_bin_ranges, temp_col_bins_settings):
-
-        if len(new_bin_ranges) == 0:
-            return (temp_col_bins_settings, -6, -6)
-
-        if InteractiveBinningMachine.validate_new_name(new_bin_name, temp_col_bins_settings) == False:
-            return (temp_col_bins_settings, -1, -1)
-
-        old_bin_list = list()
-        new_bin_list = list()
-
-        # For all bins except the selected one, remove ranges in updated_bin_ranges that overlaps with it
-        bin_to_remove_idx_li = list()
-        for bin_def_idx in range(len(temp_col_bins_settings["bins"])):
-            if temp_col_bins_settings["bins"][bin_def_idx]["name"] == selected_bin_name:
-                if temp_col_bins_settings["bins"][bin_def_idx]["ranges"] == new_bin_ranges:
-                    return (temp_col_bins_settings, [], [])
-                old_bin_list.append([temp_col_bins_settings["bins"][bin_def_idx]["name"], get_str_from_ranges(
-                    temp_col_bins_settings["bins"][bin_def_idx]["ranges"])])
-                # Remove ranges from old def that overlapped with updated_bin_ranges
-                for new_r in new_bin_ranges:
-                    r_to_remove_idx_li = list()
-                    r_to_append_li = list()
-                    for r_idx in range(len(temp_col_bins_settings["bins"][bin_def_idx]["ranges"])):
-                        r = temp_col_bins_settings["bins"][bin_def_idx]["ranges"][r_idx]
-                        if new_r[1] <= r[0]:
-                            continue
-                        elif new_r[0] <= r[0] and new_r[1] > r[0] and new_r[1] < r[1]:
-                            # then new def = [new_r[1], r[1]]
-                            temp_col_bins_settings["bins"][bin_def_idx]["ranges"][r_idx] = [
-                                new_r[1], r[1]]
-                        elif new_r[0] <= r[0] and new_r[1] > r[0] and new_r[1] >= r[1]:
-                            # remove the def r
-                            r_to_remove_idx_li.append(r_idx)
-                        elif new_r[0] > r[0] and new_r[1] < r[1]:
-                            # split to two = [r[0], new_r[0]] & [new_r[1], r[1]]
-                            temp_col_bins_settings["bins"][bin_def_idx]["ranges"][r_idx] = [
-                                r[0], new_r[0]]
-                            r_to_append_li.append([new_r[1], r[1]])
-                        elif new_r[0] > r[0] and new_r[0] < r[1] and new_r[1] >= r[1]:
-                            # new def = [r[0], new_r[0]]
-                            temp_col_bins_settings["bins"][bin_def_idx]["ranges"][r_idx] = [
-                                r[0], new_r[0]]
-                        elif new_r[0] >= r[1]:
-                            continue
-
-                    for idx in sorted(r_to_remove_idx_li, reverse=True):
-                        del temp_col_bins_settings["bins"][bin_def_idx]["ranges"][idx]
-
-                    for r_to_append in r_to_append_li:
-                        temp_col_bins_settings["bins"][bin_def_idx]["ranges"].append(
-                            r_to_append)
-
-                # no need split
-                if len(temp_col_bins_settings["bins"][bin_def_idx]["ranges"]) == 0:
-                    temp_col_bins_settings["bins"][bin_def_idx]["ranges"] = new_bin_ranges
-                else:
-                    new_bin_list.append([get_str_from_ranges(temp_col_bins_settings["bins"][bin_def_idx]["ranges"]), get_str_from_ranges(
-                        temp_col_bins_settings["bins"][bin_def_idx]["ranges"])])
-                    temp_col_bins_settings["bins"].append({"name": get_str_from_ranges(
-                        temp_col_bins_settings["bins"][bin_def_idx]["ranges"]), "ranges": temp_col_bins_settings["bins"][bin_def_idx]["ranges"]})
-
-                    if new_bin_name != "" and new_bin_name != None:
-                        temp_col_bins_settings["bins"][bin_def_idx]["name"] = new_bin_name
-                    temp_col_bins_settings["bins"][bin_def_idx]["ranges"] = new_bin_ranges
-                    new_bin_list.append([temp_col_bins_settings["bins"][bin_def_idx]["name"], get_str_from_ranges(
-                        temp_col_bins_settings["bins"][bin_def_idx]["ranges"])])
-
-            else:
-                with_changes = False
-                for new_r in new_bin_ranges:
-                    r_to_remove_idx_li = list()
-                    r_to_append_li = list()
-                    for r_idx in range(len(temp_col_bins_settings["bins"][bin_def_idx]["ranges"])):
-                        r = temp_col_bins_settings["bins"][bin_def_idx]["ranges"][r_idx]
-                        if new_r[1] <= r[0]:
-                            continue
-                        elif new_r[0] <= r[0] and new_r[1] > r[0] and new_r[1] < r[1]:
-                            if with_changes == False:
-                                old_bin_list.append([temp_col_bins_settings["bins"][bin_def_idx]["name"], get_str_from_ranges(
-                                    temp_col_bins_settings["bins"][bin_def_idx]["ranges"])])
-                                with_changes = True
-                            # then new def = [new_r[1], r[1]]
-                            temp_col_bins_settings["bins"][bin_def_idx]["ranges"][r_idx] = [
-                                new_r[1], r[1]]
-                        elif new_r[0] <= r[0] and new_r[1] > r[0] and new_r[1] >= r[1]:
-                            if with_changes == False:
-                                old_bin_list.append([temp_col_bins_settings["bins"][bin_def_idx]["name"], get_str_from_ranges(
-                                    temp_col_bins_settings["bins"][bin_def_idx]["ranges"])])
-                                with_changes = True
-                            # remove the def r
-                            r_to_remove_idx_li.append(r_idx)
-                        elif new_r[0] > r[0] and new_r[1] < r[1]:
-                            if with_changes == False:
-                                old_bin_list.append([temp_col_bins_settings["bins"][bin_def_idx]["name"], get_str_from_ranges(
-                                    temp_col_bins_settings["bins"][bin_def_idx]["ranges"])])
-                                with_changes = True
-                            # split to two = [r[0], new_r[0]] & [new_r[1], r[1]]
-                            temp_col_bins_settings["bins"][bin_def_idx]["ranges"][r_idx] = [
-                                r[0], new_r[0]]
-                            r_to_append_li.append([new_r[1], r[1]])
-                        elif new_r[0] > r[0] and new_r[0] < r[1] and new_r[1] >= r[1]:
-                            if with_changes == False:
-                                old_bin_list.append([temp_col_bins_settings["bins"][bin_def_idx]["name"], get_str_from_ranges(
-                                    temp_col_bins_settings["bins"][bin_def_idx]["ranges"])])
-                                with_changes = True
-                            # new def = [r[0], new_r[0]]
-                            temp_col_bins_settings["bins"][bin_def_idx]["ranges"][r_idx] = [
-                                r[0], new_r[0]]
-                        elif new_r[0] >= r[1]:
-                            continue
-
-                    for idx in sorted(r_to_remove_idx_li, reverse=True):
-                        del temp_col_bins_settings["bins"][bin_def_idx]["ranges"][idx]
-
-                    for r_to_append in r_to_append_li:
-                        temp_col_bins_settings["bins"][bin_def_idx]["ranges"].append(
-                            r_to_append)
-
-                if len(temp_col_bins_settings["bins"][bin_def_idx]["ranges"]) == 0:
-                    bin_to_remove_idx_li.append(bin_def_idx)
-                elif with_changes == True:
-                    new_bin_list.append([temp_col_bins_settings["bins"][bin_def_idx]["name"], get_str_from_ranges(
-                        temp_col_bins_settings["bins"][bin_def_idx]["ranges"])])
-
-        # Remove bin_def if it has empty def range list
-        for idx in sorted(bin_to_remove_idx_li, reverse=True):
-            del temp_col_bins_settings["bins"][idx]
-
-        return (temp_col_bins_settings, old_bin_list, new_bin_list)
-
-    @staticmethod
-    def numeric_rename_bin(selected_bin_name, new_bin_name, temp_col_bins_settings):
-        if selected_bin_name == new_bin_name:
-            return (temp_col_bins_settings, -2, -2)
-
-        if InteractiveBinningMachine.validate_new_name(new_bin_name, temp_col_bins_settings) == False:
-            return (temp_col_bins_settings, -1, -1)
-
-        old_bin_list = list()
-        new_bin_list = list()
-
-        for idx in range(len(temp_col_bins_settings["bins"])):
-            if temp_col_bins_settings["bins"][idx]["name"] == selected_bin_name:
-                old_bin_list.append([temp_col_bins_settings["bins"][idx]["name"], get_str_from_ranges(
-                    temp_col_bins_settings["bins"][idx]["ranges"])])
-
-                if new_bin_name == "" or new_bin_name == None:
-                    new_bin_name = get_str_from_ranges(
-                        temp_col_bins_settings["bins"][idx]["ranges"])
-
-                if InteractiveBinningMachine.validate_new_name(new_bin_name, temp_col_bins_settings) == False:
-                    return (temp_col_bins_settings, -1, -1)
-
-                temp_col_bins_settings["bins"][idx]["name"] = new_bin_name
-                new_bin_list.append([temp_col_bins_settings["bins"][idx]["name"], get_str_from_ranges(
-                    temp_col_bins_settings["bins"][idx]["ranges"])])
-                break
-
-        return (temp_col_bins_settings, old_bin_list, new_bin_list)
-
-    @staticmethod
-    def numeric_merge_bins(selected_bin_name_li, new_bin_name, temp_col_bins_settings):
-        new_bin_ranges_li = list()
-        bin_to_remove_idx_li = list()
-        # Add elements to bin if it is one of the selected bins
-        for idx in range(len(temp_col_bins_settings["bins"])):
-            if temp_col_bins_settings["bins"][idx]["name"] in selected_bin_name_li:
-                for r in temp_col_bins_settings["bins"][idx]["ranges"]:
-                    new_bin_ranges_li.append(r)
-                bin_to_remove_idx_li.append(idx)
-
-        for idx in sorted(bin_to_remove_idx_li, reverse=True):
-            del temp_col_bins_settings["bins"][idx]
-
-        decoded_new_bin_ranges_li = decode_ib_ranges(new_bin_ranges_li)
-
-        if new_bin_name == "" or new_bin_name == None:
-            new_bin_name = get_str_from_ranges(decoded_new_bin_ranges_li)
-
-        if InteractiveBinningMachine.validate_new_name(new_bin_name, temp_col_bins_settings) == False:
-            return (temp_col_bins_settings, -1, -1)
-
-        new_bin = {
-            "name": new_bin_name,
-            "ranges": decoded_new_bin_ranges_li,
-        }
-
-        temp_col_bins_settings["bins"].append(new_bin)
-
-        new_bin_list = [
-            [new_bin_name, get_str_from_ranges(decoded_new_bin_ranges_li)]]
-
-        return (temp_col_bins_settings, [], new_bin_list)
-
-    @staticmethod
-    def validate_new_name(new_name, temp_col_bins_settings, selected_bin_name=None):
-        # Return false if name has already been use. otherwise, return True
-        if selected_bin_name == None:
-            for bin_def in temp_col_bins_settings["bins"]:
-                if bin_def["name"] == new_name:
-                    return False
-            return True
-        else:
-            if selected_bin_name == new_name:
-                return True
-            for bin_def in temp_col_bins_settings["bins"]:
-                if bin_def["name"] == new_name:
-                    return False
-            return True
-
-
-def decode_ib_ranges(ranges):
-    if len(ranges) == 0:
-        return []
-    numeric_list = list()  # initialization
-    # print(len(ranges))
-    for numeric_info in ranges:
-        single_def_list = list()
-        # print(f"numeric_info: {numeric_info}")
-        a_range = [numeric_info[0], numeric_info[1]]
-        # The 2 bounds are valid, now check if any overlapping with previously saved data
-        has_column_overlap = False
-        for def_idx, saved_def in enumerate(numeric_list):
-            # print(f"def_idx: {def_idx}, saved_def: {saved_def}")
-            has_column_overlap = True
-            has_range_overlap = False
-            overlapped_def_range_idxes = list()
-            # Merge range to element list
-            for def_range_idx, def_range in enumerate(saved_def):
-                if len(overlapped_def_range_idxes) != 0:
-                    a_range = numeric_list[def_idx][overlapped_def_range_idxes[0]]
-
-                if a_range[0] <= def_range[0] and a_range[1] >= def_range[1]:
-                    has_range_overlap = True
-                    numeric_list[def_idx][def_range_idx] = [
-                        a_range[0], a_range[1]]
-                    overlapped_def_range_idxes.insert(0, def_range_idx)
-                elif def_range[0] <= a_range[0] and def_range[1] >= a_range[1]:
-                    has_range_overlap = True
-                elif a_range[0] <= def_range[0] and a_range[1] >= def_range[0] and a_range[1] <= def_range[1]:
-                    has_range_overlap = True
-                    numeric_list[def_idx][def_range_idx] = [
-                        a_range[0], def_range[1]]
-                    overlapped_def_range_idxes.insert(0, def_range_idx)
-                elif a_range[0] >= def_range[0] and a_range[0] <= def_range[1] and a_range[1] >= def_range[1]:
-                    has_range_overlap = True
-                    numeric_list[def_idx][def_range_idx] = [
-                        def_range[0], a_range[1]]
-                    overlapped_def_range_idxes.insert(0, def_range_idx)
-            if len(overlapped_def_range_idxes) != 0:
-                del overlapped_def_range_idxes[0]
-                for i in sorted(overlapped_def_range_idxes, reverse=True):
-                    del numeric_list[def_idx][i]
-            if has_range_overlap == False:
-                numeric_list[def_idx].append(a_range)
-            break
-        if has_column_overlap == False:
-            single_def_list = [a_range]
-            numeric_list.append(single_def_list)
-
-    return numeric_list[0]
-
-
 def validate_numerical_bounds(numeric_info_list):
     for numeric_info in numeric_info_list:
         a_range = [numeric_info[0], numeric_info[1]]
@@ -2237,6 +1213,8 @@ interactive_binning_page_layout = html.Div([
                                     "label": "Equal Frequency",
                                     "value": "equal frequency",
                                 },
+                                {"label": "Optimal (Max IV)", "value": "optimal"},
+                                {"label": "ChiMerge", "value": "chi merge"},
                             ],
                             value="none",
                             clearable=False,
@@ -2374,6 +1352,117 @@ interactive_binning_page_layout = html.Div([
                             id="equal_frequency_input_section",
                             style={"display": "none"},
                         ),
+                        html.Div(
+                            children=[
+                                html.Div(
+                                    [
+                                        html.Div(
+                                            [],
+                                            style={
+                                                "display": "inline",
+                                                "marginLeft": 5,
+                                            },
+                                        ),
+                                        html.P(
+                                            "Max Number of Bins:",
+                                            style={"display": "inline"},
+                                        ),
+                                        dcc.Input(
+                                            type="number",
+                                            value=10,
+                                            min=1,
+                                            style={"marginLeft": 10},
+                                            id="optimal_max_bins_input",
+                                        ),
+                                    ],
+                                ),
+                                html.Div([], style={"height": 15}),
+                                html.Div(
+                                    [
+                                        html.Div(
+                                            [],
+                                            style={
+                                                "display": "inline",
+                                                "marginLeft": 5,
+                                            },
+                                        ),
+                                        html.P(
+                                            "Min Bin Size (%):",
+                                            style={"display": "inline"},
+                                        ),
+                                        dcc.Input(
+                                            type="number",
+                                            value=5,
+                                            min=0,
+                                            max=100,
+                                            style={"marginLeft": 10},
+                                            id="optimal_min_bin_size_input",
+                                        ),
+                                    ],
+                                ),
+                                html.Div([], style={"height": 15}),
+                                dcc.Checklist(
+                                    options=[
+                                        {"label": "Monotonic WOE", "value": "monotonic"},
+                                    ],
+                                    value=["monotonic"],
+                                    id="optimal_monotonic_checkbox",
+                                ),
+                            ],
+                            id="optimal_input_section",
+                            style={"display": "none"},
+                        ),
+                        html.Div(
+                            children=[
+                                html.Div(
+                                    [
+                                        html.Div(
+                                            [],
+                                            style={
+                                                "display": "inline",
+                                                "marginLeft": 5,
+                                            },
+                                        ),
+                                        html.P(
+                                            "Max Number of Bins:",
+                                            style={"display": "inline"},
+                                        ),
+                                        dcc.Input(
+                                            type="number",
+                                            value=10,
+                                            min=1,
+                                            style={"marginLeft": 10},
+                                            id="chi_merge_max_bins_input",
+                                        ),
+                                    ],
+                                ),
+                                html.Div([], style={"height": 15}),
+                                html.Div(
+                                    [
+                                        html.Div(
+                                            [],
+                                            style={
+                                                "display": "inline",
+                                                "marginLeft": 5,
+                                            },
+                                        ),
+                                        html.P(
+                                            "Chi-Square Threshold:",
+                                            style={"display": "inline"},
+                                        ),
+                                        dcc.Input(
+                                            type="number",
+                                            value=3.841,
+                                            min=0,
+                                            style={"marginLeft": 10},
+                                            id="chi_merge_threshold_input",
+                                        ),
+                                    ],
+                                ),
+                            ],
+                            id="chi_merge_input_section",
+                            style={"display": "none"},
+                        ),
                         html.Div([], style={"marginBottom": 25}),
                         SaveButton("Refresh", id="auto_bin_refresh_button"),
                         html.P(id="auto_bin_error_msg", style={
@@ -3666,6 +2755,11 @@ def save_good_bad_def_to_storage(n_clicks, bad_numerical_column_list, bad_numeri
     if len(good_bad_def["bad"]["numerical"]) == 0 and len(good_bad_def["indeterminate"]["numerical"]) == 0 and len(good_bad_def["bad"]["categorical"]) == 0 and len(good_bad_def["indeterminate"]["categorical"]) == 0:
         raise PreventUpdate
 
+    # Definition is confirmed again, so labels & IV of the old definitions are no longer needed
+    GoodBadLabelCache.clear()
+    IVCache.clear()
+    MicroBinsCache.clear()
+
     return json.dumps(good_bad_def)
 
 
@@ -3732,15 +2826,20 @@ def show_good_bad_def_error_msg(n_clicks, bad_numerical_column_list, bad_numeric
     indeterminate_numeric_list = GoodBadDefDecoder.get_numeric_def_list_from_section(
         numeric_info_list=indeterminate_numeric_info_list)
 
-    if not has_bound_error and not validator.validate_if_numerical_def_overlapped(bad_numeric_list, indeterminate_numeric_list):
-        error_msg += "Error (Invalid User Input): Some of the numerical definitions of bad & indeterminate have overlapped.\t"
+    if not has_bound_error:
+        numeric_conflict_list = validator.get_numerical_def_conflicts(bad_numeric_list, indeterminate_numeric_list)
+        if len(numeric_conflict_list) > 0:
+            conflict_str = ", ".join([f"{column}: bad [{bad_range[0]}, {bad_range[1]}) & indeterminate [{indeterminate_range[0]}, {indeterminate_range[1]})" for column, bad_range, indeterminate_range in numeric_conflict_list])
+            error_msg += f"Error (Invalid User Input): Some of the numerical definitions of bad & indeterminate have overlapped ({conflict_str}).\t"
 
     bad_categoric_list = GoodBadDefDecoder.get_categorical_def_list_from_section(
         categoric_info_list=bad_categorical_info_list)
     indeterminate_categoric_list = GoodBadDefDecoder.get_categorical_def_list_from_section(
         categoric_info_list=indeterminate_categorical_info_list)
-    if not validator.validate_if_categorical_def_overlapped(bad_categoric_list, indeterminate_categoric_list):
-        error_msg += "Error (Invalid User Input): Some of the categorical definitions of bad & indeterminate have overlapped.\t"
+    categoric_conflict_list = validator.get_categorical_def_conflicts(bad_categoric_list, indeterminate_categoric_list)
+    if len(categoric_conflict_list) > 0:
+        conflict_str = ", ".join([f"{column}: {element}" for column, element in categoric_conflict_list])
+        error_msg += f"Error (Invalid User Input): Some of the categorical definitions of bad & indeterminate have overlapped ({conflict_str}).\t"
 
     if len(bad_numeric_list) == 0 and len(indeterminate_numeric_list) == 0 and len(bad_categoric_list) == 0 and len(indeterminate_categoric_list) == 0:
         error_msg += "Error: Definitions should not be empty."
@@ -3772,8 +2871,8 @@ def show_good_bad_stats_and_bar_chart(good_bad_def_data):
         return []
 
     # Compute statistics
-    sample_bad_count, sample_indeterminate_count, sample_good_count, good_weight, bad_weight, population_good_count, population_bad_count = GoodBadCounter.get_statistics(
-        df, good_bad_def)
+    sample_bad_count, sample_indeterminate_count, sample_good_count, good_weight, bad_weight, population_good_count, population_bad_count = GoodBadLabelCache.get_statistics(
+        good_bad_def)
 
     # Prepare bar chart
     fig = {
@@ -3838,11 +2937,7 @@ def update_ib_predictor_var_dropdown(numerical_col, categorical_col, should_sort
     if (triggered[0]['prop_id'] == "ib_sort_by_iv_checkbox.value" or triggered[0]['prop_id'] == "bins_settings.data") and should_sort_by_iv == ["sort"]:
         bins_settings = json.loads(bins_settings_data)
         good_bad_def = json.loads(good_bad_def_data)
-        iv_li = list()
-        for var_def in bins_settings["variable"]:
-            stat_df = StatCalculator.compute_summary_stat_table(
-                df.copy(), var_def, good_bad_def)
-            iv_li.append((var_def["column"], stat_df.iloc[-1]['MC']))
+        iv_li = IVCache.get_iv_list(bins_settings["variable"], good_bad_def)
 
         iv_li = sorted(iv_li, key=lambda x: x[1] if x[1] is not None else float(
             '-inf'), reverse=True)
@@ -3894,6 +2989,7 @@ def update_auto_bin_panel_on_bin_var_change(var_to_bin, bins_settings_data):
     if dtype == "categorical":
         options = [
             {"label": "No Binnings", "value": "none"},
+            {"label": "ChiMerge", "value": "chi merge"},
         ]
         return ["none", options, "width", 1, 10, "frequency", 1000, 10]
     else:
@@ -3905,6 +3001,8 @@ def update_auto_bin_panel_on_bin_var_change(var_to_bin, bins_settings_data):
                 "label": "Equal Frequency",
                 "value": "equal frequency",
             },
+            {"label": "Optimal (Max IV)", "value": "optimal"},
+            {"label": "ChiMerge", "value": "chi merge"},
         ]
         return [val, options, "width", 1, 10, "number of bins", 1000, 10]
 
@@ -3920,16 +3018,22 @@ automated binning algorithm dropdown value
     [
         Output("equal_width_input_section", "style"),
         Output("equal_frequency_input_section", "style"),
+        Output("optimal_input_section", "style"),
+        Output("chi_merge_input_section", "style"),
     ],
     Input("auto_bin_algo_dropdown", "value"),
 )
 def update_auto_bin_input_section_UI(auto_bin_algo):
     if auto_bin_algo == "none":
-        return {"display": "none"}, {"display": "none"}
+        return {"display": "none"}, {"display": "none"}, {"display": "none"}, {"display": "none"}
     elif auto_bin_algo == "equal width":
-        return {}, {"display": "none"}
+        return {}, {"display": "none"}, {"display": "none"}, {"display": "none"}
+    elif auto_bin_algo == "optimal":
+        return {"display": "none"}, {"display": "none"}, {}, {"display": "none"}
+    elif auto_bin_algo == "chi merge":
+        return {"display": "none"}, {"display": "none"}, {"display": "none"}, {}
     else:  # equal frequency
-        return {"display": "none"}, {}
+        return {"display": "none"}, {}, {"display": "none"}, {"display": "none"}
 
 
 """
@@ -3948,6 +3052,10 @@ def update_auto_bin_algo_description(selected_algo):
         return "*Regards each unique value in the dataset as a bin"
     elif selected_algo == "equal width":
         return "*Divides the range of value with predetermined width OR into predetermined number of equal width bins"
+    elif selected_algo == "optimal":
+        return "*Finds the bins with the highest information value (IV), given the max number of bins, the min percentage of observations in each bin & whether the WOE of the bins must be monotonic (needs the good bad definition)"
+    elif selected_algo == "chi merge":
+        return "*Starts from fine bins (categories ordered by bad rate) and merges the adjacent bins with the most similar good/bad distributions, until there are at most the max number of bins and the chi-square of every pair of adjacent bins reaches the threshold (needs the good bad definition)"
     else:  # equal frequency
         return "*Divides the data into a predetermined number of bins containing approximately the same number of observations"
 
@@ -4035,6 +3143,11 @@ refresh button in automated binning panel
         State("equal_freq_radio_button", "value"),
         State("equal_freq_freq_input", "value"),
         State("equal_freq_num_bin_input", "value"),
+        State("optimal_max_bins_input", "value"),
+        State("optimal_min_bin_size_input", "value"),
+        State("optimal_monotonic_checkbox", "value"),
+        State("chi_merge_max_bins_input", "value"),
+        State("chi_merge_threshold_input", "value"),
         State("temp_col_bins_settings", "data"),
         State("categoric_create_new_bin_name_input", "value"),
         State("categoric_create_new_bin_dropdown", "value"),
@@ -4054,49 +3167,37 @@ refresh button in automated binning panel
         State("numeric_adjust_cutpoints_panel_new_bin_name_input", "value"),
         State({"index": ALL, "type": "numeric_adjust_cutpoints_lower"}, "value"),
         State({"index": ALL, "type": "numeric_adjust_cutpoints_upper"}, "value"),
+        State("session_id", "data"),
+        State("temp_binned_col", "data"),
+        State("good_bad_def", "data"),
     ],
 )
-def update_temp_bins_settings(var_to_bin, n_clicks, n_clicks2, n_clicks3, n_clicks4, n_clicks5, n_clicks6, n_clicks7, n_clicks8, n_clicks9, n_clicks10, bins_settings_data, auto_bin_algo, equal_width_method, width, ew_num_bins, equal_freq_method, freq, ef_num_bins, temp_col_bins_settings_data, categoric_create_new_bin_name_input, categoric_create_new_bin_dropdown, categoric_rename_panel_new_bin_name_input, click_data, categoric_add_elements_panel_name_input, categoric_add_elements_panel_dropdown, categoric_merge_panel_new_bin_name_input, selected_data, categoric_split_panel_new_bin_name_input, categoric_split_panel_dropdown, numeric_rename_panel_new_bin_name_input, numeric_merge_panel_new_bin_name_input, numeric_create_new_bin_panel_new_bin_name_input, numeric_create_new_bin_lower, numeric_create_new_bin_upper, numeric_adjust_cutpoints_panel_new_bin_name_input, numeric_adjust_cutpoints_lower, numeric_adjust_cutpoints_upper):
+def update_temp_bins_settings(var_to_bin, n_clicks, n_clicks2, n_clicks3, n_clicks4, n_clicks5, n_clicks6, n_clicks7, n_clicks8, n_clicks9, n_clicks10, bins_settings_data, auto_bin_algo, equal_width_method, width, ew_num_bins, equal_freq_method, freq, ef_num_bins, optimal_max_bins, optimal_min_bin_size, optimal_monotonic, chi_merge_max_bins, chi_merge_threshold, temp_col_bins_settings_data, categoric_create_new_bin_name_input, categoric_create_new_bin_dropdown, categoric_rename_panel_new_bin_name_input, click_data, categoric_add_elements_panel_name_input, categoric_add_elements_panel_dropdown, categoric_merge_panel_new_bin_name_input, selected_data, categoric_split_panel_new_bin_name_input, categoric_split_panel_dropdown, numeric_rename_panel_new_bin_name_input, numeric_merge_panel_new_bin_name_input, numeric_create_new_bin_panel_new_bin_name_input, numeric_create_new_bin_lower, numeric_create_new_bin_upper, numeric_adjust_cutpoints_panel_new_bin_name_input, numeric_adjust_cutpoints_lower, numeric_adjust_cutpoints_upper, session_id, temp_binned_col_data, good_bad_def_data):
     triggered = dash.callback_context.triggered
 
     if triggered[0]['prop_id'] == "categoric_create_new_bin_submit_button.n_clicks":
         temp_col_bins_settings = json.loads(temp_col_bins_settings_data)
 
-        new_settings, _, __ = InteractiveBinningMachine.categoric_create_new_bin(
-            new_bin_name=categoric_create_new_bin_name_input, new_bin_element_li=categoric_create_new_bin_dropdown, temp_col_bins_settings=temp_col_bins_settings)
-
-        def_li, binned_series = BinningMachine.perform_binning_on_col(
-            df.loc[:, [new_settings["column"]]], new_settings)
-        temp_df = df.copy()
-        temp_df['binned_col'] = binned_series.values
+        new_settings, _, __, bins_diff = InteractiveBinningMachine.perform_action(
+            "categoric_create_new_bin", new_bin_name=categoric_create_new_bin_name_input, new_bin_element_li=categoric_create_new_bin_dropdown, temp_col_bins_settings=temp_col_bins_settings)
 
-        return [json.dumps(new_settings), json.dumps(temp_df.to_dict())]
+        return [json.dumps(new_settings), rebin_temp_col(session_id, temp_binned_col_data, new_settings, bins_diff)]
 
     if triggered[0]['prop_id'] == "categoric_rename_panel_submit_button.n_clicks":
         temp_col_bins_settings = json.loads(temp_col_bins_settings_data)
 
-        new_settings, _, __ = InteractiveBinningMachine.categoric_rename_bin(
-            selected_bin_name=click_data["points"][0]["x"], new_bin_name=categoric_rename_panel_new_bin_name_input, temp_col_bins_settings=temp_col_bins_settings)
+        new_settings, _, __, bins_diff = InteractiveBinningMachine.perform_action(
+            "categoric_rename_bin", selected_bin_name=click_data["points"][0]["x"], new_bin_name=categoric_rename_panel_new_bin_name_input, temp_col_bins_settings=temp_col_bins_settings)
 
-        def_li, binned_series = BinningMachine.perform_binning_on_col(
-            df.loc[:, [new_settings["column"]]], new_settings)
-        temp_df = df.copy()
-        temp_df['binned_col'] = binned_series.values
-
-        return [json.dumps(new_settings), json.dumps(temp_df.to_dict())]
+        return [json.dumps(new_settings), rebin_temp_col(session_id, temp_binned_col_data, new_settings, bins_diff)]
 
     if triggered[0]['prop_id'] == "categoric_add_elements_panel_submit_button.n_clicks":
         temp_col_bins_settings = json.loads(temp_col_bins_settings_data)
 
-        new_settings, _, __ = InteractiveBinningMachine.categoric_add_elements(
-            selected_bin_name=click_data["points"][0]["x"], new_bin_name=categoric_add_elements_panel_name_input, elements_to_add_li=categoric_add_elements_panel_dropdown, temp_col_bins_settings=temp_col_bins_settings)
-
-        def_li, binned_series = BinningMachine.perform_binning_on_col(
-            df.loc[:, [new_settings["column"]]], new_settings)
-        temp_df = df.copy()
-        temp_df['binned_col'] = binned_series.values
+        new_settings, _, __, bins_diff = InteractiveBinningMachine.perform_action(
+            "categoric_add_elements", selected_bin_name=click_data["points"][0]["x"], new_bin_name=categoric_add_elements_panel_name_input, elements_to_add_li=categoric_add_elements_panel_dropdown, temp_col_bins_settings=temp_col_bins_settings)
 
-        return [json.dumps(new_settings), json.dumps(temp_df.to_dict())]
+        return [json.dumps(new_settings), rebin_temp_col(session_id, temp_binned_col_data, new_settings, bins_diff)]
 
     if triggered[0]['prop_id'] == "categoric_merge_panel_submit_button.n_clicks":
         temp_col_bins_settings = json.loads(temp_col_bins_settings_data)
@@ -4106,41 +3207,26 @@ def update_temp_bins_settings(var_to_bin, n_clicks, n_clicks2, n_clicks3, n_clic
             selected_bin_name_set.add(point["x"])
         selected_bin_name_li = list(selected_bin_name_set)
 
-        new_settings, _, __ = InteractiveBinningMachine.categoric_merge_bins(
-            selected_bin_name_li=selected_bin_name_li, new_bin_name=categoric_merge_panel_new_bin_name_input, temp_col_bins_settings=temp_col_bins_settings)
+        new_settings, _, __, bins_diff = InteractiveBinningMachine.perform_action(
+            "categoric_merge_bins", selected_bin_name_li=selected_bin_name_li, new_bin_name=categoric_merge_panel_new_bin_name_input, temp_col_bins_settings=temp_col_bins_settings)
 
-        def_li, binned_series = BinningMachine.perform_binning_on_col(
-            df.loc[:, [new_settings["column"]]], new_settings)
-        temp_df = df.copy()
-        temp_df['binned_col'] = binned_series.values
-
-        return [json.dumps(new_settings), json.dumps(temp_df.to_dict())]
+        return [json.dumps(new_settings), rebin_temp_col(session_id, temp_binned_col_data, new_settings, bins_diff)]
 
     if triggered[0]['prop_id'] == "categoric_split_panel_submit_button.n_clicks":
         temp_col_bins_settings = json.loads(temp_col_bins_settings_data)
 
-        new_settings, _, __ = InteractiveBinningMachine.categoric_split_bin(
-            selected_bin_name=click_data["points"][0]["x"], new_bin_name=categoric_split_panel_new_bin_name_input, elements_to_split_out_li=categoric_split_panel_dropdown, temp_col_bins_settings=temp_col_bins_settings)
-
-        def_li, binned_series = BinningMachine.perform_binning_on_col(
-            df.loc[:, [new_settings["column"]]], new_settings)
-        temp_df = df.copy()
-        temp_df['binned_col'] = binned_series.values
+        new_settings, _, __, bins_diff = InteractiveBinningMachine.perform_action(
+            "categoric_split_bin", selected_bin_name=click_data["points"][0]["x"], new_bin_name=categoric_split_panel_new_bin_name_input, elements_to_split_out_li=categoric_split_panel_dropdown, temp_col_bins_settings=temp_col_bins_settings)
 
-        return [json.dumps(new_settings), json.dumps(temp_df.to_dict())]
+        return [json.dumps(new_settings), rebin_temp_col(session_id, temp_binned_col_data, new_settings, bins_diff)]
 
     if triggered[0]['prop_id'] == "numeric_rename_panel_submit_button.n_clicks":
         temp_col_bins_settings = json.loads(temp_col_bins_settings_data)
 
-        new_settings, _, __ = InteractiveBinningMachine.numeric_rename_bin(
-            selected_bin_name=click_data["points"][0]["x"], new_bin_name=numeric_rename_panel_new_bin_name_input, temp_col_bins_settings=temp_col_bins_settings)
-
-        def_li, binned_series = BinningMachine.perform_binning_on_col(
-            df.loc[:, [new_settings["column"]]], new_settings)
-        temp_df = df.copy()
-        temp_df['binned_col'] = binned_series.values
+        new_settings, _, __, bins_diff = InteractiveBinningMachine.perform_action(
+            "numeric_rename_bin", selected_bin_name=click_data["points"][0]["x"], new_bin_name=numeric_rename_panel_new_bin_name_input, temp_col_bins_settings=temp_col_bins_settings)
 
-        return [json.dumps(new_settings), json.dumps(temp_df.to_dict())]
+        return [json.dumps(new_settings), rebin_temp_col(session_id, temp_binned_col_data, new_settings, bins_diff)]
 
     if triggered[0]['prop_id'] == "numeric_merge_panel_submit_button.n_clicks":
         temp_col_bins_settings = json.loads(temp_col_bins_settings_data)
@@ -4150,15 +3236,10 @@ def update_temp_bins_settings(var_to_bin, n_clicks, n_clicks2, n_clicks3, n_clic
             selected_bin_name_set.add(point["x"])
         selected_bin_name_li = list(selected_bin_name_set)
 
-        new_settings, _, __ = InteractiveBinningMachine.numeric_merge_bins(
-            selected_bin_name_li=selected_bin_name_li, new_bin_name=numeric_merge_panel_new_bin_name_input, temp_col_bins_settings=temp_col_bins_settings)
+        new_settings, _, __, bins_diff = InteractiveBinningMachine.perform_action(
+            "numeric_merge_bins", selected_bin_name_li=selected_bin_name_li, new_bin_name=numeric_merge_panel_new_bin_name_input, temp_col_bins_settings=temp_col_bins_settings)
 
-        def_li, binned_series = BinningMachine.perform_binning_on_col(
-            df.loc[:, [new_settings["column"]]], new_settings)
-        temp_df = df.copy()
-        temp_df['binned_col'] = binned_series.values
-
-        return [json.dumps(new_settings), json.dumps(temp_df.to_dict())]
+        return [json.dumps(new_settings), rebin_temp_col(session_id, temp_binned_col_data, new_settings, bins_diff)]
 
     if triggered[0]['prop_id'] == "numeric_create_new_bin_panel_submit_button.n_clicks":
         temp_col_bins_settings = json.loads(temp_col_bins_settings_data)
@@ -4172,15 +3253,10 @@ def update_temp_bins_settings(var_to_bin, n_clicks, n_clicks2, n_clicks3, n_clic
             raise PreventUpdate
         else:
             ranges = decode_ib_ranges(ranges)
-            new_settings, _, __ = InteractiveBinningMachine.numeric_create_new_bin(
-                new_bin_name=numeric_create_new_bin_panel_new_bin_name_input, new_bin_ranges=ranges, temp_col_bins_settings=temp_col_bins_settings)
-
-        def_li, binned_series = BinningMachine.perform_binning_on_col(
-            df.loc[:, [new_settings["column"]]], new_settings)
-        temp_df = df.copy()
-        temp_df['binned_col'] = binned_series.values
+            new_settings, _, __, bins_diff = InteractiveBinningMachine.perform_action(
+                "numeric_create_new_bin", new_bin_name=numeric_create_new_bin_panel_new_bin_name_input, new_bin_ranges=ranges, temp_col_bins_settings=temp_col_bins_settings)
 
-        return [json.dumps(new_settings), json.dumps(temp_df.to_dict())]
+        return [json.dumps(new_settings), rebin_temp_col(session_id, temp_binned_col_data, new_settings, bins_diff)]
 
     if triggered[0]['prop_id'] == "numeric_adjust_cutpoints_panel_submit_button.n_clicks":
         temp_col_bins_settings = json.loads(temp_col_bins_settings_data)
@@ -4194,15 +3270,10 @@ def update_temp_bins_settings(var_to_bin, n_clicks, n_clicks2, n_clicks3, n_clic
             raise PreventUpdate
         else:
             ranges = decode_ib_ranges(ranges)
-            new_settings, _, __ = InteractiveBinningMachine.get_numeric_adjust_cutpoints(
-                selected_bin_name=click_data["points"][0]["x"], new_bin_name=numeric_adjust_cutpoints_panel_new_bin_name_input, new_bin_ranges=ranges, temp_col_bins_settings=temp_col_bins_settings)
+            new_settings, _, __, bins_diff = InteractiveBinningMachine.perform_action(
+                "get_numeric_adjust_cutpoints", selected_bin_name=click_data["points"][0]["x"], new_bin_name=numeric_adjust_cutpoints_panel_new_bin_name_input, new_bin_ranges=ranges, temp_col_bins_settings=temp_col_bins_settings)
 
-        def_li, binned_series = BinningMachine.perform_binning_on_col(
-            df.loc[:, [new_settings["column"]]], new_settings)
-        temp_df = df.copy()
-        temp_df['binned_col'] = binned_series.values
-
-        return [json.dumps(new_settings), json.dumps(temp_df.to_dict())]
+        return [json.dumps(new_settings), rebin_temp_col(session_id, temp_binned_col_data, new_settings, bins_diff)]
 
     bins_settings_dict = json.loads(bins_settings_data)
     bins_settings_list = bins_settings_dict["variable"]
@@ -4212,6 +3283,11 @@ def update_temp_bins_settings(var_to_bin, n_clicks, n_clicks2, n_clicks3, n_clic
             col_bins_settings = var
             break
 
+    # the auto bins of a numerical column are computed from its micro-bins (see MicroBinsCache), without scanning df
+    micro_bins = None
+    if col_bins_settings["type"] == "numerical" and good_bad_def_data != None:
+        micro_bins = MicroBinsCache.get_micro_bins(col_bins_settings["column"], json.loads(good_bad_def_data))
+
     if triggered[0]['prop_id'] == 'auto_bin_refresh_button.n_clicks':
         if auto_bin_algo == "equal width":
             if equal_width_method == "width":
@@ -4224,7 +3300,7 @@ def update_temp_bins_settings(var_to_bin, n_clicks, n_clicks2, n_clicks3, n_clic
                         "value": width,
                     }
             else:
-                num_unique_val = len(
+                num_unique_val = micro_bins.get_num_unique_values() if micro_bins != None else len(
                     df[col_bins_settings["column"]].unique().tolist())
                 if not isinstance(ew_num_bins, int) or ew_num_bins <= 0:
                     raise PreventUpdate
@@ -4250,7 +3326,7 @@ def update_temp_bins_settings(var_to_bin, n_clicks, n_clicks2, n_clicks3, n_clic
                         "value": freq,
                     }
             else:
-                num_unique_val = len(
+                num_unique_val = micro_bins.get_num_unique_values() if micro_bins != None else len(
                     df[col_bins_settings["column"]].unique().tolist())
                 if not isinstance(ef_num_bins, int) or ef_num_bins <= 0:
                     raise PreventUpdate
@@ -4262,17 +3338,51 @@ def update_temp_bins_settings(var_to_bin, n_clicks, n_clicks2, n_clicks3, n_clic
                         "method": "num_bins",
                         "value": ef_num_bins,
                     }
+        elif auto_bin_algo == "optimal":
+            # the labels of the rows are needed, i.e., the good bad definition
+            if micro_bins == None:
+                raise PreventUpdate
+            elif not isinstance(optimal_max_bins, int) or optimal_max_bins <= 0:
+                raise PreventUpdate
+            elif not isinstance(optimal_min_bin_size, (int, float)) or optimal_min_bin_size < 0 or optimal_min_bin_size > 100:
+                raise PreventUpdate
+            else:
+                col_bins_settings["bins"] = {
+                    "algo": "optimal",
+                    "max_bins": optimal_max_bins,
+                    "min_bin_size": optimal_min_bin_size / 100,
+                    "monotonic": "auto" if optimal_monotonic != None and "monotonic" in optimal_monotonic else "none",
+                }
+        elif auto_bin_algo == "chi merge":
+            # the labels of the rows are needed, i.e., the good bad definition
+            if good_bad_def_data == None:
+                raise PreventUpdate
+            elif not isinstance(chi_merge_max_bins, int) or chi_merge_max_bins <= 0:
+                raise PreventUpdate
+            elif not isinstance(chi_merge_threshold, (int, float)) or chi_merge_threshold < 0:
+                raise PreventUpdate
+            else:
+                col_bins_settings["bins"] = {
+                    "algo": "chi merge",
+                    "max_bins": chi_merge_max_bins,
+                    "threshold": chi_merge_threshold,
+                }
         else:  # none
             col_bins_settings["bins"] = "none"
 
-    def_li, binned_series = BinningMachine.perform_binning_on_col(
-        df.loc[:, [col_bins_settings["column"]]], col_bins_settings)
-    temp_df = df.copy()
-    temp_df['binned_col'] = binned_series.values
+    if micro_bins != None and not isinstance(col_bins_settings["bins"], list):
+        def_li = micro_bins.get_auto_bins(col_bins_settings["bins"])
+    else:
+        # supervised automated binning of a categorical column (i.e., chi merge) uses the cached labels of the rows
+        labels = GoodBadLabelCache.get_labels(json.loads(good_bad_def_data))["labels"] if good_bad_def_data != None else None
+        def_li, binned_series = DataikuBinningMachine.perform_binning_on_col(
+            df.loc[:, [col_bins_settings["column"]]], col_bins_settings, labels=labels)
 
+    # the result of every automated binning (incl. optimal/chi merge) is saved as custom bins, so the bins settings downloaded as
+    # ib_settings never need the labels of the rows (flow_ib_bin_dataset still fixes supervised algorithms given in the settings by hand)
     col_bins_settings["bins"] = def_li
 
-    return [json.dumps(col_bins_settings), json.dumps(temp_df.to_dict())]
+    return [json.dumps(col_bins_settings), bin_temp_col(session_id, col_bins_settings)]
 
 
 """
@@ -4295,9 +3405,14 @@ Show error message for automated binning
         State("equal_width_num_bin_input", "value"),
         State("equal_freq_freq_input", "value"),
         State("equal_freq_num_bin_input", "value"),
+        State("optimal_max_bins_input", "value"),
+        State("optimal_min_bin_size_input", "value"),
+        State("chi_merge_max_bins_input", "value"),
+        State("chi_merge_threshold_input", "value"),
+        State("good_bad_def", "data"),
     ],
 )
-def update_error_message_for_auto_bin(n_clicks, auto_bin_algo, equal_width_method, equal_freq_method, var_to_bin, width, ew_num_bins, freq, ef_num_bins):
+def update_error_message_for_auto_bin(n_clicks, auto_bin_algo, equal_width_method, equal_freq_method, var_to_bin, width, ew_num_bins, freq, ef_num_bins, optimal_max_bins, optimal_min_bin_size, chi_merge_max_bins, chi_merge_threshold, good_bad_def_data):
     triggered = dash.callback_context.triggered
 
     if triggered[0]['prop_id'] == "auto_bin_algo_dropdown.value" or triggered[0]['prop_id'] == "equal_width_radio_button.value" or triggered[0]['prop_id'] == "equal_freq_radio_button.value":
@@ -4334,6 +3449,24 @@ def update_error_message_for_auto_bin(n_clicks, auto_bin_algo, equal_width_metho
                 return "Error: The number of bins needs to be a positive integer smaller than or equal to the number of unique values in the column, which is " + str(num_unique_val) + "."
             else:
                 return ""
+    elif auto_bin_algo == "optimal":
+        if good_bad_def_data == None:
+            return "Error: The good bad definition must be defined before optimal binning."
+        elif not isinstance(optimal_max_bins, int) or optimal_max_bins <= 0:
+            return "Error: The max number of bins must be a positive integer."
+        elif not isinstance(optimal_min_bin_size, (int, float)) or optimal_min_bin_size < 0 or optimal_min_bin_size > 100:
+            return "Error: The min bin size must be a percentage between 0 and 100."
+        else:
+            return ""
+    elif auto_bin_algo == "chi merge":
+        if good_bad_def_data == None:
+            return "Error: The good bad definition must be defined before ChiMerge binning."
+        elif not isinstance(chi_merge_max_bins, int) or chi_merge_max_bins <= 0:
+            return "Error: The max number of bins must be a positive integer."
+        elif not isinstance(chi_merge_threshold, (int, float)) or chi_merge_threshold < 0:
+            return "Error: The chi-square threshold must be a non-negative number."
+        else:
+            return ""
     else:  # none
         return ""
 
@@ -4352,22 +3485,10 @@ is updated
     State("good_bad_def", "data"),
 )
 def save_temp_chart_info(temp_binned_col_data, good_bad_def_data):
-    temp_binned_col_dict = json.loads(temp_binned_col_data)
-    temp_df = pd.DataFrame(temp_binned_col_dict)
-
     good_bad_def = json.loads(good_bad_def_data)
 
-    unique_bins = sorted(temp_df['binned_col'].unique().tolist())
-    total_count_list = get_list_of_total_count(
-        temp_df, 'binned_col', unique_bins, good_bad_def)
-    bad_count_list = get_list_of_bad_count(
-        temp_df,
-        'binned_col',
-        unique_bins,
-        good_bad_def,
-    )
-    woe_list = get_list_of_woe(
-        temp_df, 'binned_col', unique_bins, good_bad_def)
+    unique_bins, total_count_list, bad_count_list, woe_list = get_chart_aggregates(
+        temp_binned_col_data, good_bad_def)
 
     combined_info = tuple(
         zip(unique_bins, total_count_list, bad_count_list, woe_list))
@@ -4508,15 +3629,21 @@ changes the variable to be binned
     [
         State("good_bad_def", "data"),
         State("stat_table_after", "children"),
+        State("temp_binned_col", "data"),
     ]
 )
-def update_stat_tables_on_var_to_bin_change(temp_col_bins_settings_data, good_bad_def_data, stat_table_after):
+def update_stat_tables_on_var_to_bin_change(temp_col_bins_settings_data, good_bad_def_data, stat_table_after, temp_binned_col_data):
     col_bins_settings = json.loads(temp_col_bins_settings_data)
 
     good_bad_def = json.loads(good_bad_def_data)
 
-    stat_df = StatCalculator.compute_summary_stat_table(
-        df.copy(), col_bins_settings, good_bad_def)
+    # The table is computed from the label counts kept with the binned column if it is binned by the same bins settings
+    if good_bad_def != None and temp_binned_col_data != None and json.loads(temp_binned_col_data)["col_bins_settings"] == col_bins_settings:
+        bin_name_list, label_counts = BinnedColStore.get_aggregates(temp_binned_col_data, good_bad_def).get_label_counts(DataikuBinningMachine.MISSING_LABEL)
+        stat_df = WebAppStatCalculator.compute_summary_stat_table_from_counts(bin_name_list, label_counts, good_bad_def)
+    else:
+        stat_df = WebAppStatCalculator.compute_summary_stat_table(
+            df, col_bins_settings, good_bad_def, GoodBadLabelCache.get_labels(good_bad_def)["labels"])
 
     if stat_table_after != []:
         old_after_stat_table = pd.DataFrame(
@@ -5675,7 +4802,7 @@ Update preview data table with binned_df
 )
 def update_preview_data_table(bins_settings_data):
     bins_settings = json.loads(bins_settings_data)
-    binned_df = BinningMachine.perform_binning_on_whole_df(
+    binned_df = DataikuBinningMachine.perform_binning_on_whole_df(
         df.copy(), bins_settings["variable"])
     return [DataTable(binned_df)]
 
@@ -5755,8 +4882,8 @@ def update_preview_stat_table(var_to_preview, bins_settings_data, good_bad_def_d
             col_bins_settings = var
             break
 
-    stat_df = StatCalculator.compute_summary_stat_table(
-        df.copy(), col_bins_settings, good_bad_def)
+    stat_df = WebAppStatCalculator.compute_summary_stat_table(
+        df, col_bins_settings, good_bad_def, GoodBadLabelCache.get_labels(good_bad_def)["labels"])
 
     # Prepare mixed chart
     sorted_df = stat_df[stat_df['Bin'] != 'Total'].sort_values(
@@ -5935,6 +5062,21 @@ def update_root_url(pathname, first_loading):
         raise PreventUpdate
 
 
+# The following callback is used to give each browser session an id, for keeping its data on the server
+
+
+@app.callback(
+    Output("session_id", "data"),
+    Input("url", "pathname"),
+    State("session_id", "data"),
+)
+def init_session_id(pathname, session_id):
+    if session_id is None:
+        return uuid.uuid4().hex
+    else:
+        raise PreventUpdate
+
+
 # This is the callback doing the routing
 @app.callback(
     Output("page-content", "children"),
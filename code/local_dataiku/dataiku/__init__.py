@@ -0,0 +1,255 @@
+# Local stand-in of the dataiku package, to run & profile the recipes and the web app outside DSS
+# A dataset is a file in the data directory named after the dataset (e.g., <data_dir>/credit_risk_dataset_generated.parquet),
+# stored as Parquet, Feather or CSV (see STORAGE_CLASS_BY_EXTENSION), and every read & write is timed (see get_io_timings)
+# Only the parts of dataiku.Dataset used by the flow are provided
+import os
+import json
+import time
+import pandas as pd
+from credit_scoring.dataset_io import DatasetIO, DatasetFileWriter
+
+DATA_DIR_ENV_VAR = "DATAIKU_LOCAL_DATA_DIR"
+DEFAULT_FORMAT_ENV_VAR = "DATAIKU_LOCAL_DEFAULT_FORMAT"
+
+_data_dir = os.environ.get(DATA_DIR_ENV_VAR, os.getcwd())
+_default_extension = "." + os.environ.get(DEFAULT_FORMAT_ENV_VAR, "parquet").lstrip(".")
+_io_timing_list = list()
+_open_writer_dataset_set = set()  # names of the datasets with an open writer
+
+# A function to set the directory holding the dataset files
+def set_data_dir(data_dir):
+    global _data_dir
+    _data_dir = data_dir
+
+def get_data_dir():
+    return _data_dir
+
+def get_default_extension():
+    return _default_extension
+
+# A function to set the file format of the datasets written for the first time, e.g., "parquet", "feather" or "csv"
+def set_default_format(file_format):
+    global _default_extension
+    _default_extension = "." + file_format.lstrip(".")
+
+# A function to get the timings of all reads & writes since the last reset, a list of
+# {"dataset": ..., "operation": ..., "rows": ..., "seconds": ...}
+def get_io_timings():
+    return list(_io_timing_list)
+
+def reset_io_timings():
+    _io_timing_list.clear()
+
+# A function to save the timings of all reads & writes as a JSON file
+def save_io_timings(path):
+    with open(path, "w") as f:
+        json.dump(get_io_timings(), f, indent=2)
+
+def record_io_timing(dataset_name, operation, num_rows, seconds):
+    _io_timing_list.append({"dataset": dataset_name, "operation": operation, "rows": int(num_rows), "seconds": seconds})
+
+
+# A class to read & write a dataset stored as a Parquet or Feather file, memory-mapped (see credit_scoring.DatasetIO)
+class ArrowFileStorage:
+    def __init__(self, path) -> None:
+        self.path = path
+
+    def read_dataframe(self, columns=None):
+        return DatasetIO.read_dataframe(self.path, columns=columns)
+
+    def iter_dataframes(self, chunksize, columns=None):
+        return DatasetIO.iter_dataframes(self.path, chunksize=chunksize, columns=columns)
+
+    def write_dataframe(self, df):
+        DatasetIO.write_dataframe(df, self.path)
+
+    def get_writer(self, schema_df=None):
+        schema = None
+        if schema_df is not None:
+            schema = DatasetIO.get_arrow_schema(DatasetIO.cast_to_dataiku_dtypes(schema_df))
+        return DatasetFileWriter(self.path, schema)
+
+
+# A class to read & write a dataset stored as a CSV file, with the dtypes inferred by pandas as dataiku.Dataset.get_dataframe() does
+class CsvFileStorage:
+    def __init__(self, path) -> None:
+        self.path = path
+
+    def read_dataframe(self, columns=None):
+        try:
+            return pd.read_csv(self.path, usecols=columns)
+        except pd.errors.EmptyDataError:  # dataset without any column
+            return pd.DataFrame()
+
+    def iter_dataframes(self, chunksize, columns=None):
+        try:
+            yield from pd.read_csv(self.path, usecols=columns, chunksize=chunksize)
+        except pd.errors.EmptyDataError:
+            return
+
+    def write_dataframe(self, df):
+        df.to_csv(self.path, index=False)
+
+    def get_writer(self, schema_df=None):
+        return CsvFileWriter(self.path)
+
+
+# A class to write a CSV file chunk by chunk, the header is written with the first chunk
+class CsvFileWriter:
+    def __init__(self, path) -> None:
+        self.path = path
+        self.is_header_written = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def write_dataframe(self, df):
+        df.to_csv(self.path, index=False, mode="a" if self.is_header_written else "w", header=not self.is_header_written)
+        self.is_header_written = True
+
+    def close(self):
+        if not self.is_header_written:
+            open(self.path, "w").close()
+
+
+# Storage of each file extension, other storages (e.g., a database) can be plugged in by register_storage()
+STORAGE_CLASS_BY_EXTENSION = {
+    ".parquet": ArrowFileStorage,
+    ".feather": ArrowFileStorage,
+    ".csv": CsvFileStorage,
+}
+
+def register_storage(extension, storage_class):
+    STORAGE_CLASS_BY_EXTENSION["." + extension.lstrip(".")] = storage_class
+
+
+# A class standing in for dataiku.Dataset, e.g.,
+#   df = dataiku.Dataset("credit_risk_dataset_generated").get_dataframe()
+#   dataiku.Dataset("binned_credit_risk_dataset").write_with_schema(binned_df)
+class Dataset:
+    def __init__(self, name, project_key=None, ignore_flow=False) -> None:
+        self.name = name.split(".")[-1]  # "PROJECT_KEY.dataset_name" --> "dataset_name"
+        self.project_key = project_key
+        self.schema_df = None  # the empty dataframe given to write_schema_from_dataframe(), which fixes the column types of the writer
+
+    def __repr__(self) -> str:
+        return f"Dataset({self.name!r})"
+
+    # A method to get the storage of the dataset, the existing file of the dataset if there is one,
+    # otherwise a new file in the default format
+    def get_storage(self):
+        for extension, storage_class in STORAGE_CLASS_BY_EXTENSION.items():
+            path = os.path.join(get_data_dir(), self.name + extension)
+            if os.path.exists(path):
+                return storage_class(path)
+        extension = get_default_extension()
+        return STORAGE_CLASS_BY_EXTENSION[extension](os.path.join(get_data_dir(), self.name + extension))
+
+    def get_dataframe(self, columns=None, limit=None, infer_with_pandas=True, **kwargs):
+        start_time = time.perf_counter()
+        df = self.get_storage().read_dataframe(columns=columns)
+        if limit is not None:
+            df = df.iloc[:limit]
+        record_io_timing(self.name, "get_dataframe", len(df), time.perf_counter() - start_time)
+        return df
+
+    # A method to read the dataset chunk by chunk, the time of reading all chunks is recorded once the iteration ends
+    def iter_dataframes(self, chunksize=10000, infer_with_pandas=True, limit=None, columns=None, **kwargs):
+        num_rows = 0
+        seconds = 0.0
+        chunk_iter = iter(self.get_storage().iter_dataframes(chunksize, columns=columns))
+        try:
+            while limit is None or num_rows < limit:
+                start_time = time.perf_counter()
+                chunk_df = next(chunk_iter, None)
+                seconds += time.perf_counter() - start_time
+                if chunk_df is None:
+                    break
+                if limit is not None:
+                    chunk_df = chunk_df.iloc[:limit - num_rows]
+                num_rows += len(chunk_df)
+                yield chunk_df
+        finally:
+            record_io_timing(self.name, "iter_dataframes", num_rows, seconds)
+
+    def read_schema(self):
+        df = self.get_dataframe(limit=0)
+        return [{"name": str(col), "type": str(dtype)} for col, dtype in df.dtypes.items()]
+
+    def write_with_schema(self, df, drop_and_create=False):
+        start_time = time.perf_counter()
+        self.get_storage().write_dataframe(Dataset.to_dataiku_dataframe(df))
+        record_io_timing(self.name, "write_with_schema", len(df), time.perf_counter() - start_time)
+
+    def write_dataframe(self, df, infer_schema=False, drop_and_create=False):
+        self.write_with_schema(df, drop_and_create=drop_and_create)
+
+    # As in DSS, the schema must be written before the writer is opened, so it cannot be changed while a writer of the dataset is open
+    def write_schema_from_dataframe(self, df, drop_and_create=False):
+        if self.name in _open_writer_dataset_set:
+            raise Exception(f"Cannot write the schema of dataset {self.name} while a writer is open, write it before get_writer()")
+        self.schema_df = Dataset.to_dataiku_dataframe(df.iloc[:0])
+
+    # A method to get a writer to write the dataset chunk by chunk, the existing file of the dataset is replaced
+    # The schema written by write_schema_from_dataframe() is captured here
+    def get_writer(self):
+        if self.name in _open_writer_dataset_set:
+            raise Exception(f"A writer of dataset {self.name} is already open")
+        storage = self.get_storage()
+        if os.path.exists(storage.path):
+            os.remove(storage.path)
+        _open_writer_dataset_set.add(self.name)
+        return DatasetWriter(self, storage, self.schema_df)
+
+    # A method to cast the values of the non-numeric columns to str (e.g., a "Bin" column holding int & str bin names),
+    # as they are stored in a string column of the dataset
+    @staticmethod
+    def to_dataiku_dataframe(df):
+        df = df.reset_index(drop=True)
+        for col in df.columns:
+            if pd.api.types.is_numeric_dtype(df[col].dtype) or pd.api.types.is_bool_dtype(df[col].dtype):
+                continue
+            if pd.api.types.infer_dtype(df[col], skipna=True) not in ("string", "empty"):
+                col_series = df[col].astype(object)
+                df[col] = col_series.where(col_series.isna(), col_series.astype(str))
+        return df
+
+
+# A class standing in for the writer returned by dataiku.Dataset.get_writer(), the time of writing all chunks is recorded on closing
+# The schema is the one written by write_schema_from_dataframe() before getting the writer (or inferred from the first chunk if none)
+class DatasetWriter:
+    def __init__(self, dataset, storage, schema_df=None) -> None:
+        self.dataset = dataset
+        self.storage = storage
+        self.schema_df = schema_df
+        self.file_writer = None
+        self.num_rows = 0
+        self.seconds = 0.0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def write_dataframe(self, df):
+        start_time = time.perf_counter()
+        if self.file_writer is None:
+            self.file_writer = self.storage.get_writer(self.schema_df)
+        self.file_writer.write_dataframe(Dataset.to_dataiku_dataframe(df))
+        self.seconds += time.perf_counter() - start_time
+        self.num_rows += len(df)
+
+    def close(self):
+        start_time = time.perf_counter()
+        try:
+            if self.file_writer is None:
+                self.file_writer = self.storage.get_writer(self.schema_df)
+            self.file_writer.close()
+        finally:
+            _open_writer_dataset_set.discard(self.dataset.name)
+        self.seconds += time.perf_counter() - start_time
+        record_io_timing(self.dataset.name, "get_writer", self.num_rows, self.seconds)
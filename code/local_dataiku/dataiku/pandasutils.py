@@ -0,0 +1 @@
+# Local stand-in of dataiku.pandasutils, which the recipes import (as pdu) but do not use
@@ -0,0 +1,69 @@
+# A script to run recipes of the flow outside DSS with the local dataiku stand-in, and save the time of each recipe
+# & each dataset read/write as JSON, e.g.,
+#   python code/local_dataiku/run_flow.py --data-dir ./datasets --ib-settings ib_settings.json --timings-file flow_timings.json
+# The data directory holds the input datasets of the recipes as Parquet/Feather/CSV files named after the datasets,
+# e.g., credit_risk_dataset_generated.parquet, and the output datasets are written there in the same way
+import os
+import sys
+import json
+import time
+import runpy
+import argparse
+
+LOCAL_DATAIKU_DIR = os.path.dirname(os.path.abspath(__file__))
+DATAIKU_PROJECT_DIR = os.path.join(os.path.dirname(LOCAL_DATAIKU_DIR), "code_in_dataiku")
+RECIPE_DIR = os.path.join(DATAIKU_PROJECT_DIR, "python_recipes")
+
+# Recipes of the interactive binning flow, in the order they are run in DSS
+IB_FLOW_RECIPE_LIST = ["flow_ib_bin_dataset", "flow_ib_stat_compute_stat"]
+
+# The project library & the stand-in are put on the path as DSS does for the project library & the dataiku package
+for path in (os.path.join(DATAIKU_PROJECT_DIR, "lib", "python"), LOCAL_DATAIKU_DIR):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+import dataiku
+
+# A function to write the ib_settings dataset from the ib_settings.json file downloaded from the web app,
+# i.e., a single row with the bins settings & the good bad definition as JSON strings
+def write_ib_settings(ib_settings_path):
+    import pandas as pd
+
+    with open(ib_settings_path) as f:
+        settings = json.load(f)
+    ib_settings_df = pd.DataFrame({"bins_settings": [json.dumps(settings["bins_settings"])], "good_bad_def": [json.dumps(settings["good_bad_def"])]})
+    dataiku.Dataset("ib_settings").write_with_schema(ib_settings_df)
+
+# A function to run recipes one by one, and get the time of each recipe & each dataset read/write
+def run_recipes(recipe_list, data_dir):
+    dataiku.set_data_dir(data_dir)
+    dataiku.reset_io_timings()
+    recipe_timing_list = list()
+    for recipe in recipe_list:
+        start_time = time.perf_counter()
+        runpy.run_path(os.path.join(RECIPE_DIR, recipe + ".py"), run_name="__main__")
+        recipe_timing_list.append({"recipe": recipe, "seconds": time.perf_counter() - start_time})
+    return {"recipes": recipe_timing_list, "io": dataiku.get_io_timings()}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run recipes of the flow with the local dataiku stand-in")
+    parser.add_argument("recipes", nargs="*", default=IB_FLOW_RECIPE_LIST, help="recipes to run, in order (default: the interactive binning flow)")
+    parser.add_argument("--data-dir", default=os.getcwd(), help="directory of the dataset files")
+    parser.add_argument("--ib-settings", default=None, help="ib_settings.json downloaded from the web app, written as the ib_settings dataset first")
+    parser.add_argument("--format", default="parquet", help="file format of the output datasets: parquet, feather or csv")
+    parser.add_argument("--timings-file", default=None, help="JSON file to save the timings to")
+    args = parser.parse_args()
+
+    dataiku.set_data_dir(args.data_dir)
+    dataiku.set_default_format(args.format)
+    if args.ib_settings is not None:
+        write_ib_settings(args.ib_settings)
+    timings = run_recipes(args.recipes, args.data_dir)
+
+    for recipe_timing in timings["recipes"]:
+        print(f"{recipe_timing['recipe']}: {recipe_timing['seconds']:.3f}s")
+    for io_timing in timings["io"]:
+        print(f"  {io_timing['operation']} {io_timing['dataset']} ({io_timing['rows']} rows): {io_timing['seconds']:.3f}s")
+    if args.timings_file is not None:
+        with open(args.timings_file, "w") as f:
+            json.dump(timings, f, indent=2)
@@ -0,0 +1,8 @@
+import os
+import sys
+
+# The classes under test live in the Dataiku project library (code/code_in_dataiku/lib/python), which Dataiku puts on the path of recipes & web apps
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "code", "code_in_dataiku", "lib", "python"))
+
+# The local stand-in of the dataiku package (code/local_dataiku), appended so that the real package is used if installed
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "code", "local_dataiku"))
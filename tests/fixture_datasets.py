@@ -0,0 +1,52 @@
+import os
+import sys
+import pandas as pd
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_DIR = os.path.dirname(TESTS_DIR)
+FIXTURE_DIR_LIST = [os.path.join(TESTS_DIR, "test_input_datasets"), os.path.join(TESTS_DIR, "test_output_datasets")]
+FIXTURE_EXTENSION = ".parquet"
+
+sys.path.insert(0, os.path.join(REPO_DIR, "code", "code_in_dataiku", "lib", "python"))
+from credit_scoring.dataset_io import DatasetIO
+
+# A function to get the absolute path of a test dataset given in the test data, e.g., "tests\\test_input_datasets\\empty_dataset.xlsx"
+# (relative to the repository root, with either "\\" or "/" separators), so that the tests can be run from any directory
+def get_fixture_path(path):
+    path = path.replace("\\", os.sep).replace("/", os.sep)
+    if os.path.isabs(path):
+        return path
+    return os.path.join(REPO_DIR, path)
+
+# A function to read a test dataset, from its Parquet copy (memory-mapped) if there is one, otherwise from the Excel file
+# The Parquet copies are regenerated from the Excel files by running this module (python tests/fixture_datasets.py)
+def read_test_dataset(path):
+    excel_path = get_fixture_path(path)
+    fixture_path = os.path.splitext(excel_path)[0] + FIXTURE_EXTENSION
+    if os.path.exists(fixture_path):
+        return DatasetIO.read_dataframe(fixture_path)
+    return pd.read_excel(excel_path)
+
+# A function to regenerate the Parquet copy of every Excel test dataset, and check it is read back the same as the Excel file
+# Excel files with a column of mixed value types (e.g., the "Bin" column of some expected summary statistics tables) cannot be
+# stored with explicit column types, so they are skipped & read from the Excel file
+def regenerate_fixtures(fixture_dir_list=FIXTURE_DIR_LIST):
+    for fixture_dir in fixture_dir_list:
+        for file_name in sorted(os.listdir(fixture_dir)):
+            if not file_name.endswith(".xlsx"):
+                continue
+            excel_path = os.path.join(fixture_dir, file_name)
+            fixture_path = os.path.splitext(excel_path)[0] + FIXTURE_EXTENSION
+            try:
+                DatasetIO.convert_excel_file(excel_path, fixture_path)
+            except ValueError as e:
+                if os.path.exists(fixture_path):
+                    os.remove(fixture_path)
+                print(f"Skipped {file_name}: {e}")
+                continue
+            pd.testing.assert_frame_equal(DatasetIO.read_dataframe(fixture_path), pd.read_excel(excel_path), check_index_type=False, check_column_type=False)
+            print(f"Converted {file_name}")
+
+
+if __name__ == "__main__":
+    regenerate_fixtures()
@@ -0,0 +1,112 @@
+from credit_scoring.bin_aggregates import BinAggregates
+from credit_scoring.interactive_binning_machine import InteractiveBinningMachine, ColValueIndex
+from credit_scoring.bins_plan import ColBinsPlan
+from credit_scoring.good_bad_counter import GoodBadCounter
+from credit_scoring.dataiku_compat import DataikuBinningMachine, WebAppStatCalculator
+from fixture_datasets import read_test_dataset
+import numpy as np
+import copy
+import pytest
+
+"""
+TEST BinAggregates class
+"""
+
+good_bad_def = {"bad": {"numerical": [{"column": "paid_past_due", "ranges": [[90, 121]]}], "categorical": [], "weight": 2}, "indeterminate": {"numerical": [{"column": "paid_past_due", "ranges": [[60, 90]]}], "categorical": []}, "good": {"weight": 1}}
+
+"""
+Test Scenario 1
+Test given a column binned into bin codes, count the labels of each bin and compute the summary statistics table from the counts,
+the table should be the same as the one computed from the rows by WebAppStatCalculator.compute_summary_stat_table.
+
+------------------------
+Test Cases Design
+------------------------
+(1) Numerical custom bins, some rows not in any bin --> "Missing" bin
+(2) Numerical custom bins, a bin without any rows --> bin not listed
+(3) Categorical custom bins
+(4) Categorical custom bins, 2 bins of the same name --> counted as a single bin
+"""
+
+summary_stat_table_test_data = [
+    ({"column": "person_age", "type": "numerical", "bins": [{"name": "young", "ranges": [[0, 25]]}, {"name": "middle", "ranges": [[25, 40]]}]}), # 1
+    ({"column": "person_age", "type": "numerical", "bins": [{"name": "old", "ranges": [[40, 200]]}, {"name": "never", "ranges": [[500, 600]]}, {"name": "young", "ranges": [[0, 40]]}]}), # 2
+    ({"column": "loan_intent", "type": "categorical", "bins": [{"name": "school", "elements": ["EDUCATION"]}, {"name": "others", "elements": ["MEDICAL", "VENTURE", "PERSONAL"]}]}), # 3
+    ({"column": "loan_grade", "type": "categorical", "bins": [{"name": "good", "elements": ["A", "B"]}, {"name": "bad", "elements": ["C", "D", "E", "F", "G"]}, {"name": "good", "elements": ["H"]}]}), # 4
+]
+
+@pytest.mark.parametrize("col_bins_settings", summary_stat_table_test_data)
+def test_compute_summary_stat_table_from_counts(col_bins_settings):
+    df = read_test_dataset("tests\\test_input_datasets\\credit_risk_dataset_generated.xlsx")
+    labels = GoodBadCounter.get_good_bad_labels(df, good_bad_def)
+    col_plan = ColBinsPlan(col_bins_settings)
+
+    aggregates = BinAggregates.from_bin_codes(col_plan.get_bin_codes(df[col_plan.column]), col_plan.bin_names, labels)
+    bin_name_list, label_counts = aggregates.get_label_counts(DataikuBinningMachine.MISSING_LABEL)
+    result = WebAppStatCalculator.compute_summary_stat_table_from_counts(bin_name_list, label_counts, good_bad_def)
+    expected = WebAppStatCalculator.compute_summary_stat_table(df, col_bins_settings, good_bad_def, labels)
+
+    print("Result: ")
+    print(result)
+    print("Expected: ")
+    print(expected)
+
+    assert result.equals(expected)
+
+
+"""
+Test Scenario 2
+Test given the label counts of each bin before an interactive action, update the counts by the changes of the bins,
+the counts (and the first row of each bin) should be the same as counting the rows binned with the bins settings after the action.
+
+------------------------
+Test Cases Design
+------------------------
+(1) Numerical, rename a bin --> counts unchanged
+(2) Numerical, merge 2 bins --> counts summed
+(3) Numerical, adjust the cutpoints of a bin --> rows in the moved ranges counted again
+(4) Numerical, create a new bin taking the first row of a bin
+(5) Categorical, merge 2 bins
+(6) Categorical, split elements out of a bin
+(7) Categorical, add elements of another bin to a bin --> the other bin without rows is not listed
+(8) Categorical, create a new bin with an element not in any bin --> rows taken from the "Missing" bin
+"""
+
+num_bins = [{"name": "young", "ranges": [[0, 25]]}, {"name": "middle", "ranges": [[25, 40]]}, {"name": "old", "ranges": [[40, 200]]}]
+cat_bins = [{"name": "A", "elements": ["A"]}, {"name": "BC", "elements": ["B", "C"]}, {"name": "DE", "elements": ["D", "E"]}]
+
+apply_bins_diff_test_data = [
+    ("person_age", "numerical", num_bins, "numeric_rename_bin", {"selected_bin_name": "young", "new_bin_name": "youth"}), # 1
+    ("person_age", "numerical", num_bins, "numeric_merge_bins", {"selected_bin_name_li": ["young", "old"], "new_bin_name": "young-old"}), # 2
+    ("person_age", "numerical", num_bins, "get_numeric_adjust_cutpoints", {"selected_bin_name": "middle", "new_bin_name": "middle2", "new_bin_ranges": [[22, 45]]}), # 3
+    ("person_age", "numerical", num_bins, "numeric_create_new_bin", {"new_bin_name": "new", "new_bin_ranges": [[20, 23], [60, 70]]}), # 4
+    ("loan_grade", "categorical", cat_bins, "categoric_merge_bins", {"selected_bin_name_li": ["A", "DE"], "new_bin_name": "ADE"}), # 5
+    ("loan_grade", "categorical", cat_bins, "categoric_split_bin", {"selected_bin_name": "BC", "new_bin_name": "C", "elements_to_split_out_li": ["C"]}), # 6
+    ("loan_grade", "categorical", cat_bins, "categoric_add_elements", {"selected_bin_name": "A", "new_bin_name": "A-E", "elements_to_add_li": ["D", "E"]}), # 7
+    ("loan_grade", "categorical", cat_bins, "categoric_create_new_bin", {"new_bin_name": "FG", "new_bin_element_li": ["F", "G"]}), # 8
+]
+
+@pytest.mark.parametrize("column,col_type,bins,action,kwargs", apply_bins_diff_test_data)
+def test_apply_bins_diff(column, col_type, bins, action, kwargs):
+    df = read_test_dataset("tests\\test_input_datasets\\credit_risk_dataset_generated.xlsx")
+    labels = GoodBadCounter.get_good_bad_labels(df, good_bad_def)
+    col_value_index = ColValueIndex(df[column], col_type)
+    temp_col_bins_settings = {"column": column, "type": col_type, "bins": copy.deepcopy(bins)}
+    bin_codes = ColBinsPlan(temp_col_bins_settings).get_bin_codes(df[column])
+    aggregates = BinAggregates.from_bin_codes(bin_codes, ColBinsPlan(temp_col_bins_settings).bin_names, labels)
+
+    new_settings, _, __, bins_diff = InteractiveBinningMachine.perform_action(action, temp_col_bins_settings, **kwargs)
+    new_bin_codes = InteractiveBinningMachine.rebin_codes(bin_codes, bins_diff, new_settings, col_value_index)
+    result = aggregates.apply_bins_diff(bins_diff, bin_codes, new_bin_codes, labels, col_value_index)
+    expected = BinAggregates.from_bin_codes(new_bin_codes, bins_diff["new_bin_names"], labels)
+
+    print("Result: ")
+    print(result.label_counts, result.first_rows)
+    print("Expected: ")
+    print(expected.label_counts, expected.first_rows)
+
+    assert result.bin_names == expected.bin_names
+    assert result.label_counts.tolist() == expected.label_counts.tolist()
+    assert result.first_rows.tolist() == expected.first_rows.tolist()
+    assert result.get_label_counts("Missing")[0] == expected.get_label_counts("Missing")[0]
+    assert aggregates.label_counts.sum() == len(df) # the counts before the action are not changed
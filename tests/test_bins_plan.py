@@ -0,0 +1,110 @@
+from credit_scoring.bins_plan import BinsPlan
+import pandas as pd
+import io
+import pytest
+
+"""
+TEST BinsPlan class
+"""
+
+"""
+Test Scenario 1
+Test given a list of bins settings (e.g., parsed from ib_settings), compile it into a BinsPlan,
+where every bound of numerical custom bins is casted to float, and the value of numerical auto bins is casted to int/float.
+
+Input:
+bins_settings_list = [
+    {
+        "column": "person_age",
+        "type": "numerical",
+        "bins": [{"name": "good", "ranges": [["10", "20"]]}],
+    },
+    ...
+]
+
+Ouput:
+(1) list of bins settings of the plan, the first bins settings of each column only
+
+------------------------
+Test Cases Design
+------------------------
+(1) Empty list of bins settings
+(2) Numerical custom bins with bounds in string
+(3) Numerical equal width (by width) with value in string --> float
+(4) Numerical equal width (by num_bins) & equal frequency (by freq) with value in string --> int
+(5) Categorical custom bins & no binning --> unchanged
+(6) 2 bins settings of the same column --> the first one is used
+(7) Value which cannot be casted --> unchanged
+"""
+
+bins_plan_test_data = [
+    ([], []), # 1
+    ([{"column": "person_age", "type": "numerical", "bins": [{"name": "good", "ranges": [["10", "20"], [25, "50.5"]]}]}], [{"column": "person_age", "type": "numerical", "bins": [{"name": "good", "ranges": [[10.0, 20.0], [25.0, 50.5]]}]}]), # 2
+    ([{"column": "person_age", "type": "numerical", "bins": {"algo": "equal width", "method": "width", "value": "5.2"}}], [{"column": "person_age", "type": "numerical", "bins": {"algo": "equal width", "method": "width", "value": 5.2}}]), # 3
+    ([{"column": "person_age", "type": "numerical", "bins": {"algo": "equal width", "method": "num_bins", "value": "3"}}, {"column": "loan_amnt", "type": "numerical", "bins": {"algo": "equal frequency", "method": "freq", "value": "100"}}], [{"column": "person_age", "type": "numerical", "bins": {"algo": "equal width", "method": "num_bins", "value": 3}}, {"column": "loan_amnt", "type": "numerical", "bins": {"algo": "equal frequency", "method": "freq", "value": 100}}]), # 4
+    ([{"column": "loan_grade", "type": "categorical", "bins": [{"name": "good", "elements": ["A", "B"]}]}, {"column": "home_ownership", "type": "categorical", "bins": "none"}], [{"column": "loan_grade", "type": "categorical", "bins": [{"name": "good", "elements": ["A", "B"]}]}, {"column": "home_ownership", "type": "categorical", "bins": "none"}]), # 5
+    ([{"column": "person_age", "type": "numerical", "bins": "none"}, {"column": "person_age", "type": "numerical", "bins": [{"name": "good", "ranges": [[10, 20]]}]}], [{"column": "person_age", "type": "numerical", "bins": "none"}]), # 6
+    ([{"column": "person_age", "type": "numerical", "bins": {"algo": "equal width", "method": "num_bins", "value": "abc"}}], [{"column": "person_age", "type": "numerical", "bins": {"algo": "equal width", "method": "num_bins", "value": "abc"}}]), # 7
+]
+
+@pytest.mark.parametrize("bins_settings_list,expected", bins_plan_test_data)
+def test_get_bins_settings_list(bins_settings_list, expected):
+    bins_plan = BinsPlan(bins_settings_list)
+    result = bins_plan.get_bins_settings_list()
+
+    print("Result: ")
+    print(result)
+    print("Expected: ")
+    print(expected)
+
+    assert result == expected
+    assert len(bins_plan) == len(expected)
+
+
+"""
+Test Scenario 2
+Test given a BinsPlan, save it as a .npz file and load it back, the loaded plan should have the same bins settings
+& lookup tables, and assign the same bin to each row.
+
+------------------------
+Test Cases Design
+------------------------
+(1) Empty plan
+(2) Numerical custom bins
+(3) Categorical custom bins (with non-string elements)
+(4) Auto bins & no binning
+(5) Mixed columns, with 1 column removed before saving
+"""
+
+bins_plan_save_test_data = [
+    ({"person_age": [1, 2]}, [], None), # 1
+    ({"person_age": [18, 19, 25, 20, 99, None, 15]}, [{"column": "person_age", "type": "numerical", "bins": [{"name": "good", "ranges": [[10, 20], [25, 50]]}, {"name": "poor", "ranges": [[80, 100]]}]}], None), # 2
+    ({"loan_status": [0, 1, 1, 2, None]}, [{"column": "loan_status", "type": "categorical", "bins": [{"name": "good", "elements": [0]}, {"name": "bad", "elements": [1, "1"]}]}], None), # 3
+    ({"person_age": [18, 19, 25, 20, 99, None, 15]}, [{"column": "person_age", "type": "numerical", "bins": {"algo": "equal width", "method": "num_bins", "value": 3}}, {"column": "loan_grade", "type": "categorical", "bins": "none"}], None), # 4
+    ({"person_age": [18, 19, 25, 20, 99, 15], "loan_grade": ["A", "B", "C", "A", "E", "D"], "loan_status": [0, 1, 1, 0, 0, 1]}, [{"column": "person_age", "type": "numerical", "bins": [{"name": "good", "ranges": [[10, 20], [25, 50]]}]}, {"column": "loan_grade", "type": "categorical", "bins": [{"name": "good", "elements": ["A", "B"]}, {"name": "poor", "elements": ["D", "E"]}]}, {"column": "loan_status", "type": "categorical", "bins": "none"}], "loan_status"), # 5
+]
+
+@pytest.mark.parametrize("input,bins_settings_list,col_to_remove", bins_plan_save_test_data)
+def test_save_and_load(input, bins_settings_list, col_to_remove):
+    bins_plan = BinsPlan(bins_settings_list)
+    if col_to_remove is not None:
+        bins_plan.remove(col_to_remove)
+
+    file = io.BytesIO()
+    bins_plan.save(file)
+    file.seek(0)
+    loaded_plan = BinsPlan.load(file)
+
+    assert loaded_plan.get_bins_settings_list() == bins_plan.get_bins_settings_list()
+    for col_plan in bins_plan:
+        loaded_col_plan = loaded_plan.get(col_plan.column)
+        assert loaded_col_plan.bin_names == col_plan.bin_names
+        assert loaded_col_plan.element_codes == col_plan.element_codes
+        if col_plan.edges is not None:
+            assert loaded_col_plan.edges.tolist() == col_plan.edges.tolist()
+            assert loaded_col_plan.codes.tolist() == col_plan.codes.tolist()
+        if col_plan.is_custom() and col_plan.column in input:
+            col_series = pd.Series(input[col_plan.column])
+            assert loaded_col_plan.get_bin_codes(col_series).tolist() == col_plan.get_bin_codes(col_series).tolist()
+    if col_to_remove is not None:
+        assert col_to_remove not in loaded_plan
@@ -0,0 +1,145 @@
+from credit_scoring.chi_merge import ChiMerge
+from credit_scoring.micro_bins import NumericMicroBins
+from credit_scoring.interactive_binning_machine import ColValueIndex
+from credit_scoring.bins_plan import ColBinsPlan
+from credit_scoring.bin_aggregates import BinAggregates
+from credit_scoring.good_bad_counter import GoodBadCounter
+from credit_scoring.binning_machine import BinningMachine
+from credit_scoring.dataiku_compat import DataikuBinningMachine
+from fixture_datasets import read_test_dataset
+import pandas as pd
+import numpy as np
+import pytest
+
+"""
+TEST ChiMerge class
+"""
+
+good_bad_def = {"bad": {"numerical": [{"column": "paid_past_due", "ranges": [[90, 121]]}], "categorical": [], "weight": 2}, "indeterminate": {"numerical": [{"column": "paid_past_due", "ranges": [[60, 90]]}], "categorical": []}, "good": {"weight": 1}}
+
+
+"""
+Test Scenario 1
+Test given the label counts of each pre-bin, merge the adjacent pre-bins by their chi-square.
+
+------------------------
+Test Cases Design
+------------------------
+(1) Pre-bins of the same good/bad distribution --> merged
+(2) Threshold of 0 & enough bins --> no merge
+(3) Max number of bins of 1 --> single bin
+(4) Max number of bins --> the pair with the lowest chi-square merged first
+(5) Indeterminate rows --> not counted
+(6) Single pre-bin
+"""
+
+merge_test_data = [
+    ([[10, 0, 0], [10, 0, 0], [0, 10, 0], [0, 10, 0]], 10, 3.841, [0, 2, 4]), # 1
+    ([[10, 2, 0], [5, 8, 0], [1, 12, 0]], 10, 0, [0, 1, 2, 3]), # 2
+    ([[10, 2, 0], [5, 8, 0], [1, 12, 0]], 1, 0, [0, 3]), # 3
+    ([[10, 2, 0], [9, 3, 0], [1, 12, 0]], 2, 0, [0, 2, 3]), # 4
+    ([[10, 2, 50], [10, 2, 0]], 10, 3.841, [0, 2]), # 5
+    ([[10, 2, 0]], 10, 3.841, [0, 1]), # 6
+]
+
+@pytest.mark.parametrize("label_counts,max_bins,threshold,expected", merge_test_data)
+def test_merge(label_counts, max_bins, threshold, expected):
+    result = ChiMerge.merge(np.array(label_counts), max_bins, threshold)
+
+    print("Result: ")
+    print(result)
+    print("Expected: ")
+    print(expected)
+
+    assert result.tolist() == expected
+
+
+"""
+Test Scenario 2
+Test given the ChiMerge settings of a column, perform ChiMerge binning on the column,
+the bins should satisfy the settings, and be the same for BinningMachine, DataikuBinningMachine & the micro-bins of a numerical column.
+
+------------------------
+Test Cases Design
+------------------------
+(1) Numerical, default settings
+(2) Numerical, max number of bins
+(3) Numerical, float column with missing values, few pre-bins
+(4) Categorical, default settings --> bins ordered by bad rate
+(5) Categorical, max number of bins
+(6) Categorical, threshold of 0 --> a bin for each element
+"""
+
+chi_merge_test_data = [
+    ("person_income", "numerical", {"algo": "chi merge"}), # 1
+    ("loan_amnt", "numerical", {"algo": "chi merge", "max_bins": 4}), # 2
+    ("loan_int_rate", "numerical", {"algo": "chi merge", "max_bins": 6, "init_bins": 20}), # 3
+    ("loan_intent", "categorical", {"algo": "chi merge"}), # 4
+    ("loan_grade", "categorical", {"algo": "chi merge", "max_bins": 3}), # 5
+    ("person_home_ownership", "categorical", {"algo": "chi merge", "threshold": 0}), # 6
+]
+
+@pytest.mark.parametrize("column,col_type,auto_bins", chi_merge_test_data)
+def test_perform_chi_merge_binning(column, col_type, auto_bins):
+    df = read_test_dataset("tests\\test_input_datasets\\credit_risk_dataset_generated.xlsx")
+    labels = GoodBadCounter.get_good_bad_labels(df, good_bad_def)
+    col_bins_settings = {"column": column, "type": col_type, "bins": auto_bins}
+    settings = ChiMerge.get_settings(auto_bins)
+
+    def_li, binned_series = DataikuBinningMachine.perform_binning_on_col(df.loc[:, [column]], col_bins_settings, labels=labels)
+    col_plan = ColBinsPlan({"column": column, "type": col_type, "bins": def_li})
+    aggregates = BinAggregates.from_bin_codes(col_plan.get_bin_codes(df[column]), col_plan.bin_names, labels)
+    label_counts = np.array([aggregates.label_counts[col_plan.bin_names.index(bin_def["name"])] for bin_def in def_li])
+    chi2 = ChiMerge.get_adjacent_chi2(label_counts[:, :2].astype(float))
+
+    print("Result: ")
+    print(def_li)
+    print(label_counts)
+
+    assert 1 <= len(def_li) <= settings["max_bins"]
+    assert len(def_li) == 1 or chi2.min() >= settings["threshold"]
+    assert aggregates.label_counts[-1].sum() == df[column].isna().sum() # every non-missing value is in a bin
+    result = BinningMachine.perform_binning_on_col(df.loc[:, [column]], col_bins_settings, labels=labels)
+    if col_type == "numerical":
+        micro_bins = NumericMicroBins.from_col_value_index(ColValueIndex(df[column], "numerical"), labels)
+        assert str(micro_bins.get_auto_bins(auto_bins)) == str(def_li)
+        # BinningMachine names the bins without the outer brackets
+        assert result[df[column].notna()].tolist() == binned_series[df[column].notna()].str[1:-1].tolist()
+    else:
+        bad_rates = label_counts[:, 1] / label_counts[:, :2].sum(axis=1)
+        assert (np.diff(bad_rates) >= 0).all()
+        assert sorted([element for bin_def in def_li for element in bin_def["elements"]]) == sorted(df[column].dropna().unique().tolist())
+        assert result.tolist() == binned_series.tolist()
+
+
+"""
+Test Scenario 3
+Test given invalid inputs, perform ChiMerge binning on a column, an error should be returned.
+
+------------------------
+Test Cases Design
+------------------------
+(1) No labels --> error returns -1
+(2) Invalid max number of bins --> error returns -1
+(3) Invalid threshold --> error returns -1
+(4) Invalid number of pre-bins --> error returns -1
+(5) Numerical column of categorical type --> error returns -1
+"""
+
+small_df = pd.DataFrame({"num": [5, 15, 20, 25, 35, 45, 50, 55], "cat": ["a", "b", "a", "c", "b", "a", "c", "b"]})
+small_labels = np.array([0, 1, 0, 0, 1, 1, 0, 1], dtype=np.int8)
+
+invalid_test_data = [
+    ("cat", "categorical", {"algo": "chi merge"}, None), # 1
+    ("num", "numerical", {"algo": "chi merge", "max_bins": 0}, small_labels), # 2
+    ("cat", "categorical", {"algo": "chi merge", "threshold": -1}, small_labels), # 3
+    ("num", "numerical", {"algo": "chi merge", "init_bins": "10"}, small_labels), # 4
+    ("cat", "numerical", {"algo": "chi merge"}, small_labels), # 5
+]
+
+@pytest.mark.parametrize("column,col_type,auto_bins,labels", invalid_test_data)
+def test_perform_chi_merge_binning_invalid(column, col_type, auto_bins, labels):
+    col_bins_settings = {"column": column, "type": col_type, "bins": auto_bins}
+
+    assert DataikuBinningMachine.perform_binning_on_col(small_df.loc[:, [column]], col_bins_settings, labels=labels) == (-1, -1)
+    assert BinningMachine.perform_binning_on_col(small_df.loc[:, [column]], col_bins_settings, labels=labels) == -1
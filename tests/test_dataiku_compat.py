@@ -0,0 +1,322 @@
+from credit_scoring.dataiku_compat import get_str_from_ranges, DataikuBinningMachine, DataikuStatCalculator, WebAppStatCalculator
+from credit_scoring.bins_plan import BinsPlan
+from credit_scoring.good_bad_counter import GoodBadCounter
+from fixture_datasets import read_test_dataset
+from concurrent.futures import ProcessPoolExecutor
+import pandas as pd
+import pytest
+
+"""
+TEST DataikuBinningMachine, DataikuStatCalculator & WebAppStatCalculator classes
+"""
+
+"""
+Test Scenario 1
+Test given a ranges list, get the string representation of the ranges (sorted by the lower bound).
+
+------------------------
+Test Cases Design
+------------------------
+(1) Not a list --> error returns -1
+(2) Empty list
+(3) Single range
+(4) Multiple ranges not in order
+"""
+
+get_str_from_ranges_test_data = [
+    ("abc", -1), # 1
+    ([], "[]"), # 2
+    ([[20.0, 25.0]], "[[20.0, 25.0)]"), # 3
+    ([[30, 40], [0, 10.5]], "[[0, 10.5), [30, 40)]"), # 4
+]
+
+@pytest.mark.parametrize("ranges,expected", get_str_from_ranges_test_data)
+def test_get_str_from_ranges(ranges, expected):
+    result = get_str_from_ranges(ranges)
+
+    print("Result: ")
+    print(result)
+    print("Expected: ")
+    print(expected)
+
+    assert result == expected
+
+
+"""
+Test Scenario 2
+Test given a column & its bins settings, perform binning on the column in the format of the recipes & the web app,
+i.e., a tuple of (list of bins definitions, binned series), where the numerical bins are named by their ranges,
+and the rows not in any bin are labelled as "Missing".
+
+Input:
+col_df = pd.DataFrame
+col_bins_settings = {"column": "person_age", "type": "numerical", "bins": ...}
+
+Ouput (2 possibilities):
+(1) tuple: (list of bins definitions, pd.Series containing the bin assigned to each row)
+OR if error occurs
+(2) tuple: (-1, -1)
+
+------------------------
+Test Cases Design
+------------------------
+(1) Empty col_df --> error returns (-1, -1)
+(2) Equal width (by width) with a missing value
+(3) Equal width (by num_bins), the last bin includes the max value
+(4) Equal width with the min & max of the whole column fixed (i.e., binning a chunk)
+(5) Equal frequency (by num_bins), the bin ending at the max value is extended to include it
+(6) Equal frequency (by freq) with a single unique value & a missing value
+(7) Equal frequency by pre-computed edges, every bin is defined even if no row is in it
+(8) Numerical custom bins, a value not in any bin
+(9) Categorical custom bins, an element not in any bin
+(10) Categorical column with equal width binning --> error returns (-1, -1)
+"""
+
+perform_binning_on_col_test_data = [
+    ([], {"column": "person_age", "type": "numerical", "bins": {"algo": "equal width", "method": "width", "value": 5}}, -1, -1), # 1
+    ([20, 27, None, 24], {"column": "person_age", "type": "numerical", "bins": {"algo": "equal width", "method": "width", "value": 5}},
+     [{"name": "[[20.0, 25.0)]", "ranges": [[20.0, 25.0]]}, {"name": "[[25.0, 30.0)]", "ranges": [[25.0, 30.0]]}, {"name": "[[30.0, 35.0)]", "ranges": [[30.0, 35.0]]}],
+     ["[[20.0, 25.0)]", "[[25.0, 30.0)]", "Missing", "[[20.0, 25.0)]"]), # 2
+    ([0, 10, 20], {"column": "person_age", "type": "numerical", "bins": {"algo": "equal width", "method": "num_bins", "value": 2}},
+     [{"name": "[[0.0, 10.0)]", "ranges": [[0.0, 10.0]]}, {"name": "[[10.0, 20.1)]", "ranges": [[10.0, 20.1]]}],
+     ["[[0.0, 10.0)]", "[[10.0, 20.1)]", "[[10.0, 20.1)]"]), # 3
+    ([12, 14], {"column": "person_age", "type": "numerical", "bins": {"algo": "equal width", "method": "width", "value": 5, "min": 0, "max": 14}},
+     [{"name": "[[0.0, 5.0)]", "ranges": [[0.0, 5.0]]}, {"name": "[[5.0, 10.0)]", "ranges": [[5.0, 10.0]]}, {"name": "[[10.0, 15.0)]", "ranges": [[10.0, 15.0]]}, {"name": "[[15.0, 20.0)]", "ranges": [[15.0, 20.0]]}],
+     ["[[10.0, 15.0)]", "[[10.0, 15.0)]"]), # 4
+    ([1, 2, 3, 4], {"column": "person_age", "type": "numerical", "bins": {"algo": "equal frequency", "method": "num_bins", "value": 2}},
+     [{"name": "[[0.999, 2.5)]", "ranges": [[0.999, 2.5]]}, {"name": "[[2.5, 4.0001)]", "ranges": [[2.5, 4.0001]]}],
+     ["[[0.999, 2.5)]", "[[0.999, 2.5)]", "[[2.5, 4.0001)]", "[[2.5, 4.0001)]"]), # 5
+    ([None, 5, 5], {"column": "person_age", "type": "numerical", "bins": {"algo": "equal frequency", "method": "freq", "value": 1}},
+     [{"name": "[[5.0, 6.0)]", "ranges": [[5.0, 6.0]]}],
+     ["[[5.0, 6.0)]", "[[5.0, 6.0)]", "[[5.0, 6.0)]"]), # 6
+    ([1, 2, None], {"column": "person_age", "type": "numerical", "bins": {"algo": "equal frequency", "method": "num_bins", "value": 3, "min": 1, "max": 9, "edges": [1, 2, 5, 9]}},
+     [{"name": "[[0.999, 2.0)]", "ranges": [[0.999, 2.0]]}, {"name": "[[2.0, 5.0)]", "ranges": [[2.0, 5.0]]}, {"name": "[[5.0, 9.0001)]", "ranges": [[5.0, 9.0001]]}],
+     ["[[0.999, 2.0)]", "[[0.999, 2.0)]", "Missing"]), # 7
+    ([15, 25, 60], {"column": "person_age", "type": "numerical", "bins": [{"name": "young", "ranges": [[10, 20]]}, {"name": "adult", "ranges": [[20, 50]]}]},
+     [{"name": "young", "ranges": [[10.0, 20.0]]}, {"name": "adult", "ranges": [[20.0, 50.0]]}],
+     ["young", "adult", "Missing"]), # 8
+    (["A", "B", "C"], {"column": "loan_grade", "type": "categorical", "bins": [{"name": "good", "elements": ["A", "B"]}]},
+     [{"name": "good", "elements": ["A", "B"]}],
+     ["good", "good", "Missing"]), # 9
+    (["A", "B", "C"], {"column": "loan_grade", "type": "categorical", "bins": {"algo": "equal width", "method": "width", "value": 5}}, -1, -1), # 10
+]
+
+@pytest.mark.parametrize("input,col_bins_settings,expected_def_li,expected_binned_li", perform_binning_on_col_test_data)
+def test_perform_binning_on_col(input, col_bins_settings, expected_def_li, expected_binned_li):
+    col_df = pd.DataFrame({col_bins_settings["column"]: input})
+    def_li, binned_series = DataikuBinningMachine.perform_binning_on_col(col_df, col_bins_settings)
+
+    print("Result: ")
+    print(def_li)
+    print(binned_series)
+    print("Expected: ")
+    print(expected_def_li)
+    print(expected_binned_li)
+
+    assert def_li == expected_def_li
+    if isinstance(expected_binned_li, list):
+        assert binned_series.tolist() == expected_binned_li
+    else:
+        assert binned_series == expected_binned_li
+
+
+"""
+Test Scenario 3
+Test given a dataframe & a BinsPlan, bin the whole dataframe, where a binned column (i.e., "<column>_binned") is added
+for each column in the plan.
+
+------------------------
+Test Cases Design
+------------------------
+(1) Empty dataframe --> unchanged
+(2) Column without bins settings is not binned
+(3) Error in binning a column --> error returns -1
+"""
+
+perform_binning_on_whole_df_test_data = [
+    ({"person_age": []}, [{"column": "person_age", "type": "numerical", "bins": {"algo": "equal width", "method": "width", "value": 5}}], []), # 1
+    ({"person_age": [20, 27], "loan_grade": ["A", "B"]}, [{"column": "loan_grade", "type": "categorical", "bins": [{"name": "good", "elements": ["A"]}]}], ["person_age", "loan_grade", "loan_grade_binned"]), # 2
+    ({"loan_grade": ["A", "B"]}, [{"column": "loan_grade", "type": "categorical", "bins": {"algo": "equal width", "method": "width", "value": 5}}], -1), # 3
+]
+
+@pytest.mark.parametrize("input,bins_settings_list,expected_col_list", perform_binning_on_whole_df_test_data)
+def test_perform_binning_on_whole_df(input, bins_settings_list, expected_col_list):
+    result = DataikuBinningMachine.perform_binning_on_whole_df(pd.DataFrame(input), BinsPlan(bins_settings_list))
+
+    if isinstance(expected_col_list, list):
+        assert list(result.columns) == (expected_col_list if len(expected_col_list) > 0 else list(input.keys()))
+    else:
+        assert result == expected_col_list
+
+
+"""
+Test Scenario 4
+Test given a dataframe, the bins settings of a column & a good bad definition, compute the summary statistics table
+with the percentage columns named as in the recipe outputs (DataikuStatCalculator) or the web app (WebAppStatCalculator),
+and the table should be the same as StatCalculator except for the names & the rounding of the percentage columns.
+
+------------------------
+Test Cases Design
+------------------------
+(1) Recipe format, "_Pct" percentage columns rounded to 4 decimal places
+(2) Web app format, "%" percentage columns rounded to 2 decimal places
+"""
+
+good_bad_def = {"bad": {"numerical": [], "categorical": [{"column": "loan_status", "elements": [1]}], "weight": 1}, "indeterminate": {"numerical": [], "categorical": []}, "good": {"weight": 1}}
+stat_input = {"loan_grade": ["A", "B", "C", "A", "B", "C"], "loan_status": [0, 1, 0, 0, 1, 1]}
+stat_col_bins_settings = {"column": "loan_grade", "type": "categorical", "bins": [{"name": "AB", "elements": ["A", "B"]}]}
+
+compute_summary_stat_table_test_data = [
+    (DataikuStatCalculator, ["Good_Pct", "Bad_Pct", "Total_Pct"], [66.6667, 66.6667, 66.6667]), # 1
+    (WebAppStatCalculator, ["Good%", "Bad%", "Total%"], [66.67, 66.67, 66.67]), # 2
+]
+
+@pytest.mark.parametrize("stat_calculator_class,expected_pct_col_list,expected_pct_list", compute_summary_stat_table_test_data)
+def test_compute_summary_stat_table(stat_calculator_class, expected_pct_col_list, expected_pct_list):
+    df = pd.DataFrame(stat_input)
+    if stat_calculator_class is WebAppStatCalculator:
+        result = WebAppStatCalculator.compute_summary_stat_table(df, stat_col_bins_settings, good_bad_def)
+    else:
+        result = stat_calculator_class(df, stat_col_bins_settings, good_bad_def).compute_summary_stat_table()
+
+    print("Result: ")
+    print(result)
+
+    assert list(result.columns) == ["Bin", "Good", "Bad", "Odds", "Total"] + expected_pct_col_list + ["Info_Odds", "WOE", "MC"]
+    assert result["Bin"].tolist() == ["AB", "Missing", "Total"]
+    assert result.loc[0, expected_pct_col_list].tolist() == expected_pct_list
+    assert list(df.columns) == list(stat_input.keys()) # df is not changed
+
+
+"""
+Test Scenario 5
+Test given a dataframe read chunk by chunk (each chunk keeps the index of the whole dataframe, as iter_dataframes does),
+bin each chunk with the bins fixed over all chunks, the binned chunks should make up the whole dataframe binned at once.
+
+------------------------
+Test Cases Design
+------------------------
+(1) Numerical column + custom binning
+(2) Numerical column + equal frequency (by num_bins), with missing values
+(3) Numerical & categorical columns + equal width (by width) & no binning
+"""
+
+chunk_binning_test_data = [
+    ({"person_age": [20, 25, 30, 35, 40, 45, 50]}, [{"column": "person_age", "type": "numerical", "bins": [{"name": "lo", "ranges": [[0, 33]]}, {"name": "hi", "ranges": [[33, 100]]}]}], 3), # 1
+    ({"person_age": [20, None, 30, 35, 40, None, 50, 22]}, [{"column": "person_age", "type": "numerical", "bins": {"algo": "equal frequency", "method": "num_bins", "value": 3}}], 3), # 2
+    ({"person_age": [20, 25, 30, 35, 40, 45], "loan_grade": ["A", "B", "A", "C", None, "B"]}, [{"column": "person_age", "type": "numerical", "bins": {"algo": "equal width", "method": "width", "value": 10}}, {"column": "loan_grade", "type": "categorical", "bins": "none"}], 4), # 3
+]
+
+@pytest.mark.parametrize("input,bins_settings_list,chunksize", chunk_binning_test_data)
+def test_perform_binning_on_whole_df_chunk_by_chunk(input, bins_settings_list, chunksize):
+    dframe = pd.DataFrame(input)
+    chunk_df_list = [dframe.iloc[idx:idx+chunksize].copy() for idx in range(0, len(dframe), chunksize)]
+    expected = DataikuBinningMachine.perform_binning_on_whole_df(dframe.copy(), BinsPlan(bins_settings_list))
+
+    bins_plan = DataikuBinningMachine.get_fixed_bins_plan_from_chunks(chunk_df_list, bins_settings_list)
+    result = pd.concat([DataikuBinningMachine.perform_binning_on_whole_df(chunk_df, bins_plan) for chunk_df in chunk_df_list])
+
+    print("Result: ")
+    print(result)
+    print("Expected: ")
+    print(expected)
+
+    assert result.index.tolist() == dframe.index.tolist()
+    assert result.equals(expected)
+
+
+"""
+Test Scenario 6
+Test given a dataframe (whose index does not start at 0, e.g., a chunk of iter_dataframes) & bins settings, bin the whole dataframe
+with the columns binned in parallel by a process pool, the result should be the same as binning the columns one by one.
+
+------------------------
+Test Cases Design
+------------------------
+(1) Numerical custom binning & categorical no binning
+(2) Numerical equal width & equal frequency, with missing values
+(3) Numerical no binning (i.e., a numerical result) & categorical custom binning with elements not in any bin
+(4) Error in binning a column --> error returns -1
+Each case is run with a pool started for the dataframe (num_workers), and with a pool kept by the caller to bin 2 chunks (executor)
+"""
+
+parallel_binning_test_data = [
+    ({"person_age": [20, 25, 30, 35, 40, 45], "loan_grade": ["A", "B", "A", "C", None, "B"]}, [{"column": "person_age", "type": "numerical", "bins": [{"name": "lo", "ranges": [[0, 33]]}, {"name": "hi", "ranges": [[33, 100]]}]}, {"column": "loan_grade", "type": "categorical", "bins": "none"}]), # 1
+    ({"person_age": [20, None, 30, 35, 40, 45], "loan_int_rate": [5.5, 7.1, None, 11.2, 15.0, 9.9]}, [{"column": "person_age", "type": "numerical", "bins": {"algo": "equal width", "method": "num_bins", "value": 2}}, {"column": "loan_int_rate", "type": "numerical", "bins": {"algo": "equal frequency", "method": "num_bins", "value": 2}}]), # 2
+    ({"person_age": [20, 25, 20, 35, 40, 45], "loan_grade": ["A", "B", "A", "C", None, "B"]}, [{"column": "person_age", "type": "numerical", "bins": "none"}, {"column": "loan_grade", "type": "categorical", "bins": [{"name": "AB", "elements": ["A", "B"]}]}]), # 3
+    ({"person_age": [20, 25, 30], "loan_grade": ["A", "B", "A"]}, [{"column": "person_age", "type": "numerical", "bins": "none"}, {"column": "loan_grade", "type": "categorical", "bins": {"algo": "equal width", "method": "width", "value": 5}}]), # 4
+]
+
+@pytest.mark.parametrize("use_executor", [False, True])
+@pytest.mark.parametrize("input,bins_settings_list", parallel_binning_test_data)
+def test_perform_binning_on_whole_df_in_parallel(input, bins_settings_list, use_executor):
+    dframe = pd.DataFrame(input, index=range(100, 100 + len(next(iter(input.values())))))
+    expected = DataikuBinningMachine.perform_binning_on_whole_df(dframe.copy(), BinsPlan(bins_settings_list))
+    if use_executor:
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            result_list = [DataikuBinningMachine.perform_binning_on_whole_df(chunk_df, BinsPlan(bins_settings_list), executor=executor) for chunk_df in [dframe.iloc[:3].copy(), dframe.iloc[3:].copy()]]
+        result = -1 if any(isinstance(chunk_result, int) for chunk_result in result_list) else pd.concat(result_list)
+        if not isinstance(expected, int): # each chunk is binned on its own
+            expected = pd.concat([DataikuBinningMachine.perform_binning_on_whole_df(chunk_df, BinsPlan(bins_settings_list)) for chunk_df in [dframe.iloc[:3].copy(), dframe.iloc[3:].copy()]])
+    else:
+        result = DataikuBinningMachine.perform_binning_on_whole_df(dframe.copy(), BinsPlan(bins_settings_list), num_workers=2)
+
+    print("Result: ")
+    print(result)
+    print("Expected: ")
+    print(expected)
+
+    if isinstance(expected, int):
+        assert result == expected
+    else:
+        assert result.equals(expected)
+        assert result.filter(like="_binned").notna().all().all() # no row lost by the index
+
+
+"""
+Test Scenario 7
+Test given a dataframe, bins settings with supervised algorithms (optimal/chi merge) & the labels of the rows, fix their bins into custom bins,
+binning the dataframe chunk by chunk without the labels should be the same as binning the whole dataframe with the labels.
+
+------------------------
+Test Cases Design
+------------------------
+(1) Optimal binning of a numerical column, other columns left as they are
+(2) ChiMerge binning of a numerical & a categorical column
+(3) No supervised algorithms --> same bins settings
+(4) No labels --> error returns -1
+"""
+
+supervised_good_bad_def = {"bad": {"numerical": [{"column": "paid_past_due", "ranges": [[90, 121]]}], "categorical": [], "weight": 2}, "indeterminate": {"numerical": [{"column": "paid_past_due", "ranges": [[60, 90]]}], "categorical": []}, "good": {"weight": 1}}
+
+supervised_fixed_test_data = [
+    ([{"column": "person_income", "type": "numerical", "bins": {"algo": "optimal", "max_bins": 5}}, {"column": "person_age", "type": "numerical", "bins": {"algo": "equal width", "method": "num_bins", "value": 4}}, {"column": "loan_grade", "type": "categorical", "bins": "none"}], True), # 1
+    ([{"column": "loan_amnt", "type": "numerical", "bins": {"algo": "chi merge", "max_bins": 6}}, {"column": "loan_intent", "type": "categorical", "bins": {"algo": "chi merge"}}], True), # 2
+    ([{"column": "person_age", "type": "numerical", "bins": [{"name": "young", "ranges": [[0, 30]]}]}, {"column": "loan_grade", "type": "categorical", "bins": "none"}], True), # 3
+    ([{"column": "person_income", "type": "numerical", "bins": {"algo": "optimal"}}], False), # 4
+]
+
+@pytest.mark.parametrize("bins_settings_list,has_labels", supervised_fixed_test_data)
+def test_get_supervised_fixed_bins_plan(bins_settings_list, has_labels):
+    df = read_test_dataset("tests\\test_input_datasets\\credit_risk_dataset_generated.xlsx")
+    labels = GoodBadCounter.get_good_bad_labels(df, supervised_good_bad_def) if has_labels else None
+    bins_plan = DataikuBinningMachine.get_supervised_fixed_bins_plan(df, bins_settings_list, labels)
+
+    print("Result: ")
+    print(bins_plan)
+
+    if not has_labels:
+        assert bins_plan == -1
+        return
+    col_list = [col_bins_settings["column"] for col_bins_settings in bins_settings_list]
+    for col_bins_settings in bins_settings_list:
+        col_plan = bins_plan.get(col_bins_settings["column"])
+        if isinstance(col_bins_settings["bins"], dict) and col_bins_settings["bins"]["algo"] in ["optimal", "chi merge"]:
+            expected_def_li, expected_series = DataikuBinningMachine.perform_binning_on_col(df.loc[:, [col_plan.column]], col_bins_settings, labels=labels)
+            assert col_plan.is_custom()
+            assert str(col_plan.bins) == str(expected_def_li)
+            # chunks are binned by the fixed bins without the labels
+            chunk_list = [DataikuBinningMachine.perform_binning_on_whole_df(df.iloc[start:start + 10000, :].loc[:, col_list].copy(), bins_plan) for start in range(0, len(df), 10000)]
+            assert pd.concat(chunk_list)[col_plan.column + "_binned"].tolist() == expected_series.tolist()
+        else:
+            assert col_plan.get_col_bins_settings() == BinsPlan([col_bins_settings]).get(col_plan.column).get_col_bins_settings()
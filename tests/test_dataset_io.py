@@ -0,0 +1,83 @@
+from credit_scoring.dataset_io import DatasetIO
+import pandas as pd
+import numpy as np
+import pytest
+
+"""
+TEST DatasetIO class
+"""
+
+"""
+Test Scenario 1
+Test given a dataframe, write it to a Parquet/Feather file and read it back memory-mapped, the dataframe read should
+have the dtypes of dataiku.Dataset.get_dataframe(), i.e., int64, float64 (incl. integers with missing values), bool,
+and object (missing values as NaN).
+
+------------------------
+Test Cases Design
+------------------------
+(1) Empty dataframe
+(2) Integer, float & string columns (Parquet)
+(3) Integer, float & string columns (Feather)
+(4) Integer column with a missing value --> float64
+(5) String column with a missing value --> object with NaN
+(6) Boolean column
+(7) Only some columns are read
+"""
+
+dataset_io_test_data = [
+    ({}, ".parquet", None, {}), # 1
+    ({"person_age": [20, 30], "loan_int_rate": [5.5, 7.1], "loan_grade": ["A", "B"]}, ".parquet", None, {"person_age": "int64", "loan_int_rate": "float64", "loan_grade": "object"}), # 2
+    ({"person_age": [20, 30], "loan_int_rate": [5.5, 7.1], "loan_grade": ["A", "B"]}, ".feather", None, {"person_age": "int64", "loan_int_rate": "float64", "loan_grade": "object"}), # 3
+    ({"person_emp_length": pd.Series([1, None, 3], dtype="Int64")}, ".parquet", None, {"person_emp_length": "float64"}), # 4
+    ({"loan_grade": ["A", None, "C"]}, ".feather", None, {"loan_grade": "object"}), # 5
+    ({"cb_person_default_on_file": [True, False]}, ".parquet", None, {"cb_person_default_on_file": "bool"}), # 6
+    ({"person_age": [20, 30], "loan_grade": ["A", "B"]}, ".parquet", ["loan_grade"], {"loan_grade": "object"}), # 7
+]
+
+@pytest.mark.parametrize("input,extension,columns,expected_dtypes", dataset_io_test_data)
+def test_write_and_read_dataframe(tmp_path, input, extension, columns, expected_dtypes):
+    df = pd.DataFrame(input)
+    path = str(tmp_path / f"dataset{extension}")
+    DatasetIO.write_dataframe(df, path)
+    result = DatasetIO.read_dataframe(path, columns=columns)
+
+    print("Result: ")
+    print(result.dtypes)
+    print("Expected: ")
+    print(expected_dtypes)
+
+    assert result.dtypes.astype(str).to_dict() == expected_dtypes
+    expected_df = DatasetIO.cast_to_dataiku_dtypes(df.loc[:, columns] if columns is not None else df)
+    pd.testing.assert_frame_equal(result, expected_df, check_index_type=False, check_column_type=False)
+    for col in result.columns:
+        if result[col].dtype == object:
+            assert all(isinstance(value, (str, float)) for value in result[col]) # missing values are NaN, not None
+
+
+"""
+Test Scenario 2
+Test the errors of writing & reading a dataset file.
+
+------------------------
+Test Cases Design
+------------------------
+(1) Column with values of different types --> error raises ValueError
+(2) Unsupported file extension when writing --> error raises ValueError
+(3) Unsupported file extension when reading --> error raises ValueError
+"""
+
+dataset_io_error_test_data = [
+    ({"Bin": [22, "Missing"]}, ".parquet", "write"), # 1
+    ({"person_age": [20]}, ".csv", "write"), # 2
+    ({"person_age": [20]}, ".csv", "read"), # 3
+]
+
+@pytest.mark.parametrize("input,extension,operation", dataset_io_error_test_data)
+def test_dataset_io_error(tmp_path, input, extension, operation):
+    path = str(tmp_path / f"dataset{extension}")
+    with pytest.raises(ValueError):
+        if operation == "write":
+            DatasetIO.write_dataframe(pd.DataFrame(input), path)
+        else:
+            DatasetIO.read_dataframe(path)
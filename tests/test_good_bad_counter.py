@@ -1,5 +1,7 @@
-from good_bad_counter import GoodBadCounter
+from credit_scoring.good_bad_counter import GoodBadCounter
+from fixture_datasets import read_test_dataset
 import pandas as pd
+import numpy as np
 import pytest
 
 """
@@ -110,7 +112,7 @@ bad_defs_test_data = [
 
 @pytest.mark.parametrize("path,bad_defs,expected", bad_defs_test_data)
 def test_count_sample_bad(path, bad_defs, expected):
-    dframe = pd.read_excel(path)
+    dframe = read_test_dataset(path)
     result_df, result_bad_count = GoodBadCounter.count_sample_bad(dframe, bad_defs)
     expected_df_len, expected_bad_count = expected
     print(result_df)
@@ -200,7 +202,7 @@ indeterminate_defs_test_data = [
 
 @pytest.mark.parametrize("path,indeterminate_defs,expected", indeterminate_defs_test_data)
 def test_count_sample_indeterminate(path, indeterminate_defs, expected):
-    dframe = pd.read_excel(path)
+    dframe = read_test_dataset(path)
     result_indeterminate_count = GoodBadCounter.count_sample_indeterminate(dframe, indeterminate_defs)
     print(f'indeterminate count = {result_indeterminate_count}    vs    expected indeterminate count = {expected}')
     assert result_indeterminate_count == expected
@@ -263,7 +265,7 @@ sample_counts_test_data = [
 
 @pytest.mark.parametrize("path,sample_bad_count,sample_indeterminate_count,expected", sample_counts_test_data)
 def test_count_sample_good(path, sample_bad_count, sample_indeterminate_count, expected):
-    dframe = pd.read_excel(path)
+    dframe = read_test_dataset(path)
     result_good_count = GoodBadCounter.count_sample_good(dframe, sample_bad_count, sample_indeterminate_count)
     assert result_good_count == expected
 
@@ -527,7 +529,7 @@ stat_test_data = [
 
 @pytest.mark.parametrize("path,good_bad_def,expected", stat_test_data)
 def test_get_statistics(path, good_bad_def, expected):
-    dframe = pd.read_excel(path)
+    dframe = read_test_dataset(path)
     expected_sample_bad_count, expected_sample_indeterminate_count, expected_sample_good_count, expected_good_weight, expected_bad_weight, expected_population_good_count, expected_population_bad_count = expected
     result_sample_bad_count, result_sample_indeterminate_count, result_sample_good_count, result_good_weight, result_bad_weight, result_population_good_count, result_population_bad_count = GoodBadCounter.get_statistics(dframe, good_bad_def)
     print(f"result_sample_bad_count = {result_sample_bad_count} vs expected_sample_bad_count = {expected_sample_bad_count}")
@@ -545,4 +547,55 @@ def test_get_statistics(path, good_bad_def, expected):
         result_bad_weight == expected_bad_weight and
         result_population_good_count == expected_population_good_count and
         result_population_bad_count == expected_population_bad_count
-    )
\ No newline at end of file
+    )
+"""
+Test Scenario 7
+Test given a dataframe and the good bad definition, label each row as good (0), bad (1) or indeterminate (2).
+
+Assumptions:
+(1) Columns appearing in definitions must also appears in the dataframe.
+(2) Categorical column must not appears in numerical definitions.
+
+Input in the form of:
+dframe = pd.DataFrame
+   paid_past_due loan_grade
+0            114          A
+1             73          C
+2            NaN       None
+...
+
+good_bad_def = dict (same as that in Test Scenario 6)
+
+Output: labels = np.array of int8, e.g., [1, 2, 0, ...]
+
+------------------------
+Test Cases Design
+------------------------
+(1) Numerical definitions only (lower bound inclusive, upper bound exclusive)
+(2) Categorical definitions only
+(3) Row satisfying both bad & indeterminate definitions is bad
+(4) Missing values are good
+(5) Missing element in categorical definitions matches nothing
+(6) No indeterminate definition
+(7) Empty definitions (i.e., all good)
+(8) Empty dataframe
+"""
+
+label_test_df = pd.DataFrame({"paid_past_due": [114, 73, None, 90, 60, 121], "loan_grade": ["A", "C", None, "E", "A", "D"]})
+
+labels_test_data = [
+    (label_test_df, {"bad": {"numerical": [{"column": "paid_past_due", "ranges": [[90, 121]]}], "categorical": [], "weight": 1}, "indeterminate": {"numerical": [{"column": "paid_past_due", "ranges": [[60, 90]]}], "categorical": []}, "good": {"weight": 1}}, [1, 2, 0, 1, 2, 0]), # 1
+    (label_test_df, {"bad": {"numerical": [], "categorical": [{"column": "loan_grade", "elements": ["D", "E"]}], "weight": 1}, "indeterminate": {"numerical": [], "categorical": [{"column": "loan_grade", "elements": ["C"]}]}, "good": {"weight": 1}}, [0, 2, 0, 1, 0, 1]), # 2
+    (label_test_df, {"bad": {"numerical": [{"column": "paid_past_due", "ranges": [[100, 200]]}], "categorical": [{"column": "loan_grade", "elements": ["C"]}], "weight": 1}, "indeterminate": {"numerical": [{"column": "paid_past_due", "ranges": [[0, 200]]}], "categorical": [{"column": "loan_grade", "elements": ["A"]}]}, "good": {"weight": 1}}, [1, 1, 0, 2, 2, 1]), # 3
+    (label_test_df, {"bad": {"numerical": [{"column": "paid_past_due", "ranges": [[0, 1000]]}], "categorical": [{"column": "loan_grade", "elements": ["A", "C", "D", "E"]}], "weight": 1}, "indeterminate": {"numerical": [], "categorical": []}, "good": {"weight": 1}}, [1, 1, 0, 1, 1, 1]), # 4
+    (label_test_df, {"bad": {"numerical": [], "categorical": [{"column": "loan_grade", "elements": [None]}], "weight": 1}, "indeterminate": {"numerical": [], "categorical": [{"column": "paid_past_due", "elements": [float("nan")]}]}, "good": {"weight": 1}}, [0, 0, 0, 0, 0, 0]), # 5
+    (label_test_df, {"bad": {"numerical": [{"column": "paid_past_due", "ranges": [[100, 200]]}], "categorical": [], "weight": 1}, "good": {"weight": 1}}, [1, 0, 0, 0, 0, 1]), # 6
+    (label_test_df, {"bad": {"numerical": [], "categorical": [], "weight": 1}, "indeterminate": {"numerical": [], "categorical": []}, "good": {"weight": 1}}, [0, 0, 0, 0, 0, 0]), # 7
+    (label_test_df.iloc[0:0], {"bad": {"numerical": [{"column": "paid_past_due", "ranges": [[90, 121]]}], "categorical": [{"column": "loan_grade", "elements": ["E"]}], "weight": 1}, "indeterminate": {"numerical": [], "categorical": []}, "good": {"weight": 1}}, []), # 8
+]
+
+@pytest.mark.parametrize("dframe,good_bad_def,expected", labels_test_data)
+def test_get_good_bad_labels(dframe, good_bad_def, expected):
+    result = GoodBadCounter.get_good_bad_labels(dframe, good_bad_def)
+    print(f"result = {result.tolist()} vs expected = {expected}")
+    assert result.dtype == np.int8 and result.tolist() == expected
@@ -1,5 +1,7 @@
-from good_bad_def_decoder import GoodBadDefDecoder
+from credit_scoring.good_bad_def_decoder import GoodBadDefDecoder
 import pytest
+import random
+import copy
 """
 TEST GoodBadDefDecoder class
 """
@@ -158,4 +160,219 @@ sort_numerical_def_ranges_test_data = [
 @pytest.mark.parametrize("numeric_def_r,expected", sort_numerical_def_ranges_test_data)
 def test_sort_numerical_def_ranges(numeric_def_r, expected):
     result = GoodBadDefDecoder.sort_numerical_def_ranges(numeric_def_r)
-    assert result == expected
\ No newline at end of file
+    assert result == expected
+
+
+"""
+Test Scenario 4
+Merge overlapping (or touching) numerical ranges of a single column into sorted non-overlapping ranges
+
+Test merging e.g., [[15, 20], [1, 10], [8, 14]] to [[1, 14], [15, 20]].
+
+------------------------
+Test Cases Design
+------------------------
+(1) Empty list
+(2) Only single range in the list
+(3) No overlapping, unsorted
+(4) Touching ranges (upper bound of one == lower bound of another)
+(5) A range containing other ranges
+(6) Ranges with the same lower bound
+(7) A range overlapping with many ranges
+(8) Float bounds
+"""
+
+merge_numerical_def_ranges_test_data = [
+    ([], []), # 1
+    ([[10, 20]], [[10, 20]]), # 2
+    ([[20, 30], [10, 15], [3, 5], [60, 80]], [[3, 5], [10, 15], [20, 30], [60, 80]]), # 3
+    ([[50, 90], [30, 50], [90, 100]], [[30, 100]]), # 4
+    ([[20, 60], [30, 50], [25, 26]], [[20, 60]]), # 5
+    ([[-8, -3], [-8, -1], [-8, -5]], [[-8, -1]]), # 6
+    ([[1, 3], [5, 7], [9, 10], [12, 13], [0, 12]], [[0, 13]]), # 7
+    ([[30.1, 50.9], [20.7, 40.8], [51.0, 52.5]], [[20.7, 50.9], [51.0, 52.5]]), # 8
+]
+
+@pytest.mark.parametrize("numeric_def_r,expected", merge_numerical_def_ranges_test_data)
+def test_merge_numerical_def_ranges(numeric_def_r, expected):
+    result = GoodBadDefDecoder.merge_numerical_def_ranges(numeric_def_r)
+    assert result == expected
+
+
+"""
+Test Scenario 5
+Property-based test of merging overlapping numerical ranges, on randomly generated definitions
+
+Test for each randomly generated ((column_name, lower_bound, upper_bound), ...) (with a fixed seed, so failures can be reproduced), that
+(1) the result is the same as that of the previous (pairwise merging) implementation, i.e., legacy_get_numeric_def_list_from_section
+(2) columns are in the order of their first appearance
+(3) ranges of each column are sorted, and separated by a gap (i.e., no overlapping or touching ranges)
+(4) every input range is covered by exactly 1 output range, and every output range is the union of some input ranges
+
+------------------------
+Test Cases Design
+------------------------
+(1) - (100) Integer bounds, up to 3 columns & 12 ranges
+(101) - (200) Integer & float bounds (incl. negative bounds & ranges with lower bound == upper bound), up to 3 columns & 12 ranges
+(201) - (220) Up to 5 columns & 300 ranges
+"""
+
+# The implementation before the sort-then-sweep merging, kept as the reference of the property-based test
+def legacy_get_numeric_def_list_from_section(numeric_info_list):
+    numeric_list = list()  # initialization
+
+    for numeric_info in numeric_info_list:
+        single_def_dict = dict()
+        column = numeric_info[0]
+        a_range = [numeric_info[1], numeric_info[2]]
+        # The 2 bounds are valid, now check if any overlapping with previously saved data
+        has_column_overlap = False
+        for def_idx, saved_def in enumerate(numeric_list):
+            if saved_def["column"] == column:
+                has_column_overlap = True
+                has_range_overlap = False
+                overlapped_def_range_idxes = list()
+                # Merge range to element list
+                for def_range_idx, def_range in enumerate(saved_def["ranges"]):
+                    if len(overlapped_def_range_idxes) != 0:
+                        a_range = numeric_list[def_idx]["ranges"][overlapped_def_range_idxes[0]]
+
+                    if a_range[0] <= def_range[0] and a_range[1] >= def_range[1]:
+                        has_range_overlap = True
+                        numeric_list[def_idx]["ranges"][def_range_idx] = [
+                            a_range[0], a_range[1]]
+                        overlapped_def_range_idxes.insert(0, def_range_idx)
+                    elif def_range[0] <= a_range[0] and def_range[1] >= a_range[1]:
+                        has_range_overlap = True
+                    elif a_range[0] <= def_range[0] and a_range[1] >= def_range[0] and a_range[1] <= def_range[1]:
+                        has_range_overlap = True
+                        numeric_list[def_idx]["ranges"][def_range_idx] = [
+                            a_range[0], def_range[1]]
+                        overlapped_def_range_idxes.insert(0, def_range_idx)
+                    elif a_range[0] >= def_range[0] and a_range[0] <= def_range[1] and a_range[1] >= def_range[1]:
+                        has_range_overlap = True
+                        numeric_list[def_idx]["ranges"][def_range_idx] = [
+                            def_range[0], a_range[1]]
+                        overlapped_def_range_idxes.insert(0, def_range_idx)
+                if len(overlapped_def_range_idxes) != 0:
+                    del overlapped_def_range_idxes[0]
+                    for i in sorted(overlapped_def_range_idxes, reverse=True):
+                        del numeric_list[def_idx]["ranges"][i]
+                if has_range_overlap == False:
+                    numeric_list[def_idx]["ranges"].append(a_range)
+                break
+        if has_column_overlap == False:
+            single_def_dict["column"] = column
+            single_def_dict["ranges"] = [a_range]
+            numeric_list.append(single_def_dict)
+    
+    for idx in range(len(numeric_list)):
+        numeric_list[idx]["ranges"] = legacy_sort_numerical_def_ranges(numeric_list[idx]["ranges"])
+   
+    return numeric_list
+
+def legacy_sort_numerical_def_ranges(numeric_def_r):
+    sorted_def_ranges = list()
+    for r in numeric_def_r:
+        has_appended = False
+        for idx in range(len(sorted_def_ranges)):
+            if r[0] < sorted_def_ranges[idx][0]:
+                sorted_def_ranges.insert(idx, r)
+                has_appended = True
+                break
+        if has_appended == False:
+            sorted_def_ranges.append(r)
+    return sorted_def_ranges
+
+
+def generate_numeric_info_list(seed):
+    rnd = random.Random(seed)
+    if seed < 200:
+        num_ranges, num_columns = rnd.randint(0, 12), 3
+    else:
+        num_ranges, num_columns = rnd.randint(100, 300), 5
+
+    numeric_info_list = list()
+    for _ in range(num_ranges):
+        if seed < 100 or seed >= 200:
+            lower = rnd.randint(-20, 100)
+            upper = lower + rnd.randint(1, 15)
+        else:
+            lower = rnd.choice([rnd.randint(-20, 30), round(rnd.uniform(-20, 30), 1)])
+            upper = lower + rnd.choice([0, rnd.randint(1, 10), round(rnd.uniform(0, 10), 2)])
+        numeric_info_list.append((f"col_{rnd.randint(0, num_columns - 1)}", lower, upper))
+    return tuple(numeric_info_list)
+
+@pytest.mark.parametrize("seed", range(220))
+def test_get_numeric_def_list_from_section_properties(seed):
+    numeric_info_list = generate_numeric_info_list(seed)
+    result = GoodBadDefDecoder.get_numeric_def_list_from_section(numeric_info_list)
+    expected = legacy_get_numeric_def_list_from_section(copy.deepcopy(numeric_info_list))
+    print(f"numeric_info_list = {numeric_info_list}")
+    print(f"result = {result}, expected = {expected}")
+
+    # (1) same as the previous implementation
+    assert result == expected
+
+    # (2) columns in the order of first appearance
+    column_list = list()
+    for numeric_info in numeric_info_list:
+        if numeric_info[0] not in column_list:
+            column_list.append(numeric_info[0])
+    assert [numeric_def["column"] for numeric_def in result] == column_list
+
+    for numeric_def in result:
+        ranges = numeric_def["ranges"]
+        # (3) sorted & separated by a gap
+        for idx in range(1, len(ranges)):
+            assert ranges[idx - 1][1] < ranges[idx][0]
+
+        # (4) each input range is in exactly 1 output range, and each output range is the union of the input ranges in it
+        input_ranges = [[numeric_info[1], numeric_info[2]] for numeric_info in numeric_info_list if numeric_info[0] == numeric_def["column"]]
+        for a_range in input_ranges:
+            assert len([r for r in ranges if r[0] <= a_range[0] and a_range[1] <= r[1]]) == 1
+        for r in ranges:
+            contained_ranges = [a_range for a_range in input_ranges if r[0] <= a_range[0] and a_range[1] <= r[1]]
+            assert min(a_range[0] for a_range in contained_ranges) == r[0]
+            assert max(a_range[1] for a_range in contained_ranges) == r[1]
+
+
+"""
+Test Scenario 6
+Cast a good bad definition parsed from the ib_settings JSON
+
+Test that the numerical bounds & the weights are cast to float, the numeric categorical elements (e.g., "1") are cast to float,
+the other elements are kept, and the given definition is not changed
+
+------------------------
+Test Cases Design
+------------------------
+(1) Numerical bad & indeterminate definitions
+(2) Categorical definitions with numeric & non-numeric elements, in a definition with a numerical section too
+(3) Categorical definition only
+(4) No indeterminate definition
+(5) Elements which are not strings, or not integers as strings (e.g., "1.5", "-1") are kept
+"""
+
+cast_test_data = [
+    ({"bad": {"numerical": [{"column": "paid_past_due", "ranges": [["90", "121"]]}], "categorical": [], "weight": "1"}, "indeterminate": {"numerical": [{"column": "paid_past_due", "ranges": [["60", "90"], ["-1.5", "0"]]}], "categorical": []}, "good": {"weight": "2.5"}},
+     {"bad": {"numerical": [{"column": "paid_past_due", "ranges": [[90.0, 121.0]]}], "categorical": [], "weight": 1.0}, "indeterminate": {"numerical": [{"column": "paid_past_due", "ranges": [[60.0, 90.0], [-1.5, 0.0]]}], "categorical": []}, "good": {"weight": 2.5}}), # 1
+    ({"bad": {"numerical": [{"column": "paid_past_due", "ranges": [["90", "121"]]}], "categorical": [{"column": "loan_status", "elements": ["1", "Y"]}], "weight": "1"}, "indeterminate": {"numerical": [], "categorical": [{"column": "person_home_ownership", "elements": ["OTHER"]}]}, "good": {"weight": "1"}},
+     {"bad": {"numerical": [{"column": "paid_past_due", "ranges": [[90.0, 121.0]]}], "categorical": [{"column": "loan_status", "elements": [1.0, "Y"]}], "weight": 1.0}, "indeterminate": {"numerical": [], "categorical": [{"column": "person_home_ownership", "elements": ["OTHER"]}]}, "good": {"weight": 1.0}}), # 2
+    ({"bad": {"categorical": [{"column": "loan_status", "elements": ["1"]}], "weight": "1"}, "good": {"weight": "1"}},
+     {"bad": {"categorical": [{"column": "loan_status", "elements": [1.0]}], "weight": 1.0}, "good": {"weight": 1.0}}), # 3
+    ({"bad": {"numerical": [{"column": "paid_past_due", "ranges": [["90", "121"]]}], "weight": "1"}, "good": {"weight": "1"}},
+     {"bad": {"numerical": [{"column": "paid_past_due", "ranges": [[90.0, 121.0]]}], "weight": 1.0}, "good": {"weight": 1.0}}), # 4
+    ({"bad": {"categorical": [{"column": "loan_status", "elements": [1, None, "1.5", "-1"]}], "weight": 1}, "good": {"weight": 1}},
+     {"bad": {"categorical": [{"column": "loan_status", "elements": [1, None, "1.5", "-1"]}], "weight": 1.0}, "good": {"weight": 1.0}}), # 5
+]
+
+@pytest.mark.parametrize("good_bad_def,expected", cast_test_data)
+def test_cast_good_bad_def(good_bad_def, expected):
+    original_good_bad_def = copy.deepcopy(good_bad_def)
+    cast_good_bad_def = GoodBadDefDecoder.cast_good_bad_def(good_bad_def)
+    assert cast_good_bad_def == expected
+    for def_type in expected:
+        if "weight" in expected[def_type]:
+            assert isinstance(cast_good_bad_def[def_type]["weight"], float)
+    assert good_bad_def == original_good_bad_def
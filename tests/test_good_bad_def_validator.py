@@ -1,4 +1,4 @@
-from good_bad_def_validator import GoodBadDefValidator
+from credit_scoring.good_bad_def_validator import GoodBadDefValidator
 import pytest
 
 """
@@ -165,4 +165,81 @@ numeric_info_test_data = [
 def test_validate_numerical_bounds(numeric_info_list, expected):
     validator = GoodBadDefValidator()
     isValid = validator.validate_numerical_bounds(numeric_info_list)
-    assert isValid == expected
\ No newline at end of file
+    assert isValid == expected
+
+"""
+Test Scenario 4
+Get all the overlapped pairs between bad & indeterminate numerical definition ranges.
+
+Test get the list of conflicts in the form of [[column, bad_range, indeterminate_range], ...], in the order of the bad ranges,
+where a bad range [b0, b1) & an indeterminate range [i0, i1) have overlapped if b0 < i1 and i0 < b1.
+The indeterminate ranges of each column are merged first, so the merged indeterminate range is given.
+
+------------------------
+Test Cases Design
+------------------------
+(1) Single column + no overlapping
+(2) Single column + no overlapping (for [r0, r1] & [b0, b1], r1 == b0)
+(3) Single column + bad range inside indeterminate range (case [{}])
+(4) Single column + 1 bad range overlapped with 2 indeterminate ranges
+(5) Single column + 2 bad ranges overlapped with the same indeterminate range
+(6) Single column + unsorted & overlapping indeterminate ranges
+(7) 2 columns + overlapping of one of the column
+(8) Indeterminate definition of the column splitted into 2 definitions
+(9) Empty definition list for bad & indeterminate
+(10) Single column + unsorted & touching indeterminate ranges overlapped with the same bad range --> merged indeterminate ranges
+"""
+
+numeric_conflict_test_data = [
+    ([{"column": "paid_past_due", "ranges": [[90, 121]]}], [{"column": "paid_past_due", "ranges": [[70, 80]]}], []), # 1
+    ([{"column": "paid_past_due", "ranges": [[90, 121]]}], [{"column": "paid_past_due", "ranges": [[70, 90]]}], []), # 2
+    ([{"column": "paid_past_due", "ranges": [[95, 100]]}], [{"column": "paid_past_due", "ranges": [[90, 121]]}], [["paid_past_due", [95, 100], [90, 121]]]), # 3
+    ([{"column": "paid_past_due", "ranges": [[50, 100]]}], [{"column": "paid_past_due", "ranges": [[40, 60], [70, 80], [100, 120]]}], [["paid_past_due", [50, 100], [40, 60]], ["paid_past_due", [50, 100], [70, 80]]]), # 4
+    ([{"column": "paid_past_due", "ranges": [[10, 20], [30, 40]]}], [{"column": "paid_past_due", "ranges": [[15, 35]]}], [["paid_past_due", [10, 20], [15, 35]], ["paid_past_due", [30, 40], [15, 35]]]), # 5
+    ([{"column": "paid_past_due", "ranges": [[50, 55]]}], [{"column": "paid_past_due", "ranges": [[60, 70], [0, 100], [10, 20]]}], [["paid_past_due", [50, 55], [0, 100]]]), # 6
+    ([{"column": "paid_past_due", "ranges": [[90, 100]]}, {"column": "person_age", "ranges": [[10, 30]]}], [{"column": "paid_past_due", "ranges": [[60, 90]]}, {"column": "person_age", "ranges": [[28, 34]]}], [["person_age", [10, 30], [28, 34]]]), # 7
+    ([{"column": "paid_past_due", "ranges": [[90, 100]]}], [{"column": "paid_past_due", "ranges": [[60, 70]]}, {"column": "paid_past_due", "ranges": [[95, 96]]}], [["paid_past_due", [90, 100], [95, 96]]]), # 8
+    ([], [], []), # 9
+    ([{"column": "paid_past_due", "ranges": [[50, 65], [150, 160]]}], [{"column": "paid_past_due", "ranges": [[60, 80], [40, 55], [80, 90]]}, {"column": "paid_past_due", "ranges": [[100, 110]]}], [["paid_past_due", [50, 65], [40, 55]], ["paid_past_due", [50, 65], [60, 90]]]), # 10
+]
+
+@pytest.mark.parametrize("bad_numeric_list,indeterminate_numeric_list,expected", numeric_conflict_test_data)
+def test_get_numerical_def_conflicts(bad_numeric_list, indeterminate_numeric_list, expected):
+    validator = GoodBadDefValidator()
+    conflict_list = validator.get_numerical_def_conflicts(bad_numeric_list, indeterminate_numeric_list)
+    assert conflict_list == expected
+    assert validator.validate_if_numerical_def_overlapped(bad_numeric_list, indeterminate_numeric_list) == (len(expected) == 0)
+
+
+"""
+Test Scenario 5
+Get all the overlapped elements between bad & indeterminate categorical definitions.
+
+Test get the list of conflicts in the form of [[column, element], ...], in the order of the elements in the bad definitions.
+
+------------------------
+Test Cases Design
+------------------------
+(1) Single column + no overlapping
+(2) Single column + 1 overlapped element
+(3) Single column + 2 overlapped elements
+(4) 2 columns + overlapping of one of the column
+(5) Same element in another column (i.e., not overlapped)
+(6) Empty definition list for bad & indeterminate
+"""
+
+categoric_conflict_test_data = [
+    ([{"column": "loan_status", "elements": ["1"]}], [{"column": "loan_status", "elements": ["0"]}], []), # 1
+    ([{"column": "loan_status", "elements": ["1"]}], [{"column": "loan_status", "elements": ["1", "0"]}], [["loan_status", "1"]]), # 2
+    ([{"column": "person_home_ownership", "elements": ["RENT", "OWN", "MORTGAGE"]}], [{"column": "person_home_ownership", "elements": ["MORTGAGE", "RENT"]}], [["person_home_ownership", "RENT"], ["person_home_ownership", "MORTGAGE"]]), # 3
+    ([{"column": "loan_status", "elements": ["1"]}, {"column": "person_home_ownership", "elements": ["RENT", "MORTGAGE"]}], [{"column": "loan_status", "elements": ["0"]}, {"column": "person_home_ownership", "elements": ["MORTGAGE", "OTHERS"]}], [["person_home_ownership", "MORTGAGE"]]), # 4
+    ([{"column": "loan_status", "elements": ["1"]}], [{"column": "loan_grade", "elements": ["1"]}], []), # 5
+    ([], [], []), # 6
+]
+
+@pytest.mark.parametrize("bad_categoric_list,indeterminate_categoric_list,expected", categoric_conflict_test_data)
+def test_get_categorical_def_conflicts(bad_categoric_list, indeterminate_categoric_list, expected):
+    validator = GoodBadDefValidator()
+    conflict_list = validator.get_categorical_def_conflicts(bad_categoric_list, indeterminate_categoric_list)
+    assert conflict_list == expected
+    assert validator.validate_if_categorical_def_overlapped(bad_categoric_list, indeterminate_categoric_list) == (len(expected) == 0)
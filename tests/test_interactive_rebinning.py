@@ -0,0 +1,175 @@
+from credit_scoring.interactive_binning_machine import InteractiveBinningMachine, ColValueIndex
+from credit_scoring.bins_plan import ColBinsPlan
+import pandas as pd
+import numpy as np
+import copy
+import pytest
+
+"""
+TEST InteractiveBinningMachine.get_bins_diff(), perform_action() & rebin_codes(), and ColValueIndex class
+"""
+
+"""
+Test Scenario 1
+Test given the column bins settings before & after an interactive action, get the changes of the bins, i.e., the new bin code
+of each old bin, the renamed & merged bins, and the ranges/elements moved to another bin.
+
+------------------------
+Test Cases Design
+------------------------
+(1) Numerical, same bins --> no change
+(2) Numerical, rename a bin --> renamed only
+(3) Numerical, merge 2 bins --> merged, bin codes mapped
+(4) Numerical, move a cutpoint --> the range between the old & new cutpoint is moved
+(5) Numerical, new bin over parts of 2 bins --> the rows of an old bin go to the new bin holding most of its range, the rest is moved (adjacent ranges joined)
+(6) Categorical, rename a bin --> renamed only
+(7) Categorical, split an element out of a bin --> the element is moved
+(8) Categorical, new bin with an element not in any bin --> the element is moved
+(9) Auto binning --> None
+"""
+
+num_bins = [{"name": "low", "ranges": [[0, 20]]}, {"name": "mid", "ranges": [[20, 50]]}, {"name": "high", "ranges": [[50, 100]]}]
+cat_bins = [{"name": "A", "elements": ["A"]}, {"name": "BC", "elements": ["B", "C"]}]
+
+def get_bins_diff_expected(old_bin_names, new_bin_names, code_map, renamed=[], merged=[], moved_ranges=[], moved_elements=[]):
+    return {"old_bin_names": old_bin_names, "new_bin_names": new_bin_names, "code_map": code_map, "renamed": renamed,
+            "merged": merged, "moved_ranges": moved_ranges, "moved_elements": moved_elements}
+
+get_bins_diff_test_data = [
+    ("numerical", num_bins, num_bins, get_bins_diff_expected(["low", "mid", "high"], ["low", "mid", "high"], [0, 1, 2])), # 1
+    ("numerical", num_bins, [{"name": "young", "ranges": [[0, 20]]}] + num_bins[1:], get_bins_diff_expected(["low", "mid", "high"], ["young", "mid", "high"], [0, 1, 2], renamed=[["low", "young"]])), # 2
+    ("numerical", num_bins, [num_bins[2], {"name": "low-mid", "ranges": [[0, 20], [20, 50]]}], get_bins_diff_expected(["low", "mid", "high"], ["high", "low-mid"], [1, 1, 0], merged=[[["low", "mid"], "low-mid"]])), # 3
+    ("numerical", num_bins, [{"name": "low", "ranges": [[0, 30]]}, {"name": "mid", "ranges": [[30, 50]]}, num_bins[2]], get_bins_diff_expected(["low", "mid", "high"], ["low", "mid", "high"], [0, 1, 2], moved_ranges=[[20.0, 30.0]])), # 4
+    ("numerical", num_bins, [{"name": "low", "ranges": [[0, 10]]}, {"name": "mid", "ranges": [[40, 50]]}, {"name": "high", "ranges": [[60, 100]]}, {"name": "new", "ranges": [[10, 40], [50, 60]]}], get_bins_diff_expected(["low", "mid", "high"], ["low", "mid", "high", "new"], [0, 3, 2], moved_ranges=[[10.0, 20.0], [40.0, 60.0]])), # 5
+    ("categorical", cat_bins, [{"name": "a", "elements": ["A"]}, cat_bins[1]], get_bins_diff_expected(["A", "BC"], ["a", "BC"], [0, 1], renamed=[["A", "a"]])), # 6
+    ("categorical", cat_bins, [cat_bins[0], {"name": "BC", "elements": ["B"]}, {"name": "C", "elements": ["C"]}], get_bins_diff_expected(["A", "BC"], ["A", "BC", "C"], [0, 1], moved_elements=["C"])), # 7
+    ("categorical", cat_bins, cat_bins + [{"name": "D", "elements": ["D"]}], get_bins_diff_expected(["A", "BC"], ["A", "BC", "D"], [0, 1], moved_elements=["D"])), # 8
+    ("numerical", {"algo": "equal width", "method": "num_bins", "value": 3}, num_bins, None), # 9
+]
+
+@pytest.mark.parametrize("col_type,old_bins,new_bins,expected", get_bins_diff_test_data)
+def test_get_bins_diff(col_type, old_bins, new_bins, expected):
+    result = InteractiveBinningMachine.get_bins_diff({"column": "col", "type": col_type, "bins": old_bins}, {"column": "col", "type": col_type, "bins": new_bins})
+
+    print("Result: ")
+    print(result)
+    print("Expected: ")
+    print(expected)
+
+    assert result == expected
+
+
+"""
+Test Scenario 2
+Test given a column binned before an interactive action (bin codes), perform the action and update the bin codes by the changes
+of the bins, the bin codes should be the same as binning the whole column with the bins settings after the action.
+
+------------------------
+Test Cases Design
+------------------------
+(1) Numerical, rename a bin
+(2) Numerical, merge 2 bins
+(3) Numerical, adjust the cutpoints of a bin
+(4) Numerical, create a new bin over parts of 2 bins
+(5) Categorical, rename a bin
+(6) Categorical, merge 2 bins
+(7) Categorical, split elements out of a bin
+(8) Categorical, add elements of another bin to a bin
+(9) Categorical, create a new bin with an element not in any bin
+(10) Action failed (invalid new bin name) --> bin codes unchanged
+"""
+
+num_col = pd.Series([5, 15, 20, 25, 35, 45, 50, 55, 75, np.nan, 99, 100, -1, 30, 60])
+cat_col = pd.Series(["A", "B", "C", "D", np.nan, "A", "C", "B", "D", "C"])
+
+rebin_codes_test_data = [
+    (num_col, "numerical", num_bins, "numeric_rename_bin", {"selected_bin_name": "low", "new_bin_name": "young"}), # 1
+    (num_col, "numerical", num_bins, "numeric_merge_bins", {"selected_bin_name_li": ["low", "mid"], "new_bin_name": "low-mid"}), # 2
+    (num_col, "numerical", num_bins, "get_numeric_adjust_cutpoints", {"selected_bin_name": "mid", "new_bin_name": "mid2", "new_bin_ranges": [[15, 60]]}), # 3
+    (num_col, "numerical", num_bins, "numeric_create_new_bin", {"new_bin_name": "new", "new_bin_ranges": [[10, 30], [45, 60]]}), # 4
+    (cat_col, "categorical", cat_bins, "categoric_rename_bin", {"selected_bin_name": "A", "new_bin_name": "a"}), # 5
+    (cat_col, "categorical", cat_bins, "categoric_merge_bins", {"selected_bin_name_li": ["A", "BC"], "new_bin_name": "ABC"}), # 6
+    (cat_col, "categorical", cat_bins, "categoric_split_bin", {"selected_bin_name": "BC", "new_bin_name": "C", "elements_to_split_out_li": ["C"]}), # 7
+    (cat_col, "categorical", cat_bins, "categoric_add_elements", {"selected_bin_name": "A", "new_bin_name": "AB", "elements_to_add_li": ["B"]}), # 8
+    (cat_col, "categorical", cat_bins, "categoric_create_new_bin", {"new_bin_name": "D", "new_bin_element_li": ["D"]}), # 9
+    (cat_col, "categorical", cat_bins, "categoric_rename_bin", {"selected_bin_name": "A", "new_bin_name": "BC"}), # 10
+]
+
+@pytest.mark.parametrize("col_series,col_type,bins,action,kwargs", rebin_codes_test_data)
+def test_rebin_codes(col_series, col_type, bins, action, kwargs):
+    temp_col_bins_settings = {"column": "col", "type": col_type, "bins": copy.deepcopy(bins)}
+    bin_codes = ColBinsPlan(temp_col_bins_settings).get_bin_codes(col_series)
+    old_bin_codes = bin_codes.copy()
+
+    new_settings, _, __, bins_diff = InteractiveBinningMachine.perform_action(action, temp_col_bins_settings, **kwargs)
+    result = InteractiveBinningMachine.rebin_codes(bin_codes, bins_diff, new_settings, ColValueIndex(col_series, col_type))
+    expected = ColBinsPlan(new_settings).get_bin_codes(col_series)
+
+    print("Result: ")
+    print(result)
+    print("Expected: ")
+    print(expected)
+
+    assert result.tolist() == expected.tolist()
+    assert bin_codes.tolist() == old_bin_codes.tolist() # the bin codes given are not changed
+    assert bins_diff["new_bin_names"] == ColBinsPlan(new_settings).bin_names
+
+
+"""
+Test Scenario 3
+Test given a column, index the rows by value, the rows holding a range of values/an element should be found.
+
+------------------------
+Test Cases Design
+------------------------
+(1) Numerical, range holding some values --> rows with values in [lower, upper), missing values excluded
+(2) Numerical, range holding no values --> no rows
+(3) Categorical, element in the column --> rows of the element
+(4) Categorical, element not in the column --> no rows
+"""
+
+col_value_index_test_data = [
+    (num_col, "numerical", [20, 50], [2, 3, 4, 5, 13]), # 1
+    (num_col, "numerical", [101, 200], []), # 2
+    (cat_col, "categorical", "C", [2, 6, 9]), # 3
+    (cat_col, "categorical", "E", []), # 4
+]
+
+@pytest.mark.parametrize("col_series,col_type,values,expected", col_value_index_test_data)
+def test_col_value_index(col_series, col_type, values, expected):
+    col_value_index = ColValueIndex(col_series, col_type)
+    if col_type == "numerical":
+        rows, range_values = col_value_index.get_rows_in_range(values[0], values[1])
+        assert range_values.tolist() == col_series.iloc[rows].tolist()
+    else:
+        rows = col_value_index.get_rows_of_element(values)
+    result = sorted(rows.tolist())
+
+    print("Result: ")
+    print(result)
+    print("Expected: ")
+    print(expected)
+
+    assert result == expected
+
+
+"""
+Test Scenario 4
+Test perform an action not supported by InteractiveBinningMachine.
+
+------------------------
+Test Cases Design
+------------------------
+(1) Unknown action --> error raises ValueError
+(2) Not an interactive action (validate_new_name) --> error raises ValueError
+"""
+
+perform_action_error_test_data = [
+    ("unknown_action"), # 1
+    ("validate_new_name"), # 2
+]
+
+@pytest.mark.parametrize("action", perform_action_error_test_data)
+def test_perform_action_error(action):
+    with pytest.raises(ValueError):
+        InteractiveBinningMachine.perform_action(action, {"column": "col", "type": "categorical", "bins": copy.deepcopy(cat_bins)})
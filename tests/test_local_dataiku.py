@@ -0,0 +1,135 @@
+import dataiku
+import pandas as pd
+import numpy as np
+import pytest
+
+"""
+TEST local dataiku stand-in (code/local_dataiku)
+"""
+
+@pytest.fixture(autouse=True)
+def data_dir(tmp_path):
+    dataiku.set_data_dir(str(tmp_path))
+    dataiku.reset_io_timings()
+    yield tmp_path
+    dataiku.set_default_format("parquet")
+
+
+"""
+Test Scenario 1
+Test given a dataframe, write it to a dataset with write_with_schema() and read it back with get_dataframe(), the dataset
+is stored as a file named after it in the data directory, and the dataframe read has the dtypes of dataiku.Dataset.get_dataframe().
+
+------------------------
+Test Cases Design
+------------------------
+(1) Parquet, all columns
+(2) Feather, only some columns
+(3) CSV, with a row limit
+(4) Column with int & str values (e.g., "Bin" of a summary statistics table) --> stored as str
+(5) Dataset name with the project key
+"""
+
+get_dataframe_test_data = [
+    ("parquet", "input_dataset", {"person_age": [20, 30, 40], "loan_grade": ["A", None, "C"]}, {}, {"person_age": [20, 30, 40], "loan_grade": ["A", np.nan, "C"]}), # 1
+    ("feather", "input_dataset", {"person_age": [20, 30, 40], "loan_grade": ["A", None, "C"]}, {"columns": ["loan_grade"]}, {"loan_grade": ["A", np.nan, "C"]}), # 2
+    ("csv", "input_dataset", {"person_age": [20, 30, 40], "loan_int_rate": [5.5, None, 7.1]}, {"limit": 2}, {"person_age": [20, 30], "loan_int_rate": [5.5, np.nan]}), # 3
+    ("parquet", "stat_table", {"Bin": [22, "Missing", "Total"], "Good": [1, 2, 3]}, {}, {"Bin": ["22", "Missing", "Total"], "Good": [1, 2, 3]}), # 4
+    ("parquet", "PROJECT.input_dataset", {"person_age": [20]}, {}, {"person_age": [20]}), # 5
+]
+
+@pytest.mark.parametrize("file_format,name,input,kwargs,expected", get_dataframe_test_data)
+def test_get_dataframe(data_dir, file_format, name, input, kwargs, expected):
+    dataiku.set_default_format(file_format)
+    dataiku.Dataset(name).write_with_schema(pd.DataFrame(input))
+    result = dataiku.Dataset(name).get_dataframe(**kwargs)
+
+    print("Result: ")
+    print(result)
+    print("Expected: ")
+    print(expected)
+
+    assert (data_dir / f"{name.split('.')[-1]}.{file_format}").exists()
+    pd.testing.assert_frame_equal(result, pd.DataFrame(expected), check_index_type=False)
+    assert [(io_timing["operation"], io_timing["rows"]) for io_timing in dataiku.get_io_timings()] == [("write_with_schema", len(next(iter(input.values())))), ("get_dataframe", len(result))]
+
+
+"""
+Test Scenario 2
+Test given chunks of a dataframe, write them to a dataset with a writer and read the dataset back chunk by chunk
+with iter_dataframes(), the chunks read should make up the same dataframe, and the reads & writes are timed.
+
+------------------------
+Test Cases Design
+------------------------
+(1) Parquet, schema written from the first chunk before getting the writer, an integer column with a missing value in a later chunk --> float64
+(2) Feather, without writing the schema
+(3) CSV
+(4) No chunk written --> empty dataset
+"""
+
+iter_dataframes_test_data = [
+    ("parquet", [{"person_age": [20, 30], "loan_grade": ["A", "B"]}, {"person_age": [40, None], "loan_grade": ["C", None]}], 3, {"person_age": [20.0, 30.0, 40.0, np.nan], "loan_grade": ["A", "B", "C", np.nan]}), # 1
+    ("feather", [{"person_age": [20, 30]}, {"person_age": [40]}], 2, {"person_age": [20, 30, 40]}), # 2
+    ("csv", [{"person_age": [20, 30]}, {"person_age": [40]}, {"person_age": [50]}], 3, {"person_age": [20, 30, 40, 50]}), # 3
+    ("parquet", [], 2, {}), # 4
+]
+
+@pytest.mark.parametrize("file_format,chunk_list,chunksize,expected", iter_dataframes_test_data)
+def test_iter_dataframes(file_format, chunk_list, chunksize, expected):
+    dataiku.set_default_format(file_format)
+    dataset = dataiku.Dataset("output_dataset")
+    if len(chunk_list) > 0 and file_format == "parquet":
+        dataset.write_schema_from_dataframe(pd.DataFrame(chunk_list[0]))
+    with dataset.get_writer() as writer:
+        for chunk in chunk_list:
+            writer.write_dataframe(pd.DataFrame(chunk))
+    result_chunk_list = list(dataiku.Dataset("output_dataset").iter_dataframes(chunksize=chunksize))
+
+    expected_df = pd.DataFrame(expected)
+    assert all(len(result_chunk) <= chunksize for result_chunk in result_chunk_list)
+    if len(expected_df) > 0:
+        pd.testing.assert_frame_equal(pd.concat(result_chunk_list, ignore_index=True), expected_df, check_index_type=False)
+    else:
+        assert sum(len(result_chunk) for result_chunk in result_chunk_list) == 0
+    assert [(io_timing["operation"], io_timing["rows"]) for io_timing in dataiku.get_io_timings()] == [("get_writer", len(expected_df)), ("iter_dataframes", len(expected_df))]
+
+
+"""
+Test Scenario 3
+Test the schema of a dataset is written before getting a writer, as in DSS, i.e., it cannot be changed while a writer of the dataset is open.
+
+------------------------
+Test Cases Design
+------------------------
+(1) Schema written while a writer is open --> error
+(2) Schema written while a writer is open, by another Dataset object of the same dataset --> error
+(3) Second writer of the same dataset --> error
+(4) Schema written after the writer is closed --> used by the next writer
+"""
+
+schema_writer_order_test_data = ["open_writer", "other_object", "second_writer", "closed_writer"] # 1-4
+
+@pytest.mark.parametrize("case", schema_writer_order_test_data)
+def test_write_schema_before_writer(case):
+    dataset = dataiku.Dataset("output_dataset")
+    dataset.write_schema_from_dataframe(pd.DataFrame({"person_age": [20.0]}))
+    with dataset.get_writer() as writer:
+        writer.write_dataframe(pd.DataFrame({"person_age": [20]}))
+        if case == "open_writer":
+            with pytest.raises(Exception):
+                dataset.write_schema_from_dataframe(pd.DataFrame({"person_age": ["20"]}))
+        elif case == "other_object":
+            with pytest.raises(Exception):
+                dataiku.Dataset("output_dataset").write_schema_from_dataframe(pd.DataFrame({"person_age": ["20"]}))
+        elif case == "second_writer":
+            with pytest.raises(Exception):
+                dataiku.Dataset("output_dataset").get_writer()
+    # the schema captured on getting the writer is used
+    assert dataiku.Dataset("output_dataset").get_dataframe()["person_age"].dtype == np.float64
+
+    if case == "closed_writer":
+        dataset.write_schema_from_dataframe(pd.DataFrame({"person_age": [20]}))
+        with dataset.get_writer() as writer:
+            writer.write_dataframe(pd.DataFrame({"person_age": [30]}))
+        assert dataiku.Dataset("output_dataset").get_dataframe()["person_age"].tolist() == [30]
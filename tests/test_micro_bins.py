@@ -0,0 +1,146 @@
+from credit_scoring.micro_bins import NumericMicroBins
+from credit_scoring.bin_aggregates import BinAggregates
+from credit_scoring.interactive_binning_machine import ColValueIndex
+from credit_scoring.bins_plan import ColBinsPlan
+from credit_scoring.good_bad_counter import GoodBadCounter
+from credit_scoring.dataiku_compat import DataikuBinningMachine
+from fixture_datasets import read_test_dataset
+import pandas as pd
+import numpy as np
+import pytest
+
+"""
+TEST NumericMicroBins class
+"""
+
+good_bad_def = {"bad": {"numerical": [{"column": "paid_past_due", "ranges": [[90, 121]]}], "categorical": [], "weight": 2}, "indeterminate": {"numerical": [{"column": "paid_past_due", "ranges": [[60, 90]]}], "categorical": []}, "good": {"weight": 1}}
+
+# A function to get the micro-bins of a column of the test dataset
+def get_micro_bins(df, column, labels):
+    return NumericMicroBins.from_col_value_index(ColValueIndex(df[column], "numerical"), labels, is_integer=pd.api.types.is_integer_dtype(df[column]))
+
+
+"""
+Test Scenario 1
+Test given the auto binning settings of a numerical column, get the bins from the micro-bins of the column,
+the bins should be the same as the bins definitions of DataikuBinningMachine.perform_binning_on_col.
+
+------------------------
+Test Cases Design
+------------------------
+(1) Equal width, by width
+(2) Equal width, by number of bins
+(3) Equal width, by number of bins, float column with missing values
+(4) Equal frequency, by frequency
+(5) Equal frequency, by number of bins
+(6) Equal frequency, by number of bins, many repeated values --> duplicated edges dropped
+(7) Equal frequency, by number of bins, float column with missing values
+(8) Equal frequency, 1 bin
+(9) No binning, integer column --> a bin for each value in the order of appearance
+(10) No binning, float column with missing values --> a bin for missing values
+"""
+
+auto_bins_test_data = [
+    ("person_age", {"algo": "equal width", "method": "width", "value": 10}), # 1
+    ("person_income", {"algo": "equal width", "method": "num_bins", "value": 20}), # 2
+    ("loan_int_rate", {"algo": "equal width", "method": "num_bins", "value": 7}), # 3
+    ("loan_amnt", {"algo": "equal frequency", "method": "freq", "value": 3000}), # 4
+    ("person_income", {"algo": "equal frequency", "method": "num_bins", "value": 10}), # 5
+    ("cb_person_cred_hist_length", {"algo": "equal frequency", "method": "num_bins", "value": 30}), # 6
+    ("person_emp_length", {"algo": "equal frequency", "method": "num_bins", "value": 8}), # 7
+    ("loan_percent_income", {"algo": "equal frequency", "method": "num_bins", "value": 1}), # 8
+    ("cb_person_cred_hist_length", "none"), # 9
+    ("person_emp_length", "none"), # 10
+]
+
+@pytest.mark.parametrize("column,auto_bins", auto_bins_test_data)
+def test_get_auto_bins(column, auto_bins):
+    df = read_test_dataset("tests\\test_input_datasets\\credit_risk_dataset_generated.xlsx")
+    labels = GoodBadCounter.get_good_bad_labels(df, good_bad_def)
+
+    result = get_micro_bins(df, column, labels).get_auto_bins(auto_bins)
+    expected, _ = DataikuBinningMachine.perform_binning_on_col(df.loc[:, [column]], {"column": column, "type": "numerical", "bins": auto_bins})
+
+    print("Result: ")
+    print(result)
+    print("Expected: ")
+    print(expected)
+
+    assert str(result) == str(expected) # also compares the types of the values, e.g., 22 vs 22.0
+
+
+"""
+Test Scenario 2
+Test given the bins settings of a numerical column, count the labels of each bin from the micro-bins of the column,
+the counts (and the first row of each bin) should be the same as counting the rows binned with the bins settings.
+
+------------------------
+Test Cases Design
+------------------------
+(1) Custom bins, some rows not in any bin --> counted in the extra last row
+(2) Custom bins, a bin without any rows & overlapping bins --> the first bin takes the overlap
+(3) Custom bins, a bin of 2 ranges
+(4) Custom bins, float column with missing values
+(5) Equal width auto binning --> binned by its list of bins
+(6) Equal frequency auto binning
+"""
+
+aggregates_test_data = [
+    ({"column": "person_age", "type": "numerical", "bins": [{"name": "young", "ranges": [[0, 25]]}, {"name": "middle", "ranges": [[25, 40]]}]}), # 1
+    ({"column": "person_age", "type": "numerical", "bins": [{"name": "old", "ranges": [[40, 200]]}, {"name": "never", "ranges": [[500, 600]]}, {"name": "young", "ranges": [[0, 50]]}]}), # 2
+    ({"column": "person_income", "type": "numerical", "bins": [{"name": "low-high", "ranges": [[0, 30000], [100000, 10000000]]}, {"name": "mid", "ranges": [[30000, 100000]]}]}), # 3
+    ({"column": "loan_int_rate", "type": "numerical", "bins": [{"name": "low", "ranges": [[0, 10.5]]}, {"name": "high", "ranges": [[10.5, 30]]}]}), # 4
+    ({"column": "person_income", "type": "numerical", "bins": {"algo": "equal width", "method": "num_bins", "value": 20}}), # 5
+    ({"column": "person_emp_length", "type": "numerical", "bins": {"algo": "equal frequency", "method": "num_bins", "value": 8}}), # 6
+]
+
+@pytest.mark.parametrize("col_bins_settings", aggregates_test_data)
+def test_get_aggregates(col_bins_settings):
+    df = read_test_dataset("tests\\test_input_datasets\\credit_risk_dataset_generated.xlsx")
+    labels = GoodBadCounter.get_good_bad_labels(df, good_bad_def)
+    column = col_bins_settings["column"]
+
+    result = get_micro_bins(df, column, labels).get_aggregates(col_bins_settings)
+    if not isinstance(col_bins_settings["bins"], list):
+        def_li, _ = DataikuBinningMachine.perform_binning_on_col(df.loc[:, [column]], col_bins_settings)
+        col_bins_settings = {"column": column, "type": "numerical", "bins": def_li}
+    col_plan = ColBinsPlan(col_bins_settings)
+    expected = BinAggregates.from_bin_codes(col_plan.get_bin_codes(df[column]), col_plan.bin_names, labels)
+
+    print("Result: ")
+    print(result.label_counts, result.first_rows)
+    print("Expected: ")
+    print(expected.label_counts, expected.first_rows)
+
+    assert result.bin_names == expected.bin_names
+    assert result.label_counts.tolist() == expected.label_counts.tolist()
+    assert result.first_rows.tolist() == expected.first_rows.tolist()
+    assert result.get_label_counts("Missing")[0] == expected.get_label_counts("Missing")[0]
+
+
+"""
+Test Scenario 3
+Test given a small numerical column, get the label counts of a range & the quantiles from the micro-bins of the column.
+
+------------------------
+Test Cases Design
+------------------------
+(1) Range holding some values --> values in [lower, upper), missing values excluded
+(2) Range holding no values --> no counts
+(3) Quantiles --> same as np.quantile of the values (linear interpolation)
+(4) Invalid auto binning settings (frequency larger than the number of rows) --> error returns -1
+(5) Column with missing values only --> error returns -1
+"""
+
+small_col = pd.Series([5, 15, 20, 25, 35, 45, 50, 55, 75, np.nan, 99, 100, -1, 30, 20, 20])
+small_labels = np.array([0, 1, 2, 0, 0, 1, 1, 0, 0, 2, 0, 1, 0, 0, 1, 2], dtype=np.int8)
+
+def test_get_range_label_counts():
+    micro_bins = NumericMicroBins.from_col_value_index(ColValueIndex(small_col, "numerical"), small_labels)
+
+    assert micro_bins.get_range_label_counts(20, 50).tolist() == [3, 2, 2] # 1
+    assert micro_bins.get_range_label_counts(101, 200).tolist() == [0, 0, 0] # 2
+    assert micro_bins.get_quantiles(np.linspace(0, 1, 7)).tolist() == np.quantile(small_col.dropna(), np.linspace(0, 1, 7)).tolist() # 3
+    assert micro_bins.get_auto_bins({"algo": "equal frequency", "method": "freq", "value": 17}) == -1 # 4
+    empty_micro_bins = NumericMicroBins.from_col_value_index(ColValueIndex(pd.Series([np.nan, np.nan]), "numerical"), small_labels[:2])
+    assert empty_micro_bins.get_auto_bins({"algo": "equal width", "method": "num_bins", "value": 3}) == -1 # 5
@@ -0,0 +1,186 @@
+from credit_scoring.optimal_binning import OptimalBinning
+from credit_scoring.micro_bins import NumericMicroBins
+from credit_scoring.interactive_binning_machine import ColValueIndex
+from credit_scoring.good_bad_counter import GoodBadCounter
+from credit_scoring.binning_machine import BinningMachine
+from credit_scoring.dataiku_compat import DataikuBinningMachine, WebAppStatCalculator
+from fixture_datasets import read_test_dataset
+import pandas as pd
+import numpy as np
+import itertools
+import pytest
+
+"""
+TEST OptimalBinning class
+"""
+
+good_bad_def = {"bad": {"numerical": [{"column": "paid_past_due", "ranges": [[90, 121]]}], "categorical": [], "weight": 2}, "indeterminate": {"numerical": [{"column": "paid_past_due", "ranges": [[60, 90]]}], "categorical": []}, "good": {"weight": 1}}
+
+# A function to get the total IV & the WOE of each bin given the cut points, None if any bin breaks the constraints
+def get_iv_and_woe(cum_counts, total_label_counts, cuts, min_bin_rows):
+    total_iv, woe_list = 0, list()
+    for start, end in zip(cuts[:-1], cuts[1:]):
+        good, bad, _ = cum_counts[end] - cum_counts[start]
+        if good <= 0 or bad <= 0 or (cum_counts[end] - cum_counts[start]).sum() < max(min_bin_rows, 1):
+            return None
+        good_pct, bad_pct = good / total_label_counts[0], bad / total_label_counts[1]
+        woe_list.append(np.log(good_pct / bad_pct))
+        total_iv += (good_pct - bad_pct) * woe_list[-1]
+    return (total_iv, woe_list)
+
+# A function to find the max total IV by trying every set of cut points
+def get_brute_force_iv(cum_counts, total_label_counts, max_bins, min_bin_rows, monotonic):
+    best_iv = -np.inf
+    num_cuts = len(cum_counts)
+    for num_bins in range(1, min(max_bins, num_cuts - 1) + 1):
+        for inner_cuts in itertools.combinations(range(1, num_cuts - 1), num_bins - 1):
+            result = get_iv_and_woe(cum_counts, total_label_counts, [0, *inner_cuts, num_cuts - 1], min_bin_rows)
+            if result == None:
+                continue
+            woe_diff = np.diff(result[1])
+            if monotonic == "ascending" and not (woe_diff > 0).all():
+                continue
+            if monotonic == "descending" and not (woe_diff < 0).all():
+                continue
+            if monotonic == "auto" and not ((woe_diff > 0).all() or (woe_diff < 0).all()):
+                continue
+            best_iv = max(best_iv, result[0])
+    return best_iv
+
+
+"""
+Test Scenario 1
+Test given the label counts of each candidate bin, find the cut points maximizing the IV,
+the total IV should be the same as the best of all cut points satisfying the constraints.
+
+------------------------
+Test Cases Design
+------------------------
+(1) No constraints
+(2) Max number of bins
+(3) Min bin size
+(4) Ascending WOE
+(5) Descending WOE
+(6) Monotonic WOE, either ascending or descending
+(7) Candidate bins without bad rows --> merged with others
+(8) No bins satisfy the constraints --> single bin
+"""
+
+label_counts_1 = [[30, 2, 1], [25, 5, 0], [10, 12, 3], [40, 4, 2], [5, 20, 1], [12, 12, 0], [20, 3, 5], [8, 15, 2]]
+label_counts_2 = [[10, 0, 0], [15, 3, 1], [20, 0, 2], [8, 9, 0], [5, 0, 0], [3, 12, 1]]
+
+solve_test_data = [
+    (label_counts_1, 8, 0, "none"), # 1
+    (label_counts_1, 3, 0, "none"), # 2
+    (label_counts_1, 8, 60, "none"), # 3
+    (label_counts_1, 8, 0, "ascending"), # 4
+    (label_counts_1, 8, 0, "descending"), # 5
+    (label_counts_1, 4, 20, "auto"), # 6
+    (label_counts_2, 6, 0, "auto"), # 7
+    (label_counts_2, 6, 200, "auto"), # 8
+]
+
+@pytest.mark.parametrize("label_counts,max_bins,min_bin_rows,monotonic", solve_test_data)
+def test_solve(label_counts, max_bins, min_bin_rows, monotonic):
+    cum_counts = np.zeros((len(label_counts) + 1, 3), dtype=np.int64)
+    cum_counts[1:] = np.cumsum(label_counts, axis=0)
+    total_label_counts = cum_counts[-1]
+
+    cuts = OptimalBinning.solve(cum_counts, total_label_counts, max_bins, min_bin_rows, monotonic)
+    expected_iv = get_brute_force_iv(cum_counts, total_label_counts, max_bins, min_bin_rows, monotonic)
+
+    print("Result: ")
+    print(cuts)
+    print("Expected IV: ")
+    print(expected_iv)
+
+    if expected_iv == -np.inf:
+        assert cuts == [0, len(label_counts)]
+    else:
+        assert len(cuts) - 1 <= max_bins
+        assert get_iv_and_woe(cum_counts, total_label_counts, cuts, min_bin_rows)[0] == pytest.approx(expected_iv)
+
+
+"""
+Test Scenario 2
+Test given the optimal binning settings of a numerical column, perform optimal binning on the column,
+the bins should satisfy the settings, and be the same whether computed from the rows or from the micro-bins of the column.
+
+------------------------
+Test Cases Design
+------------------------
+(1) Default settings
+(2) Max number of bins & min bin size
+(3) Monotonic WOE not required
+(4) Float column with missing values
+(5) Few distinct values, fewer candidate bins than max number of bins
+"""
+
+optimal_test_data = [
+    ("person_income", {"algo": "optimal"}), # 1
+    ("loan_amnt", {"algo": "optimal", "max_bins": 4, "min_bin_size": 0.1}), # 2
+    ("person_age", {"algo": "optimal", "max_bins": 6, "monotonic": "none"}), # 3
+    ("loan_int_rate", {"algo": "optimal", "max_bins": 5, "max_candidates": 50}), # 4
+    ("cb_person_cred_hist_length", {"algo": "optimal", "max_bins": 20, "min_bin_size": 0}), # 5
+]
+
+@pytest.mark.parametrize("column,auto_bins", optimal_test_data)
+def test_perform_optimal_binning(column, auto_bins):
+    df = read_test_dataset("tests\\test_input_datasets\\credit_risk_dataset_generated.xlsx")
+    labels = GoodBadCounter.get_good_bad_labels(df, good_bad_def)
+    col_bins_settings = {"column": column, "type": "numerical", "bins": auto_bins}
+    settings = OptimalBinning.get_settings(auto_bins)
+
+    def_li, binned_series = DataikuBinningMachine.perform_binning_on_col(df.loc[:, [column]], col_bins_settings, labels=labels)
+    micro_bins = NumericMicroBins.from_col_value_index(ColValueIndex(df[column], "numerical"), labels)
+    stat_table = WebAppStatCalculator.compute_summary_stat_table(df, {"column": column, "type": "numerical", "bins": def_li}, good_bad_def, labels)
+    bin_stat_table = stat_table[~stat_table["Bin"].isin(["Missing", "Total"])]
+    woe_list = [bin_stat_table.loc[bin_stat_table["Bin"] == bin_def["name"], "WOE"].iloc[0] for bin_def in def_li]
+
+    print("Result: ")
+    print(def_li)
+    print(stat_table)
+
+    assert 1 <= len(def_li) <= settings["max_bins"]
+    assert str(micro_bins.get_auto_bins(auto_bins)) == str(def_li)
+    bin_size_series = binned_series[binned_series != DataikuBinningMachine.MISSING_LABEL].value_counts()
+    assert bin_size_series.sum() == df[column].notna().sum() # every non-missing value is in a bin
+    assert bin_size_series.min() >= np.ceil(settings["min_bin_size"] * df[column].notna().sum())
+    if settings["monotonic"] != "none":
+        assert (np.diff(woe_list) > 0).all() or (np.diff(woe_list) < 0).all()
+    # BinningMachine names the bins without the outer brackets
+    result = BinningMachine.perform_binning_on_col(df.loc[:, [column]], col_bins_settings, labels=labels)
+    assert result[df[column].notna()].tolist() == binned_series[df[column].notna()].str[1:-1].tolist()
+
+
+"""
+Test Scenario 3
+Test given invalid inputs, perform optimal binning on a column, an error should be returned.
+
+------------------------
+Test Cases Design
+------------------------
+(1) No labels --> error returns -1
+(2) Invalid max number of bins --> error returns -1
+(3) Invalid min bin size --> error returns -1
+(4) Invalid monotonic setting --> error returns -1
+(5) Categorical column --> error returns -1
+"""
+
+small_df = pd.DataFrame({"num": [5, 15, 20, 25, 35, 45, 50, 55], "cat": ["a", "b", "a", "c", "b", "a", "c", "b"]})
+small_labels = np.array([0, 1, 0, 0, 1, 1, 0, 1], dtype=np.int8)
+
+invalid_test_data = [
+    ("num", {"algo": "optimal"}, None), # 1
+    ("num", {"algo": "optimal", "max_bins": 0}, small_labels), # 2
+    ("num", {"algo": "optimal", "min_bin_size": 1.5}, small_labels), # 3
+    ("num", {"algo": "optimal", "monotonic": "up"}, small_labels), # 4
+    ("cat", {"algo": "optimal"}, small_labels), # 5
+]
+
+@pytest.mark.parametrize("column,auto_bins,labels", invalid_test_data)
+def test_perform_optimal_binning_invalid(column, auto_bins, labels):
+    col_bins_settings = {"column": column, "type": "numerical", "bins": auto_bins}
+
+    assert DataikuBinningMachine.perform_binning_on_col(small_df.loc[:, [column]], col_bins_settings, labels=labels) == (-1, -1)
+    assert BinningMachine.perform_binning_on_col(small_df.loc[:, [column]], col_bins_settings, labels=labels) == -1
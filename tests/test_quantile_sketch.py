@@ -0,0 +1,167 @@
+from credit_scoring.quantile_sketch import QuantileSketch
+import numpy as np
+import pytest
+
+"""
+TEST QuantileSketch class
+"""
+
+"""
+Test Scenario 1
+Test given chunks of a numerical column, estimate the quantiles of the whole column.
+
+Input:
+chunks = list of list of numbers (e.g., [[7, 0, 3], [5, 101, 11], [18, 8, None, 9]])
+k = int (capacity of the top level of the sketch)
+quantiles = list of float between 0 and 1
+
+Ouput: 
+(1) list containing the estimated value at each quantile
+
+------------------------
+Test Cases Design
+------------------------
+(1) No chunks --> None for each quantile
+(2) Single chunk, no compaction --> exact (same as np.quantile)
+(3) Multiple chunks, no compaction --> exact (same as np.quantile)
+(4) With missing values --> ignored
+(5) All missing values --> None for each quantile
+"""
+
+sketch_quantiles_test_data = [
+    ([], 200, [0, 0.5, 1], [None, None, None]), # 1
+    ([[7, 0, 3, 5, 101, 11, 18, 8, 9]], 200, [0, 1/3, 2/3, 1], [0.0, 6.333333333333333, 9.666666666666666, 101.0]), # 2
+    ([[7, 0, 3], [5, 101, 11], [18, 8, 9]], 200, [0, 1/3, 2/3, 1], [0.0, 6.333333333333333, 9.666666666666666, 101.0]), # 3
+    ([[7, 0, None, 3], [5, 101, 11], [18, 8, 9, None]], 200, [0, 1/3, 2/3, 1], [0.0, 6.333333333333333, 9.666666666666666, 101.0]), # 4
+    ([[None, None], [None]], 200, [0, 0.5, 1], [None, None, None]), # 5
+]
+
+@pytest.mark.parametrize("chunks,k,quantiles,expected", sketch_quantiles_test_data)
+def test_get_quantiles(chunks, k, quantiles, expected):
+    sketch = QuantileSketch(k)
+    for chunk in chunks:
+        sketch.update([np.nan if x is None else x for x in chunk])
+    result = sketch.get_quantiles(quantiles)
+    
+    print("Result: ")
+    print(result)
+    print("Expected: ")
+    print(expected)
+    
+    if expected[0] is None:
+        assert result == expected
+    else:
+        assert result == pytest.approx(expected)
+
+
+"""
+Test Scenario 2
+Test the estimated quantiles are within the rank error bound of the exact quantiles after compaction (no values kept exactly), 
+whether the chunks are added to 1 sketch or to separate sketches which are then merged.
+
+------------------------
+Test Cases Design
+------------------------
+(1) Uniform values, added to 1 sketch
+(2) Skewed values, added to 1 sketch
+(3) Uniform values, 1 sketch per chunk then merged
+(4) Skewed values, 1 sketch per chunk then merged
+(5) Many duplicated values, 1 sketch per chunk then merged
+"""
+
+sketch_error_bound_test_data = [
+    ("uniform", False), # 1
+    ("lognormal", False), # 2
+    ("uniform", True), # 3
+    ("lognormal", True), # 4
+    ("integers", True), # 5
+]
+
+@pytest.mark.parametrize("distribution,should_merge", sketch_error_bound_test_data)
+def test_rank_error_bound(distribution, should_merge):
+    rng = np.random.default_rng(0)
+    if distribution == "uniform":
+        values = rng.uniform(0, 1000, 50000)
+    elif distribution == "lognormal":
+        values = rng.lognormal(10, 1, 50000)
+    else:
+        values = rng.integers(0, 20, 50000).astype(float)
+    chunks = [values[i:i+5000] for i in range(0, len(values), 5000)]
+    
+    if should_merge:
+        sketch = QuantileSketch(100, max_exact_values=0)
+        for chunk in chunks:
+            sketch.merge(QuantileSketch(100, max_exact_values=0).update(chunk))
+    else:
+        sketch = QuantileSketch(100, max_exact_values=0)
+        for chunk in chunks:
+            sketch.update(chunk)
+    
+    assert sketch.count == len(values)
+    assert sketch.rank_error_bound > 0
+    
+    sorted_values = np.sort(values)
+    for q, estimated in zip(np.linspace(0.1, 0.9, 9), sketch.get_quantiles(np.linspace(0.1, 0.9, 9))):
+        # the exact rank range of the estimated value
+        lower_rank = np.searchsorted(sorted_values, estimated, side="left")
+        upper_rank = np.searchsorted(sorted_values, estimated, side="right")
+        target_rank = q * len(values)
+        distance = max(lower_rank - target_rank, target_rank - upper_rank, 0)
+        
+        print(f"q: {q}, distance: {distance}, bound: {sketch.rank_error_bound}")
+        
+        assert distance <= sketch.rank_error_bound
+
+
+"""
+Test Scenario 3
+Test the values are kept exactly until there are more than max_exact_values of them, then the sketch is compacted 
+with the geometric capacities of the levels (i.e., at most about 3k values are kept).
+
+------------------------
+Test Cases Design
+------------------------
+(1) Large column within the default budget --> exact (same as np.quantile)
+(2) Chunks added to 1 sketch within the budget --> exact
+(3) Sketches merged within the budget --> exact
+(4) Budget exceeded by the last chunk --> compacted, within the rank error bound
+(5) Sketches merged beyond the budget --> compacted, within the rank error bound
+"""
+
+sketch_exact_test_data = [
+    (QuantileSketch.DEFAULT_MAX_EXACT_VALUES, False, 1, True), # 1
+    (50000, False, 10, True), # 2
+    (50000, True, 10, True), # 3
+    (45000, False, 10, False), # 4
+    (45000, True, 10, False), # 5
+]
+
+@pytest.mark.parametrize("max_exact_values,should_merge,num_chunks,expected_exact", sketch_exact_test_data)
+def test_exact_until_budget(max_exact_values, should_merge, num_chunks, expected_exact):
+    values = np.random.default_rng(0).lognormal(10, 1, 50000)
+    chunks = np.array_split(values, num_chunks)
+    
+    sketch = QuantileSketch(100, max_exact_values=max_exact_values)
+    for chunk in chunks:
+        if should_merge:
+            sketch.merge(QuantileSketch(100, max_exact_values=max_exact_values).update(chunk))
+        else:
+            sketch.update(chunk)
+    
+    quantiles = np.linspace(0, 1, 11)
+    result = sketch.get_quantiles(quantiles)
+    
+    print(f"exact: {sketch.is_exact()}, rank_error_bound: {sketch.rank_error_bound}, levels: {[len(level) for level in sketch.levels]}")
+    
+    assert sketch.is_exact() == expected_exact
+    if expected_exact:
+        assert sketch.rank_error_bound == 0
+        assert result == pytest.approx(np.quantile(values, quantiles).tolist())
+    else:
+        assert sketch.rank_error_bound > 0
+        # the top level holds k values, and the capacities of the lower levels shrink geometrically (2/3 of the level above)
+        assert sum(len(level) for level in sketch.levels) <= 3 * 100 + 2 * len(sketch.levels)
+        sorted_values = np.sort(values)
+        for q, estimated in zip(quantiles[1:-1], result[1:-1]):
+            distance = max(np.searchsorted(sorted_values, estimated, side="left") - q * len(values), q * len(values) - np.searchsorted(sorted_values, estimated, side="right"), 0)
+            assert distance <= sketch.rank_error_bound
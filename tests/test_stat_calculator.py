@@ -1,5 +1,10 @@
-from stat_calculator import StatCalculator
+from credit_scoring.stat_calculator import StatCalculator
+from credit_scoring.bins_plan import BinsPlan
+from credit_scoring.binning_machine import BinningMachine
+from credit_scoring.good_bad_counter import GoodBadCounter
+from fixture_datasets import read_test_dataset
 import pandas as pd
+import numpy as np
 import pytest
 
 """
@@ -270,9 +275,9 @@ summary_stat_table_test_data = [
 @pytest.mark.parametrize("input_df_path,col_bins_settings,good_bad_def,expected", summary_stat_table_test_data)
 def test_compute_summary_stat_table(input_df_path, col_bins_settings, good_bad_def, expected):
     print(expected)
-    dframe = pd.read_excel(input_df_path)
+    dframe = read_test_dataset(input_df_path)
     if expected != None:
-        expected = pd.read_excel(expected)
+        expected = read_test_dataset(expected)
         expected = expected.values.tolist()
     
     stat_calculator = StatCalculator(dframe, col_bins_settings, good_bad_def)
@@ -296,4 +301,127 @@ def test_compute_summary_stat_table(input_df_path, col_bins_settings, good_bad_d
     
     
 
- 
\ No newline at end of file
+ 
+"""
+Test Scenario 7
+Test given a binned series, get the list of unique bin names (in the order of appearance), and the index of the bin of each row.
+
+Input: binned_series = pd.Series, e.g., pd.Series(["[0, 10)", None, "[10, 20)", "[0, 10)"])
+
+Output: (bin_name_list, bin_idx)
+(1) bin_name_list = list, e.g., ["[0, 10)", None, "[10, 20)"]
+(2) bin_idx = np.array, e.g., [0, 1, 2, 0]
+
+------------------------
+Test Cases Design
+------------------------
+(1) No missing bin
+(2) Missing bin (None) appears first
+(3) Missing bin (None) appears in between
+(4) Categorical series
+(5) NaN without None bin (i.e., not in any bin, index = len(bin_name_list))
+(6) Single bin
+"""
+
+bin_indices_test_data = [
+    (pd.Series(["[0, 10)", "[10, 20)", "[0, 10)", "[20, 30)"]), ["[0, 10)", "[10, 20)", "[20, 30)"], [0, 1, 0, 2]), # 1
+    (pd.Series([None, "[10, 20)", "[0, 10)", None]), [None, "[10, 20)", "[0, 10)"], [0, 1, 2, 0]), # 2
+    (pd.Series(["[0, 10)", None, "[10, 20)", "[0, 10)"]), ["[0, 10)", None, "[10, 20)"], [0, 1, 2, 0]), # 3
+    (pd.Series(["B", "A", "B", "C"], dtype="category"), ["B", "A", "C"], [0, 1, 0, 2]), # 4
+    (pd.Series(["A", np.nan, "B"]), ["A", np.nan, "B"], [0, 3, 2]), # 5
+    (pd.Series(["A", "A"]), ["A"], [0, 0]), # 6
+]
+
+@pytest.mark.parametrize("binned_series,expected_bin_name_list,expected_bin_idx", bin_indices_test_data)
+def test_get_bin_indices(binned_series, expected_bin_name_list, expected_bin_idx):
+    result_bin_name_list, result_bin_idx = StatCalculator.get_bin_indices(binned_series)
+    print(f"result_bin_name_list = {result_bin_name_list} vs expected_bin_name_list = {expected_bin_name_list}")
+    print(f"result_bin_idx = {result_bin_idx.tolist()} vs expected_bin_idx = {expected_bin_idx}")
+    assert (
+        len(result_bin_name_list) == len(expected_bin_name_list) and
+        all((pd.isna(result) and pd.isna(expected)) or (result == expected) for result, expected in zip(result_bin_name_list, expected_bin_name_list)) and
+        result_bin_idx.tolist() == expected_bin_idx
+    )
+
+
+"""
+Test Scenario 8
+Test given a dataframe, a list of bins settings (or a BinsPlan) and good bad definitions, compute the summary statistics tables of many columns at once.
+The good & bad counts of each bin should be the same as counting the rows of the bin independently (by GoodBadCounter.get_statistics),
+the percentages & WOE should follow from the counts, and the dataframe should not be changed.
+
+Output: dict of column name -> summary statistics table (None if the column has no bins settings)
+
+------------------------
+Test Cases Design
+------------------------
+(1) Empty dataframe
+(2) Empty good_bad_def
+(3) Numerical + categorical columns + loan_status (0 = Good, 1 = Bad)
+(4) Numerical + categorical columns + paid_past_due ([0, 60) = Good, [60, 90) = Indeterminate, [90, 120) = Bad)
+(5) Column without bins settings in col_list
+(6) BinsPlan as bins settings, with weights
+"""
+
+multi_stat_table_df = pd.DataFrame({
+    "person_age": [22, 25, 31, 47, None, 22, 60, 38, 25, 29],
+    "loan_grade": ["A", "B", "A", "C", "D", None, "B", "A", "E", "C"],
+    "loan_status": [0, 1, 0, 0, 1, 1, 0, 0, 1, 0],
+    "paid_past_due": [10, 95, 0, 61, 100, 70, 5, 89, 119, 30],
+})
+multi_stat_table_bins_settings = [
+    {"column": "person_age", "type": "numerical", "bins": [{"name": "young", "ranges": [[18, 30]]}, {"name": "old", "ranges": [[30, 70]]}]},
+    {"column": "loan_grade", "type": "categorical", "bins": [{"name": "good", "elements": ["A", "B"]}, {"name": "poor", "elements": ["C", "D", "E"]}]},
+    {"column": "paid_past_due", "type": "numerical", "bins": {"algo": "equal width", "method": "num_bins", "value": 3}},
+    {"column": "loan_status", "type": "categorical", "bins": "none"},
+]
+loan_status_good_bad_def = {"bad": {"numerical": [], "categorical": [{"column": "loan_status", "elements": [1]}], "weight": 1}, "indeterminate": {"numerical": [], "categorical": []}, "good": {"weight": 1}}
+paid_past_due_good_bad_def = {"bad": {"numerical": [{"column": "paid_past_due", "ranges": [[90, 121]]}], "categorical": [], "weight": 1}, "indeterminate": {"numerical": [{"column": "paid_past_due", "ranges": [[60, 90]]}], "categorical": []}, "good": {"weight": 1}}
+
+multi_stat_table_test_data = [
+    (multi_stat_table_df.iloc[0:0], multi_stat_table_bins_settings, loan_status_good_bad_def, None), # 1
+    (multi_stat_table_df, multi_stat_table_bins_settings, None, None), # 2
+    (multi_stat_table_df, multi_stat_table_bins_settings, loan_status_good_bad_def, None), # 3
+    (multi_stat_table_df, multi_stat_table_bins_settings, paid_past_due_good_bad_def, None), # 4
+    (multi_stat_table_df, multi_stat_table_bins_settings[0:2], loan_status_good_bad_def, ["person_age", "paid_past_due", "loan_grade"]), # 5
+    (multi_stat_table_df, BinsPlan(multi_stat_table_bins_settings), {"bad": {"categorical": [{"column": "loan_status", "elements": [1]}], "weight": 2.5}, "good": {"weight": 4}}, ["loan_grade", "person_age"]), # 6
+]
+
+@pytest.mark.parametrize("dframe,bins_settings_list,good_bad_def,col_list", multi_stat_table_test_data)
+def test_compute_summary_stat_tables(dframe, bins_settings_list, good_bad_def, col_list):
+    input_df = dframe.copy()
+    result = StatCalculator.compute_summary_stat_tables(dframe, bins_settings_list, good_bad_def, col_list=col_list)
+
+    expected_col_list = col_list if col_list is not None else [col_bins_settings["column"] for col_bins_settings in bins_settings_list]
+    assert list(result.keys()) == expected_col_list
+    for col in expected_col_list:
+        col_bins_settings = None
+        for bins_settings in bins_settings_list:
+            if bins_settings["column"] == col:
+                col_bins_settings = bins_settings
+                break
+        print(f"column: {col}")
+        print(result[col])
+        if col_bins_settings is None or len(dframe) == 0 or good_bad_def is None:
+            assert result[col] is None
+            continue
+
+        # count the rows of each bin independently, the bin of each row given by BinningMachine
+        binned_series = BinningMachine.perform_binning_on_col(dframe.loc[:, [col]], col_bins_settings)
+        _, _, _, _, _, total_good, total_bad = GoodBadCounter.get_statistics(dframe, good_bad_def)
+        stat_table = result[col]
+        bin_table = stat_table.iloc[:-1]
+        assert len(bin_table) == binned_series.nunique(dropna=False)
+        for _, row in bin_table.iterrows():
+            in_bin = binned_series.isna() if pd.isna(row["Bin"]) else (binned_series == row["Bin"])
+            _, _, _, _, _, good, bad = GoodBadCounter.get_statistics(dframe[in_bin.to_numpy()], good_bad_def)
+            assert (row["Good"], row["Bad"], row["Total"]) == (good, bad, good + bad)
+            assert row["Good%"] == pytest.approx(round(good / total_good * 100, 4) if total_good else 0)
+            assert row["Bad%"] == pytest.approx(round(bad / total_bad * 100, 4) if total_bad else 0)
+            if good > 0 and bad > 0:
+                assert row["WOE"] == pytest.approx(round(np.log((good / total_good) / (bad / total_bad)), 4))
+        total_row = stat_table.iloc[-1]
+        assert (total_row["Bin"], total_row["Good"], total_row["Bad"], total_row["Total"]) == ("Total", total_good, total_bad, total_good + total_bad)
+
+    # dataframe is not changed, i.e., no binned column is added
+    assert dframe.equals(input_df)